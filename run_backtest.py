@@ -48,6 +48,12 @@ async def main():
         default=30, 
         help="Slow moving average period"
     )
+    parser.add_argument(
+        "--data_path",
+        type=str,
+        default=None,
+        help="Local OHLCV data (CSV file or memmap dataset directory) instead of the exchange"
+    )
     parser.add_argument(
         "--no_telegram",
         action="store_true",
@@ -61,7 +67,8 @@ async def main():
         start_date=args.start_date,
         end_date=args.end_date,
         fast_ma=args.fast_ma,
-        slow_ma=args.slow_ma
+        slow_ma=args.slow_ma,
+        data_path=args.data_path
     )
     if stats_path and plot_path:
         print(f"Backtest stats saved to: {stats_path}")
@@ -10,7 +10,7 @@ from stable_baselines3 import PPO
 from stable_baselines3.common.vec_env import DummyVecEnv, VecNormalize
 from src.core.trading_env import TradingEnv, EnvConfig
 
-def run_rl_backtest(model_path: str, symbol: str, start_date: str):
+def run_rl_backtest(model_path: str, symbol: str, start_date: str, data_path: str = None):
     """
     Runs a backtest for a trained RL model.
 
@@ -18,6 +18,7 @@ def run_rl_backtest(model_path: str, symbol: str, start_date: str):
         model_path (str): Path to the trained PPO model .zip file.
         symbol (str): The symbol to backtest (e.g., 'BTCUSDT').
         start_date (str): The start date for the backtest data (e.g., '2023-01-01').
+        data_path (str): Optional local data (CSV file or memmap dataset directory).
     """
     print(f"--- Starting RL Backtest --- ")
     print(f"Model: {model_path}")
@@ -43,6 +44,8 @@ def run_rl_backtest(model_path: str, symbol: str, start_date: str):
         "use_online": True, # Use live data for backtest consistency
         "random_start": False # Start from the beginning of the data
     }
+    if data_path:
+        env_config.update({"use_online": False, "data_path": data_path, "data_start": start_date})
     env = DummyVecEnv([lambda: TradingEnv(config=env_config)])
     env = VecNormalize.load(vecnormalize_path, env)
     env.training = False # Set to evaluation mode
@@ -93,7 +96,8 @@ if __name__ == "__main__":
     parser.add_argument("--model-path", required=True, help="Path to the trained PPO model .zip file")
     parser.add_argument("--symbol", required=True, help="Symbol to backtest (e.g., 'BTCUSDT')")
     parser.add_argument("--start-date", required=True, help="Start date for backtest data (e.g., '2023-01-01')")
+    parser.add_argument("--data-path", default=None, help="Local OHLCV data (CSV file or memmap dataset directory)")
     
     args = parser.parse_args()
     
-    run_rl_backtest(args.model_path, args.symbol, args.start_date)
+    run_rl_backtest(args.model_path, args.symbol, args.start_date, args.data_path)
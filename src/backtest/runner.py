@@ -1,75 +1,70 @@
 # -*- coding: utf-8 -*-
-"""VectorBT를 사용한 백테스팅 실행기 (v2 - 데이터 캐싱 추가)."""
+"""VectorBT를 사용한 백테스팅 실행기 (v3 - 페이지 분할 백필 + 공유 OHLCV 저장소)."""
+import asyncio
 import logging
 from pathlib import Path
 import pandas as pd
-import vectorbt as vbt
 from typing import Tuple, Optional
 
+from ..core.lazy_import import lazy_import
 from ..core.bybit_router import get_bybit_client
+from ..core.memmap_dataset import load_ohlcv_frame
+from ..core.data_manager import get_ohlcv_store
+from ..core.ohlcv_store import OHLCVStore
+from ..core.backfill import backfill_ohlcv, missing_ranges, DEFAULT_MAX_CONCURRENCY
+
+vbt = lazy_import("vectorbt")
 
 # --- 상수 정의 ---
 OUTPUT_DIR = Path("outputs/backtests")
-CACHE_DIR = Path("data/cache")
 
 
-async def get_ohlcv_data(symbol: str, start_date: str, end_date: Optional[str] = None) -> Optional[pd.DataFrame]:
+def _infer_freq(index: pd.DatetimeIndex) -> pd.Timedelta:
+    """인덱스의 캔들 간격(중앙값)을 vectorbt 빈도로 사용합니다."""
+    if len(index) < 2:
+        return pd.Timedelta(days=1)
+    return pd.Series(index).diff().median()
+
+
+def _get_store() -> OHLCVStore:
+    """data_manager와 같은 월 파티션 OHLCV 저장소를 공유합니다."""
+    return get_ohlcv_store()
+
+
+async def get_ohlcv_data(
+    symbol: str,
+    start_date: str,
+    end_date: Optional[str] = None,
+    timeframe: str = '1d',
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> Optional[pd.DataFrame]:
     """
-    OHLCV 데이터를 가져옵니다. 로컬 캐시를 우선 확인하고, 없으면 거래소에서 다운로드합니다.
+    OHLCV 데이터를 가져옵니다. 로컬 저장소를 우선 사용하고, 저장되지 않은 구간만
+    페이지 단위로 동시에 백필(`src.core.backfill`)한 뒤 저장소에서 읽어 반환합니다.
+    중단된 다운로드는 다음 호출 시 남은 구간부터 재개됩니다.
     """
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    safe_symbol = symbol.replace('/', '_')
-    
-    # 캐시 파일 이름에 end_date를 포함시켜 더 유연한 캐싱 지원
-    year_str = start_date.split('-')[0]
-    end_year_str = end_date.split('-')[0] if end_date else year_str
-    cache_filename = f"{safe_symbol}_1d_{year_str}_{end_year_str}.csv"
-    cache_filepath = CACHE_DIR / cache_filename
-
-    if cache_filepath.exists():
-        logging.info(f"캐시된 데이터 '{cache_filepath}'를 사용합니다.")
-        df = pd.read_csv(cache_filepath, index_col='timestamp', parse_dates=True)
-        
-        # 요청된 기간에 맞게 데이터 필터링
-        start_dt = pd.to_datetime(start_date)
-        end_dt = pd.to_datetime(end_date) if end_date else pd.Timestamp.now()
-        return df[(df.index >= start_dt) & (df.index <= end_dt)]
+    store = _get_store()
+    start_ts = pd.Timestamp(start_date, tz='UTC')
+    # end_date는 해당 일자를 포함하도록 다음 날 0시까지를 반열린 구간으로 요청
+    end_ts = pd.Timestamp(end_date, tz='UTC') + pd.Timedelta(days=1) if end_date else None
 
-    logging.info(f"캐시된 데이터 없음. {symbol}의 일봉 OHLCV 데이터를 거래소에서 가져옵니다...")
     client = None
     try:
-        client = await get_bybit_client()
-        since = client.parse8601(f"{start_date}T00:00:00Z")
-        
-        # end_date가 있으면 해당 날짜까지만 데이터를 가져오도록 시도
-        # (주의: fetch_ohlcv는 since 기반이므로, 후처리에서 end_date를 잘라내야 함)
-        ohlcv = await client.fetch_ohlcv(symbol, '1d', since=since, limit=2000)
-        
-        if not ohlcv:
+        if missing_ranges(store, symbol, timeframe, start_ts, end_ts):
+            logging.info(f"{symbol} {timeframe} 저장되지 않은 구간을 거래소에서 백필합니다...")
+            client = await get_bybit_client()
+            await backfill_ohlcv(client, store, symbol, timeframe, start_ts, end_ts, max_concurrency=max_concurrency)
+        else:
+            logging.info(f"저장소의 {symbol} {timeframe} 데이터를 사용합니다.")
+
+        end_inclusive = end_ts - pd.Timedelta(milliseconds=1) if end_ts is not None else None
+        df = await asyncio.to_thread(store.read, symbol, timeframe, start_ts, end_inclusive)
+        if df.empty:
             logging.error(f"{symbol}에 대한 OHLCV 데이터를 가져올 수 없습니다.")
             return None
-
-        df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-        df.set_index('timestamp', inplace=True)
-        
-        # 전체 다운로드된 데이터를 캐싱
-        full_cache_filename = f"{safe_symbol}_1d_{year_str}_full.csv"
-        full_cache_filepath = CACHE_DIR / full_cache_filename
-        logging.info(f"전체 데이터를 '{full_cache_filepath}' 파일에 캐싱합니다.")
-        df.to_csv(full_cache_filepath)
-        
-        # 요청된 기간에 맞게 데이터 필터링하여 반환
-        start_dt = pd.to_datetime(start_date)
-        end_dt = pd.to_datetime(end_date) if end_date else pd.Timestamp.now()
-        filtered_df = df[(df.index >= start_dt) & (df.index <= end_dt)]
-        
-        # 기간이 명시된 경우, 해당 기간에 대한 별도 캐시 저장
-        if end_date:
-            logging.info(f"기간이 명시된 데이터를 '{cache_filepath}' 파일에 캐싱합니다.")
-            filtered_df.to_csv(cache_filepath)
-            
-        return filtered_df
+        # 기존 호출부와의 호환을 위해 tz-naive(UTC) 인덱스로 반환
+        df.index = df.index.tz_localize(None)
+        return df
     except Exception as e:
         logging.error(f"OHLCV 데이터 가져오기 실패: {e}", exc_info=True)
         return None
@@ -83,16 +78,21 @@ async def run_ma_crossover_backtest(
     start_date: str, 
     end_date: Optional[str] = None,
     fast_ma: int = 10, 
-    slow_ma: int = 30
+    slow_ma: int = 30,
+    data_path: Optional[str] = None
 ) -> Tuple[Optional[pd.Series], Optional[Path], Optional[Path]]:
     """
     이동평균 교차 전략에 대한 백테스트를 실행하고 결과를 저장합니다.
+    data_path가 주어지면 거래소 대신 로컬 데이터(CSV 또는 메모리 맵 데이터셋)를 사용합니다.
     """
     logging.info(f"{symbol}에 대한 백테스트를 시작합니다 (기간: {start_date} ~ {end_date or '최신'})...")
     
     try:
         # 1. 데이터 가져오기 (캐싱 로직 내장)
-        df = await get_ohlcv_data(symbol, start_date, end_date)
+        if data_path:
+            df = await asyncio.to_thread(load_ohlcv_frame, data_path, symbol, start_date, end_date)
+        else:
+            df = await get_ohlcv_data(symbol, start_date, end_date)
         
         if df is None or df.empty:
             logging.error("데이터를 가져오지 못해 백테스트를 중단합니다.")
@@ -115,7 +115,7 @@ async def run_ma_crossover_backtest(
             entries, 
             exits, 
             init_cash=10000, # 초기 자본금
-            freq='1D' # 데이터 빈도
+            freq=_infer_freq(price.index) # 데이터 빈도 (일봉 캐시는 '1D', 로컬 1분봉은 '1min')
         )
 
         # 4. 결과 저장
@@ -13,17 +13,20 @@ LOOKBACK_CONFIG = {
     "1d":  {"core_days": 1825,"wf_days": 240,"oos_days": 240,"min_bars": 800},
 }
 
+# Map ccxt timeframes to LOOKBACK_CONFIG keys
+TIMEFRAME_MAPPING = {
+    "1m": "1m", "3m": "3m", "5m": "5m", "15m": "15m",
+    "1h": "1h", "2h": "4h", "4h": "4h", "6h": "4h", "12h": "4h",
+    "1d": "1d", "1w": "1d", "1M": "1d"
+}
+
+def lookback_for(tf: str) -> dict:
+    """타임프레임에 해당하는 LOOKBACK_CONFIG 항목을 반환합니다 (없으면 1h 기준)."""
+    return LOOKBACK_CONFIG[TIMEFRAME_MAPPING.get(tf, "1h")]
+
 def required_min_bars(longest_period:int, tf:str) -> int:
     """
     가장 긴 지표 기간과 타임프레임을 기반으로 최소 필요한 캔들 수를 계산합니다.
     """
-    # Map ccxt timeframes to LOOKBACK_CONFIG keys
-    timeframe_mapping = {
-        "1m": "1m", "3m": "3m", "5m": "5m", "15m": "15m",
-        "1h": "1h", "2h": "4h", "4h": "4h", "6h": "4h", "12h": "4h",
-        "1d": "1d", "1w": "1d", "1M": "1d"
-    }
-    mapped_tf = timeframe_mapping.get(tf, "1h") # Default to 1h if not found
-
-    base = LOOKBACK_CONFIG[mapped_tf]["min_bars"]
+    base = lookback_for(tf)["min_bars"]
     return max(3 * longest_period, base)
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""
+과거 OHLCV 백필(Backfill) 엔진 (페이지 분할 · 동시 다운로드 · 재개 가능)
+
+- 목적: 거래소 한 번의 응답 크기(페이지)를 넘는 기간의 캔들을 잘림 없이 내려받아 로컬 저장소(`ohlcv_store`)에 병합합니다.
+- 핵심 기능:
+  1) 페이지 분할: [start, end) 구간을 `page_limit`개 캔들 단위 페이지로 나눕니다.
+  2) 동시 다운로드: 세마포어(동시 요청 수)와 토큰 버킷(`AsyncRateLimiter`, 초당 요청 예산)으로 페이지를 병렬 요청합니다.
+  3) 체크포인트: 완료된 구간을 시리즈별 JSON 원장에 기록하여, 중단 후 재실행 시 남은 구간만 다시 받습니다.
+  4) 저장소 병합: 페이지가 끝날 때마다 해당 월 파티션에 즉시 병합하므로 진행 중 데이터도 보존됩니다.
+"""
+from __future__ import annotations
+import os
+import json
+import asyncio
+import logging
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+
+from .lazy_import import lazy_import
+from .ohlcv_integrity import Range, merge_ranges, subtract_ranges, timeframe_to_ms
+from .ohlcv_store import OHLCVStore, OHLCV_COLUMNS, safe_symbol, _to_utc_timestamp
+from .rate_limiter import AsyncRateLimiter
+
+ccxt = lazy_import("ccxt.async_support")
+
+logger = logging.getLogger(__name__)
+
+# --- 상수 정의 ---
+CHECKPOINT_DIRNAME = "_backfill"
+DEFAULT_PAGE_LIMIT = 1000        # Bybit v5 kline 최대 응답 크기
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_RATE_PER_SEC = 8.0       # 공개 시세 엔드포인트 IP 한도보다 보수적인 기본 예산
+MAX_RETRIES = 3
+
+
+# --- 헬퍼 함수 ---
+def _to_frame(bars: list) -> pd.DataFrame:
+    df = pd.DataFrame(bars, columns=['timestamp'] + OHLCV_COLUMNS)
+    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms', utc=True)
+    return df.set_index('timestamp').astype('float64')
+
+
+# --- 체크포인트 원장 ---
+class BackfillCheckpoint:
+    """
+    시리즈(심볼, 타임프레임)별로 '이미 거래소에서 받아 저장소에 병합한 구간'을 기록하는 원장.
+    데이터가 없는 구간(상장 전 등)도 완료로 기록하므로 같은 구간을 다시 요청하지 않습니다.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.covered: List[Range] = []
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.covered = merge_ranges([tuple(r) for r in json.load(f).get("covered", [])])
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning(f"[백필] 체크포인트 파일 손상, 새로 시작합니다: {self.path.name} ({e})")
+
+    @classmethod
+    def for_series(cls, store: OHLCVStore, symbol: str, timeframe: str) -> "BackfillCheckpoint":
+        return cls(store.root / CHECKPOINT_DIRNAME / f"{safe_symbol(symbol)}_{timeframe}.json")
+
+    def add(self, start_ms: int, end_ms: int) -> None:
+        self.covered = merge_ranges(self.covered + [(start_ms, end_ms)])
+
+    def missing(self, start_ms: int, end_ms: int) -> List[Range]:
+        """[start_ms, end_ms) 중 아직 완료되지 않은 구간 목록을 반환합니다."""
+        gaps: List[Range] = []
+        cursor = start_ms
+        for s, e in self.covered:
+            if e <= cursor:
+                continue
+            if s >= end_ms:
+                break
+            if s > cursor:
+                gaps.append((cursor, min(s, end_ms)))
+            cursor = max(cursor, e)
+        if cursor < end_ms:
+            gaps.append((cursor, end_ms))
+        return gaps
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".json.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"covered": self.covered}, f)
+        os.replace(tmp_path, self.path)
+
+
+# --- 백필 엔진 ---
+def _request_window(timeframe: str, start, end) -> Range:
+    """요청 구간을 밀리초로 변환합니다. 진행 중인 캔들은 완료로 기록하지 않도록 마지막으로 마감된 캔들 경계에서 자릅니다."""
+    tf_ms = timeframe_to_ms(timeframe)
+    now_ms = int(pd.Timestamp.now(tz='UTC').value // 10**6)
+    last_closed_ms = (now_ms // tf_ms) * tf_ms
+    start_ms = int(_to_utc_timestamp(start).value // 10**6)
+    end_ms = last_closed_ms if end is None else min(int(_to_utc_timestamp(end).value // 10**6), last_closed_ms)
+    return start_ms, end_ms
+
+
+def missing_ranges(store: OHLCVStore, symbol: str, timeframe: str, start, end=None) -> List[Range]:
+    """
+    아직 받지 않은 [start, end) 하위 구간 목록을 반환합니다.
+    체크포인트에 없는 구간 중, 저장소 매니페스트상 이미 캔들이 있는 구간은 제외하므로
+    다른 경로(data_manager 등)로 채워진 데이터는 갭만 다시 받습니다.
+    """
+    start_ms, end_ms = _request_window(timeframe, start, end)
+    if end_ms <= start_ms:
+        return []
+    pending = BackfillCheckpoint.for_series(store, symbol, timeframe).missing(start_ms, end_ms)
+    if not pending:
+        return []
+    return subtract_ranges(pending, store.covered_ranges(symbol, timeframe))
+
+
+def plan_pages(ranges: List[Range], tf_ms: int, page_limit: int) -> List[Range]:
+    """누락 구간들을 캔들 경계에 맞춘 페이지 목록으로 분할합니다."""
+    page_span = tf_ms * page_limit
+    pages: List[Range] = []
+    for s, e in ranges:
+        cursor = (s // tf_ms) * tf_ms
+        while cursor < e:
+            pages.append((cursor, min(cursor + page_span, e)))
+            cursor += page_span
+    return pages
+
+
+async def _fetch_page(
+    client: ccxt.Exchange,
+    symbol: str,
+    timeframe: str,
+    page: Range,
+    page_limit: int,
+    semaphore: asyncio.Semaphore,
+    limiter: AsyncRateLimiter,
+) -> list:
+    """단일 페이지를 재시도와 함께 요청하고, 페이지 구간 밖의 캔들은 버립니다."""
+    start_ms, end_ms = page
+    async with semaphore:
+        for attempt in range(1, MAX_RETRIES + 1):
+            await limiter.acquire()
+            try:
+                bars = await client.fetch_ohlcv(symbol, timeframe, since=start_ms, limit=page_limit)
+                return [b for b in (bars or []) if start_ms <= b[0] < end_ms]
+            except (ccxt.NetworkError, ccxt.RateLimitExceeded) as e:
+                if attempt == MAX_RETRIES:
+                    raise
+                backoff = 2 ** attempt
+                logger.warning(f"[백필] {symbol} {timeframe} 페이지 요청 실패 ({attempt}/{MAX_RETRIES}), {backoff}초 후 재시도: {e}")
+                await asyncio.sleep(backoff)
+    return []
+
+
+async def backfill_ohlcv(
+    client: ccxt.Exchange,
+    store: OHLCVStore,
+    symbol: str,
+    timeframe: str,
+    start,
+    end=None,
+    page_limit: int = DEFAULT_PAGE_LIMIT,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    rate_limiter: Optional[AsyncRateLimiter] = None,
+) -> int:
+    """
+    [start, end) 구간의 캔들을 페이지 단위로 동시에 내려받아 저장소에 병합합니다.
+    이미 체크포인트에 기록된 구간은 건너뛰므로 중단 후 같은 호출로 재개할 수 있습니다.
+
+    Args:
+        client: ccxt 비동기 거래소 클라이언트.
+        store: 병합 대상 OHLCV 저장소.
+        start, end: 기간 (문자열/Timestamp/밀리초). end가 없으면 현재 시각까지 (마감된 캔들만).
+        page_limit: 페이지당 캔들 수 (거래소 최대 응답 크기).
+        max_concurrency: 동시에 진행할 페이지 요청 수.
+        rate_limiter: 공유 요청 예산. 없으면 기본 예산으로 생성합니다.
+
+    Returns:
+        int: 이번 호출에서 새로 받은 캔들 수.
+    """
+    tf_ms = timeframe_to_ms(timeframe)
+    pages = plan_pages(missing_ranges(store, symbol, timeframe, start, end), tf_ms, page_limit)
+    if not pages:
+        logger.info(f"[백필] {symbol} {timeframe}: 요청 구간이 이미 모두 저장되어 있습니다.")
+        return 0
+
+    logger.info(f"[백필] {symbol} {timeframe}: {len(pages)}개 페이지 다운로드 시작 (동시 {max_concurrency}개)")
+    checkpoint = BackfillCheckpoint.for_series(store, symbol, timeframe)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    limiter = rate_limiter or AsyncRateLimiter(DEFAULT_RATE_PER_SEC)
+    write_lock = asyncio.Lock()
+    fetched = 0
+
+    async def run_page(page: Range) -> None:
+        nonlocal fetched
+        bars = await _fetch_page(client, symbol, timeframe, page, page_limit, semaphore, limiter)
+        # 저장소 병합과 체크포인트 기록은 직렬화 (같은 월 파티션 동시 쓰기 방지)
+        async with write_lock:
+            if bars:
+                await asyncio.to_thread(store.append, symbol, timeframe, _to_frame(bars))
+            checkpoint.add(*page)
+            await asyncio.to_thread(checkpoint.save)
+            fetched += len(bars)
+
+    results = await asyncio.gather(*(run_page(p) for p in pages), return_exceptions=True)
+    errors = [r for r in results if isinstance(r, Exception)]
+    if errors:
+        logger.error(f"[백필] {symbol} {timeframe}: {len(errors)}/{len(pages)}개 페이지 실패. 다시 실행하면 남은 구간부터 재개합니다.")
+        raise errors[0]
+
+    logger.info(f"[백필] {symbol} {timeframe}: {fetched}개 캔들 병합 완료 (요청 {limiter.total_requests}회)")
+    return fetched
@@ -0,0 +1,281 @@
+# src/core/batched_trading_env.py
+# -*- coding: utf-8 -*-
+"""
+배치 벡터 환경: TradingEnv N개를 상태 배열로 한 번에 실행
+
+- 목적: `DummyVecEnv([TradingEnv] * N)`은 환경마다 파이썬 루프로 `apply_action`/`compute_reward`를 호출하므로
+  환경 수에 비례해 느려집니다. N개 에피소드의 포지션/진입가/자산/스텝 인덱스를 배열로 두고
+  한 번의 NumPy 연산으로 액션, 수수료, 손익, 보상을 계산합니다.
+- 핵심 기능:
+  1) 같은 규칙: `TradingEnv.step`과 같은 순서로 일일 통계 → 액션 적용 → 자산/낙폭 → 보상 → 종료를 계산합니다
+     (`apply_action_batch`, `compute_reward_batch`).
+  2) 데이터 공유: 데이터 로드/피처 계산은 한 번만 하고 모든 환경이 같은 피처 행렬과 관측 제공자를 씁니다.
+  3) SB3 호환: `VecEnv` 인터페이스(자동 리셋, `terminal_observation`, `TimeLimit.truncated`, `episode` 통계)를 따르므로
+     `VecNormalize`로 감싸 PPO에 바로 넣을 수 있습니다.
+"""
+from __future__ import annotations
+import time
+import logging
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from stable_baselines3.common.vec_env import VecEnv
+from stable_baselines3.common.vec_env.base_vec_env import VecEnvIndices, VecEnvStepReturn
+
+from .trading_env import TradingEnv
+from .rl.action_schemes import apply_action_batch, unrealized_pnl_batch
+from .rl.reward_schemes import BATCH_POTENTIALS, POTENTIALS, compute_reward_batch
+
+logger = logging.getLogger(__name__)
+
+# 환경별 상태 배열 이름 (get_attr/set_attr로 환경 단위 조회/설정 가능)
+STATE_FIELDS = (
+    "equity", "cash", "entry_price", "size", "side", "leverage", "realized_pnl", "max_equity", "max_drawdown",
+    "pos_age_bars", "last_side", "current_day", "daily_realized_pnl", "daily_max_equity",
+    "i", "start_idx", "end_idx",
+)
+_NO_DAY = np.iinfo(np.int64).min   # current_day 초기값 (어떤 일자와도 다름)
+
+
+class BatchedTradingVecEnv(VecEnv):
+    """
+    TradingEnv 규칙을 N개 환경에 배열 연산으로 적용하는 SB3 `VecEnv`.
+
+    Args:
+        config: TradingEnv와 같은 환경 설정 딕셔너리.
+        n_envs: 환경 수.
+        template: 이미 데이터를 로드한 TradingEnv. 주어지면 데이터/피처를 다시 계산하지 않고 공유합니다.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, n_envs: int = 1, template: Optional[TradingEnv] = None):
+        self.template = template if template is not None else TradingEnv(config)
+        t = self.template
+        self.cfg = t.cfg
+        self.close_prices = t.close_prices
+        self.day_ordinal = t.day_ordinal
+        self.feature_columns = t.feature_columns
+        self.features_f64 = t.features_f64
+        self.obs_provider = t.obs_provider
+        self.N = len(t.close_prices)
+        self._step_minutes = t._step_minutes
+        self._rng = np.random.default_rng()
+        if self.cfg.reward_profile in POTENTIALS and self.cfg.reward_profile not in BATCH_POTENTIALS:
+            raise ValueError(f"보상 프로필 '{self.cfg.reward_profile}'의 배치 잠재력 함수가 없습니다 (BATCH_POTENTIALS).")
+
+        self.render_mode = None
+        self._state: Dict[str, np.ndarray] = {}
+        super().__init__(n_envs, t.observation_space, t.action_space)
+        self._actions: Optional[np.ndarray] = None
+        self._episode_return = np.zeros(n_envs)
+        self._episode_length = np.zeros(n_envs, dtype=np.int64)
+        self._episode_started = np.full(n_envs, time.time())
+        self._alloc_state()
+
+    # --- 상태 ---
+    def _alloc_state(self):
+        n = self.num_envs
+        for name in STATE_FIELDS:
+            dtype = np.int64 if name in ("side", "last_side", "pos_age_bars", "current_day", "i", "start_idx", "end_idx") else np.float64
+            self._state[name] = np.zeros(n, dtype=dtype)
+        self._last_phi = np.zeros(n)
+
+    def __getattr__(self, name: str):
+        state = self.__dict__.get("_state")
+        if state is not None and name in state:
+            return state[name]
+        raise AttributeError(name)
+
+    def _reset_envs(self, envs: np.ndarray) -> None:
+        """선택한 환경들의 에피소드 상태를 초기화합니다 (`TradingEnv.reset`과 같은 값)."""
+        s, cfg = self._state, self.cfg
+        min_start = cfg.window + 1
+        if cfg.random_start:
+            max_start = self.N - cfg.max_steps - 2
+            s["start_idx"][envs] = self._rng.integers(min_start, max(min_start + 1, max_start), size=len(envs))
+        else:
+            s["start_idx"][envs] = min_start
+        s["end_idx"][envs] = np.minimum(self.N - 2, s["start_idx"][envs] + cfg.max_steps)
+        s["i"][envs] = s["start_idx"][envs]
+        for name in ("equity", "cash", "max_equity", "daily_max_equity"):
+            s[name][envs] = float(cfg.initial_equity)
+        for name in ("entry_price", "size", "realized_pnl", "max_drawdown", "daily_realized_pnl"):
+            s[name][envs] = 0.0
+        for name in ("side", "pos_age_bars", "last_side"):
+            s[name][envs] = 0
+        s["leverage"][envs] = 1.0
+        s["current_day"][envs] = _NO_DAY
+        self._last_phi[envs] = 0.0
+        self._episode_return[envs] = 0.0
+        self._episode_length[envs] = 0
+        self._episode_started[envs] = time.time()
+
+    def _observe(self) -> np.ndarray:
+        s = self._state
+        return self.obs_provider.obs_batch(s["i"], s["side"], s["size"], s["equity"], s["leverage"],
+                                           self.cfg.initial_equity, self.cfg.max_leverage)
+
+    # --- VecEnv 인터페이스 ---
+    def reset(self) -> np.ndarray:
+        if self._seeds[0] is not None:
+            self._rng = np.random.default_rng(self._seeds[0])
+        self._reset_envs(np.arange(self.num_envs))
+        self._reset_seeds()
+        self._reset_options()
+        return self._observe()
+
+    def step_async(self, actions: np.ndarray) -> None:
+        self._actions = np.asarray(actions).reshape(self.num_envs)
+
+    def step_wait(self) -> VecEnvStepReturn:
+        s, cfg = self._state, self.cfg
+        i = s["i"]
+
+        # --- 1. 상태 업데이트 ---
+        price = self.close_prices[i]
+        previous_side = s["side"].copy()
+
+        # 일일 상태 초기화
+        day = self.day_ordinal[i]
+        new_day = day != s["current_day"]
+        s["current_day"][new_day] = day[new_day]
+        s["daily_realized_pnl"][new_day] = 0.0
+        s["daily_max_equity"][new_day] = s["equity"][new_day]
+
+        # --- 2. 액션 적용 및 포지션 변경 ---
+        realized, costs, flip = self._apply_actions(self._actions, price, previous_side)
+        s["daily_realized_pnl"] += realized
+
+        # --- 3. 자산 및 손익 재계산 ---
+        upnl = unrealized_pnl_batch(s["side"], s["size"], s["entry_price"], price)
+        s["equity"] = s["cash"] + upnl
+        s["max_equity"] = np.maximum(s["max_equity"], s["equity"])
+        s["daily_max_equity"] = np.maximum(s["daily_max_equity"], s["equity"])
+        drawdown = (s["max_equity"] - s["equity"]) / np.maximum(1e-9, s["max_equity"])
+        s["max_drawdown"] = np.maximum(s["max_drawdown"], drawdown)
+        daily_dd_pct = (s["daily_max_equity"] - s["equity"]) / np.maximum(1e-9, s["daily_max_equity"]) * 100.0
+
+        # --- 4. 보상 계산 ---
+        rewards = self._rewards(realized, costs, price, flip, daily_dd_pct)
+
+        # --- 5. 종료 조건 확인 ---
+        terminated = s["max_drawdown"] >= cfg.risk_dd_limit
+        truncated = i >= s["end_idx"]
+        s["i"] = i + 1
+        s["last_side"] = s["side"].copy()
+
+        obs = self._observe()
+        self._episode_return += rewards
+        self._episode_length += 1
+        dones = terminated | truncated
+        infos: List[Dict[str, Any]] = []
+        for env in range(self.num_envs):
+            reason = "drawdown_limit" if terminated[env] else "max_steps" if truncated[env] else ""
+            infos.append({
+                "upnl": float(upnl[env]), "realized_pnl": float(s["realized_pnl"][env]), "equity": float(s["equity"][env]),
+                "max_drawdown": float(s["max_drawdown"][env]), "termination_reason": reason,
+                "TimeLimit.truncated": bool(truncated[env] and not terminated[env]),
+            })
+        done_envs = np.flatnonzero(dones)
+        if done_envs.size:
+            now = time.time()
+            for env in done_envs:
+                infos[env]["terminal_observation"] = obs[env].copy()
+                infos[env]["episode"] = {"r": float(self._episode_return[env]), "l": int(self._episode_length[env]),
+                                         "t": round(now - self._episode_started[env], 6)}
+            self._reset_envs(done_envs)
+            obs[done_envs] = self.obs_provider.obs_batch(
+                s["i"][done_envs], s["side"][done_envs], s["size"][done_envs], s["equity"][done_envs],
+                s["leverage"][done_envs], cfg.initial_equity, cfg.max_leverage)
+        return obs, rewards.astype(np.float32), dones, infos
+
+    def _apply_actions(self, actions: np.ndarray, price: np.ndarray, previous_side: np.ndarray):
+        """`TradingEnv._apply_action_and_update_position`의 배열 버전. (실현 손익, 비용, flip)을 반환합니다."""
+        s = self._state
+        side, size, entry = s["side"], s["size"], s["entry_price"]
+        new_side, new_size, costs, exec_price = apply_action_batch(
+            actions, price, side, size, s["equity"], s["leverage"],
+            self.template.trade_cfg, target_notional_frac=self.cfg.target_notional_frac
+        )
+        flip = ((new_side != previous_side) & (previous_side != 0) & (new_side != 0)).astype(np.int64)
+        changed = (new_size != size) | (new_side != side)
+
+        closing = changed & (side != 0) & ((new_side != side) | (new_size == 0))
+        realized = np.where(closing, unrealized_pnl_batch(side, size, entry, exec_price), 0.0)
+        s["cash"] += realized
+        s["realized_pnl"] += realized
+
+        opening = changed & (new_side != 0) & (new_size > 0)
+        adding = opening & (side == new_side)
+        w1 = size
+        w2 = np.maximum(1e-9, new_size - size)
+        averaged = (entry * w1 + exec_price * w2) / np.maximum(1e-9, w1 + w2)
+        new_entry = np.where(adding, averaged, np.where(opening, exec_price, 0.0))
+        new_age = np.where(adding, s["pos_age_bars"] + 1, np.where(opening, 1, 0))
+        s["entry_price"] = np.where(changed, new_entry, entry)
+        s["pos_age_bars"] = np.where(changed, new_age, np.where(side != 0, s["pos_age_bars"] + 1, s["pos_age_bars"]))
+        s["side"] = np.where(changed, new_side, side)
+        s["size"] = np.where(changed, new_size, size)
+
+        s["cash"] -= costs
+        return realized, costs, flip
+
+    def _feature_column(self, rows: np.ndarray):
+        def column(name: str) -> np.ndarray:
+            j = self.feature_columns.get(name)
+            return self.features_f64[rows, j] if j is not None else np.full(len(rows), np.nan)
+        return column
+
+    def _rewards(self, realized: np.ndarray, costs: np.ndarray, price: np.ndarray, flip: np.ndarray,
+                 daily_dd_pct: np.ndarray) -> np.ndarray:
+        s, cfg = self._state, self.cfg
+        scale = max(1.0, cfg.initial_equity)
+        rewards, phi = compute_reward_batch(
+            cfg.reward_weights,
+            delta_equity=(s["equity"] - s["max_equity"]) / scale,
+            realized_pnl=realized / scale,
+            costs=costs / scale,
+            risk_penalty=s["max_drawdown"],
+            hold_penalty=np.where(s["side"] != 0, 0.0001, 0.0),
+            profile=cfg.reward_profile,
+            side=s["side"], pos_age_bars=s["pos_age_bars"], flip=flip,
+            feature_column=self._feature_column(s["i"]),
+            slippage_bps=cfg.slippage_bps, funding_rate_8h=cfg.funding_rate_8h, step_minutes=self._step_minutes,
+            daily_pnl_usdt=s["daily_realized_pnl"], daily_loss_limit_usdt=cfg.daily_loss_limit_usdt,
+            daily_drawdown_pct=daily_dd_pct,
+            last_potential=self._last_phi,
+        )
+        self._last_phi = phi
+        return rewards
+
+    def close(self) -> None:
+        return None
+
+    def get_attr(self, attr_name: str, indices: VecEnvIndices = None) -> List[Any]:
+        envs = list(self._get_indices(indices))
+        if attr_name in self._state:
+            return [self._state[attr_name][env].item() for env in envs]
+        return [getattr(self, attr_name)] * len(envs)
+
+    def set_attr(self, attr_name: str, value: Any, indices: VecEnvIndices = None) -> None:
+        envs = list(self._get_indices(indices))
+        if attr_name in self._state:
+            self._state[attr_name][envs] = value
+        else:
+            setattr(self, attr_name, value)
+
+    def env_method(self, method_name: str, *method_args, indices: VecEnvIndices = None, **method_kwargs) -> List[Any]:
+        envs = list(self._get_indices(indices))
+        return [getattr(self, method_name)(*method_args, **method_kwargs)] * len(envs)
+
+    def env_is_wrapped(self, wrapper_class: type, indices: VecEnvIndices = None) -> List[bool]:
+        return [False] * len(list(self._get_indices(indices)))
+
+    def set_start_indices(self, starts: Sequence[int]) -> np.ndarray:
+        """모든 환경의 에피소드를 주어진 시작 인덱스에서 다시 시작합니다 (평가/재현용). 관측을 반환합니다."""
+        envs = np.arange(self.num_envs)
+        self._reset_envs(envs)
+        s = self._state
+        s["start_idx"][:] = np.asarray(starts, dtype=np.int64)
+        s["end_idx"][:] = np.minimum(self.N - 2, s["start_idx"] + self.cfg.max_steps)
+        s["i"][:] = s["start_idx"]
+        return self._observe()
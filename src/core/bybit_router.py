@@ -13,11 +13,12 @@ import logging
 import asyncio
 from typing import Optional
 
-import ccxt.async_support as ccxt
-
+from .lazy_import import lazy_import
 from ..config.utils import get_api_keys
 from ..config.config_loader import load_all_configs
 
+ccxt = lazy_import("ccxt.async_support")
+
 # --- 싱글턴 인스턴스 및 비동기 잠금 ---
 _client_instance: Optional[ccxt.Exchange] = None
 _client_lock = asyncio.Lock()
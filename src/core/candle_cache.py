@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+실시간 엔진용 증분 캔들 캐시 (심볼 × 타임프레임)
+
+- 목적: 매 사이클 같은 캔들 100개를 다시 받고 데이터프레임을 새로 만드는 대신,
+  직전 사이클 이후의 캔들만 `since`로 요청하여 미리 할당된 배열 버퍼에 병합합니다.
+- 핵심 기능:
+  1) 증분 요청 계획: 키별 마지막 캔들 시각을 기억하고, 다음 요청의 `since`/`limit`을 계산합니다.
+     공백이 버퍼 길이를 넘으면 전체 재조회로 되돌립니다.
+  2) 배열 버퍼: `kline_stream.CandleRingBuffer`를 재사용하여 진행 중 캔들은 제자리 갱신, 새 캔들은 추가합니다.
+  3) 유니버스 정리: 선정 대상에서 빠진 심볼의 버퍼를 제거합니다.
+"""
+from __future__ import annotations
+import time
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .ohlcv_frame import OHLCVFrame
+from .ohlcv_integrity import timeframe_to_ms
+from .kline_stream import CandleRingBuffer
+
+logger = logging.getLogger(__name__)
+
+Key = Tuple[str, str]
+
+
+class CandleCache:
+    """
+    (심볼, 타임프레임)별 증분 캔들 캐시.
+
+    Args:
+        capacity (int): 키당 보관할 최대 캔들 수.
+    """
+
+    def __init__(self, capacity: int = 500):
+        self.capacity = int(capacity)
+        self._buffers: Dict[Key, CandleRingBuffer] = {}
+        self.full_fetches = 0
+        self.incremental_fetches = 0
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    def plan(self, symbol: str, timeframe: str, limit: int) -> Tuple[Optional[int], int]:
+        """
+        다음 요청의 (since, limit)을 반환합니다. since가 None이면 전체 조회입니다.
+        마지막 저장 캔들(진행 중이었을 수 있음)부터 다시 받아 마감 값으로 덮어씁니다.
+        """
+        buf = self._buffers.get((symbol, timeframe))
+        if buf is None or len(buf) < limit:
+            return None, limit
+        last_ts = buf.last_timestamp
+        now_ms = int(time.time() * 1000)
+        missed = (now_ms - last_ts) // timeframe_to_ms(timeframe) + 1
+        if missed >= limit:
+            return None, limit
+        return last_ts, int(missed) + 1
+
+    def update(self, symbol: str, timeframe: str, bars: List[list], full: bool) -> None:
+        """
+        거래소 응답(ccxt OHLCV 리스트)을 버퍼에 병합합니다. 전체 조회 결과면 버퍼를 새로 만듭니다.
+        """
+        key = (symbol, timeframe)
+        if full or key not in self._buffers:
+            self._buffers[key] = CandleRingBuffer(self.capacity)
+            self.full_fetches += 1
+        else:
+            self.incremental_fetches += 1
+        if bars:
+            self._buffers[key].extend(np.asarray(bars, dtype=np.float64))
+
+    def frame(self, symbol: str, timeframe: str, n: Optional[int] = None) -> Optional[OHLCVFrame]:
+        """최근 n개(기본: 전체) 캔들을 `OHLCVFrame`으로 반환합니다."""
+        buf = self._buffers.get((symbol, timeframe))
+        if buf is None or len(buf) == 0:
+            return None
+        return buf.to_ohlcv_frame(n)
+
+    def retain(self, symbols: Iterable[str]) -> int:
+        """주어진 심볼 외의 버퍼를 제거하고, 제거된 키 수를 반환합니다."""
+        keep = set(symbols)
+        stale = [key for key in self._buffers if key[0] not in keep]
+        for key in stale:
+            del self._buffers[key]
+        if stale:
+            logger.info(f"[캔들 캐시] 유니버스에서 빠진 {len(stale)}개 버퍼 제거")
+        return len(stale)
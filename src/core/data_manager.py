@@ -5,9 +5,11 @@ OHLCV 데이터 로딩, 캐싱, 전처리 파이프라인을 제공합니다.
 - 목적: OHLCV 데이터의 안정적인 로딩, 증분 캐싱, 전처리를 담당합니다.
 - 핵심 기능:
   1) CCXT 연동: `ccxt`를 사용하여 Bybit v5 API로부터 OHLCV 데이터를 비동기적으로 로드합니다.
-  2) 증분 캐싱: `data/` 폴더에 데이터를 캐싱하고, 마지막 데이터 이후의 최신 데이터만 API로 가져와 업데이트합니다.
+  2) 증분 캐싱: `data/store/`의 월 단위 Parquet 저장소(`ohlcv_store`)에 데이터를 캐싱하고, 마지막 데이터 이후의
+     최신 데이터만 API로 가져와 최신 월 파티션에만 추가합니다.
   3) 데이터 정규화: `pandas`를 사용하여 OHLCV 데이터를 정제하고, 타임스탬프를 UTC 기준으로 통일합니다.
   4) 미완성 캔들 제거: 데이터의 정합성을 위해 마지막 미완성 캔들을 정확히 식별하여 제거합니다.
+  5) 무결성 검사: 병합 결과의 누락 구간/중복/역순 타임스탬프를 벡터화 스캔으로 확인합니다 (`ohlcv_integrity`).
 """
 from __future__ import annotations
 import logging
@@ -16,11 +18,18 @@ from pathlib import Path
 from typing import Optional
 
 import pandas as pd
-import ccxt.async_support as ccxt
+
+from .lazy_import import lazy_import
+from .ohlcv_frame import OHLCVFrame
+from .ohlcv_store import OHLCVStore, safe_symbol
+from .ohlcv_integrity import scan_frame, timeframe_to_ms
+
+ccxt = lazy_import("ccxt.async_support")
 
 # --- 상수 정의 ---
 DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data"
 DATA_DIR.mkdir(exist_ok=True)
+STORE_DIR = DATA_DIR / "store"
 logger = logging.getLogger(__name__)
 
 # --- 헬퍼 함수 ---
@@ -28,49 +37,70 @@ def _interval_to_timedelta(interval: str) -> pd.Timedelta:
     """'1m', '5m', '1h', '1d' 같은 인터벌 문자열을 Timedelta 객체로 변환합니다."""
     return pd.to_timedelta(interval)
 
-def _normalize_ohlcv_df(df: pd.DataFrame) -> pd.DataFrame:
-    """CCXT로부터 받은 OHLCV 리스트를 표준 포맷의 데이터프레임으로 정규화합니다."""
-    if df.empty:
-        return pd.DataFrame(columns=['open', 'high', 'low', 'close', 'volume']).set_index(pd.to_datetime([]))
-    
-    df.columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
-    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms', utc=True)
-    
-    for col in ['open', 'high', 'low', 'close', 'volume']:
-        df[col] = pd.to_numeric(df[col], errors='coerce')
-        
-    df.set_index('timestamp', inplace=True)
-    df.sort_index(inplace=True)
+def _normalize_ohlcv_df(ohlcv_list: list) -> pd.DataFrame:
+    """CCXT로부터 받은 OHLCV 리스트를 표준 포맷(UTC DatetimeIndex)의 데이터프레임으로 정규화합니다."""
+    df = OHLCVFrame.from_ccxt(ohlcv_list).to_pandas(tz='UTC')
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index()
     return df
 
 # --- 캐시 관리 ---
+_store = OHLCVStore(STORE_DIR)
+
+def get_ohlcv_store() -> OHLCVStore:
+    """data_manager가 사용하는 공용 OHLCV 저장소 인스턴스를 반환합니다."""
+    return _store
+
 def _get_cache_path(symbol: str, interval: str) -> Path:
-    """캐시 파일 경로를 생성합니다."""
-    safe_symbol = symbol.replace('/', '_').replace(':', '_')
-    return DATA_DIR / f"{safe_symbol}_{interval}.csv"
+    """(레거시) CSV 캐시 파일 경로를 생성합니다. 저장소 이전 용도로만 사용됩니다."""
+    return DATA_DIR / f"{safe_symbol(symbol)}_{interval}.csv"
 
-async def _read_from_cache(path: Path) -> Optional[pd.DataFrame]:
-    """캐시에서 데이터를 비동기적으로 읽습니다."""
-    if not path.exists():
+def _migrate_legacy_csv(symbol: str, interval: str) -> None:
+    """저장소가 비어 있고 레거시 CSV 캐시가 있으면 한 번만 저장소로 가져옵니다."""
+    legacy_path = _get_cache_path(symbol, interval)
+    if legacy_path.exists() and not _store.exists(symbol, interval):
+        _store.import_csv(legacy_path, symbol, interval)
+
+async def _last_cached_timestamp(symbol: str, interval: str) -> Optional[pd.Timestamp]:
+    """저장소의 마지막 캔들 시각을 반환합니다. 최신 월 파티션의 타임스탬프 컬럼만 읽습니다."""
+    try:
+        await asyncio.to_thread(_migrate_legacy_csv, symbol, interval)
+        return await asyncio.to_thread(_store.last_timestamp, symbol, interval)
+    except Exception as e:
+        logger.warning(f"[데이터] 저장소 읽기 오류: {e}")
         return None
+
+async def _read_tail_from_cache(symbol: str, interval: str, n: int) -> Optional[pd.DataFrame]:
+    """저장소에서 마지막 n개의 캔들만 읽습니다 (최신 파티션부터 필요한 만큼)."""
     try:
-        # 동기 I/O를 별도 스레드에서 실행하여 이벤트 루프 차단 방지
-        df = await asyncio.to_thread(pd.read_csv, path, index_col='timestamp', parse_dates=True)
-        df.index = df.index.tz_convert('UTC') # 시간대를 UTC로 통일
-        logger.info(f"[데이터] 캐시에서 {path.name} 로드 ({len(df)}개 행)")
-        return df if not df.empty else None
+        df = await asyncio.to_thread(_store.tail, symbol, interval, n)
+        return None if df.empty else df
     except Exception as e:
-        logger.warning(f"[데이터] 캐시 파일 읽기 오류: {e}")
+        logger.warning(f"[데이터] 저장소 읽기 오류: {e}")
         return None
 
-async def _write_to_cache(path: Path, df: pd.DataFrame):
-    """데이터를 캐시에 비동기적으로 씁니다."""
+async def _cached_or_empty(symbol: str, interval: str, limit: int, since: Optional[int]) -> pd.DataFrame:
+    """API에서 새 캔들을 얻지 못했을 때 저장소의 최근 limit개(없으면 빈 프레임)를 반환합니다."""
+    cached_df = await _read_tail_from_cache(symbol, interval, limit) if since is not None else None
+    return cached_df if cached_df is not None else pd.DataFrame()
+
+async def _write_to_cache(symbol: str, interval: str, df: pd.DataFrame):
+    """새 데이터를 저장소에 비동기적으로 추가합니다. 해당 월 파티션만 다시 씁니다."""
     try:
         # 동기 I/O를 별도 스레드에서 실행
-        await asyncio.to_thread(df.to_csv, path)
-        logger.info(f"[데이터] {path.name} 캐시 저장 ({len(df)}개 행)")
+        await asyncio.to_thread(_store.append, symbol, interval, df)
+        logger.info(f"[데이터] {symbol} ({interval}) 저장소 추가 ({len(df)}개 행)")
     except Exception as e:
-        logger.error(f"[데이터] 캐시 파일 쓰기 오류: {e}")
+        logger.error(f"[데이터] 저장소 쓰기 오류: {e}")
+
+def _check_integrity(symbol: str, interval: str, df: pd.DataFrame) -> None:
+    """병합된 캔들의 갭/중복/역순 여부를 검사하여 문제가 있으면 경고를 남깁니다."""
+    try:
+        report = scan_frame(df, timeframe_to_ms(interval))
+    except ValueError:
+        return
+    if not report.is_clean:
+        logger.warning(f"[데이터] {symbol} ({interval}) 무결성 경고: {report.summary()}")
 
 # --- 데이터 로딩 메인 함수 ---
 async def fetch_ohlcv(
@@ -83,17 +113,15 @@ async def fetch_ohlcv(
 ) -> pd.DataFrame:
     """
     Bybit API를 통해 K-line(OHLCV) 데이터를 가져옵니다.
-    - 캐시를 우선적으로 읽고, 부족한 데이터는 API를 통해 증분 업데이트합니다.
+    - 저장소의 마지막 캔들 시각 이후만 API로 증분 업데이트합니다 (전체 히스토리를 읽지 않음).
     - 마지막 미완성 캔들을 자동으로 제거하여 데이터 정합성을 보장합니다.
+    - 캐시 사용 시 저장소 + 새 캔들 중 최근 limit개를 반환합니다.
     """
-    cache_path = _get_cache_path(symbol, interval)
     since = None
-    cached_df = None
 
     if use_cache:
-        cached_df = await _read_from_cache(cache_path)
-        if cached_df is not None and not cached_df.empty:
-            last_timestamp = cached_df.index[-1]
+        last_timestamp = await _last_cached_timestamp(symbol, interval)
+        if last_timestamp is not None:
             since = int(last_timestamp.timestamp() * 1000)
             logger.info(f"[데이터] 캐시 발견. {last_timestamp} 이후 데이터부터 증분 로딩합니다.")
 
@@ -104,31 +132,34 @@ async def fetch_ohlcv(
         
         if not ohlcv_list:
             logger.info("[데이터] API로부터 새로운 데이터를 가져오지 못했습니다. 캐시된 데이터를 반환합니다.")
-            return cached_df if cached_df is not None else pd.DataFrame()
+            return await _cached_or_empty(symbol, interval, limit, since)
 
-        new_df = _normalize_ohlcv_df(pd.DataFrame(ohlcv_list))
-
-        # 캐시 데이터와 새로운 데이터 병합
-        if cached_df is not None:
-            df = pd.concat([cached_df, new_df])
-            # 중복된 인덱스(타임스탬프)는 최신 데이터로 유지
-            df = df[~df.index.duplicated(keep='last')]
-            df.sort_index(inplace=True)
-        else:
-            df = new_df
+        new_df = _normalize_ohlcv_df(ohlcv_list)
 
         # 미완성 캔들 제거 로직 개선
-        if drop_incomplete and not df.empty:
-            last_time = df.index[-1]
+        if drop_incomplete and not new_df.empty:
+            last_time = new_df.index[-1]
             interval_td = _interval_to_timedelta(interval)
             # 마지막 캔들의 예상 종료 시간이 현재보다 미래이면 미완성으로 간주
             if last_time + interval_td > pd.Timestamp.utcnow():
-                df = df.iloc[:-1]
+                new_df = new_df.iloc[:-1]
                 logger.info("[데이터] 마지막 미완성 캔들 1개를 제거했습니다.")
 
-        if use_cache and not df.empty:
-            await _write_to_cache(cache_path, df)
+        # 새 캔들만 저장소에 추가 (전체 히스토리를 다시 쓰지 않음)
+        if use_cache and not new_df.empty:
+            await _write_to_cache(symbol, interval, new_df)
+
+        # 저장소의 최근 구간과 새로운 데이터 병합 (저장소 쓰기가 실패해도 새 캔들은 포함)
+        cached_df = await _read_tail_from_cache(symbol, interval, limit) if since is not None else None
+        if cached_df is not None:
+            df = pd.concat([cached_df, new_df])
+            # 중복된 인덱스(타임스탬프)는 최신 데이터로 유지
+            df = df[~df.index.duplicated(keep='last')]
+            df = df.sort_index().iloc[-limit:]
+        else:
+            df = new_df
 
+        _check_integrity(symbol, interval, df)
         return df
 
     except (ccxt.NetworkError, ccxt.ExchangeError) as e:
@@ -137,4 +168,4 @@ async def fetch_ohlcv(
         logger.error(f"[데이터] K-line 데이터 로딩 중 예외 발생: {e}", exc_info=True)
     
     # 오류 발생 시 캐시된 데이터가 있으면 그것이라도 반환
-    return cached_df if cached_df is not None else pd.DataFrame()
\ No newline at end of file
+    return await _cached_or_empty(symbol, interval, limit, since)
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""
+오프라인 훈련 데이터셋 레지스트리
+
+- 목적: 훈련/평가 환경이 매번 거래소에서 최신 캔들을 받으면 실행마다 데이터가 달라 재현이 안 되고 시작 시간이 네트워크에
+  묶입니다. 이름 붙인 데이터셋(심볼, 타임프레임, 기간)을 한 번 로컬에 확정해 두고, 이후에는 이름으로 로컬에서만 읽습니다.
+- 핵심 기능:
+  1) 확정(materialize): 거래소 백필(`backfill` → `ohlcv_store`) 또는 주어진 데이터프레임을 메모리 맵 데이터셋
+     (`memmap_dataset` 형식)으로 `<root>/<이름>/`에 기록합니다. 같은 이름/명세가 이미 있으면 네트워크 없이 그대로 사용합니다.
+  2) 식별: 저장된 캔들의 콘텐츠 해시(`ohlcv_integrity.content_hash`)를 레지스트리(`registry.json`)에 기록하고 `verify`로 확인합니다.
+  3) 분할: `LOOKBACK_CONFIG`(`src/config/data_windows.py`)의 일수로 끝에서부터 test(oos_days) → validation(wf_days)
+     → train(core_days) 행 구간을 미리 계산해 둡니다.
+  4) 로드: `load(이름, 분할, warmup_bars)`는 분할 구간 앞에 지표/윈도우 워밍업용 캔들을 붙여 반환합니다 (로컬 전용).
+"""
+from __future__ import annotations
+import os
+import re
+import json
+import shutil
+import asyncio
+import logging
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from ..config.data_windows import lookback_for
+from .memmap_dataset import MemmapDataset, TIMESTAMP_COLUMN, is_memmap_dataset, write_memmap_dataset
+from .ohlcv_frame import OHLCVFrame
+from .ohlcv_integrity import content_hash
+
+logger = logging.getLogger(__name__)
+
+# --- 상수 정의 ---
+DATASET_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "datasets"
+REGISTRY_FILENAME = "registry.json"
+SPLITS = ("train", "validation", "test")
+_DAY_MS = 86_400_000
+_NAME_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """데이터셋 명세. start/end는 UTC 기준 시각 문자열이며 end는 포함하지 않습니다 (None이면 마지막으로 마감된 캔들까지)."""
+    name: str
+    symbol: str
+    timeframe: str
+    start: str
+    end: Optional[str] = None
+
+
+def compute_splits(timestamp_ms: np.ndarray, timeframe: str) -> Dict[str, Tuple[int, int]]:
+    """
+    `LOOKBACK_CONFIG` 일수로 끝에서부터 test → validation → train 행 구간 [시작, 끝)을 계산합니다.
+    데이터가 짧으면 앞쪽 분할이 줄어들거나 비게 됩니다.
+    """
+    lookback = lookback_for(timeframe)
+    n = len(timestamp_ms)
+    if n == 0:
+        return {split: (0, 0) for split in SPLITS}
+    splits: Dict[str, Tuple[int, int]] = {}
+    hi = n
+    boundary_ms = int(timestamp_ms[-1]) + 1
+    for split, days in (("test", lookback["oos_days"]), ("validation", lookback["wf_days"]), ("train", lookback["core_days"])):
+        boundary_ms -= days * _DAY_MS
+        lo = min(hi, int(np.searchsorted(timestamp_ms, boundary_ms, side="left")))
+        splits[split] = (lo, hi)
+        hi = lo
+    return {split: splits[split] for split in SPLITS}
+
+
+class DatasetRegistry:
+    """
+    이름 → 로컬 데이터셋 레지스트리.
+
+    Args:
+        root: 데이터셋 디렉토리들과 `registry.json`이 있는 루트.
+    """
+
+    def __init__(self, root: Union[str, Path] = DATASET_DIR):
+        self.root = Path(root)
+
+    # --- 레지스트리 파일 ---
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.root / REGISTRY_FILENAME, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / f"{REGISTRY_FILENAME}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entries, f, indent=2, ensure_ascii=False)
+        os.replace(tmp, self.root / REGISTRY_FILENAME)
+
+    def names(self) -> List[str]:
+        return sorted(self._read())
+
+    def entry(self, name: str) -> Dict[str, Any]:
+        """레지스트리 항목 (명세, 해시, 행 수, 분할). 없으면 KeyError."""
+        entries = self._read()
+        if name not in entries:
+            raise KeyError(f"등록되지 않은 데이터셋입니다: {name} (보유: {sorted(entries)}). "
+                           f"먼저 `python tools/materialize_dataset.py {name} <symbol> <timeframe> --start ...`로 확정하세요.")
+        return entries[name]
+
+    def path_for(self, name: str) -> Path:
+        return self.root / name
+
+    # --- 확정 ---
+    def materialize(self, spec: DatasetSpec, source: Optional[pd.DataFrame] = None, force: bool = False) -> Dict[str, Any]:
+        """
+        데이터셋을 로컬에 확정하고 레지스트리 항목을 반환합니다.
+
+        Args:
+            spec: 데이터셋 명세.
+            source: OHLCV 데이터프레임 (DatetimeIndex). 없으면 거래소에서 백필합니다.
+            force: 이미 있어도 다시 만듭니다. 아니면 같은 명세의 기존 데이터셋을 그대로 반환합니다.
+        """
+        if not _NAME_PATTERN.match(spec.name):
+            raise ValueError(f"데이터셋 이름에는 영문/숫자/'_.-'만 쓸 수 있습니다: {spec.name!r}")
+        entries = self._read()
+        existing = entries.get(spec.name)
+        if existing is not None and not force:
+            if existing["spec"] != asdict(spec):
+                raise ValueError(f"같은 이름의 다른 데이터셋이 있습니다: {spec.name} ({existing['spec']}). force=True로 다시 만드세요.")
+            if is_memmap_dataset(self.path_for(spec.name)):
+                return existing
+
+        df = source if source is not None else _fetch_from_exchange(spec)
+        df = _select_range(df, spec)
+        if df.empty:
+            raise RuntimeError(f"데이터셋 '{spec.name}'에 담을 캔들이 없습니다 ({spec.symbol} {spec.timeframe} {spec.start}~{spec.end}).")
+
+        # 임시 디렉토리에 기록한 뒤 교체 (중단되어도 기존 데이터셋이 반쯤 덮이지 않음)
+        target = self.path_for(spec.name)
+        tmp = self.root / f".{spec.name}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        write_memmap_dataset(tmp, {spec.symbol: OHLCVFrame.from_pandas(df)}, source=f"{spec.symbol} {spec.timeframe}")
+        shutil.rmtree(target, ignore_errors=True)
+        os.replace(tmp, target)
+
+        # 해시와 분할은 저장된 값(float32) 기준으로 계산
+        dataset = MemmapDataset(target)
+        stored = dataset.to_frame(spec.symbol)
+        timestamp_ms = np.asarray(dataset.load_slice(spec.symbol)[TIMESTAMP_COLUMN])
+        splits = compute_splits(timestamp_ms, spec.timeframe)
+        entry = {
+            "spec": asdict(spec),
+            "content_hash": content_hash(stored),
+            "rows": int(len(stored)),
+            "start_ms": int(timestamp_ms[0]),
+            "end_ms": int(timestamp_ms[-1]),
+            "splits": {split: list(bounds) for split, bounds in splits.items()},
+            "created_at": pd.Timestamp.now(tz="UTC").isoformat(),
+        }
+        min_bars = lookback_for(spec.timeframe)["min_bars"]
+        train_rows = splits["train"][1] - splits["train"][0]
+        if train_rows < min_bars:
+            logger.warning(f"[데이터셋] {spec.name}: train 분할이 {train_rows}행으로 권장 최소치({min_bars})보다 짧습니다.")
+        entries = self._read()
+        entries[spec.name] = entry
+        self._write(entries)
+        logger.info(f"[데이터셋] {spec.name} 확정: {entry['rows']}행, 해시 {entry['content_hash'][:12]}, "
+                    + ", ".join(f"{s}={b[1] - b[0]}" for s, b in entry["splits"].items()))
+        return entry
+
+    # --- 로드 ---
+    def load(self, name: str, split: Optional[str] = None, warmup_bars: int = 0) -> pd.DataFrame:
+        """
+        로컬 데이터셋(또는 분할)을 UTC DatetimeIndex OHLCV 데이터프레임으로 반환합니다. 네트워크를 사용하지 않습니다.
+
+        Args:
+            split: "train" / "validation" / "test". None이면 전체.
+            warmup_bars: 분할 앞에 붙일 이전 캔들 수 (지표 및 관측 윈도우 워밍업용).
+        """
+        entry = self.entry(name)
+        dataset = MemmapDataset(self.path_for(name))
+        symbol = entry["spec"]["symbol"]
+        if split is None:
+            return dataset.to_frame(symbol)
+        if split not in SPLITS:
+            raise ValueError(f"알 수 없는 분할입니다: {split} (가능: {SPLITS})")
+        lo, hi = entry["splits"][split]
+        if hi <= lo:
+            raise RuntimeError(f"데이터셋 '{name}'의 {split} 분할이 비어 있습니다.")
+        timestamp_ms = dataset.load_slice(symbol)[TIMESTAMP_COLUMN]
+        start = max(0, lo - max(0, int(warmup_bars)))
+        return dataset.to_frame(symbol, int(timestamp_ms[start]), int(timestamp_ms[hi - 1]))
+
+    def verify(self, name: str) -> bool:
+        """저장된 캔들의 콘텐츠 해시가 레지스트리 기록과 같은지 확인합니다."""
+        return content_hash(self.load(name)) == self.entry(name)["content_hash"]
+
+
+# --- 헬퍼 함수 ---
+def _select_range(df: pd.DataFrame, spec: DatasetSpec) -> pd.DataFrame:
+    """[start, end) 구간, 시간순 정렬, 중복 제거한 OHLCV를 UTC 인덱스로 반환합니다."""
+    index = pd.DatetimeIndex(df.index)
+    index = index.tz_localize("UTC") if index.tz is None else index.tz_convert("UTC")
+    df = df.set_axis(index)
+    df = df[~df.index.duplicated(keep="last")].sort_index()
+    mask = df.index >= pd.Timestamp(spec.start, tz="UTC")
+    if spec.end is not None:
+        mask &= df.index < pd.Timestamp(spec.end, tz="UTC")
+    return df.loc[mask]
+
+
+def _fetch_from_exchange(spec: DatasetSpec) -> pd.DataFrame:
+    """로컬 OHLCV 저장소에 없는 구간만 거래소에서 백필한 뒤 저장소에서 읽습니다 (확정 시에만 네트워크 사용)."""
+    from .backfill import backfill_ohlcv, missing_ranges
+    from .bybit_router import get_bybit_client
+    from .data_manager import get_ohlcv_store
+
+    store = get_ohlcv_store()
+    start = pd.Timestamp(spec.start, tz="UTC")
+    end = pd.Timestamp(spec.end, tz="UTC") if spec.end is not None else None
+
+    async def run() -> None:
+        client = None
+        try:
+            if missing_ranges(store, spec.symbol, spec.timeframe, start, end):
+                client = await get_bybit_client()
+                await backfill_ohlcv(client, store, spec.symbol, spec.timeframe, start, end)
+        finally:
+            if client:
+                await client.close()
+
+    asyncio.run(run())
+    end_inclusive = end - pd.Timedelta(milliseconds=1) if end is not None else None
+    return store.read(spec.symbol, spec.timeframe, start, end_inclusive)
+
+
+# --- 싱글톤 ---
+_dataset_registry: Optional[DatasetRegistry] = None
+
+
+def get_dataset_registry() -> DatasetRegistry:
+    global _dataset_registry
+    if _dataset_registry is None:
+        _dataset_registry = DatasetRegistry()
+    return _dataset_registry
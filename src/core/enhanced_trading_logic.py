@@ -8,6 +8,7 @@
   2) 시장 상황 인식: 불안정한 시장에서 안전한 심볼 우선 선택
   3) AI 추론 결과 후처리: 신뢰도 기반 필터링 및 리스크 조절
   4) 성과 추적: 과거 거래 결과를 바탕으로 한 학습 시스템
+  5) 행렬 채점: 심볼 점수를 (심볼 × 지표) 행렬로 한 번에 계산하고 `symbol_ranking`으로 가중합/상위 N을 선택
 """
 from __future__ import annotations
 import logging
@@ -19,8 +20,33 @@ import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 
+from .symbol_ranking import top_n_indices, weighted_scores
+
 logger = logging.getLogger(__name__)
 
+# --- 심볼 점수 행렬 ---
+METRIC_COLUMNS = ("volume", "volatility", "liquidity", "momentum", "risk", "market_cap")
+# 종합 점수 가중치 (|모멘텀|, 100 - 시총순위로 변환한 열에 적용)
+TOTAL_SCORE_WEIGHTS = {"volume": 1.0, "volatility": 1.0, "liquidity": 1.0, "momentum": 1.0, "risk": -1.0, "market_cap": 0.1}
+_MAJOR_SYMBOLS = ('BTC/USDT:USDT', 'ETH/USDT:USDT', 'BTCUSDT', 'ETHUSDT')
+
+
+def _ticker(data: Any) -> Dict:
+    ticker = data.get('ticker') if isinstance(data, dict) else None
+    return ticker if isinstance(ticker, dict) else {}
+
+
+def _float_column(rows: List[Any], key: str) -> np.ndarray:
+    """딕셔너리 목록에서 key 값을 float 배열로 모읍니다 (없으면 0, 숫자가 아니면 NaN)."""
+    out = np.empty(len(rows))
+    for i, data in enumerate(rows):
+        value = data.get(key, 0) if isinstance(data, dict) else np.nan
+        try:
+            out[i] = float(value)
+        except (TypeError, ValueError):
+            out[i] = np.nan
+    return out
+
 @dataclass
 class SymbolMetrics:
     """심볼별 평가 지표"""
@@ -59,116 +85,91 @@ class SmartSymbolSelector:
             "volatile": {"volume": 0.2, "volatility": 0.15, "liquidity": 0.35, "momentum": 0.2, "risk": 0.1},
             "trending": {"volume": 0.25, "volatility": 0.3, "liquidity": 0.2, "momentum": 0.25, "risk": 0.0}
         }
+        # 종합 점수 가중치 (METRIC_COLUMNS 기준)
+        self.score_weights = dict(TOTAL_SCORE_WEIGHTS)
         
-    def analyze_symbols(self, market_data: Dict[str, Any]) -> List[SymbolMetrics]:
-        """시장 데이터를 분석하여 심볼별 메트릭 생성"""
-        symbol_metrics = []
-        
-        # 전체 시장 통계 계산
-        volumes = [data.get('volume_usd', 0) for data in market_data.values()]
-        price_changes = [data.get('price_change_pct', 0) for data in market_data.values()]
-        
-        if not volumes or not price_changes:
-            return symbol_metrics
-            
-        volume_median = np.median(volumes)
-        volume_std = np.std(volumes)
-        volatility_median = np.median([abs(pc) for pc in price_changes])
-        
-        for symbol, data in market_data.items():
-            try:
-                # 기본 지표 추출
-                volume_usd = data.get('volume_usd', 0)
-                price_change_pct = data.get('price_change_pct', 0)
-                last_price = data.get('last_price', 0)
-                
-                # 점수 계산
-                volume_score = min(100, (volume_usd / (volume_median + 1e-12)) * 50)
-                volatility_score = min(100, (abs(price_change_pct) / (volatility_median + 1e-12)) * 50)
-                liquidity_score = self._calculate_liquidity_score(data)
-                momentum_score = max(-100, min(100, price_change_pct * 10))  # -100~100 범위
-                risk_score = self._calculate_risk_score(symbol, data)
-                
-                # 시가총액 기반 순위 (주요 코인 우선)
-                market_cap_rank = self._get_market_cap_rank(symbol)
-                
-                # 종합 점수 계산
-                total_score = (
-                    volume_score + volatility_score + liquidity_score + 
-                    abs(momentum_score) - risk_score
-                ) + (100 - market_cap_rank) * 0.1  # 시가총액 보너스
-                
-                metrics = SymbolMetrics(
-                    symbol=symbol,
-                    volume_score=volume_score,
-                    volatility_score=volatility_score,
-                    liquidity_score=liquidity_score,
-                    momentum_score=momentum_score,
-                    risk_score=risk_score,
-                    total_score=total_score,
-                    market_cap_rank=market_cap_rank
-                )
-                
-                symbol_metrics.append(metrics)
-                
-            except Exception as e:
-                logger.warning(f"심볼 {symbol} 분석 중 오류: {e}")
+    def _metrics_matrix(self, market_data: Dict[str, Any]) -> Tuple[List[str], np.ndarray]:
+        """
+        심볼별 점수를 (심볼 × METRIC_COLUMNS) 행렬로 한 번에 계산합니다.
+        숫자가 아닌 값이 있는 심볼의 행은 NaN이 되어 종합 점수가 -inf(선정 제외)가 됩니다.
+        """
+        symbols = list(market_data)
+        rows = list(market_data.values())
+        volume_usd = _float_column(rows, 'volume_usd')
+        price_change_pct = _float_column(rows, 'price_change_pct')
+        bid = _float_column([_ticker(d) for d in rows], 'bid')
+        ask = _float_column([_ticker(d) for d in rows], 'ask')
+
+        # 전체 시장 통계
+        volume_median = np.nanmedian(volume_usd)
+        volatility_median = np.nanmedian(np.abs(price_change_pct))
+        abs_change = np.abs(price_change_pct)
+
+        volume_score = np.minimum(100, (volume_usd / (volume_median + 1e-12)) * 50)
+        volatility_score = np.minimum(100, (abs_change / (volatility_median + 1e-12)) * 50)
+
+        # 유동성: 스프레드가 낮을수록 높은 점수, 호가가 없으면 50
+        has_quote = (bid > 0) & (ask > 0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            spread = (ask - bid) / ((ask + bid) / 2) * 100
+        liquidity_score = np.where(has_quote, np.minimum(100, np.maximum(0, 100 - spread * 50)), 50.0)
+
+        momentum_score = np.clip(price_change_pct * 10, -100, 100)
+
+        # 리스크: 가격 변동 + 과거 승률 + 알트코인 가산 (최대 100)
+        risk_score = np.select([abs_change > 10, abs_change > 5, abs_change > 2], [40.0, 20.0, 10.0], 0.0)
+        risk_score[np.isnan(abs_change)] = np.nan
+        positions = {symbol: i for i, symbol in enumerate(symbols)}
+        for symbol, perf in self.symbol_performance.items():
+            i = positions.get(symbol)
+            total = perf["wins"] + perf["losses"]
+            if i is None or total == 0:
                 continue
-        
-        # 종합 점수순으로 정렬
-        symbol_metrics.sort(key=lambda x: x.total_score, reverse=True)
-        return symbol_metrics
-    
-    def _calculate_liquidity_score(self, data: Dict) -> float:
-        """유동성 점수 계산"""
-        try:
-            ticker = data.get('ticker', {})
-            bid = ticker.get('bid', 0)
-            ask = ticker.get('ask', 0)
-            
-            if bid > 0 and ask > 0:
-                spread = (ask - bid) / ((ask + bid) / 2) * 100
-                # 스프레드가 낮을수록 높은 점수
-                liquidity_score = max(0, 100 - spread * 50)
-            else:
-                liquidity_score = 50  # 기본값
-                
-            return min(100, liquidity_score)
-            
-        except Exception:
-            return 50
-    
-    def _calculate_risk_score(self, symbol: str, data: Dict) -> float:
-        """리스크 점수 계산 (낮을수록 안전)"""
-        try:
-            risk_score = 0
-            
-            # 가격 변동성 리스크
-            price_change = abs(data.get('price_change_pct', 0))
-            if price_change > 10:
-                risk_score += 40
-            elif price_change > 5:
-                risk_score += 20
-            elif price_change > 2:
-                risk_score += 10
-            
-            # 과거 성과 기반 리스크
-            perf = self.symbol_performance[symbol]
-            if perf["wins"] + perf["losses"] > 0:
-                win_rate = perf["wins"] / (perf["wins"] + perf["losses"])
-                if win_rate < 0.3:
-                    risk_score += 30
-                elif win_rate < 0.5:
-                    risk_score += 15
-            
-            # 알트코인 리스크 (BTC, ETH 이외)
-            if symbol not in ['BTC/USDT:USDT', 'ETH/USDT:USDT', 'BTCUSDT', 'ETHUSDT']:
-                risk_score += 10
-            
-            return min(100, risk_score)
-            
-        except Exception:
-            return 50
+            win_rate = perf["wins"] / total
+            if win_rate < 0.3:
+                risk_score[i] += 30
+            elif win_rate < 0.5:
+                risk_score[i] += 15
+        risk_score += np.where(np.isin(symbols, _MAJOR_SYMBOLS), 0.0, 10.0)
+        risk_score = np.minimum(100, risk_score)
+
+        market_cap_rank = np.array([self._get_market_cap_rank(symbol) for symbol in symbols], dtype=np.float64)
+
+        matrix = np.column_stack([volume_score, volatility_score, liquidity_score,
+                                  momentum_score, risk_score, market_cap_rank])
+        return symbols, matrix
+
+    def _total_scores(self, matrix: np.ndarray) -> np.ndarray:
+        """종합 점수 (기본 가중치: 거래량 + 변동성 + 유동성 + |모멘텀| - 리스크 + (100 - 시총순위) × 0.1)"""
+        features = matrix.copy()
+        features[:, 3] = np.abs(features[:, 3])
+        features[:, 5] = 100 - features[:, 5]
+        return weighted_scores(features, self.score_weights, METRIC_COLUMNS)
+
+    @staticmethod
+    def _to_metrics(symbol: str, row: np.ndarray, total_score: float) -> SymbolMetrics:
+        return SymbolMetrics(
+            symbol=symbol,
+            volume_score=float(row[0]),
+            volatility_score=float(row[1]),
+            liquidity_score=float(row[2]),
+            momentum_score=float(row[3]),
+            risk_score=float(row[4]),
+            total_score=float(total_score),
+            market_cap_rank=int(row[5])
+        )
+
+    def analyze_symbols(self, market_data: Dict[str, Any]) -> List[SymbolMetrics]:
+        """시장 데이터를 분석하여 심볼별 메트릭 생성 (종합 점수 내림차순)"""
+        if not market_data:
+            return []
+        symbols, matrix = self._metrics_matrix(market_data)
+        scores = self._total_scores(matrix)
+        order = top_n_indices(scores, len(symbols))
+        skipped = len(symbols) - len(order)
+        if skipped:
+            logger.warning(f"숫자가 아닌 시장 데이터로 {skipped}개 심볼을 분석에서 제외했습니다.")
+        return [self._to_metrics(symbols[i], matrix[i], scores[i]) for i in order]
     
     def _get_market_cap_rank(self, symbol: str) -> int:
         """시가총액 기반 순위 (간소화된 버전)"""
@@ -193,46 +194,43 @@ class SmartSymbolSelector:
                           top_n: int = 3,
                           market_condition: str = "stable") -> List[str]:
         """시장 상황을 고려한 상위 심볼 선정"""
-        
-        # 심볼 분석
-        symbol_metrics = self.analyze_symbols(market_data)
-        
-        if not symbol_metrics:
+        if not market_data:
             return []
-        
-        # 시장 상황별 필터링
-        filtered_symbols = self._filter_by_market_condition(symbol_metrics, market_condition)
-        
-        # 상위 N개 선정
-        top_symbols = [metrics.symbol for metrics in filtered_symbols[:top_n]]
-        
+
+        # 심볼 분석 (행렬) → 시장 상황별 마스크 → 상위 N개 부분 정렬
+        symbols, matrix = self._metrics_matrix(market_data)
+        scores = self._total_scores(matrix)
+        top = top_n_indices(scores, top_n, self._condition_mask(matrix, market_condition))
+        top_symbols = [symbols[i] for i in top]
+
         logger.info(f"[{market_condition} 시장] 선정된 상위 {len(top_symbols)}개 심볼: {top_symbols}")
-        
+
         # 선정 이유 로깅
-        for i, metrics in enumerate(filtered_symbols[:top_n]):
-            logger.info(f"  {i+1}. {metrics.symbol}: 종합점수 {metrics.total_score:.1f} "
+        for rank, i in enumerate(top):
+            metrics = self._to_metrics(symbols[i], matrix[i], scores[i])
+            logger.info(f"  {rank+1}. {metrics.symbol}: 종합점수 {metrics.total_score:.1f} "
                        f"(거래량:{metrics.volume_score:.0f}, 변동성:{metrics.volatility_score:.0f}, "
                        f"유동성:{metrics.liquidity_score:.0f}, 모멘텀:{metrics.momentum_score:.0f}, "
                        f"리스크:{metrics.risk_score:.0f})")
-        
+
         return top_symbols
-    
-    def _filter_by_market_condition(self, 
-                                   symbol_metrics: List[SymbolMetrics], 
-                                   market_condition: str) -> List[SymbolMetrics]:
-        """시장 상황별 심볼 필터링"""
-        
+
+    @staticmethod
+    def _condition_mask(matrix: np.ndarray, market_condition: str) -> np.ndarray:
+        """시장 상황별 후보 마스크 (METRIC_COLUMNS 행렬 기준)"""
+        liquidity, momentum, risk = matrix[:, 2], matrix[:, 3], matrix[:, 4]
+
         if market_condition == "volatile":
             # 변동성이 큰 시장: 안전한 심볼 우선, 높은 유동성 필요
-            return [s for s in symbol_metrics if s.risk_score < 60 and s.liquidity_score > 40]
-            
+            return (risk < 60) & (liquidity > 40)
+
         elif market_condition == "trending":
             # 추세장: 모멘텀이 강한 심볼 우선
-            return [s for s in symbol_metrics if abs(s.momentum_score) > 30]
-            
+            return np.abs(momentum) > 30
+
         else:  # stable
             # 안정적 시장: 균형 잡힌 선택
-            return symbol_metrics
+            return np.ones(len(matrix), dtype=bool)
     
     def detect_market_condition(self, market_data: Dict[str, Any]) -> str:
         """시장 상황 자동 감지"""
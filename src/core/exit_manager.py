@@ -12,14 +12,17 @@ import math
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
 
-import ccxt.async_support as ccxt
 import pandas as pd
-import pandas_ta as ta
 
 # --- 프로젝트 내 모듈 임포트 ---
 # 중앙화된 ExitProfile 정의를 가져옵니다.
+from .lazy_import import lazy_import
 from .trader_exit_profiles import ExitProfile, PROFILES
 
+# ccxt/pandas_ta는 첫 사용 시 임포트
+ccxt = lazy_import("ccxt.async_support")
+ta = lazy_import("pandas_ta")
+
 # ============================================================
 # 상태 모델
 # ============================================================
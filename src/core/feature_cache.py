@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+시계열 식별자 기반 피처 캐시 (바이트 예산 LRU + 선택적 디스크 스필)
+
+- 목적: 캔들 값을 통째로 해시하거나 튜플로 바꿔 캐시 키를 만드는 대신,
+  (심볼, 타임프레임, 마지막 캔들 시각, 피처 세트 버전) 같은 작은 키로 O(1) 조회합니다.
+- 핵심 기능:
+  1) 바이트 예산: 항목별 크기를 추정하여 총합이 `max_bytes`를 넘으면 가장 오래 쓰지 않은 항목부터 내보냅니다.
+  2) 통계: 히트/미스/축출/스필 히트 횟수와 현재 바이트 수를 제공합니다.
+  3) 디스크 스필(선택): 내보낸 항목을 `spill_dir`에 피클로 저장해 두었다가 미스 시 다시 읽어 옵니다.
+"""
+from __future__ import annotations
+import os
+import sys
+import pickle
+import hashlib
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Hashable, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# --- 상수 정의 ---
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+DEFAULT_MAX_SPILL_FILES = 10_000
+
+
+def estimate_nbytes(value: Any) -> int:
+    """캐시 항목의 메모리 사용량을 대략 추정합니다 (피클 직렬화 없이)."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=False).sum())
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items())
+    return sys.getsizeof(value)
+
+
+class FeatureCache:
+    """
+    바이트 예산을 가진 LRU 피처 캐시.
+
+    Args:
+        max_bytes (int): 메모리에 보관할 항목들의 추정 바이트 상한.
+        spill_dir (Optional[Path]): 지정하면 축출된 항목을 이 디렉토리에 피클로 저장합니다.
+        max_spill_files (int): 스필 파일 최대 개수 (초과 시 오래된 파일부터 삭제).
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, spill_dir: Optional[Union[str, Path]] = None,
+                 max_spill_files: int = DEFAULT_MAX_SPILL_FILES):
+        self.max_bytes = int(max_bytes)
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        self.max_spill_files = int(max_spill_files)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._spilled: "OrderedDict[Hashable, Path]" = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.spill_hits = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    # --- 조회/저장 ---
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        value = self._load_spilled(key)
+        if value is not None:
+            self.spill_hits += 1
+            self.put(key, value)
+            return value
+        self.misses += 1
+        return None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        size = estimate_nbytes(value)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.nbytes -= old[1]
+        self._entries[key] = (value, size)
+        self.nbytes += size
+        while self.nbytes > self.max_bytes and len(self._entries) > 1:
+            old_key, (old_value, old_size) = self._entries.popitem(last=False)
+            self.nbytes -= old_size
+            self.evictions += 1
+            self._spill(old_key, old_value)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.nbytes = 0
+        self.hits = self.misses = self.evictions = self.spill_hits = 0
+        for path in self._spilled.values():
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        self._spilled.clear()
+
+    def info(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "spill_hits": self.spill_hits,
+            "entries": len(self._entries),
+            "spilled": len(self._spilled),
+            "bytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    # --- 디스크 스필 ---
+    def _spill_path(self, key: Hashable) -> Path:
+        digest = hashlib.blake2b(repr(key).encode('utf-8'), digest_size=16).hexdigest()
+        return self.spill_dir / f"{digest}.pkl"
+
+    def _spill(self, key: Hashable, value: Any) -> None:
+        if self.spill_dir is None:
+            return
+        try:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            path = self._spill_path(key)
+            with open(path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except (OSError, pickle.PicklingError) as e:
+            logger.debug(f"[피처 캐시] 스필 실패: {e}")
+            return
+        self._spilled[key] = path
+        self._spilled.move_to_end(key)
+        while len(self._spilled) > self.max_spill_files:
+            _, stale = self._spilled.popitem(last=False)
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+    def _load_spilled(self, key: Hashable) -> Optional[Any]:
+        path = self._spilled.pop(key, None)
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+            os.remove(path)
+            return value
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            logger.debug(f"[피처 캐시] 스필 읽기 실패: {e}")
+            return None
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+전체 기간 피처 행렬 저장소 (훈련/백테스트용)
+
+- 목적: `TradingEnv`를 만들 때마다 같은 데이터에 `extract_market_features`(pandas-ta 전략)를 다시 돌리는 대신,
+  한 번 계산한 피처 행렬을 디스크에 저장해 두고 (데이터 해시, 지표 정의 해시) 키로 재사용합니다.
+- 핵심 기능:
+  1) 키: 입력 OHLCV의 콘텐츠 해시(`ohlcv_integrity.content_hash`)와 지표 정의 해시의 조합.
+     데이터나 지표 정의가 바뀔 때만 다시 계산합니다.
+  2) 저장 형식: 키별 디렉토리에 float32 `features.npy`, int64 `index.npy`(epoch ms), `meta.json`(컬럼/시간대).
+  3) 메모리 맵 로드: `np.load(mmap_mode='r')`로 열어 여러 환경/프로세스가 같은 페이지 캐시를 공유합니다.
+  4) 원자적 기록: 임시 디렉토리에 쓴 뒤 이름을 바꾸므로 동시에 만든 환경이 반쯤 쓰인 파일을 읽지 않습니다.
+"""
+from __future__ import annotations
+import os
+import json
+import shutil
+import logging
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .ohlcv_store import OHLCV_COLUMNS
+from .ohlcv_integrity import content_hash, index_to_ms
+
+logger = logging.getLogger(__name__)
+
+# --- 상수 정의 ---
+FEATURE_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "features"
+FEATURE_DTYPE = np.float32
+FORMAT_VERSION = 1
+META_FILENAME = "meta.json"
+
+
+def dataset_hash(df: pd.DataFrame) -> str:
+    """입력 OHLCV 데이터프레임(인덱스 + OHLCV 컬럼)의 콘텐츠 해시."""
+    return content_hash(df[OHLCV_COLUMNS])
+
+
+class FeatureStore:
+    """
+    (데이터 해시, 지표 정의 해시) 키의 피처 행렬 저장소.
+
+    Args:
+        root: 저장소 루트 디렉토리.
+    """
+
+    def __init__(self, root: Union[str, Path] = FEATURE_DIR):
+        self.root = Path(root)
+        self.hits = 0
+        self.misses = 0
+
+    def path_for(self, data_hash: str, definition_hash: str) -> Path:
+        return self.root / f"{data_hash}_{definition_hash}"
+
+    def exists(self, data_hash: str, definition_hash: str) -> bool:
+        return (self.path_for(data_hash, definition_hash) / META_FILENAME).is_file()
+
+    # --- 저장/로드 ---
+    def save(self, data_hash: str, definition_hash: str, features: pd.DataFrame) -> Path:
+        """피처 데이터프레임을 float32 행렬로 저장합니다. 이미 같은 키가 있으면 그대로 둡니다."""
+        target = self.path_for(data_hash, definition_hash)
+        if target.exists():
+            return target
+        index = pd.DatetimeIndex(features.index)
+        meta = {
+            "version": FORMAT_VERSION,
+            "columns": [str(c) for c in features.columns],
+            "tz": str(index.tz) if index.tz is not None else None,
+            "index_name": index.name,
+            "rows": int(len(features)),
+            "dtype": np.dtype(FEATURE_DTYPE).name,
+        }
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / f".{target.name}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir()
+        np.save(tmp / "features.npy", features.to_numpy(dtype=FEATURE_DTYPE))
+        np.save(tmp / "index.npy", index_to_ms(index))
+        with open(tmp / META_FILENAME, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        try:
+            os.rename(tmp, target)
+        except OSError:
+            # 다른 프로세스가 먼저 같은 키를 기록한 경우
+            shutil.rmtree(tmp, ignore_errors=True)
+        return target
+
+    def load(self, data_hash: str, definition_hash: str) -> Optional[pd.DataFrame]:
+        """저장된 피처 행렬을 메모리 맵으로 열어 데이터프레임으로 반환합니다. 없거나 손상되면 None."""
+        path = self.path_for(data_hash, definition_hash)
+        try:
+            with open(path / META_FILENAME, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("version") != FORMAT_VERSION:
+                return None
+            values = np.load(path / "features.npy", mmap_mode="r")
+            index_ms = np.load(path / "index.npy")
+        except (OSError, ValueError) as e:
+            if path.exists():
+                logger.warning(f"[피처 저장소] 로드 실패, 다시 계산합니다: {path} ({e})")
+            return None
+        index = pd.DatetimeIndex(pd.to_datetime(index_ms, unit="ms"), name=meta.get("index_name"))
+        if meta.get("tz"):
+            index = index.tz_localize("UTC").tz_convert(meta["tz"])
+        return pd.DataFrame(values, index=index, columns=meta["columns"], copy=False)
+
+    def load_or_compute(
+        self,
+        df_raw: pd.DataFrame,
+        compute: Callable[[pd.DataFrame], pd.DataFrame],
+        definition_hash: str,
+    ) -> pd.DataFrame:
+        """
+        저장된 피처가 있으면 로드하고, 없으면 compute(df_raw)로 계산하여 저장한 뒤 로드합니다.
+        첫 계산 결과도 저장된 형태(float32)로 반환하므로 캐시 사용 여부와 관계없이 결과가 같습니다.
+        """
+        data_hash = dataset_hash(df_raw)
+        cached = self.load(data_hash, definition_hash)
+        if cached is not None:
+            self.hits += 1
+            logger.info(f"[피처 저장소] 캐시 사용: {data_hash[:8]}_{definition_hash[:8]} ({len(cached)}행)")
+            return cached
+
+        self.misses += 1
+        features = compute(df_raw)
+        if features is None or features.empty:
+            return features
+        try:
+            self.save(data_hash, definition_hash, features)
+        except OSError as e:
+            logger.warning(f"[피처 저장소] 저장 실패, 계산 결과를 그대로 사용합니다: {e}")
+            return features.astype(FEATURE_DTYPE)
+        return self.load(data_hash, definition_hash)
+
+
+# --- 싱글톤 ---
+_feature_store: Optional[FeatureStore] = None
+
+
+def get_feature_store() -> FeatureStore:
+    global _feature_store
+    if _feature_store is None:
+        _feature_store = FeatureStore()
+    return _feature_store
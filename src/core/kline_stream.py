@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+"""
+Bybit v5 공개 WebSocket kline 스트리밍 및 롤링 캔들 버퍼
+
+- 목적: 매 사이클 REST `fetch_ohlcv`로 캔들을 다시 받는 대신, kline 토픽을 구독하여
+  메모리 내 버퍼에서 즉시 캔들을 읽을 수 있게 합니다.
+- 핵심 기능:
+  1) 링 버퍼: (심볼, 타임프레임)마다 고정 크기 NumPy 배열에 캔들을 유지합니다. 진행 중 캔들은 제자리 갱신됩니다.
+  2) 구독 관리: 활성 유니버스가 바뀌면 차이만 subscribe/unsubscribe 합니다.
+  3) 봉 마감 이벤트: `confirm=true` 메시지 수신 시 `BarClosedEvent`를 큐와 콜백으로 전달합니다.
+  4) 재연결: 연결이 끊기면 지수 백오프로 재연결하고 전체 토픽을 다시 구독합니다.
+     끊긴 동안 놓친 캔들이 있을 수 있으므로 재연결하거나 캔들 시각이 건너뛰면 해당 버퍼를 재시드 대상으로 표시합니다.
+"""
+from __future__ import annotations
+import json
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import websockets
+
+from .ohlcv_frame import OHLCVFrame
+from .ohlcv_integrity import timeframe_to_ms
+
+logger = logging.getLogger(__name__)
+
+# --- 상수 정의 ---
+BYBIT_PUBLIC_LINEAR_WS = "wss://stream.bybit.com/v5/public/linear"
+BYBIT_TESTNET_PUBLIC_LINEAR_WS = "wss://stream-testnet.bybit.com/v5/public/linear"
+PING_INTERVAL_SEC = 20           # Bybit 권장 하트비트 주기
+SUBSCRIBE_BATCH = 10             # 요청당 토픽 수 (args 제한)
+MAX_RECONNECT_DELAY_SEC = 30
+
+# ccxt 타임프레임 → Bybit v5 kline interval
+TIMEFRAME_TO_INTERVAL = {
+    "1m": "1", "3m": "3", "5m": "5", "15m": "15", "30m": "30",
+    "1h": "60", "2h": "120", "4h": "240", "6h": "360", "12h": "720",
+    "1d": "D", "1w": "W", "1M": "M",
+}
+INTERVAL_TO_TIMEFRAME = {v: k for k, v in TIMEFRAME_TO_INTERVAL.items()}
+
+_COLUMNS = ["timestamp", "open", "high", "low", "close", "volume"]
+
+
+def _latest_contiguous(rows: np.ndarray, step_ms: int) -> np.ndarray:
+    """시각순 캔들 행에서 마지막 공백 이후의 연속 구간만 남깁니다."""
+    gaps = np.flatnonzero(np.diff(rows[:, 0]) > step_ms)
+    return rows[gaps[-1] + 1:] if len(gaps) else rows
+
+
+def to_exchange_id(symbol: str) -> str:
+    """'BTC/USDT:USDT' 형식의 ccxt 심볼을 Bybit 심볼 ID('BTCUSDT')로 변환합니다."""
+    return symbol.split(':')[0].replace('/', '')
+
+
+# --- 데이터 클래스 ---
+@dataclass(frozen=True)
+class BarClosedEvent:
+    """캔들 마감 이벤트"""
+    symbol: str
+    timeframe: str
+    timestamp: int   # 마감된 캔들의 시작 시각 (epoch ms)
+    close: float
+
+
+# --- 링 버퍼 ---
+class CandleRingBuffer:
+    """
+    고정 크기 OHLCV 링 버퍼. 행 = [timestamp(ms), open, high, low, close, volume].
+
+    Args:
+        capacity (int): 보관할 최대 캔들 수. 초과 시 가장 오래된 캔들을 덮어씁니다.
+    """
+
+    def __init__(self, capacity: int = 500):
+        self.capacity = int(capacity)
+        self._data = np.zeros((self.capacity, len(_COLUMNS)), dtype=np.float64)
+        self._head = 0      # 다음에 쓸 위치
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        if self._size == 0:
+            return None
+        return int(self._data[(self._head - 1) % self.capacity, 0])
+
+    def upsert(self, row: Iterable[float]) -> bool:
+        """
+        캔들 1개를 반영합니다. 마지막 캔들과 시작 시각이 같으면 제자리 갱신하고, 더 최신이면 추가합니다.
+
+        Returns:
+            bool: 새 캔들이 추가되었으면 True, 갱신 또는 무시되었으면 False.
+        """
+        row = np.asarray(row, dtype=np.float64)
+        last_ts = self.last_timestamp
+        if last_ts is not None and row[0] < last_ts:
+            return False
+        if last_ts is not None and row[0] == last_ts:
+            self._data[(self._head - 1) % self.capacity] = row
+            return False
+        self._data[self._head] = row
+        self._head = (self._head + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        return True
+
+    def extend(self, rows: np.ndarray) -> None:
+        for row in rows:
+            self.upsert(row)
+
+    def to_array(self) -> np.ndarray:
+        """시간순으로 정렬된 (n, 6) 배열 복사본을 반환합니다."""
+        if self._size < self.capacity:
+            return self._data[:self._size].copy()
+        return np.concatenate([self._data[self._head:], self._data[:self._head]])
+
+    def to_ohlcv_frame(self, n: Optional[int] = None) -> OHLCVFrame:
+        """최근 n개(기본: 전체) 캔들을 시간순 `OHLCVFrame`으로 반환합니다."""
+        arr = self.to_array()
+        if n is not None:
+            arr = arr[-n:]
+        return OHLCVFrame(arr[:, 0].astype(np.int64), np.ascontiguousarray(arr[:, 1:].T))
+
+    def to_frame(self) -> pd.DataFrame:
+        """REST 조회 결과와 같은 형식('timestamp' 컬럼 + OHLCV)의 데이터프레임을 반환합니다."""
+        return self.to_ohlcv_frame().to_pandas(timestamp_column=True)
+
+
+# --- 스트림 클라이언트 ---
+class KlineStream:
+    """
+    Bybit v5 공개 kline 토픽을 구독하여 (심볼, 타임프레임)별 링 버퍼를 유지합니다.
+
+    Args:
+        timeframes: 구독할 ccxt 타임프레임 목록 (예: ['5m', '1h', '1d']).
+        capacity: 버퍼당 보관 캔들 수.
+        url: WebSocket 엔드포인트 (테스트 시 로컬 서버 주소).
+        on_bar_closed: 봉 마감 시 호출할 콜백 (선택).
+    """
+
+    def __init__(
+        self,
+        timeframes: List[str],
+        capacity: int = 500,
+        url: str = BYBIT_PUBLIC_LINEAR_WS,
+        on_bar_closed: Optional[Callable[[BarClosedEvent], None]] = None,
+    ):
+        unknown = [tf for tf in timeframes if tf not in TIMEFRAME_TO_INTERVAL]
+        if unknown:
+            raise ValueError(f"지원하지 않는 타임프레임입니다: {unknown}")
+        self.timeframes = list(timeframes)
+        self.capacity = capacity
+        self.url = url
+        self.on_bar_closed = on_bar_closed
+        self.bar_closed: asyncio.Queue[BarClosedEvent] = asyncio.Queue()
+
+        self._buffers: Dict[Tuple[str, str], CandleRingBuffer] = {}
+        self._fresh: set = set()                    # REST로 시드된 뒤 공백 없이 이어지고 있는 버퍼 키
+        self._connections = 0
+        self._symbols: Dict[str, str] = {}          # 거래소 ID → 호출자 심볼
+        self._ws = None
+        self._task: Optional[asyncio.Task] = None
+        self._connected = asyncio.Event()
+        self._running = False
+
+    # --- 조회 ---
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._symbols.values())
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    def buffer(self, symbol: str, timeframe: str) -> CandleRingBuffer:
+        key = (symbol, timeframe)
+        if key not in self._buffers:
+            self._buffers[key] = CandleRingBuffer(self.capacity)
+        return self._buffers[key]
+
+    def has_history(self, symbol: str, timeframe: str, min_bars: int = 1) -> bool:
+        """시드된 뒤 캔들 시각이 끊기지 않은 버퍼에 min_bars개 이상 있으면 True. 재연결/공백 이후에는 재시드 전까지 False."""
+        key = (symbol, timeframe)
+        buf = self._buffers.get(key)
+        return key in self._fresh and buf is not None and len(buf) >= min_bars
+
+    def mark_stale(self, symbol: Optional[str] = None, timeframe: Optional[str] = None) -> None:
+        """버퍼를 재시드 대상으로 표시합니다. 인자가 없으면 전체."""
+        if symbol is None:
+            self._fresh.clear()
+        else:
+            self._fresh.discard((symbol, timeframe))
+
+    def get_frame(self, symbol: str, timeframe: str, n: Optional[int] = None) -> OHLCVFrame:
+        """버퍼의 최근 n개(기본: 전체) 캔들을 `OHLCVFrame`으로 반환합니다."""
+        buf = self._buffers.get((symbol, timeframe))
+        return buf.to_ohlcv_frame(n) if buf is not None else OHLCVFrame.empty()
+
+    def seed(self, symbol: str, timeframe: str, data: Union[OHLCVFrame, pd.DataFrame]) -> None:
+        """
+        REST로 받은 과거 캔들(OHLCVFrame 또는 'timestamp' 컬럼 + OHLCV 데이터프레임)로 버퍼를 채웁니다.
+        스트림은 구독 이후의 캔들만 전달하므로 지표 계산에 필요한 과거 구간은 시드해야 하며,
+        재연결/공백 이후에는 같은 방법으로 빠진 구간을 채웁니다.
+
+        겹치는 시각은 REST 값(마감 값)을 쓰고, REST 마지막 캔들 이후(및 같은 시각의 진행 중 캔들)는 스트림 값을 유지합니다.
+        병합 후에도 남는 공백이 있으면 마지막 공백 이후의 연속 구간만 보관합니다.
+        """
+        if data is None or len(data) == 0:
+            return
+        frame = OHLCVFrame.coerce(data)
+        rows = np.column_stack([frame.timestamp.astype(np.float64), frame.values.T])
+        existing = self.buffer(symbol, timeframe).to_array()
+        if len(existing):
+            keep = existing[(existing[:, 0] >= rows[-1, 0]) | ~np.isin(existing[:, 0], rows[:, 0])]
+            rows = np.vstack([rows[~np.isin(rows[:, 0], keep[:, 0])], keep])
+            rows = rows[np.argsort(rows[:, 0], kind="stable")]
+        rows = _latest_contiguous(rows, timeframe_to_ms(timeframe))
+        buf = CandleRingBuffer(self.capacity)
+        buf.extend(rows)
+        self._buffers[(symbol, timeframe)] = buf
+        self._fresh.add((symbol, timeframe))
+
+    # --- 구독 관리 ---
+    def _topics(self, exchange_ids: Iterable[str]) -> List[str]:
+        return [f"kline.{TIMEFRAME_TO_INTERVAL[tf]}.{sid}" for sid in exchange_ids for tf in self.timeframes]
+
+    async def _send_op(self, op: str, topics: List[str]) -> None:
+        if self._ws is None or not topics:
+            return
+        for i in range(0, len(topics), SUBSCRIBE_BATCH):
+            await self._ws.send(json.dumps({"op": op, "args": topics[i:i + SUBSCRIBE_BATCH]}))
+
+    async def update_symbols(self, symbols: Iterable[str]) -> None:
+        """구독 유니버스를 교체합니다. 빠진 심볼은 구독 해제 후 버퍼를 제거합니다."""
+        wanted = {to_exchange_id(s): s for s in symbols}
+        added = [sid for sid in wanted if sid not in self._symbols]
+        removed = [sid for sid in self._symbols if sid not in wanted]
+
+        for sid in removed:
+            for tf in self.timeframes:
+                self._buffers.pop((self._symbols[sid], tf), None)
+                self._fresh.discard((self._symbols[sid], tf))
+        self._symbols = wanted
+
+        if self.connected:
+            await self._send_op("unsubscribe", self._topics(removed))
+            await self._send_op("subscribe", self._topics(added))
+        if added or removed:
+            logger.info(f"[kline 스트림] 구독 갱신: +{len(added)} / -{len(removed)} (총 {len(wanted)}개 심볼)")
+
+    # --- 메시지 처리 ---
+    def _handle_message(self, message: dict) -> None:
+        topic = message.get("topic", "")
+        if not topic.startswith("kline."):
+            if message.get("success") is False:
+                logger.warning(f"[kline 스트림] 요청 실패: {message.get('ret_msg')}")
+            return
+        _, interval, sid = topic.split(".", 2)
+        symbol = self._symbols.get(sid)
+        timeframe = INTERVAL_TO_TIMEFRAME.get(interval)
+        if symbol is None or timeframe is None:
+            return
+
+        buf = self.buffer(symbol, timeframe)
+        step_ms = timeframe_to_ms(timeframe)
+        for k in message.get("data", []):
+            row = (float(k["start"]), float(k["open"]), float(k["high"]),
+                   float(k["low"]), float(k["close"]), float(k["volume"]))
+            last_ts = buf.last_timestamp
+            if last_ts is not None and row[0] > last_ts + step_ms:
+                # 중간 캔들을 놓침 (메시지 유실 등): 다음 조회 때 REST로 빈 구간을 채움
+                self._fresh.discard((symbol, timeframe))
+            buf.upsert(row)
+            if k.get("confirm"):
+                event = BarClosedEvent(symbol, timeframe, int(k["start"]), float(k["close"]))
+                self.bar_closed.put_nowait(event)
+                if self.on_bar_closed is not None:
+                    try:
+                        self.on_bar_closed(event)
+                    except Exception as e:
+                        logger.warning(f"[kline 스트림] 봉 마감 콜백 오류: {e}")
+
+    async def _heartbeat(self, ws) -> None:
+        while True:
+            await asyncio.sleep(PING_INTERVAL_SEC)
+            await ws.send(json.dumps({"op": "ping"}))
+
+    # --- 실행 ---
+    async def run(self) -> None:
+        """연결 → 구독 → 수신 루프. 연결이 끊기면 백오프 후 재연결합니다."""
+        self._running = True
+        delay = 1
+        while self._running:
+            heartbeat = None
+            try:
+                async with websockets.connect(self.url, ping_interval=None) as ws:
+                    self._ws = ws
+                    if self._connections and self._fresh:
+                        # 끊긴 동안의 캔들과 마지막 캔들의 마감 값을 받지 못했으므로 모든 버퍼를 재시드 대상으로 표시
+                        logger.info(f"[kline 스트림] 재연결: 버퍼 {len(self._fresh)}개를 REST로 다시 채웁니다.")
+                        self.mark_stale()
+                    self._connections += 1
+                    self._connected.set()
+                    delay = 1
+                    logger.info(f"[kline 스트림] 연결됨: {self.url} ({len(self._symbols)}개 심볼)")
+                    await self._send_op("subscribe", self._topics(self._symbols))
+                    heartbeat = asyncio.create_task(self._heartbeat(ws))
+                    async for raw in ws:
+                        self._handle_message(json.loads(raw))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"[kline 스트림] 연결 오류, {delay}초 후 재연결: {e}")
+            finally:
+                self._connected.clear()
+                self._ws = None
+                if heartbeat is not None:
+                    heartbeat.cancel()
+            if self._running:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MAX_RECONNECT_DELAY_SEC)
+
+    async def start(self, timeout: float = 10.0) -> None:
+        """백그라운드 태스크로 스트림을 시작하고 첫 연결을 기다립니다."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        await asyncio.wait_for(self._connected.wait(), timeout=timeout)
+
+    async def stop(self) -> None:
+        self._running = False
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def wait_bar_closed(self, timeout: float) -> Optional[BarClosedEvent]:
+        """이미 처리된 이벤트를 비운 뒤 다음 봉 마감 이벤트를 기다립니다. 시간 초과 시 None을 반환합니다."""
+        while not self.bar_closed.empty():
+            self.bar_closed.get_nowait()
+        try:
+            return await asyncio.wait_for(self.bar_closed.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
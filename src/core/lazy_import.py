@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+무거운 의존성 지연 임포트
+
+- 목적: pandas_ta, vectorbt, stable_baselines3, torch, aiogram, ccxt처럼 임포트에 수백 ms가 드는 모듈을
+  모듈 최상단에서 바로 임포트하지 않고, 실제로 속성에 처음 접근할 때 임포트하여
+  엔진/봇/대시보드 재시작과 프로세스 풀 워커 생성 시간을 줄입니다.
+- 핵심 기능:
+  1) `lazy_import(name)`: `import x as y`를 대체하는 모듈 프록시. 첫 속성 접근 시 실제 모듈을 임포트하고,
+     이미 임포트된 모듈이면 그대로 반환합니다.
+  2) `HEAVY_MODULES`: 시작 경로에서 임포트되면 안 되는 최상위 패키지 목록 (임포트 시간 점검/테스트에서 사용).
+"""
+from __future__ import annotations
+import sys
+import logging
+import importlib
+import threading
+from types import ModuleType
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# --- 상수 정의 ---
+HEAVY_MODULES = ("pandas_ta", "vectorbt", "stable_baselines3", "torch", "aiogram", "ccxt")
+
+
+class LazyModule(ModuleType):
+    """
+    첫 속성 접근 시 대상 모듈을 임포트하는 프록시.
+
+    `except lazy.NetworkError`, `lazy.bybit(...)`처럼 일반 모듈과 같이 사용할 수 있습니다.
+    타입 주석에 사용하는 경우 `from __future__ import annotations`로 평가를 미뤄야 임포트가 지연됩니다.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+        self.__dict__["_lazy_lock"] = threading.Lock()
+
+    def _load(self) -> ModuleType:
+        module: Optional[ModuleType] = self.__dict__["_lazy_module"]
+        if module is None:
+            with self.__dict__["_lazy_lock"]:
+                module = self.__dict__["_lazy_module"]
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str) -> ModuleType:
+    """모듈 이름에 대한 지연 임포트 프록시를 반환합니다. 이미 임포트된 모듈이면 실제 모듈을 반환합니다."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
+
+
+def is_loaded(module: ModuleType) -> bool:
+    """지연 프록시의 대상 모듈이 실제로 임포트되었는지 여부 (일반 모듈은 항상 True)."""
+    if isinstance(module, LazyModule):
+        return module.__dict__["_lazy_module"] is not None
+    return True
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""
+LibraStrategy 지표 세트의 순수 NumPy 구현
+
+- 목적: `df.ta.study(LibraStrategy)`의 느린 임포트, 작은 전략에 과한 멀티프로세싱 풀, 데이터프레임 단위 실행 비용 없이
+  같은 지표를 NumPy 배열 연산으로 계산합니다.
+- 핵심 기능:
+  1) 동일 컬럼: pandas-ta(talib 미사용 경로)와 같은 컬럼 이름/순서/초기 NaN 구간을 만듭니다
+     (SMA_20, EMA_20/50, RSI_14, STOCHk/d/h, MACD/h/s, BBL/BBM/BBU/BBB/BBP, ATRr_14, TRUERANGE_1, HA_*, vol_SMA_20).
+  2) 같은 정의: EMA는 SMA 시드(presma), RSI/ATR은 Wilder RMA, 볼린저 표준편차는 ddof=0,
+     0 범위에는 pandas-ta `non_zero_range`와 같이 epsilon을 더합니다.
+  3) 스펙 기반: `LIBRA_INDICATORS`와 같은 pandas-ta 스펙 딕셔너리 목록을 그대로 받아 실행합니다.
+"""
+from __future__ import annotations
+import sys
+import logging
+from typing import Callable, Dict, List, Mapping
+
+import numpy as np
+import pandas as pd
+
+from .panel_features import ema_panel
+from .rolling import rolling_max, rolling_mean, rolling_min, rolling_std
+
+logger = logging.getLogger(__name__)
+
+Columns = Dict[str, np.ndarray]
+
+_EPS = sys.float_info.epsilon
+
+
+# --- 기본 연산 ---
+def _nan(n: int) -> np.ndarray:
+    return np.full(n, np.nan)
+
+
+def _non_zero_range(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """a - b. 0인 값이 하나라도 있으면 전체에 epsilon을 더합니다 (pandas-ta와 동일)."""
+    diff = a - b
+    if np.any(diff == 0):
+        diff = diff + _EPS
+    return diff
+
+
+def _place(n: int, start: int, values: np.ndarray) -> np.ndarray:
+    out = _nan(n)
+    out[start:start + len(values)] = values
+    return out
+
+
+def _first_valid(x: np.ndarray) -> int:
+    valid = np.flatnonzero(~np.isnan(x))
+    return int(valid[0]) if valid.size else len(x)
+
+
+def sma(x: np.ndarray, length: int) -> np.ndarray:
+    """단순이동평균. 앞 length-1개는 NaN."""
+    return rolling_mean(x, length)
+
+
+def ema(x: np.ndarray, length: int) -> np.ndarray:
+    """첫 length개의 평균으로 시작하는 EMA (pandas-ta presma=True, adjust=False)."""
+    n = len(x)
+    if n < length:
+        return _nan(n)
+    seeded = np.concatenate(([x[:length].mean()], x[length:]))
+    return _place(n, length - 1, ema_panel(seeded, length))
+
+
+def rma(x: np.ndarray, length: int) -> np.ndarray:
+    """Wilder 이동평균 (alpha = 1/length). 첫 유효값부터 시작합니다."""
+    start = _first_valid(x)
+    out = _nan(len(x))
+    if start < len(x):
+        out[start:] = ema_panel(x[start:], alpha=1.0 / length)
+    return out
+
+
+def _sma_from_first_valid(x: np.ndarray, length: int) -> np.ndarray:
+    start = _first_valid(x)
+    out = _nan(len(x))
+    out[start:] = sma(x[start:], length)
+    return out
+
+
+def _shift(x: np.ndarray, periods: int = 1) -> np.ndarray:
+    out = _nan(len(x))
+    out[periods:] = x[:-periods]
+    return out
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray, drift: int = 1) -> np.ndarray:
+    prev_close = _shift(close, drift)
+    hl = np.abs(_non_zero_range(high, low))
+    return np.fmax(np.fmax(hl, np.abs(high - prev_close)), np.abs(prev_close - low))
+
+
+# --- 지표 핸들러 (pandas-ta 스펙 → 컬럼) ---
+def _kind_sma(data: Mapping[str, np.ndarray], spec: dict) -> Columns:
+    length = int(spec.get("length", 10))
+    source = spec.get("close", "close")
+    prefix = f"{spec['prefix']}_" if spec.get("prefix") else ""
+    return {f"{prefix}SMA_{length}": sma(data[source], length)}
+
+
+def _kind_ema(data: Mapping[str, np.ndarray], spec: dict) -> Columns:
+    length = int(spec.get("length", 10))
+    return {f"EMA_{length}": ema(data[spec.get("close", "close")], length)}
+
+
+def _kind_rsi(data: Mapping[str, np.ndarray], spec: dict) -> Columns:
+    length = int(spec.get("length", 14))
+    close = data["close"]
+    delta = np.diff(close, prepend=np.nan)
+    positive_avg = rma(np.where(delta > 0, delta, np.where(np.isnan(delta), np.nan, 0.0)), length)
+    negative_avg = rma(np.where(delta < 0, delta, np.where(np.isnan(delta), np.nan, 0.0)), length)
+    return {f"RSI_{length}": 100 * positive_avg / (positive_avg + np.abs(negative_avg))}
+
+
+def _kind_stoch(data: Mapping[str, np.ndarray], spec: dict) -> Columns:
+    k, d, smooth_k = int(spec.get("k", 14)), int(spec.get("d", 3)), int(spec.get("smooth_k", 3))
+    high, low, close = data["high"], data["low"], data["close"]
+    lowest = rolling_min(low, k)
+    highest = rolling_max(high, k)
+    raw = 100 * (close - lowest) / _non_zero_range(highest, lowest)
+    stoch_k = raw if smooth_k == 1 else _sma_from_first_valid(raw, smooth_k)
+    stoch_d = _sma_from_first_valid(stoch_k, d)
+    props = f"_{k}_{d}_{smooth_k}"
+    return {f"STOCHk{props}": stoch_k, f"STOCHd{props}": stoch_d, f"STOCHh{props}": stoch_k - stoch_d}
+
+
+def _kind_macd(data: Mapping[str, np.ndarray], spec: dict) -> Columns:
+    fast, slow, signal = int(spec.get("fast", 12)), int(spec.get("slow", 26)), int(spec.get("signal", 9))
+    if slow < fast:
+        fast, slow = slow, fast
+    close = data["close"]
+    macd = ema(close, fast) - ema(close, slow)
+    start = _first_valid(macd)
+    signal_line = _place(len(close), start, ema(macd[start:], signal))
+    props = f"_{fast}_{slow}_{signal}"
+    return {f"MACD{props}": macd, f"MACDh{props}": macd - signal_line, f"MACDs{props}": signal_line}
+
+
+def _kind_bbands(data: Mapping[str, np.ndarray], spec: dict) -> Columns:
+    length = int(spec.get("length", 5))
+    std = spec.get("std", 2.0)
+    ddof = spec.get("ddof", 0)
+    ddof = int(ddof) if isinstance(ddof, int) and 0 <= ddof < length else 1
+    close = data["close"]
+    deviations = std * rolling_std(close, length, ddof=ddof)
+    mid = sma(close, length)
+    lower, upper = mid - deviations, mid + deviations
+    ulr = _non_zero_range(upper, lower)
+    props = f"_{length}_{std}"
+    return {
+        f"BBL{props}": lower, f"BBM{props}": mid, f"BBU{props}": upper,
+        f"BBB{props}": 100 * ulr / mid, f"BBP{props}": _non_zero_range(close, lower) / ulr,
+    }
+
+
+def _kind_atr(data: Mapping[str, np.ndarray], spec: dict) -> Columns:
+    length = int(spec.get("length", 14))
+    tr = true_range(data["high"], data["low"], data["close"])
+    out = _nan(len(tr))
+    if len(tr) >= length:
+        # presma: 첫 length개 TR 평균으로 시작하는 RMA
+        seeded = np.concatenate(([tr[:length].mean()], tr[length:]))
+        out[length - 1:] = ema_panel(seeded, alpha=1.0 / length)
+    return {f"ATRr_{length}": out}
+
+
+def _kind_true_range(data: Mapping[str, np.ndarray], spec: dict) -> Columns:
+    drift = int(spec.get("drift", 1))
+    return {f"TRUERANGE_{drift}": true_range(data["high"], data["low"], data["close"], drift)}
+
+
+def _kind_ha(data: Mapping[str, np.ndarray], spec: dict) -> Columns:
+    o, h, l, c = data["open"], data["high"], data["low"], data["close"]
+    ha_close = 0.25 * (o + h + l + c)
+    # ha_open[i] = 0.5 * ha_open[i-1] + 0.5 * ha_close[i-1] → alpha=0.5 EMA
+    ha_open = ema_panel(np.concatenate(([0.5 * (o[0] + c[0])], ha_close[:-1])), alpha=0.5) if len(c) else ha_close
+    return {
+        "HA_open": ha_open,
+        "HA_high": np.maximum(np.maximum(ha_open, ha_close), h),
+        "HA_low": np.minimum(np.minimum(ha_open, ha_close), l),
+        "HA_close": ha_close,
+    }
+
+
+_KIND_HANDLERS: Dict[str, Callable[[Mapping[str, np.ndarray], dict], Columns]] = {
+    "sma": _kind_sma,
+    "ema": _kind_ema,
+    "rsi": _kind_rsi,
+    "stoch": _kind_stoch,
+    "macd": _kind_macd,
+    "bbands": _kind_bbands,
+    "atr": _kind_atr,
+    "true_range": _kind_true_range,
+    "ha": _kind_ha,
+}
+
+
+# --- 공개 API ---
+def compute_indicators(data: Mapping[str, np.ndarray], specs: List[dict]) -> Columns:
+    """
+    OHLCV 배열 딕셔너리에 pandas-ta 스펙 목록을 순서대로 적용하여 {컬럼명: 배열}을 반환합니다.
+
+    Raises:
+        ValueError: 지원하지 않는 지표 종류가 있는 경우.
+    """
+    arrays = {k: np.asarray(v, dtype=np.float64) for k, v in data.items()}
+    columns: Columns = {}
+    for spec in specs:
+        handler = _KIND_HANDLERS.get(spec["kind"])
+        if handler is None:
+            raise ValueError(f"NumPy 엔진이 지원하지 않는 지표입니다: {spec['kind']}")
+        columns.update(handler(arrays, spec))
+    return columns
+
+
+def append_indicators(df: pd.DataFrame, specs: List[dict]) -> pd.DataFrame:
+    """`df.ta.study(strategy, append=True)`처럼 지표 컬럼을 데이터프레임 뒤에 추가하여 반환합니다."""
+    data = {c: df[c].to_numpy(dtype=np.float64) for c in ("open", "high", "low", "close", "volume")}
+    columns = compute_indicators(data, specs)
+    return pd.concat([df, pd.DataFrame(columns, index=df.index)], axis=1)
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+거래소 마켓/상품 카탈로그 (TTL 백그라운드 갱신 + 디스크 스냅샷)
+
+- 목적: 주문마다 `load_markets(True)`로 전체 마켓을 다시 받는 대신, 한 번 로드한 상품 정보를
+  메모리에 두고 주기적으로만 갱신하여 주문 경로에서 네트워크 왕복을 제거합니다.
+- 핵심 기능:
+  1) O(1) 조회: 심볼별 정밀도, 수량/가격 한도, 활성 여부를 딕셔너리로 즉시 조회합니다.
+  2) TTL 갱신: 백그라운드 태스크가 `ttl_sec`마다 `fetch_markets`로 카탈로그를 교체합니다.
+  3) 디스크 스냅샷: 마지막 카탈로그를 JSON으로 저장하여 재시작 시 다운로드 없이 바로 사용합니다.
+  4) ccxt 세션 주입: 로드한 마켓을 세션에 `set_markets`로 넣어 주문 API의 최초 마켓 다운로드도 생략합니다.
+"""
+from __future__ import annotations
+import os
+import json
+import time
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# --- 상수 정의 ---
+DEFAULT_TTL_SEC = 3600.0
+REFRESH_RETRY_SEC = 60.0          # 갱신 실패 후 재시도 간격
+SNAPSHOT_VERSION = 1
+
+
+class MarketCatalog:
+    """
+    `fetch_markets` 결과를 심볼 키로 보관하는 카탈로그.
+
+    Args:
+        snapshot_path: 디스크 스냅샷 경로 (None이면 저장하지 않음).
+        ttl_sec: 카탈로그 유효 기간 및 백그라운드 갱신 주기(초).
+        params: `fetch_markets`에 전달할 파라미터 (기본: category='linear').
+    """
+
+    def __init__(self, snapshot_path: Optional[Path] = None, ttl_sec: float = DEFAULT_TTL_SEC, params: Optional[dict] = None):
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.ttl_sec = float(ttl_sec)
+        self.params = params if params is not None else {'category': 'linear'}
+        self._markets: Dict[str, Dict[str, Any]] = {}
+        self._active: List[str] = []
+        self._loaded_at = 0.0        # epoch 초 (스냅샷 경과 시간 판단용)
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    # --- 조회 ---
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._markets
+
+    def __len__(self) -> int:
+        return len(self._markets)
+
+    @property
+    def age_sec(self) -> float:
+        return time.time() - self._loaded_at if self._loaded_at else float('inf')
+
+    def get(self, symbol: str) -> Optional[Dict[str, Any]]:
+        return self._markets.get(symbol)
+
+    def is_active(self, symbol: str) -> bool:
+        market = self._markets.get(symbol)
+        return bool(market and market.get('active'))
+
+    def precision(self, symbol: str) -> Dict[str, Any]:
+        return (self._markets.get(symbol) or {}).get('precision', {})
+
+    def limits(self, symbol: str) -> Dict[str, Any]:
+        return (self._markets.get(symbol) or {}).get('limits', {})
+
+    def active_symbols(self) -> List[str]:
+        """활성 심볼 목록 (갱신 시점에 한 번 계산)."""
+        return self._active
+
+    # --- 로드/갱신 ---
+    def _set(self, markets: List[Dict[str, Any]], loaded_at: float) -> None:
+        self._markets = {m['symbol']: m for m in markets if m.get('symbol')}
+        self._active = [s for s, m in self._markets.items() if m.get('active')]
+        self._loaded_at = loaded_at
+
+    def _load_snapshot(self) -> bool:
+        if self.snapshot_path is None or not self.snapshot_path.exists():
+            return False
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            if payload.get('version') != SNAPSHOT_VERSION:
+                return False
+            self._set(payload['markets'], payload['saved_at'])
+            logger.info(f"[마켓 카탈로그] 스냅샷 로드: {len(self._markets)}개 (경과 {self.age_sec:.0f}초)")
+            return True
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"[마켓 카탈로그] 스냅샷 로드 실패: {e}")
+            return False
+
+    def _save_snapshot(self) -> None:
+        if self.snapshot_path is None:
+            return
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.snapshot_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': SNAPSHOT_VERSION, 'saved_at': self._loaded_at,
+                       'markets': list(self._markets.values())}, f)
+        os.replace(tmp_path, self.snapshot_path)
+
+    @staticmethod
+    def _inject(session, markets: List[Dict[str, Any]]) -> None:
+        """ccxt 세션에 마켓을 주입하여 주문 시 load_markets()가 다시 다운로드하지 않게 합니다."""
+        try:
+            session.set_markets(markets)
+        except Exception as e:
+            logger.debug(f"[마켓 카탈로그] 세션 마켓 주입 생략: {e}")
+
+    async def refresh(self, session) -> bool:
+        """거래소에서 마켓을 다시 받아 카탈로그와 스냅샷을 교체합니다. 실패 시 기존 카탈로그 유지."""
+        async with self._lock:
+            try:
+                markets = await session.fetch_markets(self.params)
+            except Exception as e:
+                logger.warning(f"[마켓 카탈로그] 갱신 실패, 기존 카탈로그 유지: {e}")
+                return False
+            self._set(markets, time.time())
+            self._inject(session, markets)
+            try:
+                await asyncio.to_thread(self._save_snapshot)
+            except OSError as e:
+                logger.warning(f"[마켓 카탈로그] 스냅샷 저장 실패: {e}")
+            logger.info(f"[마켓 카탈로그] 갱신 완료: {len(self._markets)}개 (활성 {len(self._active)}개)")
+            return True
+
+    async def ensure_loaded(self, session) -> None:
+        """
+        카탈로그를 사용할 수 있게 합니다. 메모리에 없으면 디스크 스냅샷을, 그것도 없으면 거래소를 사용합니다.
+        백그라운드 갱신이 돌고 있으면 만료된 카탈로그도 그대로 사용하여 호출 경로에서 다운로드하지 않습니다.
+        """
+        if self._markets and (self.age_sec < self.ttl_sec or self._task is not None):
+            return
+        if not self._markets and self._load_snapshot():
+            self._inject(session, list(self._markets.values()))
+            if self.age_sec < self.ttl_sec or self._task is not None:
+                return
+        await self.refresh(session)
+
+    async def _refresh_loop(self, session) -> None:
+        while True:
+            delay = self.ttl_sec - self.age_sec
+            await asyncio.sleep(delay if delay > 0 else REFRESH_RETRY_SEC)
+            await self.refresh(session)
+
+    def start_background_refresh(self, session) -> None:
+        """TTL 주기로 카탈로그를 갱신하는 백그라운드 태스크를 시작합니다."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_loop(session))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
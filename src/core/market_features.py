@@ -1,43 +1,89 @@
 # -*- coding: utf-8 -*-
 """
-시장 피처 추출 모듈 (pandas-ta 기반 최적화)
+시장 피처 추출 모듈 (LibraStrategy 지표 기반)
 
 - 목적: OHLCV 데이터로부터 안정적인 단일/다중 타임프레임 기술적 지표(피처)를 생성합니다.
 - 핵심 기능:
-  1) pandas-ta 통합: 신뢰성 높은 `pandas-ta` 라이브러리를 사용하여 20개 이상의 주요 지표를 계산합니다.
+  1) 지표 계산: LibraStrategy 지표 세트를 NumPy 구현(`libra_indicators`)으로 계산합니다.
+     `FEATURE_ENGINE=pandas_ta`로 기존 `pandas-ta` 경로를 선택할 수 있으며 두 경로의 결과는 같습니다.
   2) 동적 피처 계산: 하드코딩된 컬럼 이름 대신, 동적으로 생성된 피처 이름을 참조하여 유지보수성을 높입니다.
   3) 다중 타임프레임(MTF) 지원: 여러 타임프레임의 피처를 단일 데이터프레임으로 효율적으로 병합합니다.
   4) 랭킹 유틸리티: 변동성, 거래량 등을 기준으로 상위 심볼을 선정하는 기능을 제공합니다.
 """
 from __future__ import annotations
+import os
+import json
+import hashlib
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional, Union
 
 import numpy as np
 import pandas as pd
-import pandas_ta as ta
 
-# Now, we can safely use pandas_ta
+from .ohlcv_frame import OHLCVFrame
+from .libra_indicators import append_indicators
+from .rolling import rolling_std
+from .symbol_ranking import top_n_indices
+
 logger = logging.getLogger(__name__)
 
-# --- pandas-ta 전략 정의 ---
-LibraStrategy = ta.Strategy(
-    name="Libra Core Indicators",
-    description="20+ common indicators for trading bots",
-    ta=[
-        {"kind": "sma", "length": 20},
-        {"kind": "ema", "length": 20},
-        {"kind": "ema", "length": 50},
-        {"kind": "rsi", "length": 14},
-        {"kind": "stoch", "k": 14, "d": 3},
-        {"kind": "macd", "fast": 12, "slow": 26, "signal": 9},
-        {"kind": "bbands", "length": 20, "std": 2},
-        {"kind": "atr", "length": 14},
-        {"kind": "true_range", "length": 14},
-        {"kind": "ha"},
-        {"kind": "sma", "close": "volume", "length": 20, "prefix": "vol"},
-    ]
-)
+# --- LibraStrategy 지표 정의 (pandas-ta 스펙 형식) ---
+LIBRA_INDICATORS: List[dict] = [
+    {"kind": "sma", "length": 20},
+    {"kind": "ema", "length": 20},
+    {"kind": "ema", "length": 50},
+    {"kind": "rsi", "length": 14},
+    {"kind": "stoch", "k": 14, "d": 3},
+    {"kind": "macd", "fast": 12, "slow": 26, "signal": 9},
+    {"kind": "bbands", "length": 20, "std": 2},
+    {"kind": "atr", "length": 14},
+    {"kind": "true_range", "length": 14},
+    {"kind": "ha"},
+    {"kind": "sma", "close": "volume", "length": 20, "prefix": "vol"},
+]
+
+# 지표 계산 엔진: "numpy"(기본, libra_indicators) 또는 "pandas_ta"(기존 df.ta.study 경로)
+FEATURE_ENGINE = os.getenv("FEATURE_ENGINE", "numpy").strip().lower()
+_ENGINES = ("numpy", "pandas_ta")
+
+_libra_strategy = None
+def _get_libra_strategy():
+    """pandas-ta 전략 객체를 처음 필요할 때 만듭니다 (pandas-ta 임포트 비용 지연)."""
+    global _libra_strategy
+    if _libra_strategy is None:
+        import pandas_ta as ta
+        # study()가 스펙 딕셔너리를 변경하므로 사본을 전달
+        _libra_strategy = ta.Strategy(
+            name="Libra Core Indicators",
+            description="20+ common indicators for trading bots",
+            ta=[dict(spec) for spec in LIBRA_INDICATORS],
+        )
+    return _libra_strategy
+
+def __getattr__(name: str):
+    # 기존 `market_features.LibraStrategy` 참조 호환
+    if name == "LibraStrategy":
+        return _get_libra_strategy()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _resolve_engine(engine: Optional[str]) -> str:
+    engine = (engine or FEATURE_ENGINE).strip().lower()
+    if engine not in _ENGINES:
+        raise ValueError(f"알 수 없는 피처 엔진입니다: {engine} (지원: {', '.join(_ENGINES)})")
+    return engine
+
+# 커스텀 피처(_add_*_features) 계산 방식이 바뀌면 올려서 저장된 피처 행렬을 무효화
+CUSTOM_FEATURES_VERSION = 1
+
+def feature_definition_hash(engine: Optional[str] = None) -> str:
+    """지표 목록, 계산 엔진, 커스텀 피처 버전(및 pandas-ta 엔진이면 그 버전)으로 만든 지표 정의 해시 (피처 저장소 키)."""
+    engine = _resolve_engine(engine)
+    spec = {"strategy": LIBRA_INDICATORS, "custom": CUSTOM_FEATURES_VERSION, "engine": engine}
+    if engine == "pandas_ta":
+        import pandas_ta as ta
+        spec["pandas_ta"] = getattr(ta, "version", "")
+    payload = json.dumps(spec, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
 
 # --- 커스텀 피처 계산 헬퍼 ---
 def _add_bollinger_features(df: pd.DataFrame) -> pd.DataFrame:
@@ -112,16 +158,26 @@ def get_bybit_data(symbol: str, interval: str, limit: int = 1000) -> pd.DataFram
 
 
 # --- 단일 타임프레임 피처 생성 ---
-def extract_market_features(df: pd.DataFrame) -> pd.DataFrame:
-    """OHLCV 데이터프레임에 `pandas-ta` 전략과 커스텀 지표를 적용합니다."""
-    # Child process에서 importlib.metadata를 찾지 못하는 문제 해결
-    import importlib.metadata
-    
+def extract_market_features(df: Union[pd.DataFrame, OHLCVFrame], engine: Optional[str] = None) -> pd.DataFrame:
+    """
+    OHLCV 데이터프레임(또는 `OHLCVFrame`)에 LibraStrategy 지표와 커스텀 지표를 적용합니다.
+    engine: "numpy"(기본값, `FEATURE_ENGINE` 환경 변수) 또는 "pandas_ta". 두 엔진의 결과 컬럼은 같습니다.
+    """
+    engine = _resolve_engine(engine)
+    if isinstance(df, OHLCVFrame):
+        # pandas-ta가 컬럼을 추가하므로 블록을 공유하지 않는 사본으로 변환
+        df = df.copy().to_pandas()
     if df.empty:
         return pd.DataFrame()
     
     try:
-        df.ta.study(LibraStrategy, append=True)
+        if engine == "pandas_ta":
+            # Child process에서 importlib.metadata를 찾지 못하는 문제 해결
+            import importlib.metadata
+            strategy = _get_libra_strategy()  # pandas_ta 임포트로 df.ta 접근자 등록
+            df.ta.study(strategy, append=True)
+        else:
+            df = append_indicators(df, LIBRA_INDICATORS)
         
         df = _add_bollinger_features(df)
         df = _add_volume_features(df)
@@ -178,27 +234,39 @@ def get_top_ranked_symbols(
     if not market_data:
         return []
 
-    rankings = {}
+    symbols, values = [], []
     for symbol, df in market_data.items():
         if df.empty:
             continue
         try:
             if method == "price":
-                rankings[symbol] = df['close'].iloc[-1]
+                values.append(df['close'].iloc[-1])
             elif method == "volume":
-                rankings[symbol] = df['volume'].iloc[-2:].mean()
-            else: # volatility (기본값)
-                returns = df['close'].pct_change()
-                rankings[symbol] = returns.rolling(window=volatility_window, min_periods=10).std().iloc[-1]
+                values.append(df['volume'].iloc[-2:].mean())
+            else: # volatility (기본값): 최근 volatility_window + 1개 종가만 사용
+                values.append(df['close'].to_numpy(dtype=np.float64)[-volatility_window - 1:])
         except (KeyError, IndexError) as e:
             logger.warning(f"'{symbol}' 심볼 랭킹 계산 중 오류: {e}")
             continue
+        symbols.append(symbol)
 
-    if not rankings:
+    if not symbols:
         return []
 
-    sorted_symbols = sorted(rankings.keys(), key=lambda s: rankings.get(s, -np.inf), reverse=True)
-    top_symbols = sorted_symbols[:top_n]
+    if method in ("price", "volume"):
+        scores = np.asarray(values, dtype=np.float64)
+    else:
+        # (심볼 × 종가) 패널(짧은 이력은 앞쪽 NaN)로 모든 심볼의 마지막 윈도우 표준편차를 한 번에 계산
+        closes = np.full((len(values), volatility_window + 1), np.nan)
+        for i, close in enumerate(values):
+            if len(close):
+                closes[i, -len(close):] = close
+        with np.errstate(invalid="ignore", divide="ignore"):
+            returns = closes[:, 1:] / closes[:, :-1] - 1.0
+        scores = rolling_std(returns, volatility_window, min_periods=min(10, volatility_window))[:, -1]
+
+    top = top_n_indices(np.where(np.isnan(scores), -np.inf, scores), top_n)
+    top_symbols = [symbols[i] for i in top]
     logger.info(f"[{method.capitalize()} 랭킹] 상위 {top_n}개 심볼: {top_symbols}")
     return top_symbols
 
@@ -218,7 +286,7 @@ def get_longest_indicator_period(strategy_name: str = "default") -> int:
     # 인자는 받지만 사용하지 않고 LibraStrategy를 기준으로 계산합니다.
     # 추후 다른 전략이 추가되면 이 부분을 확장할 수 있습니다.
     longest = 0
-    for indicator in LibraStrategy.ta:
+    for indicator in LIBRA_INDICATORS:
         if "length" in indicator:
             longest = max(longest, indicator["length"])
         if "slow" in indicator:
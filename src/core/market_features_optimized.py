@@ -7,36 +7,35 @@
   1) 필수 피처만 선별: 20개 지표 → 8개 핵심 지표로 축소
   2) NumPy 기반 최적화: pandas-ta 대신 직접 구현으로 10x 속도 향상
   3) 메모리 효율성: 불필요한 중간 계산 제거
-  4) 캐싱 메커니즘: 동일 데이터에 대한 중복 계산 방지
+  4) 캐싱 메커니즘: (심볼, 타임프레임, 마지막 캔들, 피처 버전) 키의 바이트 예산 LRU로 중복 계산 방지.
+     캐시는 프로세스별이므로 프로세스 풀 워커(`symbol_features_task`)에서는 워커마다 따로 채워집니다.
+  5) OHLCVFrame 입력: 캔들 배열을 튜플/데이터프레임으로 다시 만들지 않고 그대로 계산
+  6) 워커 작업: 공유 메모리 블록에서 한 심볼의 모든 타임프레임을 한 번에 계산하여 배열로 반환
 """
 from __future__ import annotations
 import logging
-from typing import Dict, List, Optional
-from functools import lru_cache
+from typing import Dict, List, Optional, Union
 import hashlib
 
 import numpy as np
 import pandas as pd
 
+from .ohlcv_frame import OHLCVFrame
+from .feature_cache import FeatureCache, DEFAULT_MAX_BYTES
+from .panel_features import FEATURE_NAMES, ema_panel
+from .rolling import rolling_max, rolling_mean, rolling_min, rolling_std
+from .shared_frames import SharedFramesDescriptor, attach_frames
+
 logger = logging.getLogger(__name__)
 
 # --- 성능 최적화된 기술적 지표 계산 ---
 def _sma(series: np.ndarray, period: int) -> np.ndarray:
     """빠른 단순이동평균 계산"""
-    return pd.Series(series).rolling(window=period, min_periods=1).mean().values
+    return rolling_mean(series, period, min_periods=1)
 
 def _ema(series: np.ndarray, period: int, alpha: Optional[float] = None) -> np.ndarray:
-    """빠른 지수이동평균 계산"""
-    if alpha is None:
-        alpha = 2.0 / (period + 1.0)
-    
-    result = np.empty_like(series)
-    result[0] = series[0]
-    
-    for i in range(1, len(series)):
-        result[i] = alpha * series[i] + (1 - alpha) * result[i-1]
-    
-    return result
+    """빠른 지수이동평균 계산 (블록 가중치 행렬 곱, 캔들별 파이썬 루프 없음)"""
+    return ema_panel(series, period, alpha=alpha)
 
 def _rsi(series: np.ndarray, period: int = 14) -> np.ndarray:
     """빠른 RSI 계산"""
@@ -44,8 +43,8 @@ def _rsi(series: np.ndarray, period: int = 14) -> np.ndarray:
     gain = np.where(delta > 0, delta, 0)
     loss = np.where(delta < 0, -delta, 0)
     
-    avg_gain = pd.Series(gain).rolling(window=period, min_periods=1).mean().values
-    avg_loss = pd.Series(loss).rolling(window=period, min_periods=1).mean().values
+    avg_gain = rolling_mean(gain, period, min_periods=1)
+    avg_loss = rolling_mean(loss, period, min_periods=1)
     
     rs = avg_gain / (avg_loss + 1e-14)
     rsi = 100 - (100 / (1 + rs))
@@ -55,8 +54,8 @@ def _rsi(series: np.ndarray, period: int = 14) -> np.ndarray:
 
 def _stoch_k(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
     """빠른 Stochastic %K 계산"""
-    lowest_low = pd.Series(low).rolling(window=period, min_periods=1).min().values
-    highest_high = pd.Series(high).rolling(window=period, min_periods=1).max().values
+    lowest_low = rolling_min(low, period, min_periods=1)
+    highest_high = rolling_max(high, period, min_periods=1)
     
     k = 100 * (close - lowest_low) / (highest_high - lowest_low + 1e-14)
     return k
@@ -73,35 +72,52 @@ def _macd(series: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9) -
 def _bollinger_bands(series: np.ndarray, period: int = 20, std_dev: float = 2.0) -> tuple:
     """빠른 볼린저 밴드 계산"""
     sma = _sma(series, period)
-    rolling_std = pd.Series(series).rolling(window=period, min_periods=1).std().values
+    std = rolling_std(series, period, min_periods=1)
     
-    upper = sma + (rolling_std * std_dev)
-    lower = sma - (rolling_std * std_dev)
+    upper = sma + (std * std_dev)
+    lower = sma - (std * std_dev)
     
     return upper, sma, lower
 
-# --- 캐싱을 위한 데이터 해시 생성 ---
-def _get_data_hash(df: pd.DataFrame) -> str:
-    """데이터프레임의 해시값을 생성하여 캐시 키로 사용"""
-    try:
-        # 마지막 10행의 OHLCV 데이터로 해시 생성
-        sample = df[['open', 'high', 'low', 'close', 'volume']].tail(10)
-        data_str = sample.to_string()
-        return hashlib.md5(data_str.encode()).hexdigest()[:16]
-    except Exception:
-        return "no_cache"
+# --- 캐시 키 생성 ---
+FEATURE_SET_VERSION = 1          # 피처 계산 로직이 바뀌면 올려서 이전 캐시 항목을 무효화
+_feature_cache = FeatureCache()
+
+
+def configure_cache(max_bytes: int = DEFAULT_MAX_BYTES, spill_dir: Optional[str] = None) -> None:
+    """피처 캐시의 메모리 예산과 디스크 스필 경로를 설정합니다 (기존 항목은 비워집니다)."""
+    global _feature_cache
+    _feature_cache.clear()
+    _feature_cache = FeatureCache(max_bytes=max_bytes, spill_dir=spill_dir)
+
+
+def _get_data_hash(frame: OHLCVFrame) -> str:
+    """시계열 식별자가 없을 때 쓰는 대체 키: 타임스탬프와 OHLCV 블록의 원시 바이트 해시."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(np.ascontiguousarray(frame.timestamp).tobytes())
+    h.update(np.ascontiguousarray(frame.values).tobytes())
+    return h.hexdigest()
+
+
+def _cache_key(frame: OHLCVFrame, symbol: Optional[str], timeframe: Optional[str]) -> tuple:
+    """
+    (심볼, 타임프레임, 윈도우 첫/마지막 캔들 시각, 마지막 캔들 값, 피처 세트 버전) 키.
+    진행 중 캔들은 시각이 같아도 값이 바뀌므로 마지막 행 바이트(40바이트)를 함께 넣습니다.
+    """
+    if symbol is None:
+        return (_get_data_hash(frame), FEATURE_SET_VERSION)
+    return (symbol, timeframe, int(frame.timestamp[0]), int(frame.timestamp[-1]),
+            frame.values[:, -1].tobytes(), FEATURE_SET_VERSION)
+
 
 # --- LRU 캐시를 사용한 피처 계산 ---
-@lru_cache(maxsize=100)
-def _calculate_features_cached(data_hash: str, data_tuple: tuple) -> dict:
-    """캐시된 피처 계산 (튜플 형태의 데이터 사용)"""
+def _calculate_features(frame: OHLCVFrame) -> dict:
+    """OHLCVFrame의 컬럼 뷰에서 바로 피처를 계산합니다."""
     try:
-        # 튜플을 numpy 배열로 변환
-        open_prices = np.array(data_tuple[0])
-        high_prices = np.array(data_tuple[1])
-        low_prices = np.array(data_tuple[2])
-        close_prices = np.array(data_tuple[3])
-        volumes = np.array(data_tuple[4])
+        high_prices = frame.high.astype(np.float64, copy=False)
+        low_prices = frame.low.astype(np.float64, copy=False)
+        close_prices = frame.close.astype(np.float64, copy=False)
+        volumes = frame.volume.astype(np.float64, copy=False)
         
         # 최소 데이터 포인트 확인
         if len(close_prices) < 20:
@@ -140,33 +156,43 @@ def _calculate_features_cached(data_hash: str, data_tuple: tuple) -> dict:
         logger.error(f"피처 계산 오류: {e}")
         return {}
 
+
+def _calculate_features_cached(frame: OHLCVFrame, symbol: Optional[str] = None,
+                               timeframe: Optional[str] = None) -> dict:
+    """같은 시계열의 같은 윈도우에 대해서는 이전 계산 결과를 재사용합니다."""
+    key = _cache_key(frame, symbol, timeframe)
+    cached = _feature_cache.get(key)
+    if cached is not None:
+        return cached
+    features = _calculate_features(frame)
+    _feature_cache.put(key, features)
+    return features
+
 # --- 메인 피처 추출 함수 ---
-def extract_market_features(df: pd.DataFrame) -> pd.DataFrame:
-    """최적화된 피처 추출 (CPU 사용량 80% 감소)"""
-    if df.empty or len(df) < 50:
+def extract_market_features(data: Union[OHLCVFrame, pd.DataFrame], symbol: Optional[str] = None,
+                            timeframe: Optional[str] = None) -> pd.DataFrame:
+    """
+    최적화된 피처 추출 (CPU 사용량 80% 감소).
+
+    `OHLCVFrame`을 받으면 배열을 그대로 사용하고, 데이터프레임은 한 번만 변환합니다.
+    symbol/timeframe을 주면 값 해시 대신 시계열 식별자로 캐시를 조회합니다.
+    """
+    try:
+        frame = OHLCVFrame.coerce(data)
+    except Exception as e:
+        logger.error(f"피처 추출 입력 변환 오류: {e}")
+        return pd.DataFrame()
+    if len(frame) < 50:
         return pd.DataFrame()
     
     try:
-        # 데이터 해시 생성
-        data_hash = _get_data_hash(df)
-        
-        # 캐싱을 위해 데이터를 튜플로 변환
-        data_tuple = (
-            tuple(df['open'].values),
-            tuple(df['high'].values),
-            tuple(df['low'].values),
-            tuple(df['close'].values),
-            tuple(df['volume'].values)
-        )
-        
-        # 캐시된 계산 실행
-        features = _calculate_features_cached(data_hash, data_tuple)
+        features = _calculate_features_cached(frame, symbol, timeframe)
         
         if not features:
             return pd.DataFrame()
         
         # 마지막 타임스탬프를 인덱스로 하는 DataFrame 생성
-        result_df = pd.DataFrame([features], index=[df.index[-1]])
+        result_df = pd.DataFrame([features], index=[pd.Timestamp(int(frame.timestamp[-1]), unit='ms')])
         
         logger.debug(f"최적화된 피처 추출 완료: {len(features)}개 피처")
         return result_df
@@ -175,6 +201,29 @@ def extract_market_features(df: pd.DataFrame) -> pd.DataFrame:
         logger.error(f"피처 추출 오류: {e}")
         return pd.DataFrame()
 
+def symbol_features_task(
+    descriptor: SharedFramesDescriptor, symbol: str, timeframes: List[str], min_bars: int = 50
+) -> tuple:
+    """
+    공유 블록에서 한 심볼의 여러 타임프레임 피처를 한 작업으로 계산합니다 (프로세스 풀용).
+    (심볼, 타임프레임) 키로 이 워커 프로세스의 피처 캐시를 조회하므로, 같은 워커가 같은 윈도우를 다시 받으면 재계산하지 않습니다.
+    Returns: (계산된 타임프레임 목록, (타임프레임 × len(FEATURE_NAMES)) 행렬).
+    """
+    done: List[str] = []
+    rows: List[List[float]] = []
+    with attach_frames(descriptor) as frames:
+        for tf in timeframes:
+            frame = frames.get((symbol, tf))
+            if frame is None or len(frame) < max(min_bars, 50):
+                continue
+            features = _calculate_features_cached(frame, symbol, tf)
+            if features:
+                done.append(tf)
+                rows.append([features[name] for name in FEATURE_NAMES])
+        frame = None   # 블록을 닫기 전에 뷰 참조 해제
+    matrix = np.asarray(rows, dtype=np.float64).reshape(len(rows), len(FEATURE_NAMES))
+    return done, matrix
+
 # --- MTF 피처 병합 (최적화) ---
 def combine_mtf_features(feature_df_dict: Dict[str, pd.DataFrame]) -> pd.DataFrame:
     """
@@ -232,14 +281,18 @@ def last_row_to_feature_dict(df: pd.DataFrame) -> Dict[str, float]:
 # --- 성능 통계 ---
 def get_cache_info() -> dict:
     """캐시 사용 통계 반환"""
+    info = _feature_cache.info()
     return {
-        "cache_hits": _calculate_features_cached.cache_info().hits,
-        "cache_misses": _calculate_features_cached.cache_info().misses,
-        "cache_size": _calculate_features_cached.cache_info().currsize,
-        "cache_maxsize": _calculate_features_cached.cache_info().maxsize,
+        "cache_hits": info["hits"],
+        "cache_misses": info["misses"],
+        "cache_evictions": info["evictions"],
+        "cache_spill_hits": info["spill_hits"],
+        "cache_size": info["entries"],
+        "cache_bytes": info["bytes"],
+        "cache_max_bytes": info["max_bytes"],
     }
 
 def clear_cache():
     """캐시 초기화"""
-    _calculate_features_cached.cache_clear()
-    logger.info("피처 계산 캐시를 초기화했습니다.")
\ No newline at end of file
+    _feature_cache.clear()
+    logger.info("피처 계산 캐시를 초기화했습니다.")
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""
+심볼별 메모리 맵(.npy) OHLCV 데이터셋 변환기 및 로더
+
+- 목적: 수백 MB~수 GB 규모의 1분봉 CSV를 매 훈련/백테스트마다 `pd.read_csv`로 파싱하지 않도록,
+  한 번 변환해 둔 컬럼별 `.npy` 파일을 메모리 맵으로 열어 즉시 사용합니다.
+- 핵심 기능:
+  1) 일회성 변환: CSV를 청크 단위로 읽어 심볼별 `timestamp.npy`(int64, ms)와 OHLCV `.npy`(float32)로 기록합니다.
+  2) 인덱스 파일: `index.json`에 심볼별 디렉토리, 행 수, 시작/종료 시각과 무결성 정보(갭/중복)를 기록합니다.
+  3) 제로 카피 로더: `np.load(mmap_mode='r')` + `searchsorted`로 심볼/기간 슬라이스를 복사 없이 반환합니다.
+     여러 훈련 프로세스가 같은 파일을 열면 OS 페이지 캐시를 공유합니다.
+  4) 프레임 기록: `write_memmap_dataset`으로 이미 메모리에 있는 `OHLCVFrame`을 같은 형식으로 기록합니다 (데이터셋 레지스트리).
+"""
+from __future__ import annotations
+import os
+import json
+import shutil
+import logging
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .ohlcv_frame import OHLCVFrame
+from .ohlcv_store import OHLCV_COLUMNS, safe_symbol
+from .ohlcv_integrity import scan_timestamps
+
+logger = logging.getLogger(__name__)
+
+# --- 상수 정의 ---
+INDEX_FILENAME = "index.json"
+FORMAT_VERSION = 1
+TIMESTAMP_COLUMN = "timestamp"
+PRICE_DTYPE = np.float32
+TIME_DTYPE = np.int64
+
+_TIMESTAMP_CANDIDATES = ("timestamp", "datetime", "date", "time", "open_time")
+_SYMBOL_CANDIDATES = ("symbol", "ticker", "pair", "coin")
+
+TimeLike = Union[str, int, pd.Timestamp, None]
+
+
+# --- 헬퍼 함수 ---
+def is_memmap_dataset(path: Union[str, Path, None]) -> bool:
+    """경로가 변환된 메모리 맵 데이터셋 디렉토리인지 확인합니다."""
+    return path is not None and (Path(path) / INDEX_FILENAME).is_file()
+
+
+def _find_column(columns: Iterable[str], candidates: Iterable[str]) -> Optional[str]:
+    lowered = {c.lower(): c for c in columns}
+    for name in candidates:
+        if name in lowered:
+            return lowered[name]
+    return None
+
+
+def _compact_symbol(symbol: str) -> str:
+    """'BTC/USDT:USDT', 'BTC_USDT' 등을 정산 통화 없이 붙여 쓴 형태('BTCUSDT')로 변환합니다."""
+    return symbol.split(':')[0].replace('/', '').replace('_', '')
+
+
+def _to_epoch_ms(values: pd.Series) -> np.ndarray:
+    """타임스탬프 컬럼(문자열/초/밀리초)을 UTC 기준 epoch 밀리초(int64)로 변환합니다."""
+    if pd.api.types.is_numeric_dtype(values):
+        arr = values.to_numpy(dtype=np.int64)
+        # 초 단위 타임스탬프는 밀리초로 변환 (2001년 이후 ms 값은 1e12 이상)
+        return arr * 1000 if len(arr) and arr.max() < 10**11 else arr
+    parsed = pd.to_datetime(values, utc=True)
+    return (parsed.astype("int64") // 10**6).to_numpy(dtype=np.int64)
+
+
+def _to_ms(value: TimeLike) -> Optional[int]:
+    if value is None:
+        return None
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    ts = pd.Timestamp(value)
+    ts = ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+    return int(ts.value // 10**6)
+
+
+def _end_to_ms(value: TimeLike) -> Optional[int]:
+    """
+    구간 끝(포함)을 epoch 밀리초로 변환합니다. 'YYYY-MM-DD'처럼 날짜만 있는 문자열은 그날 마지막 순간까지 포함합니다
+    (`df.loc[start:end]` 부분 문자열 슬라이싱 및 `runner.get_ohlcv_data`의 end_date와 같은 의미).
+    """
+    if isinstance(value, str):
+        try:
+            day = date.fromisoformat(value.strip())
+        except ValueError:
+            day = None
+        if day is not None:
+            return _to_ms(pd.Timestamp(day) + pd.Timedelta(days=1)) - 1
+    return _to_ms(value)
+
+
+def _integrity_summary(ts_sorted: np.ndarray) -> Optional[dict]:
+    """정렬된 타임스탬프의 갭/중복 정보를 인덱스에 기록할 형태로 요약합니다. 캔들 간격은 중앙값으로 추정합니다."""
+    if len(ts_sorted) < 2:
+        return None
+    step_ms = int(np.median(np.diff(ts_sorted)))
+    report = scan_timestamps(ts_sorted, step_ms)
+    return {"step_ms": step_ms, "gaps": report.gaps, "missing_bars": report.missing_bars, "duplicates": report.duplicates}
+
+
+# --- 변환기 ---
+def convert_csv_to_memmap(
+    csv_path: Union[str, Path],
+    out_dir: Union[str, Path],
+    symbol: Optional[str] = None,
+    chunksize: int = 1_000_000,
+) -> Dict[str, dict]:
+    """
+    OHLCV CSV를 심볼별 메모리 맵 `.npy` 데이터셋으로 변환합니다.
+
+    Args:
+        csv_path: 원본 CSV 경로. 심볼 컬럼(symbol/ticker 등)이 있으면 심볼별로 분리합니다.
+        out_dir: 출력 디렉토리. `index.json`과 심볼별 하위 디렉토리가 생성됩니다.
+        symbol: 심볼 컬럼이 없는 단일 심볼 CSV의 심볼 이름 (기본값: 파일 이름).
+        chunksize: 한 번에 읽을 CSV 행 수. 메모리 사용량 상한을 결정합니다.
+
+    Returns:
+        Dict[str, dict]: index.json에 기록된 심볼별 메타데이터.
+    """
+    csv_path, out_dir = Path(csv_path), Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    staging_dir = out_dir / ".staging"
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    staging_dir.mkdir()
+
+    default_symbol = symbol or csv_path.stem
+    columns = [TIMESTAMP_COLUMN] + OHLCV_COLUMNS
+    row_counts: Dict[str, int] = {}
+
+    # 1단계: 청크 단위로 읽어 심볼별 raw 바이너리 파일에 이어 쓰기
+    logger.info(f"[메모리맵] {csv_path.name} 변환 시작 (청크 크기: {chunksize:,})")
+    for chunk in pd.read_csv(csv_path, chunksize=chunksize):
+        ts_col = _find_column(chunk.columns, _TIMESTAMP_CANDIDATES)
+        if ts_col is None:
+            raise ValueError(f"타임스탬프 컬럼을 찾을 수 없습니다: {list(chunk.columns)}")
+        sym_col = _find_column(chunk.columns, _SYMBOL_CANDIDATES)
+        chunk = chunk.rename(columns={ts_col: TIMESTAMP_COLUMN, **{c: c.lower() for c in chunk.columns if c.lower() in OHLCV_COLUMNS}})
+
+        groups = chunk.groupby(sym_col, sort=False) if sym_col else [(default_symbol, chunk)]
+        for sym, part in groups:
+            sym_dir = staging_dir / safe_symbol(str(sym))
+            sym_dir.mkdir(exist_ok=True)
+            ts = _to_epoch_ms(part[TIMESTAMP_COLUMN])
+            with open(sym_dir / f"{TIMESTAMP_COLUMN}.bin", "ab") as f:
+                ts.astype(TIME_DTYPE).tofile(f)
+            for col in OHLCV_COLUMNS:
+                with open(sym_dir / f"{col}.bin", "ab") as f:
+                    part[col].to_numpy(dtype=PRICE_DTYPE).tofile(f)
+            row_counts[str(sym)] = row_counts.get(str(sym), 0) + len(part)
+
+    # 2단계: raw 파일을 시간순으로 정렬된 .npy 파일로 확정
+    index: Dict[str, dict] = {}
+    for sym, rows in row_counts.items():
+        src_dir = staging_dir / safe_symbol(sym)
+        dst_dir = out_dir / safe_symbol(sym)
+        dst_dir.mkdir(exist_ok=True)
+
+        ts = np.fromfile(src_dir / f"{TIMESTAMP_COLUMN}.bin", dtype=TIME_DTYPE)
+        order = None if np.all(ts[1:] >= ts[:-1]) else np.argsort(ts, kind="stable")
+        for col in columns:
+            dtype = TIME_DTYPE if col == TIMESTAMP_COLUMN else PRICE_DTYPE
+            raw = ts if col == TIMESTAMP_COLUMN else np.memmap(src_dir / f"{col}.bin", dtype=dtype, mode="r")
+            out = np.lib.format.open_memmap(dst_dir / f"{col}.npy", mode="w+", dtype=dtype, shape=(rows,))
+            out[:] = raw if order is None else raw[order]
+            out.flush()
+            del out, raw
+
+        ts_sorted = ts if order is None else ts[order]
+        index[sym] = {
+            "dir": safe_symbol(sym),
+            "rows": int(rows),
+            "start_ms": int(ts_sorted[0]) if rows else None,
+            "end_ms": int(ts_sorted[-1]) if rows else None,
+            "integrity": _integrity_summary(ts_sorted),
+        }
+        logger.info(f"[메모리맵] {sym}: {rows:,}개 행 변환 완료")
+
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    _write_index(out_dir, csv_path.name, index)
+    return index
+
+
+def write_memmap_dataset(out_dir: Union[str, Path], frames: Mapping[str, OHLCVFrame], source: str) -> Dict[str, dict]:
+    """
+    메모리에 있는 심볼별 `OHLCVFrame`을 `convert_csv_to_memmap`과 같은 형식의 데이터셋으로 기록합니다.
+    프레임은 시간순으로 정렬되어 있어야 합니다.
+
+    Returns:
+        Dict[str, dict]: index.json에 기록된 심볼별 메타데이터.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    index: Dict[str, dict] = {}
+    for sym, frame in frames.items():
+        dst_dir = out_dir / safe_symbol(sym)
+        dst_dir.mkdir(exist_ok=True)
+        np.save(dst_dir / f"{TIMESTAMP_COLUMN}.npy", frame.timestamp.astype(TIME_DTYPE))
+        for col in OHLCV_COLUMNS:
+            np.save(dst_dir / f"{col}.npy", frame.column(col).astype(PRICE_DTYPE))
+        rows = len(frame)
+        index[sym] = {
+            "dir": safe_symbol(sym),
+            "rows": int(rows),
+            "start_ms": int(frame.timestamp[0]) if rows else None,
+            "end_ms": int(frame.timestamp[-1]) if rows else None,
+            "integrity": _integrity_summary(frame.timestamp),
+        }
+    _write_index(out_dir, source, index)
+    return index
+
+
+def _write_index(out_dir: Path, source: str, index: Dict[str, dict]) -> None:
+    meta = {
+        "version": FORMAT_VERSION,
+        "source": source,
+        "columns": [TIMESTAMP_COLUMN] + OHLCV_COLUMNS,
+        "dtypes": {TIMESTAMP_COLUMN: np.dtype(TIME_DTYPE).name, **{c: np.dtype(PRICE_DTYPE).name for c in OHLCV_COLUMNS}},
+        "symbols": index,
+    }
+    tmp_index = out_dir / f"{INDEX_FILENAME}.tmp"
+    with open(tmp_index, "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_index, out_dir / INDEX_FILENAME)
+
+
+# --- 로더 ---
+class MemmapDataset:
+    """
+    `convert_csv_to_memmap`으로 생성된 데이터셋을 읽기 전용 메모리 맵으로 엽니다.
+
+    Args:
+        root: `index.json`이 있는 데이터셋 디렉토리.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+        with open(self.root / INDEX_FILENAME, "r", encoding="utf-8") as f:
+            self.meta = json.load(f)
+        self._arrays: Dict[str, Dict[str, np.ndarray]] = {}
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self.meta["symbols"].keys())
+
+    def resolve_symbol(self, symbol: str) -> str:
+        """'BTC/USDT', 'BTC/USDT:USDT', 'BTCUSDT' 같은 표기 차이를 흡수하여 인덱스의 심볼 키를 찾습니다."""
+        symbols = self.meta["symbols"]
+        if symbol in symbols:
+            return symbol
+        wanted = {symbol, safe_symbol(symbol), _compact_symbol(symbol)}
+        for key, info in symbols.items():
+            if key in wanted or info["dir"] in wanted or _compact_symbol(key) in wanted:
+                return key
+        raise KeyError(f"데이터셋에 심볼이 없습니다: {symbol} (보유: {self.symbols[:10]}...)")
+
+    def _open(self, symbol: str) -> Dict[str, np.ndarray]:
+        key = self.resolve_symbol(symbol)
+        if key not in self._arrays:
+            sym_dir = self.root / self.meta["symbols"][key]["dir"]
+            self._arrays[key] = {
+                col: np.load(sym_dir / f"{col}.npy", mmap_mode="r") for col in self.meta["columns"]
+            }
+        return self._arrays[key]
+
+    def load_slice(self, symbol: str, start: TimeLike = None, end: TimeLike = None) -> Dict[str, np.ndarray]:
+        """
+        [start, end] 구간의 컬럼 배열을 복사 없이(메모리 맵 뷰) 반환합니다. 날짜만 있는 end는 그날 전체를 포함합니다.
+
+        Returns:
+            Dict[str, np.ndarray]: 'timestamp'(int64 ms) 및 OHLCV(float32) 읽기 전용 뷰.
+        """
+        arrays = self._open(symbol)
+        ts = arrays[TIMESTAMP_COLUMN]
+        start_ms, end_ms = _to_ms(start), _end_to_ms(end)
+        lo = 0 if start_ms is None else int(np.searchsorted(ts, start_ms, side="left"))
+        hi = len(ts) if end_ms is None else int(np.searchsorted(ts, end_ms, side="right"))
+        return {col: arr[lo:hi] for col, arr in arrays.items()}
+
+    def to_ohlcv_frame(self, symbol: str, start: TimeLike = None, end: TimeLike = None) -> OHLCVFrame:
+        """구간 슬라이스를 `OHLCVFrame`으로 반환합니다 (컬럼 파일들을 (5, n) 블록으로 1회 복사)."""
+        cols = self.load_slice(symbol, start, end)
+        return OHLCVFrame.from_columns(cols[TIMESTAMP_COLUMN], *(cols[c] for c in OHLCV_COLUMNS))
+
+    def to_frame(self, symbol: str, start: TimeLike = None, end: TimeLike = None) -> pd.DataFrame:
+        """구간 슬라이스를 UTC DatetimeIndex('timestamp')를 가진 OHLCV 데이터프레임으로 반환합니다."""
+        return self.to_ohlcv_frame(symbol, start, end).to_pandas(tz="UTC")
+
+
+def load_ohlcv_frame(path: Union[str, Path], symbol: str, start: TimeLike = None, end: TimeLike = None) -> pd.DataFrame:
+    """
+    로컬 OHLCV 데이터를 로드합니다. 메모리 맵 데이터셋이면 슬라이스만 읽고, 아니면 CSV로 간주합니다.
+    두 경우 모두 UTC tz-aware 인덱스와 같은 구간 규칙([start, end], 날짜만 있는 end는 그날 전체)을 따릅니다.
+    CSV의 tz-naive 시각은 UTC로 간주합니다 (`convert_csv_to_memmap`과 동일).
+    """
+    if is_memmap_dataset(path):
+        return MemmapDataset(path).to_frame(symbol, start, end)
+    df = pd.read_csv(path, index_col=TIMESTAMP_COLUMN)
+    ts_ms = _to_epoch_ms(df.index.to_series())
+    start_ms, end_ms = _to_ms(start), _end_to_ms(end)
+    if start_ms is not None or end_ms is not None:
+        mask = np.ones(len(ts_ms), dtype=bool)
+        if start_ms is not None:
+            mask &= ts_ms >= start_ms
+        if end_ms is not None:
+            mask &= ts_ms <= end_ms
+        df, ts_ms = df.loc[mask], ts_ms[mask]
+    df.index = pd.DatetimeIndex(pd.to_datetime(ts_ms, unit="ms", utc=True), name=TIMESTAMP_COLUMN)
+    return df
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+기준 해상도 캔들로부터 파생한 다중 타임프레임(MTF) 피처
+
+- 목적: 5m/1h/1d를 따로 조회해 마지막 행만 잇는 `combine_mtf_features`와 달리, 기준 해상도 캔들 하나에서
+  상위 타임프레임 캔들을 로컬로 만들고, 타임프레임별 피처를 기준 인덱스 전체 이력에 미래 참조 없이 붙입니다.
+- 핵심 기능:
+  1) 리샘플: epoch 기준으로 정렬된 버킷(1d는 UTC 자정, 1w는 월요일 시작)에 open=첫 값, high=최대, low=최소,
+     close=마지막 값, volume=합으로 집계합니다 (`np.*.reduceat`, 파이썬 루프 없음).
+  2) as-of 정렬: 각 캔들을 마감 시각(시작 + 길이)으로 키를 잡아, 기준 캔들이 마감된 시점에 이미 마감된
+     상위 타임프레임 캔들의 피처만 붙입니다. 진행 중인 상위 캔들의 값은 사용하지 않습니다.
+  3) 실시간 파생: `derive_frames`로 기준 `OHLCVFrame`에서 상위 타임프레임 프레임을 만들어 타임프레임별 API 조회를 대체합니다.
+"""
+from __future__ import annotations
+import logging
+from typing import Callable, Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .ohlcv_frame import OHLCVFrame
+from .ohlcv_integrity import timeframe_to_ms
+
+logger = logging.getLogger(__name__)
+
+# --- 상수 정의 ---
+_WEEK_ORIGIN_MS = 4 * 86_400_000   # epoch(1970-01-01)은 목요일 → 주봉은 월요일 00:00 UTC 시작
+
+
+def _bucket_origin(timeframe: str) -> int:
+    return _WEEK_ORIGIN_MS if timeframe.endswith("w") else 0
+
+
+# --- 리샘플 ---
+def resample_frame(frame: OHLCVFrame, timeframe: str) -> OHLCVFrame:
+    """
+    시간순으로 정렬된 기준 프레임을 상위 타임프레임 프레임으로 집계합니다.
+    마지막 버킷은 진행 중인 캔들일 수 있습니다 (거래소가 반환하는 현재 캔들과 같은 의미).
+    """
+    if len(frame) == 0:
+        return OHLCVFrame.empty(frame.dtype)
+    tf_ms = timeframe_to_ms(timeframe)
+    origin = _bucket_origin(timeframe)
+    buckets = (frame.timestamp - origin) // tf_ms * tf_ms + origin
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(frame)] - 1
+    values = np.empty((5, len(starts)), dtype=frame.dtype)
+    values[0] = frame.open[starts]
+    values[1] = np.maximum.reduceat(frame.high, starts)
+    values[2] = np.minimum.reduceat(frame.low, starts)
+    values[3] = frame.close[ends]
+    values[4] = np.add.reduceat(frame.volume, starts)
+    return OHLCVFrame(buckets[starts], values)
+
+
+def resample_ohlcv(df: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    """OHLCV 데이터프레임(DatetimeIndex)을 상위 타임프레임으로 집계합니다. 시간대는 입력과 같게 유지합니다."""
+    tz = pd.DatetimeIndex(df.index).tz
+    out = resample_frame(OHLCVFrame.from_pandas(df), timeframe).to_pandas(tz=str(tz) if tz is not None else None)
+    out.index.name = df.index.name
+    return out
+
+
+def derive_frames(frame: OHLCVFrame, timeframes: Sequence[str]) -> Dict[str, OHLCVFrame]:
+    """기준 프레임 하나에서 여러 상위 타임프레임 프레임을 만듭니다 (실시간 루프의 타임프레임별 조회 대체)."""
+    return {tf: resample_frame(frame, tf) for tf in timeframes}
+
+
+# --- as-of 정렬 ---
+def _index_ms(index: pd.Index) -> np.ndarray:
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+    return index.as_unit("ms").asi8
+
+
+def _infer_timeframe_ms(index: pd.Index) -> int:
+    ms = _index_ms(index)
+    if len(ms) < 2:
+        raise ValueError("기준 타임프레임을 추정하려면 최소 2개 캔들이 필요합니다.")
+    return int(np.median(np.diff(ms)))
+
+
+def asof_align(base_close_ms: np.ndarray, other_close_ms: np.ndarray) -> np.ndarray:
+    """
+    각 기준 마감 시각에 대해 그 시각 이전(같은 시각 포함)에 마감된 마지막 행 위치를 반환합니다. 없으면 -1.
+    (`pd.merge_asof(direction='backward')`와 같은 규칙)
+    """
+    return np.searchsorted(other_close_ms, base_close_ms, side="right") - 1
+
+
+def build_mtf_features(
+    df_base: pd.DataFrame,
+    timeframes: Sequence[str],
+    base_timeframe: Optional[str] = None,
+    compute: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+) -> pd.DataFrame:
+    """
+    기준 해상도 OHLCV 전체 이력에 상위 타임프레임 피처를 붙인 데이터프레임을 반환합니다.
+
+    Args:
+        df_base: 기준 해상도 OHLCV 데이터프레임 (DatetimeIndex, 캔들 시작 시각).
+        timeframes: 파생할 상위 타임프레임 목록 (예: ("1h", "4h")).
+        base_timeframe: 기준 타임프레임 (예: "1m"). None이면 인덱스 간격의 중앙값으로 추정합니다.
+        compute: 타임프레임별 피처 함수. 기본값은 `market_features.extract_market_features`.
+
+    Returns:
+        기준 피처 컬럼 + `<컬럼>_<타임프레임>` 컬럼. 모든 상위 타임프레임 피처가 준비되기 전 행은 제외합니다.
+    """
+    if compute is None:
+        from .market_features import extract_market_features as compute
+    base_ms = timeframe_to_ms(base_timeframe) if base_timeframe else _infer_timeframe_ms(df_base.index)
+
+    features = compute(df_base)
+    if features is None or features.empty or not timeframes:
+        return features
+    base_close = _index_ms(features.index) + base_ms
+
+    parts = [features]
+    for tf in timeframes:
+        tf_ms = timeframe_to_ms(tf)
+        if tf_ms <= base_ms:
+            raise ValueError(f"상위 타임프레임은 기준 타임프레임({base_ms}ms)보다 길어야 합니다: {tf}")
+        tf_features = compute(resample_ohlcv(df_base, tf))
+        if tf_features is None or tf_features.empty:
+            logger.warning(f"[MTF] {tf} 피처가 비어 있습니다 (기준 캔들 {len(df_base)}개).")
+            return pd.DataFrame()
+        columns = [f"{c}_{tf}" for c in tf_features.columns]
+        positions = asof_align(base_close, _index_ms(tf_features.index) + tf_ms)
+        values = tf_features.to_numpy(dtype=np.float64)[np.maximum(positions, 0)]
+        values[positions < 0] = np.nan
+        parts.append(pd.DataFrame(values, index=features.index, columns=columns))
+
+    merged = pd.concat(parts, axis=1)
+    return merged.dropna()
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+경량 OHLCV 컨테이너 (Struct-of-Arrays)
+
+- 목적: ccxt 리스트 → DataFrame → 복사본 → 파이썬 튜플 → NumPy 배열로 매 사이클 형태를 바꾸며 생기는
+  전체 복사를 없애고, 파이프라인 전 구간에서 같은 배열을 그대로 전달합니다.
+- 핵심 기능:
+  1) 메모리 배치: int64 타임스탬프(ms) 배열 1개 + OHLCV 값을 담은 (5, n) 블록 1개 (생성 시 C-연속).
+     각 컬럼(`open`, `high`, ...)은 블록의 행 뷰이므로 연속 메모리이며 복사 없이 접근합니다.
+  2) 슬라이싱: `frame[a:b]`, `tail(n)`은 원본 배열의 뷰를 공유하는 새 프레임을 반환합니다.
+  3) 제로 카피 변환: `to_pandas()`는 블록을 pandas 내부 블록 배치((컬럼, 행))에 그대로 넘겨 복사 없이 생성합니다.
+  4) 직렬화 비용 최소화: `__slots__`만 가진 객체라 프로세스 풀에 보낼 때 배열 2개만 피클링됩니다.
+"""
+from __future__ import annotations
+from typing import Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+OHLCV_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+_FIELD_INDEX = {name: i for i, name in enumerate(OHLCV_FIELDS)}
+
+
+class OHLCVFrame:
+    """
+    타임스탬프(int64 ms)와 (5, n) OHLCV 블록으로 구성된 캔들 시퀀스.
+
+    Args:
+        timestamp: epoch 밀리초 int64 배열 (길이 n).
+        values: OHLCV 값 블록 (5, n). 컬럼(행)별로 연속이 아니면 한 번만 연속 배열로 변환합니다.
+    """
+
+    __slots__ = ('timestamp', 'values')
+
+    def __init__(self, timestamp: np.ndarray, values: np.ndarray):
+        timestamp = np.asarray(timestamp, dtype=np.int64)
+        values = np.asarray(values)
+        if values.dtype not in (np.float32, np.float64):
+            values = values.astype(np.float64)
+        if values.ndim != 2 or values.shape[0] != len(OHLCV_FIELDS) or values.shape[1] != timestamp.shape[0]:
+            raise ValueError(f"values는 (5, {timestamp.shape[0]}) 형태여야 합니다: {values.shape}")
+        self.timestamp = timestamp
+        # 컬럼(행)별로 연속이면 슬라이스 뷰도 그대로 공유하고, 아니면 한 번만 연속 배열로 변환
+        row_contiguous = values.shape[1] <= 1 or values.strides[1] == values.itemsize
+        self.values = values if row_contiguous else np.ascontiguousarray(values)
+
+    # --- 생성자 ---
+    @classmethod
+    def empty(cls, dtype=np.float64) -> "OHLCVFrame":
+        return cls(np.empty(0, dtype=np.int64), np.empty((len(OHLCV_FIELDS), 0), dtype=dtype))
+
+    @classmethod
+    def from_ccxt(cls, bars: Sequence[Sequence[float]], dtype=np.float64) -> "OHLCVFrame":
+        """ccxt `fetch_ohlcv` 결과([[ts, o, h, l, c, v], ...])를 한 번의 배열 변환으로 프레임으로 만듭니다."""
+        if not bars:
+            return cls.empty(dtype)
+        arr = np.asarray(bars, dtype=np.float64)
+        return cls(arr[:, 0].astype(np.int64), np.ascontiguousarray(arr[:, 1:6].T, dtype=dtype))
+
+    @classmethod
+    def from_columns(cls, timestamp: np.ndarray, open, high, low, close, volume, dtype=None) -> "OHLCVFrame":
+        """컬럼 배열들로부터 프레임을 만듭니다 (블록 구성을 위해 1회 복사)."""
+        values = np.stack([open, high, low, close, volume])
+        return cls(timestamp, values if dtype is None else values.astype(dtype, copy=False))
+
+    @classmethod
+    def from_pandas(cls, df: pd.DataFrame, dtype=np.float64) -> "OHLCVFrame":
+        """
+        DatetimeIndex 또는 'timestamp' 컬럼을 가진 OHLCV 데이터프레임을 변환합니다.
+        컬럼 이름은 대소문자를 구분하지 않습니다.
+        """
+        if df is None or df.empty:
+            return cls.empty(dtype)
+        cols = {c.lower() if isinstance(c, str) else c: c for c in df.columns}
+        if 'timestamp' in cols:
+            ts = pd.DatetimeIndex(pd.to_datetime(df[cols['timestamp']]))
+        else:
+            ts = pd.DatetimeIndex(df.index)
+        if ts.tz is not None:
+            ts = ts.tz_convert('UTC').tz_localize(None)
+        values = df[[cols[f] for f in OHLCV_FIELDS]].to_numpy(dtype=dtype).T
+        return cls(ts.asi8 // 10**6, values)
+
+    @classmethod
+    def coerce(cls, data: Union["OHLCVFrame", pd.DataFrame, Sequence]) -> "OHLCVFrame":
+        """OHLCVFrame, 데이터프레임, ccxt 리스트 중 무엇이든 OHLCVFrame으로 변환합니다."""
+        if isinstance(data, OHLCVFrame):
+            return data
+        if isinstance(data, pd.DataFrame):
+            return cls.from_pandas(data)
+        return cls.from_ccxt(data)
+
+    # --- 컬럼 뷰 ---
+    @property
+    def open(self) -> np.ndarray:
+        return self.values[0]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self.values[1]
+
+    @property
+    def low(self) -> np.ndarray:
+        return self.values[2]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self.values[3]
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self.values[4]
+
+    def column(self, name: str) -> np.ndarray:
+        return self.values[_FIELD_INDEX[name]]
+
+    # --- 기본 연산 ---
+    def __len__(self) -> int:
+        return self.timestamp.shape[0]
+
+    def __getitem__(self, key: slice) -> "OHLCVFrame":
+        if not isinstance(key, slice):
+            raise TypeError("OHLCVFrame은 슬라이스 인덱싱만 지원합니다.")
+        return OHLCVFrame(self.timestamp[key], self.values[:, key])
+
+    def __repr__(self) -> str:
+        if len(self) == 0:
+            return "OHLCVFrame(empty)"
+        first, last = pd.Timestamp(self.timestamp[0], unit='ms'), pd.Timestamp(self.timestamp[-1], unit='ms')
+        return f"OHLCVFrame({len(self)} bars, {first} ~ {last}, {self.values.dtype})"
+
+    def __getstate__(self):
+        return self.timestamp, self.values
+
+    def __setstate__(self, state):
+        self.timestamp, self.values = state
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.values.dtype
+
+    @property
+    def nbytes(self) -> int:
+        return self.timestamp.nbytes + self.values.nbytes
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        return int(self.timestamp[-1]) if len(self) else None
+
+    def tail(self, n: int) -> "OHLCVFrame":
+        return self[max(0, len(self) - n):]
+
+    def between(self, start_ms: Optional[int] = None, end_ms: Optional[int] = None) -> "OHLCVFrame":
+        """[start_ms, end_ms] 구간의 뷰를 반환합니다 (타임스탬프는 정렬되어 있다고 가정)."""
+        lo = 0 if start_ms is None else int(np.searchsorted(self.timestamp, start_ms, side='left'))
+        hi = len(self) if end_ms is None else int(np.searchsorted(self.timestamp, end_ms, side='right'))
+        return self[lo:hi]
+
+    def astype(self, dtype) -> "OHLCVFrame":
+        return OHLCVFrame(self.timestamp, self.values.astype(dtype, copy=False))
+
+    def copy(self) -> "OHLCVFrame":
+        return OHLCVFrame(self.timestamp.copy(), self.values.copy())
+
+    # --- 변환 ---
+    def datetime_index(self, tz: Optional[str] = None, name: str = 'timestamp') -> pd.DatetimeIndex:
+        index = pd.DatetimeIndex(self.timestamp.astype('datetime64[ms]').astype('datetime64[ns]'), name=name)
+        return index.tz_localize('UTC').tz_convert(tz) if tz else index
+
+    def to_pandas(self, tz: Optional[str] = None, timestamp_column: bool = False) -> pd.DataFrame:
+        """
+        데이터프레임으로 변환합니다. OHLCV 값은 복사하지 않고 블록을 공유합니다.
+
+        Args:
+            tz: 지정하면 해당 시간대의 tz-aware 인덱스 (예: 'UTC'). 기본은 tz-naive UTC.
+            timestamp_column: True면 인덱스 대신 'timestamp' 컬럼 + RangeIndex 형태
+                (실시간 엔진의 REST 조회 결과와 같은 형태)로 반환합니다.
+        """
+        index = self.datetime_index(tz)
+        df = pd.DataFrame(self.values.T, index=index, columns=list(OHLCV_FIELDS), copy=False)
+        if timestamp_column:
+            df = df.reset_index()
+        return df
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""
+OHLCV 캔들 무결성 검사기 및 매니페스트
+
+- 목적: 캐시된 캔들의 누락 구간, 중복, 역순 타임스탬프를 벡터화 연산으로 한 번에 찾아내고,
+  결과를 파일별 매니페스트로 남겨 로더와 백필 계층이 매번 전체를 다시 스캔하지 않게 합니다.
+- 핵심 기능:
+  1) 벡터화 스캔: `np.diff`로 타임스탬프 간격을 계산하여 갭 구간([시작, 끝) ms), 중복, 역순 개수를 구합니다.
+  2) 콘텐츠 해시: 타임스탬프와 OHLCV 값의 바이트에 대한 BLAKE2b 해시로 데이터 동일성을 식별합니다.
+  3) 매니페스트: 커버 구간, 갭 목록, 해시, 원본 파일 크기/수정 시각을 `_manifest.json`으로 저장합니다.
+     원본 파일이 바뀌지 않았으면 매니페스트를 그대로 신뢰합니다.
+  4) 구간 연산: 반열린 구간 목록의 병합/차집합 헬퍼를 제공합니다 (백필 누락 구간 계산용).
+"""
+from __future__ import annotations
+import os
+import json
+import hashlib
+import logging
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# --- 상수 정의 ---
+MANIFEST_FILENAME = "_manifest.json"   # pyarrow.dataset이 무시하는 접두사(_) 사용
+MANIFEST_VERSION = 1
+
+_TF_UNIT_MS = {"m": 60_000, "h": 3_600_000, "d": 86_400_000, "w": 604_800_000}
+
+Range = Tuple[int, int]
+
+
+# --- 헬퍼 함수 ---
+def timeframe_to_ms(timeframe: str) -> int:
+    """'1m', '5m', '1h', '1d', '1w' 형식의 타임프레임을 밀리초로 변환합니다."""
+    unit = timeframe[-1]
+    if unit not in _TF_UNIT_MS or not timeframe[:-1].isdigit():
+        raise ValueError(f"지원하지 않는 타임프레임입니다: {timeframe}")
+    return int(timeframe[:-1]) * _TF_UNIT_MS[unit]
+
+
+def merge_ranges(ranges: List[Range]) -> List[Range]:
+    """겹치거나 맞닿은 반열린 구간 [s, e)들을 병합합니다."""
+    merged: List[Range] = []
+    for s, e in sorted(r for r in ranges if r[1] > r[0]):
+        if merged and s <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], e))
+        else:
+            merged.append((s, e))
+    return merged
+
+
+def subtract_ranges(ranges: List[Range], holes: List[Range]) -> List[Range]:
+    """ranges에서 holes와 겹치는 부분을 제거한 구간 목록을 반환합니다."""
+    result: List[Range] = []
+    holes = merge_ranges(holes)
+    for s, e in merge_ranges(ranges):
+        cursor = s
+        for hs, he in holes:
+            if he <= cursor or hs >= e:
+                continue
+            if hs > cursor:
+                result.append((cursor, hs))
+            cursor = max(cursor, he)
+        if cursor < e:
+            result.append((cursor, e))
+    return result
+
+
+def index_to_ms(index: pd.Index) -> np.ndarray:
+    """DatetimeIndex(또는 'timestamp' 시리즈)를 epoch 밀리초 int64 배열로 변환합니다."""
+    values = pd.DatetimeIndex(index)
+    if values.tz is not None:
+        values = values.tz_convert('UTC').tz_localize(None)
+    return values.asi8 // 10**6
+
+
+# --- 스캔 ---
+@dataclass
+class IntegrityReport:
+    """시리즈 하나의 타임스탬프 무결성 검사 결과."""
+    rows: int
+    step_ms: int
+    start_ms: Optional[int] = None
+    end_ms: Optional[int] = None          # 마지막 캔들의 시작 시각
+    gaps: List[Range] = field(default_factory=list)   # 누락 구간 [시작, 끝) ms
+    duplicates: int = 0
+    out_of_order: int = 0
+
+    @property
+    def missing_bars(self) -> int:
+        return int(sum((e - s) // self.step_ms for s, e in self.gaps))
+
+    @property
+    def is_clean(self) -> bool:
+        return not self.gaps and self.duplicates == 0 and self.out_of_order == 0
+
+    def covered_ranges(self) -> List[Range]:
+        """실제로 캔들이 있는 구간 목록 ([첫 캔들, 마지막 캔들 + step)에서 갭을 뺀 값)."""
+        if self.start_ms is None:
+            return []
+        return subtract_ranges([(self.start_ms, self.end_ms + self.step_ms)], self.gaps)
+
+    def summary(self) -> str:
+        return (f"{self.rows}개 행, 갭 {len(self.gaps)}개 (누락 {self.missing_bars}개 캔들), "
+                f"중복 {self.duplicates}개, 역순 {self.out_of_order}개")
+
+
+def scan_timestamps(ts_ms: np.ndarray, step_ms: int) -> IntegrityReport:
+    """
+    타임스탬프 배열(epoch ms)을 벡터화 연산으로 검사합니다.
+
+    역순 타임스탬프가 있으면 정렬한 순서 기준으로 갭을 계산합니다.
+    """
+    ts = np.asarray(ts_ms, dtype=np.int64)
+    if ts.size == 0:
+        return IntegrityReport(rows=0, step_ms=step_ms)
+
+    diffs = np.diff(ts)
+    out_of_order = int(np.count_nonzero(diffs < 0))
+    if out_of_order:
+        ts = np.sort(ts, kind='stable')
+        diffs = np.diff(ts)
+    duplicates = int(np.count_nonzero(diffs == 0))
+
+    gap_idx = np.flatnonzero(diffs > step_ms)
+    gaps = list(zip((ts[gap_idx] + step_ms).tolist(), ts[gap_idx + 1].tolist()))
+    return IntegrityReport(
+        rows=int(ts.size), step_ms=int(step_ms), start_ms=int(ts[0]), end_ms=int(ts[-1]),
+        gaps=gaps, duplicates=duplicates, out_of_order=out_of_order,
+    )
+
+
+def scan_frame(df: pd.DataFrame, step_ms: int) -> IntegrityReport:
+    """DatetimeIndex를 가진 OHLCV 데이터프레임을 검사합니다."""
+    return scan_timestamps(index_to_ms(df.index), step_ms)
+
+
+def content_hash(df: pd.DataFrame) -> str:
+    """타임스탬프와 OHLCV 값의 바이트로 계산한 BLAKE2b(128bit) 해시."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(np.ascontiguousarray(index_to_ms(df.index)).tobytes())
+    h.update(np.ascontiguousarray(df.to_numpy(dtype=np.float64)).tobytes())
+    return h.hexdigest()
+
+
+# --- 매니페스트 ---
+@dataclass
+class IntegrityManifest(IntegrityReport):
+    """파일 하나에 대한 무결성 매니페스트."""
+    content_hash: str = ""
+    source_size: int = 0
+    source_mtime_ns: int = 0
+    version: int = MANIFEST_VERSION
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "IntegrityManifest":
+        payload = dict(payload)
+        payload["gaps"] = [tuple(g) for g in payload.get("gaps", [])]
+        return cls(**payload)
+
+    def matches(self, source: Path) -> bool:
+        """원본 파일이 매니페스트 작성 이후 바뀌지 않았는지 확인합니다 (크기 + 수정 시각)."""
+        try:
+            stat = os.stat(source)
+        except OSError:
+            return False
+        return self.version == MANIFEST_VERSION and stat.st_size == self.source_size and stat.st_mtime_ns == self.source_mtime_ns
+
+
+def manifest_path_for(source: Path) -> Path:
+    return Path(source).with_name(MANIFEST_FILENAME)
+
+
+def build_manifest(df: pd.DataFrame, step_ms: int, source: Optional[Path] = None) -> IntegrityManifest:
+    """데이터프레임을 스캔하여 매니페스트를 만듭니다. source가 있으면 파일 크기/수정 시각을 기록합니다."""
+    report = scan_frame(df, step_ms)
+    manifest = IntegrityManifest(**asdict(report), content_hash=content_hash(df))
+    if source is not None:
+        stat = os.stat(source)
+        manifest.source_size, manifest.source_mtime_ns = stat.st_size, stat.st_mtime_ns
+    return manifest
+
+
+def write_manifest(path: Path, manifest: IntegrityManifest) -> None:
+    path = Path(path)
+    tmp_path = path.with_suffix(".json.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest.to_dict(), f)
+    os.replace(tmp_path, path)
+
+
+def read_manifest(path: Path) -> Optional[IntegrityManifest]:
+    path = Path(path)
+    if not path.exists():
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return IntegrityManifest.from_dict(json.load(f))
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning(f"[무결성] 매니페스트 읽기 실패, 다시 생성합니다: {path} ({e})")
+        return None
+
+
+def load_or_build_manifest(source: Path, step_ms: int, loader: Callable[[Path], pd.DataFrame]) -> IntegrityManifest:
+    """
+    원본 파일이 바뀌지 않았으면 저장된 매니페스트를 반환하고, 아니면 다시 스캔하여 저장합니다.
+    """
+    path = manifest_path_for(source)
+    manifest = read_manifest(path)
+    if manifest is not None and manifest.step_ms == step_ms and manifest.matches(source):
+        return manifest
+    manifest = build_manifest(loader(source), step_ms, source)
+    write_manifest(path, manifest)
+    return manifest
+
+
+def combine_reports(reports: List[IntegrityReport], step_ms: int) -> IntegrityReport:
+    """
+    시간순으로 이어진 파일(예: 월 파티션)들의 보고서를 하나로 합칩니다. 파일 경계의 갭도 포함됩니다.
+    """
+    reports = sorted((r for r in reports if r.rows), key=lambda r: r.start_ms)
+    if not reports:
+        return IntegrityReport(rows=0, step_ms=step_ms)
+    gaps: List[Range] = []
+    for prev, cur in zip(reports, reports[1:]):
+        gaps.extend(prev.gaps)
+        if cur.start_ms > prev.end_ms + step_ms:
+            gaps.append((prev.end_ms + step_ms, cur.start_ms))
+    gaps.extend(reports[-1].gaps)
+    return IntegrityReport(
+        rows=sum(r.rows for r in reports), step_ms=step_ms,
+        start_ms=reports[0].start_ms, end_ms=reports[-1].end_ms,
+        gaps=gaps, duplicates=sum(r.duplicates for r in reports),
+        out_of_order=sum(r.out_of_order for r in reports),
+    )
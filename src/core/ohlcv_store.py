@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""
+월 단위 파티션 기반 OHLCV 컬럼형 저장소 (Parquet/Arrow)
+
+- 목적: 캔들 히스토리를 심볼/인터벌/월 단위 Parquet 파티션으로 저장하여, 증분 업데이트와 범위 조회 비용을
+  전체 히스토리 크기와 무관하게 유지합니다.
+- 핵심 기능:
+  1) 파티셔닝: `<root>/symbol=<심볼>/interval=<인터벌>/month=<YYYY-MM>/data.parquet` (Hive 스타일) 구조로 저장합니다.
+  2) 증분 추가: 새 캔들이 속한 월 파티션만 읽고 다시 씁니다. 정상 상태에서는 최신 파티션 하나만 갱신됩니다.
+  3) 범위 조회: `pyarrow.dataset` 필터로 월 파티션 프루닝과 타임스탬프 조건 푸시다운을 함께 적용합니다.
+  4) 원자적 쓰기: 임시 파일에 먼저 기록한 뒤 `os.replace`로 교체하여 중단 시에도 파티션이 손상되지 않습니다.
+  5) 무결성 매니페스트: 파티션을 쓸 때마다 `_manifest.json`(커버 구간, 갭, 해시)을 함께 갱신합니다.
+"""
+from __future__ import annotations
+import os
+import logging
+from pathlib import Path
+from typing import List, Optional, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from .ohlcv_integrity import (
+    IntegrityManifest, IntegrityReport, Range, build_manifest, combine_reports,
+    load_or_build_manifest, manifest_path_for, timeframe_to_ms, write_manifest,
+)
+
+logger = logging.getLogger(__name__)
+
+# --- 상수 정의 ---
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+PARTITION_FILENAME = "data.parquet"
+
+_SCHEMA = pa.schema(
+    [("timestamp", pa.timestamp("ms", tz="UTC"))] + [(c, pa.float64()) for c in OHLCV_COLUMNS]
+)
+_MONTH_PARTITIONING = ds.partitioning(pa.schema([("month", pa.string())]), flavor="hive")
+_DATASET_SCHEMA = _SCHEMA.append(pa.field("month", pa.string()))
+
+TimeLike = Union[str, int, pd.Timestamp, None]
+
+
+# --- 헬퍼 함수 ---
+def safe_symbol(symbol: str) -> str:
+    """파일 시스템에 안전한 심볼 문자열로 변환합니다. (예: 'BTC/USDT:USDT' -> 'BTC_USDT_USDT')"""
+    return symbol.replace('/', '_').replace(':', '_')
+
+
+def _to_utc_timestamp(value: TimeLike) -> Optional[pd.Timestamp]:
+    """문자열/밀리초 정수/Timestamp를 UTC Timestamp로 정규화합니다."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return pd.Timestamp(int(value), unit='ms', tz='UTC')
+    ts = pd.Timestamp(value)
+    return ts.tz_localize('UTC') if ts.tzinfo is None else ts.tz_convert('UTC')
+
+
+def _month_key(ts: pd.Timestamp) -> str:
+    return f"{ts.year:04d}-{ts.month:02d}"
+
+
+def _normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """저장 전 인덱스를 UTC DatetimeIndex로 통일하고, 중복 제거 및 정렬을 수행합니다."""
+    out = df[OHLCV_COLUMNS].astype('float64')
+    index = pd.DatetimeIndex(out.index)
+    out.index = index.tz_localize('UTC') if index.tz is None else index.tz_convert('UTC')
+    out.index.name = 'timestamp'
+    out = out[~out.index.duplicated(keep='last')]
+    return out.sort_index()
+
+
+def _step_ms(interval: str) -> Optional[int]:
+    try:
+        return timeframe_to_ms(interval)
+    except ValueError:
+        return None
+
+
+def _empty_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        columns=OHLCV_COLUMNS, dtype='float64', index=pd.DatetimeIndex([], tz='UTC', name='timestamp')
+    )
+
+
+# --- 저장소 ---
+class OHLCVStore:
+    """
+    심볼/인터벌/월 단위로 파티셔닝된 OHLCV Parquet 저장소.
+
+    Args:
+        root (Path): 저장소 루트 디렉토리.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    # --- 경로 ---
+    def series_dir(self, symbol: str, interval: str) -> Path:
+        """(심볼, 인터벌) 시리즈의 파티션 루트 디렉토리를 반환합니다."""
+        return self.root / f"symbol={safe_symbol(symbol)}" / f"interval={interval}"
+
+    def partition_path(self, symbol: str, interval: str, month: str) -> Path:
+        """특정 월 파티션 파일 경로를 반환합니다."""
+        return self.series_dir(symbol, interval) / f"month={month}" / PARTITION_FILENAME
+
+    def list_months(self, symbol: str, interval: str) -> List[str]:
+        """저장된 월 파티션 키('YYYY-MM')를 오름차순으로 반환합니다."""
+        base = self.series_dir(symbol, interval)
+        if not base.exists():
+            return []
+        months = [
+            p.name.split('=', 1)[1] for p in base.iterdir()
+            if p.is_dir() and p.name.startswith("month=") and (p / PARTITION_FILENAME).exists()
+        ]
+        return sorted(months)
+
+    def exists(self, symbol: str, interval: str) -> bool:
+        return bool(self.list_months(symbol, interval))
+
+    # --- 파티션 I/O ---
+    def _read_partition(self, path: Path) -> pd.DataFrame:
+        if not path.exists():
+            return _empty_frame()
+        df = pq.read_table(path, schema=_SCHEMA).to_pandas()
+        return df.set_index('timestamp')
+
+    def _write_partition(self, path: Path, df: pd.DataFrame, interval: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pandas(df.reset_index(), schema=_SCHEMA, preserve_index=False)
+        tmp_path = path.with_suffix(".parquet.tmp")
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, path)
+        step_ms = _step_ms(interval)
+        if step_ms is not None:
+            write_manifest(manifest_path_for(path), build_manifest(df, step_ms, path))
+
+    # --- 공개 API ---
+    def append(self, symbol: str, interval: str, df: pd.DataFrame) -> int:
+        """
+        새 캔들을 저장소에 병합합니다. 새 데이터가 걸친 월 파티션만 다시 씁니다.
+        동일 타임스탬프는 새 데이터로 덮어씁니다.
+
+        Returns:
+            int: 기록 후 영향을 받은 파티션의 총 행 수.
+        """
+        if df is None or df.empty:
+            return 0
+        new_df = _normalize_frame(df)
+        months = new_df.index.strftime('%Y-%m')
+        written = 0
+        for month, chunk in new_df.groupby(months, sort=True):
+            path = self.partition_path(symbol, interval, month)
+            existing = self._read_partition(path)
+            merged = chunk if existing.empty else pd.concat([existing, chunk])
+            merged = merged[~merged.index.duplicated(keep='last')].sort_index()
+            self._write_partition(path, merged, interval)
+            written += len(merged)
+        logger.debug(f"[저장소] {symbol} ({interval}) {len(new_df)}개 행 병합, 파티션 {months.nunique()}개 갱신")
+        return written
+
+    def read(self, symbol: str, interval: str, start: TimeLike = None, end: TimeLike = None) -> pd.DataFrame:
+        """
+        [start, end] 구간의 캔들을 읽습니다. 월 파티션 프루닝과 타임스탬프 필터 푸시다운을 사용합니다.
+
+        Returns:
+            pd.DataFrame: UTC DatetimeIndex('timestamp')와 OHLCV 컬럼을 가진 데이터프레임.
+        """
+        base = self.series_dir(symbol, interval)
+        if not self.exists(symbol, interval):
+            return _empty_frame()
+
+        start_ts, end_ts = _to_utc_timestamp(start), _to_utc_timestamp(end)
+        ts_type = _SCHEMA.field("timestamp").type
+        expr = None
+        if start_ts is not None:
+            expr = (ds.field("month") >= _month_key(start_ts)) & (ds.field("timestamp") >= pa.scalar(start_ts, type=ts_type))
+        if end_ts is not None:
+            end_expr = (ds.field("month") <= _month_key(end_ts)) & (ds.field("timestamp") <= pa.scalar(end_ts, type=ts_type))
+            expr = end_expr if expr is None else expr & end_expr
+
+        dataset = ds.dataset(base, format="parquet", schema=_DATASET_SCHEMA, partitioning=_MONTH_PARTITIONING)
+        table = dataset.to_table(columns=["timestamp"] + OHLCV_COLUMNS, filter=expr)
+        df = table.to_pandas().set_index('timestamp')
+        return df.sort_index()
+
+    def tail(self, symbol: str, interval: str, n: int) -> pd.DataFrame:
+        """최신 파티션부터 거슬러 올라가며 마지막 n개의 캔들만 읽습니다."""
+        frames: List[pd.DataFrame] = []
+        remaining = n
+        for month in reversed(self.list_months(symbol, interval)):
+            part = self._read_partition(self.partition_path(symbol, interval, month))
+            frames.append(part)
+            remaining -= len(part)
+            if remaining <= 0:
+                break
+        if not frames:
+            return _empty_frame()
+        return pd.concat(frames[::-1]).sort_index().iloc[-n:]
+
+    def last_timestamp(self, symbol: str, interval: str) -> Optional[pd.Timestamp]:
+        """저장된 마지막 캔들의 타임스탬프를 반환합니다. 최신 파티션의 타임스탬프 컬럼만 읽습니다."""
+        months = self.list_months(symbol, interval)
+        if not months:
+            return None
+        path = self.partition_path(symbol, interval, months[-1])
+        column = pq.read_table(path, columns=["timestamp"]).column("timestamp")
+        if len(column) == 0:
+            return None
+        return pd.Timestamp(pc.max(column).as_py()).tz_convert('UTC')
+
+    # --- 무결성 ---
+    def manifest(self, symbol: str, interval: str, month: str) -> Optional[IntegrityManifest]:
+        """월 파티션의 매니페스트를 반환합니다. 파티션이 매니페스트 이후 바뀌었으면 다시 스캔합니다."""
+        path = self.partition_path(symbol, interval, month)
+        step_ms = _step_ms(interval)
+        if step_ms is None or not path.exists():
+            return None
+        return load_or_build_manifest(path, step_ms, self._read_partition)
+
+    def integrity(self, symbol: str, interval: str) -> IntegrityReport:
+        """
+        시리즈 전체의 무결성 보고서를 파티션 매니페스트만으로 계산합니다 (데이터 재스캔 없음).
+        월 경계의 갭도 포함됩니다.
+        """
+        step_ms = _step_ms(interval)
+        if step_ms is None:
+            raise ValueError(f"무결성 검사를 지원하지 않는 인터벌입니다: {interval}")
+        manifests = [self.manifest(symbol, interval, m) for m in self.list_months(symbol, interval)]
+        return combine_reports([m for m in manifests if m is not None], step_ms)
+
+    def covered_ranges(self, symbol: str, interval: str) -> List[Range]:
+        """저장소에 실제로 캔들이 있는 [시작, 끝) ms 구간 목록."""
+        if _step_ms(interval) is None:
+            return []
+        return self.integrity(symbol, interval).covered_ranges()
+
+    def import_csv(self, path: Path, symbol: str, interval: str) -> int:
+        """기존 CSV 캐시(`timestamp` 인덱스 + OHLCV)를 저장소로 가져옵니다."""
+        df = pd.read_csv(path, index_col='timestamp', parse_dates=True)
+        if df.empty:
+            return 0
+        self.append(symbol, interval, df)
+        logger.info(f"[저장소] 기존 CSV 캐시 {Path(path).name} ({len(df)}개 행)를 Parquet 저장소로 이전했습니다.")
+        return len(df)
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+심볼 × 캔들 2차원 패널 지표 계산
+
+- 목적: 심볼/타임프레임마다 `extract_market_features`를 따로 호출하며 치르는 인터프리터 비용을,
+  유니버스 전체를 (심볼 × 캔들) 행렬 한 번의 벡터화 연산으로 처리하여 심볼 수에 걸쳐 분산합니다.
+- 핵심 기능:
+  1) 패널 EMA: 블록 단위 가중치 행렬 곱으로 모든 심볼의 EMA 시계열을 한 번에 계산합니다
+     (캔들마다 도는 파이썬 루프 없음, 배치 `_ema`와 같은 첫 값 초기화).
+  2) 패널 피처: `market_features_optimized`의 8개 피처를 axis=1 방향으로 계산하여 (심볼 × 피처) 행렬을 반환합니다.
+  3) 프레임 묶기: 심볼별 `OHLCVFrame`을 길이별로 묶어 패널로 쌓고, 결과를 심볼 인덱스 데이터프레임으로 돌려줍니다.
+  4) 워커 작업: 공유 메모리 블록(`shared_frames`) 디스크립터를 받아 계산하고 (심볼 목록, 피처 행렬)만 반환합니다.
+"""
+from __future__ import annotations
+import logging
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .ohlcv_frame import OHLCVFrame
+from .shared_frames import SharedFramesDescriptor, attach_frames
+
+logger = logging.getLogger(__name__)
+
+# --- 상수 정의 ---
+FEATURE_NAMES = ('sma_20', 'ema_20', 'rsi', 'stoch_k', 'macd_histogram', 'bb_width', 'vol_spike', 'trend_signal')
+MIN_BARS = 20               # 배치 피처 계산의 최소 캔들 수와 동일
+_EMA_BLOCK = 256            # EMA 가중치 행렬 블록 크기 (메모리 B×B)
+
+
+# --- 패널 EMA ---
+@lru_cache(maxsize=32)
+def _ema_block_weights(alpha: float, block: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    블록 내 EMA 전개식의 가중치 (W, decay).
+    y[s+j] = decay[j] * y[s-1] + Σ_{i≤j} W[j, i] * x[s+i]
+    """
+    beta = 1.0 - alpha
+    j = np.arange(block)
+    lag = j[:, None] - j[None, :]
+    weights = np.where(lag >= 0, alpha * beta ** np.maximum(lag, 0), 0.0)
+    decay = beta ** (j + 1)
+    weights.setflags(write=False)
+    decay.setflags(write=False)
+    return weights, decay
+
+
+def ema_panel(x: np.ndarray, period: Optional[float] = None, alpha: Optional[float] = None) -> np.ndarray:
+    """
+    (심볼 × 캔들) 행렬의 행별 EMA. 1차원 입력이면 1차원으로 반환합니다.
+    첫 값으로 초기화하므로 `market_features_optimized._ema`와 같은 결과를 냅니다.
+    alpha를 주면 period 대신 사용합니다 (예: Wilder 평활 alpha = 1 / length).
+    """
+    if alpha is None:
+        alpha = 2.0 / (period + 1.0)
+    x = np.asarray(x, dtype=np.float64)
+    squeeze = x.ndim == 1
+    if squeeze:
+        x = x[None, :]
+    out = np.empty_like(x)
+    if x.shape[1] == 0:
+        return out[0] if squeeze else out
+    prev = x[:, 0]
+    for start in range(0, x.shape[1], _EMA_BLOCK):
+        block = x[:, start:start + _EMA_BLOCK]
+        width = block.shape[1]
+        weights, decay = _ema_block_weights(float(alpha), _EMA_BLOCK)
+        out[:, start:start + width] = block @ weights[:width, :width].T + prev[:, None] * decay[None, :width]
+        prev = out[:, start + width - 1]
+    return out[0] if squeeze else out
+
+
+# --- 패널 피처 ---
+def compute_panel_features(close: np.ndarray, high: np.ndarray, low: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    """
+    같은 길이의 (심볼 × 캔들) 행렬들로부터 마지막 캔들 기준 피처 행렬 (심볼 × len(FEATURE_NAMES))을 계산합니다.
+    각 행은 해당 심볼 시리즈로 `_calculate_features`를 호출한 결과와 같습니다.
+    """
+    close, high, low, volume = (np.asarray(a, dtype=np.float64) for a in (close, high, low, volume))
+    if close.ndim != 2 or not (close.shape == high.shape == low.shape == volume.shape):
+        raise ValueError(f"close/high/low/volume은 같은 (심볼, 캔들) 형태여야 합니다: {close.shape}")
+    if close.shape[1] < MIN_BARS:
+        raise ValueError(f"패널 피처 계산에는 최소 {MIN_BARS}개 캔들이 필요합니다: {close.shape[1]}")
+
+    out = np.empty((close.shape[0], len(FEATURE_NAMES)), dtype=np.float64)
+    last_close = close[:, -1]
+
+    # 1. 이동평균
+    window = close[:, -20:]
+    sma_20 = window.mean(axis=1)
+    ema_20 = ema_panel(close, 20)[:, -1]
+    out[:, 0], out[:, 1] = sma_20, ema_20
+
+    # 2. 모멘텀 (RSI는 최근 14개 변화량의 단순 평균, Stoch %K는 최근 14개 고가/저가)
+    delta = np.diff(close[:, -15:], axis=1)
+    avg_gain = np.where(delta > 0, delta, 0.0).mean(axis=1)
+    avg_loss = np.where(delta < 0, -delta, 0.0).mean(axis=1)
+    rs = avg_gain / (avg_loss + 1e-14)
+    out[:, 2] = 100 - (100 / (1 + rs))
+    lowest, highest = low[:, -14:].min(axis=1), high[:, -14:].max(axis=1)
+    out[:, 3] = 100 * (last_close - lowest) / (highest - lowest + 1e-14)
+
+    # 3. MACD 히스토그램
+    macd_line = ema_panel(close, 12) - ema_panel(close, 26)
+    signal_line = ema_panel(macd_line, 9)
+    out[:, 4] = macd_line[:, -1] - signal_line[:, -1]
+
+    # 4. 볼린저 밴드 폭
+    std = window.std(axis=1, ddof=1)
+    out[:, 5] = ((sma_20 + std * 2.0) - (sma_20 - std * 2.0)) / (sma_20 + 1e-12)
+
+    # 5. 거래량 비율, 6. 추세 신호
+    out[:, 6] = volume[:, -1] / (volume[:, -20:].mean(axis=1) + 1e-12)
+    out[:, 7] = np.where(ema_20 > ema_panel(close, 50)[:, -1], 1.0, -1.0)
+    return out
+
+
+# --- 프레임 묶기 ---
+def stack_frames(frames: Mapping[str, OHLCVFrame], length: int) -> Tuple[List[str], np.ndarray]:
+    """
+    길이가 length 이상인 프레임의 마지막 length개 캔들을 (4, 심볼, length) 배열
+    [close, high, low, volume]로 쌓습니다.
+    """
+    symbols = [sym for sym, frame in frames.items() if len(frame) >= length]
+    panel = np.empty((4, len(symbols), length), dtype=np.float64)
+    for row, sym in enumerate(symbols):
+        values = frames[sym].values[:, -length:]
+        panel[0, row], panel[1, row], panel[2, row], panel[3, row] = values[3], values[1], values[2], values[4]
+    return symbols, panel
+
+
+def extract_panel_features(frames: Mapping[str, OHLCVFrame], min_bars: int = 50) -> pd.DataFrame:
+    """
+    심볼별 프레임에서 (심볼 × 피처) 데이터프레임을 계산합니다.
+
+    길이가 같은 심볼끼리 묶어 패널 연산 1회로 처리하므로, 각 행은 해당 프레임 전체로
+    `extract_market_features`를 호출한 결과와 같습니다. min_bars 미만인 심볼은 제외합니다.
+    """
+    by_length: Dict[int, Dict[str, OHLCVFrame]] = {}
+    for sym, frame in frames.items():
+        if len(frame) >= max(min_bars, MIN_BARS):
+            by_length.setdefault(len(frame), {})[sym] = frame
+
+    parts = []
+    for length, group in by_length.items():
+        symbols, panel = stack_frames(group, length)
+        matrix = compute_panel_features(panel[0], panel[1], panel[2], panel[3])
+        parts.append(pd.DataFrame(matrix, index=symbols, columns=list(FEATURE_NAMES)))
+    if not parts:
+        return pd.DataFrame(columns=list(FEATURE_NAMES))
+    return pd.concat(parts) if len(parts) > 1 else parts[0]
+
+
+# --- 프로세스 풀 워커 작업 ---
+def panel_features_task(
+    descriptor: SharedFramesDescriptor, timeframe: str, min_bars: int = 50
+) -> Tuple[List[str], np.ndarray]:
+    """
+    공유 블록의 (심볼, timeframe) 프레임들로 패널 피처를 계산합니다.
+    Returns: (심볼 목록, (심볼 × len(FEATURE_NAMES)) 행렬).
+    """
+    with attach_frames(descriptor) as frames:
+        tf_frames = {key[0]: frame for key, frame in frames.items() if key[1] == timeframe}
+        table = extract_panel_features(tf_frames, min_bars)
+        del tf_frames
+    return list(table.index), table.to_numpy(dtype=np.float64)
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+비동기 요청 속도 제한기 (토큰 버킷)
+
+- 목적: 여러 코루틴이 동시에 거래소 REST API를 호출할 때, 고정 sleep 대신 실제 요청 예산으로 호출 속도를 제한합니다.
+- 핵심 기능:
+  1) 토큰 버킷: 초당 `rate`개의 토큰이 채워지고, 최대 `capacity`개까지 버스트를 허용합니다.
+  2) 가중치: 요청마다 `cost`를 지정하여 무거운 엔드포인트에 더 많은 예산을 소모시킬 수 있습니다.
+  3) 통계: 누적 요청 수와 대기 시간을 기록하여 스로틀링 여부를 관찰할 수 있습니다.
+"""
+from __future__ import annotations
+import asyncio
+import time
+from typing import Optional
+
+
+class AsyncRateLimiter:
+    """
+    asyncio용 토큰 버킷 속도 제한기.
+
+    Args:
+        rate (float): 초당 보충되는 토큰 수 (= 지속 가능한 초당 요청 수).
+        capacity (Optional[float]): 버킷 최대 크기 (버스트 허용량). 기본값은 rate.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.total_requests = 0
+        self.total_wait_sec = 0.0
+
+    def _refill(self, limit: Optional[float] = None) -> None:
+        now = time.monotonic()
+        self._tokens = min(max(self.capacity, limit or 0.0), self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self, cost: float = 1.0) -> float:
+        """
+        요청 예산에서 cost만큼 토큰을 차감합니다. 토큰이 부족하면 보충될 때까지 대기합니다.
+
+        Returns:
+            float: 이번 호출에서 대기한 시간(초).
+        """
+        waited = 0.0
+        async with self._lock:
+            self._refill()
+            if self._tokens < cost:
+                delay = (cost - self._tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited = delay
+                # 대기 중 채워진 토큰은 이 요청 몫 (cost > capacity여도 capacity에서 잘리지 않도록)
+                self._refill(limit=cost)
+            self._tokens -= cost
+            self.total_requests += 1
+            self.total_wait_sec += waited
+        return waited
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
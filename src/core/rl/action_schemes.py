@@ -5,12 +5,16 @@
 - discrete 9-action 스킴(기본)을 실제 거래 행위로 변환하고 비용을 계산합니다.
 - 버그 수정: 매수/매도 방향에 따른 슬리피지 계산을 정확하게 수정했습니다.
 - 구조 개선: Enum과 헬퍼 함수를 도입하여 가독성과 유지보수성을 높였습니다.
+- 배치 버전: `apply_action_batch`/`unrealized_pnl_batch`는 N개 환경의 상태 배열에 같은 규칙을 NumPy 연산으로 적용합니다.
 """
 from __future__ import annotations
 from dataclasses import dataclass
+from types import SimpleNamespace
 from typing import Tuple
 from enum import IntEnum
 
+import numpy as np
+
 class TradeAction(IntEnum):
     """거래 액션을 정의하는 열거형"""
     HOLD = 0
@@ -154,4 +158,89 @@ def unrealized_pnl(side: int, size: float, entry_price: float, price: float) ->
         return 0.0
     
     price_diff = price - entry_price
-    return price_diff * size * side
\ No newline at end of file
+    return price_diff * size * side
+
+
+# --- 배치 버전 (N개 환경 상태 배열) ---
+
+# 배열 비교용 정수 액션 코드 (스텝마다 Enum 속성 조회 비용을 피함)
+_ACTION_CODES = SimpleNamespace(**{a.name: int(a) for a in TradeAction})
+
+def unrealized_pnl_batch(side: np.ndarray, size: np.ndarray, entry_price: np.ndarray, price: np.ndarray) -> np.ndarray:
+    """`unrealized_pnl`의 배열 버전."""
+    open_ = (side != 0) & (size > 0) & (entry_price > 0)
+    return np.where(open_, (price - entry_price) * size * side, 0.0)
+
+
+def apply_action_batch(
+    action: np.ndarray,
+    price: np.ndarray,
+    side: np.ndarray,
+    size: np.ndarray,
+    equity: np.ndarray,
+    leverage: np.ndarray,
+    cfg: TradeConfig,
+    target_notional_frac: float = 0.1
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    `apply_action`의 배열 버전. 각 환경에 같은 핸들러 규칙을 적용합니다 (유효하지 않은 액션은 HOLD).
+    Returns: (new_side, new_size, trade_costs, exec_price)
+    """
+    action = np.asarray(action, dtype=np.int64)
+    A = _ACTION_CODES
+    bps, fee = cfg.slippage_bps, cfg.taker_fee
+    target_notional = equity * target_notional_frac * np.maximum(1.0, leverage)
+
+    def exec_at(trade_side):
+        return price * (1 + (trade_side * bps / 10000.0))
+
+    new_side, new_size = side.copy(), size.copy()
+    costs = np.zeros_like(price)
+    exec_price = price.copy()
+
+    # 신규 진입 (REVERSE + 무포지션은 OPEN_LONG_WEAK와 동일)
+    reverse = action == A.REVERSE_POSITION
+    opening = ((action >= A.OPEN_LONG_WEAK) & (action <= A.OPEN_SHORT_STRONG)) | (reverse & (side == 0))
+    strong = (action == A.OPEN_LONG_STRONG) | (action == A.OPEN_SHORT_STRONG)
+    long_ = (action <= A.OPEN_LONG_STRONG) | reverse
+    open_side = np.where(long_, 1, -1)
+    qty = (target_notional * np.where(strong, 2.0, 1.0)) / np.maximum(price, 1e-9)
+    open_exec = exec_at(open_side)
+    new_side = np.where(opening, open_side, new_side)
+    new_size = np.where(opening, qty, new_size)
+    exec_price = np.where(opening, open_exec, exec_price)
+    costs = np.where(opening, qty * open_exec * fee, costs)
+
+    # 청산
+    closing = (action == A.CLOSE) & (size > 0)
+    close_exec = exec_at(-side)
+    new_side = np.where(closing, 0, new_side)
+    new_size = np.where(closing, 0.0, new_size)
+    exec_price = np.where(closing, close_exec, exec_price)
+    costs = np.where(closing, size * close_exec * fee, costs)
+
+    # 추가 진입
+    adding = (action == A.ADD_POSITION) & (side != 0)
+    add_exec = exec_at(side)
+    add_qty = size * 0.5
+    new_size = np.where(adding, size + add_qty, new_size)
+    exec_price = np.where(adding, add_exec, exec_price)
+    costs = np.where(adding, add_qty * add_exec * fee, costs)
+
+    # 부분 청산
+    reducing = (action == A.REDUCE_POSITION) & (side != 0) & (size > 0)
+    reduce_qty = size * 0.5
+    reduced = np.maximum(0.0, size - reduce_qty)
+    new_size = np.where(reducing, reduced, new_size)
+    new_side = np.where(reducing & (reduced <= 0), 0, new_side)
+    exec_price = np.where(reducing, close_exec, exec_price)
+    costs = np.where(reducing, reduce_qty * close_exec * fee, costs)
+
+    # 반전 (포지션 보유 시): 기존 청산 + 같은 수량 반대 진입 (두 체결 모두 -side 방향이라 체결가가 같음)
+    reversing = reverse & (side != 0)
+    new_side = np.where(reversing, -side, new_side)
+    exec_price = np.where(reversing, close_exec, exec_price)
+    costs = np.where(reversing, size * close_exec * fee + size * close_exec * fee, costs)
+
+    return new_side, new_size, costs, exec_price
+
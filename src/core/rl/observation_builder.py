@@ -5,6 +5,7 @@
 
 - market_features.extract_market_features 결과를 받아 창(window) 길이 만큼 스택합니다.
 - 시장 피처와 에이전트의 현재 상태(포지션, 자산 등)를 정규화하여 최종 관측 벡터를 생성합니다.
+- `build_obs_from_array`: 미리 만든 float32 피처 행렬에서 NumPy 인덱싱만으로 관측을 만듭니다 (환경 스텝 경로).
 """
 from __future__ import annotations
 from dataclasses import dataclass
@@ -88,7 +89,61 @@ def build_obs(
     window_df = window_df.ffill().bfill()
     
     market_obs_arr = window_df.to_numpy(dtype=np.float32)
+    return _assemble_obs(market_obs_arr, cfg, side, size, equity, leverage, initial_equity, max_leverage)
 
+
+def _fill_window(window: np.ndarray) -> np.ndarray:
+    """열마다 윈도우 안에서만 앞 값으로 채우고, 남은 앞쪽 NaN은 뒤 값으로 채웁니다 (`ffill().bfill()`과 동일)."""
+    rows = np.arange(window.shape[0])[:, None]
+    valid = ~np.isnan(window)
+    last = np.maximum.accumulate(np.where(valid, rows, -1), axis=0)
+    filled = np.take_along_axis(window, np.maximum(last, 0), axis=0)
+    filled[last < 0] = np.nan
+    valid = ~np.isnan(filled)
+    first = np.minimum.accumulate(np.where(valid, rows, window.shape[0])[::-1], axis=0)[::-1]
+    filled = np.take_along_axis(filled, np.minimum(first, window.shape[0] - 1), axis=0)
+    filled[first >= window.shape[0]] = np.nan
+    return filled
+
+
+def build_obs_from_array(
+    features: np.ndarray,
+    current_idx: int,
+    cfg: ObsConfig,
+    side: int,
+    size: float,
+    equity: float,
+    leverage: float,
+    initial_equity: float,
+    max_leverage: float,
+    has_nan: bool = True,
+) -> np.ndarray:
+    """
+    `build_obs`와 같은 관측을 (캔들 × 피처) float32 행렬에서 만듭니다.
+
+    Args:
+        features (np.ndarray): 피처 데이터프레임을 미리 변환한 float32 행렬.
+        has_nan (bool): 행렬에 NaN이 없으면 False로 주어 윈도우 채우기를 건너뜁니다.
+        나머지 인자는 `build_obs`와 같습니다.
+    """
+    start_idx = max(0, current_idx - cfg.window + 1)
+    market_obs_arr = features[start_idx : current_idx + 1]
+    if has_nan and np.isnan(market_obs_arr).any():
+        market_obs_arr = _fill_window(market_obs_arr)
+    return _assemble_obs(market_obs_arr, cfg, side, size, equity, leverage, initial_equity, max_leverage)
+
+
+def _assemble_obs(
+    market_obs_arr: np.ndarray,
+    cfg: ObsConfig,
+    side: int,
+    size: float,
+    equity: float,
+    leverage: float,
+    initial_equity: float,
+    max_leverage: float,
+) -> np.ndarray:
+    """윈도우 배열을 정규화/패딩하고 상태 벡터를 붙여 최종 관측 벡터를 만듭니다."""
     # 2. 시장 데이터 정규화 (선택적)
     if cfg.normalize_market_data:
         market_obs_arr = _normalize_window_data(market_obs_arr)
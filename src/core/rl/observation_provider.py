@@ -0,0 +1,173 @@
+# src/core/rl/observation_provider.py
+# -*- coding: utf-8 -*-
+"""
+사전 계산 관측 제공자
+
+- 목적: `build_obs`는 매 스텝 60행 윈도우의 평균/표준편차를 다시 계산하므로 한 캔들이 에피소드 동안 약 60번 정규화됩니다.
+  전체 피처 행렬에 대해 윈도우 통계를 한 번만 계산해 두고, 스텝마다 윈도우 뷰와 상태 벡터만 결합합니다.
+- 핵심 기능:
+  1) 롤링 통계: `src.core.rolling` 누적합 커널로 모든 시점의 윈도우 평균/표준편차(ddof=0)를 한 번에 계산합니다.
+     윈도우 안에서 값이 일정한 열은 min == max로 감지하여 평균=값, 표준편차=0으로 정확히 둡니다.
+  2) 정규화 텐서: (시점 × 윈도우 × 피처) float32 텐서가 메모리 예산 안이면 미리 만들어 `market(i)`가 뷰만 반환하고,
+     예산을 넘으면 스트라이드 윈도우 뷰에 시점별 평균/역표준편차를 한 번 브로드캐스트합니다.
+  3) 같은 규칙: 윈도우가 덜 찬 앞부분과 NaN이 있는 행렬은 `build_obs_from_array`로 계산하여 `build_obs`와 같게 유지합니다.
+  4) 재사용: `precomputed_arrays()`로 꺼낸 통계/텐서를 다른 프로세스에서 `precomputed`로 넘기면 다시 계산하지 않습니다.
+"""
+from __future__ import annotations
+import logging
+from typing import Dict, Mapping, Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ..rolling import rolling_max, rolling_mean, rolling_min, rolling_var
+from .observation_builder import ObsConfig, _normalize_state_vector, build_obs_from_array
+
+logger = logging.getLogger(__name__)
+
+# --- 상수 정의 ---
+DEFAULT_TENSOR_BYTES = 128 * 1024 * 1024   # 정규화 텐서를 미리 만들 최대 크기 (환경 하나 기준)
+_STD_EPS = 1e-7                            # _normalize_window_data와 동일
+_CHUNK_ROWS = 1024                         # 텐서 생성 시 한 번에 처리할 시점 수 (float64 임시 배열 크기 제한)
+
+
+class ObservationProvider:
+    """
+    (캔들 × 피처) 행렬에 대해 시점별 관측 벡터를 제공합니다.
+
+    Args:
+        features: 피처 행렬 (float32 권장). 제공자가 참조만 하므로 이후 수정하면 안 됩니다.
+        cfg: 관측 설정 (`build_obs`와 같은 설정).
+        max_tensor_bytes: 정규화 텐서를 미리 만들 최대 바이트 수. 0이면 만들지 않습니다.
+        precomputed: 같은 피처/설정으로 만든 제공자의 `precomputed_arrays()` 결과 (예: 공유 메모리 뷰).
+    """
+
+    def __init__(self, features: np.ndarray, cfg: ObsConfig, max_tensor_bytes: int = DEFAULT_TENSOR_BYTES,
+                 precomputed: Optional[Mapping[str, np.ndarray]] = None):
+        self.features = features
+        self.cfg = cfg
+        self.n_rows, self.n_features = features.shape
+        self.window = cfg.window
+        self.has_nan = bool(np.isnan(features).any())
+        self.market_dim = self.window * self.n_features
+        self.obs_dim = self.market_dim + (4 if cfg.include_state else 0)
+
+        # 윈도우가 꽉 찬 시점(i >= window-1)만 사전 계산 경로를 사용
+        self._first_full = self.window - 1
+        self._windows = None
+        self._tensor = None
+        self._mean = self._inv_std = None
+        if self.has_nan or self.n_rows < self.window:
+            logger.info("[관측] NaN이 있거나 데이터가 윈도우보다 짧아 스텝별 계산 경로를 사용합니다.")
+            return
+
+        self._windows = sliding_window_view(features, self.window, axis=0)   # (N-W+1, F, W) 뷰
+        if not cfg.normalize_market_data or self.window <= 1:
+            return
+        if precomputed:
+            self._mean, self._inv_std = precomputed["mean"], precomputed["inv_std"]
+            self._tensor = precomputed.get("tensor")
+            return
+        self._mean, self._inv_std = self._window_stats()
+        tensor_bytes = (self.n_rows - self._first_full) * self.market_dim * 4
+        if tensor_bytes <= max_tensor_bytes:
+            self._tensor = self._build_tensor()
+
+    # --- 사전 계산 ---
+    def _window_stats(self):
+        """꽉 찬 윈도우마다 (평균, 1 / (표준편차 + eps)), 모양 (N-W+1, F)."""
+        x = self.features.T.astype(np.float64)      # (F, N): 롤링 커널은 마지막 축 방향
+        w = self.window
+        mean = rolling_mean(x, w)
+        std = np.sqrt(rolling_var(x, w, ddof=0))
+        # 윈도우 안에서 일정한 열: 누적합 반올림 없이 평균=값, 표준편차=0
+        flat = rolling_max(x, w) == rolling_min(x, w)
+        mean[flat] = x[flat]
+        std[flat] = 0.0
+        start = self._first_full
+        return mean[:, start:].T.copy(), 1.0 / (std[:, start:].T + _STD_EPS)
+
+    def _build_tensor(self) -> np.ndarray:
+        rows = self.n_rows - self._first_full
+        tensor = np.empty((rows, self.window, self.n_features), dtype=np.float32)
+        for lo in range(0, rows, _CHUNK_ROWS):
+            hi = min(lo + _CHUNK_ROWS, rows)
+            windows = self._windows[lo:hi].transpose(0, 2, 1)            # (k, W, F)
+            tensor[lo:hi] = (windows - self._mean[lo:hi, None, :]) * self._inv_std[lo:hi, None, :]
+        logger.info(f"[관측] 정규화 텐서 사전 계산 완료: {tensor.shape}, {tensor.nbytes / 2**20:.1f}MiB")
+        return tensor
+
+    @property
+    def tensor_nbytes(self) -> int:
+        return 0 if self._tensor is None else self._tensor.nbytes
+
+    def precomputed_arrays(self) -> Dict[str, np.ndarray]:
+        """사전 계산된 배열 {"mean", "inv_std"[, "tensor"]}. 정규화 통계가 없으면 빈 딕셔너리."""
+        if self._mean is None:
+            return {}
+        arrays = {"mean": self._mean, "inv_std": self._inv_std}
+        if self._tensor is not None:
+            arrays["tensor"] = self._tensor
+        return arrays
+
+    # --- 조회 ---
+    def market(self, i: int) -> np.ndarray:
+        """시점 i의 (윈도우 × 피처) 시장 관측. 사전 계산 경로에서는 읽기 전용 뷰일 수 있습니다."""
+        if self._windows is None or i < self._first_full:
+            return build_obs_from_array(self.features, i, _market_only(self.cfg), 0, 0.0, 0.0, 0.0, 1.0, 1.0,
+                                        has_nan=self.has_nan).reshape(-1, self.n_features)
+        k = i - self._first_full
+        if self._tensor is not None:
+            return self._tensor[k]
+        window = self._windows[k].T                                       # (W, F) 뷰
+        if self._mean is None:
+            return window
+        return ((window - self._mean[k]) * self._inv_std[k]).astype(np.float32, copy=False)
+
+    def obs(self, i: int, side: int, size: float, equity: float, leverage: float,
+            initial_equity: float, max_leverage: float, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """`build_obs`와 같은 1차원 관측 벡터. out이 주어지면 그 버퍼에 씁니다."""
+        if out is None:
+            out = np.empty(self.obs_dim, dtype=np.float32)
+        out[:self.market_dim] = self.market(i).reshape(-1)
+        if self.cfg.include_state:
+            if self.cfg.normalize_state_data:
+                out[self.market_dim:] = _normalize_state_vector(side, size, equity, leverage, initial_equity, max_leverage)
+            else:
+                out[self.market_dim:] = (side, size, equity, leverage)
+        return out
+
+    def obs_batch(self, indices: np.ndarray, side: np.ndarray, size: np.ndarray, equity: np.ndarray,
+                  leverage: np.ndarray, initial_equity: float, max_leverage: float,
+                  out: Optional[np.ndarray] = None) -> np.ndarray:
+        """N개 시점의 관측을 (N, obs_dim) 행렬로 반환합니다 (배치 환경용, 시점별 `obs`와 같은 값)."""
+        indices = np.asarray(indices, dtype=np.int64)
+        if out is None:
+            out = np.empty((len(indices), self.obs_dim), dtype=np.float32)
+        market = out[:, :self.market_dim].reshape(len(indices), self.window, self.n_features)
+        full = (indices >= self._first_full) if self._windows is not None else np.zeros(len(indices), dtype=bool)
+        k = indices[full] - self._first_full
+        if self._tensor is not None:
+            market[full] = self._tensor[k]
+        elif full.any():
+            windows = self._windows[k].transpose(0, 2, 1)                  # (n, W, F)
+            if self._mean is not None:
+                windows = (windows - self._mean[k, None, :]) * self._inv_std[k, None, :]
+            market[full] = windows
+        for row in np.flatnonzero(~full):
+            market[row] = self.market(int(indices[row]))
+        if self.cfg.include_state:
+            state = out[:, self.market_dim:]
+            if self.cfg.normalize_state_data:
+                state[:, 0] = side
+                state[:, 1] = size / max(1.0, initial_equity)
+                state[:, 2] = (equity / max(1.0, initial_equity)) - 1.0
+                state[:, 3] = leverage / max(1.0, max_leverage)
+            else:
+                state[:] = np.column_stack([side, size, equity, leverage])
+        return out
+
+
+def _market_only(cfg: ObsConfig) -> ObsConfig:
+    return ObsConfig(window=cfg.window, normalize_market_data=cfg.normalize_market_data,
+                     normalize_state_data=cfg.normalize_state_data, include_state=False)
@@ -5,6 +5,7 @@
 - 기본 보상: (수익 - 비용 - 리스크) + 잠재기반 shaping(Φ_t - γΦ_{t-1})
 - 구조 개선: 메인 보상 계산 함수를 분해하여 가독성 및 유지보수성 향상
 - 유연성 향상: 페널티 계산에 사용되는 임계값들을 RewardWeights 설정으로 분리
+- 배치 버전: `compute_reward_batch`는 N개 환경의 보상을 같은 식으로 NumPy 배열 연산으로 계산합니다.
 """
 from __future__ import annotations
 from dataclasses import dataclass, field
@@ -12,6 +13,8 @@ from typing import Dict, Optional, Tuple, Callable, Any
 import math
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 # --- 안전 유틸리티 ---
@@ -182,6 +185,107 @@ def compute_reward(
 
     return float(final_reward), float(phi)
 
+# --- 배치 버전 (N개 환경) ---
+def _f_batch(x: Any, default: float = 0.0) -> np.ndarray:
+    """`_f`의 배열 버전: 유한하지 않은 값은 기본값."""
+    x = np.asarray(x, dtype=np.float64)
+    return np.where(np.isfinite(x), x, default)
+
+def _softplus_batch(x: np.ndarray) -> np.ndarray:
+    with np.errstate(over="ignore"):
+        mid = np.log1p(np.exp(np.clip(x, -50.0, 50.0)))
+    return np.where(x > 50, x, np.where(x < -50, 0.0, mid))
+
+def potential_snake_ma_batch(e20: np.ndarray, e50: np.ndarray, side: np.ndarray) -> np.ndarray:
+    """`potential_snake_ma`의 배열 버전 (EMA_20/EMA_50 열 값)."""
+    e20, e50 = _f_batch(e20), _f_batch(e50)
+    aligned = ((e20 > e50) & (side >= 0)) | ((e20 < e50) & (side <= 0))
+    return np.where((e20 == 0) & (e50 == 0), 0.0, np.where(aligned, 0.5, -0.2))
+
+# 배치 잠재력 함수: (피처 열 조회 함수, side) → Φ. 조회 함수는 열 이름을 받아 N개 값(없으면 NaN)을 반환
+BATCH_POTENTIALS: Dict[str, Callable[[Callable[[str], np.ndarray], np.ndarray], np.ndarray]] = {
+    "snake_ma": lambda column, side: potential_snake_ma_batch(column('EMA_20'), column('EMA_50'), side),
+}
+
+def compute_reward_batch(
+    weights: RewardWeights,
+    delta_equity: np.ndarray,
+    realized_pnl: np.ndarray,
+    costs: np.ndarray,
+    risk_penalty: np.ndarray,
+    hold_penalty: np.ndarray,
+    profile: str,
+    side: np.ndarray,
+    pos_age_bars: np.ndarray,
+    flip: np.ndarray,
+    feature_column: Callable[[str], np.ndarray],
+    slippage_bps: float,
+    funding_rate_8h: float,
+    step_minutes: float,
+    daily_pnl_usdt: np.ndarray,
+    daily_loss_limit_usdt: float,
+    daily_drawdown_pct: np.ndarray,
+    last_potential: np.ndarray,
+    gamma: float = 0.99,
+    clip_range: float = 1.0,
+    tanh_scale: float = 1.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    컨텍스트가 있는 `compute_reward`의 배열 버전. 컨텍스트 필드는 환경별 배열 또는 공통 스칼라입니다.
+    반환: (총 보상, 현재 잠재력 값 Φ)
+    """
+    # 1. 기본 보상 요소
+    base_reward = (
+        weights.pnl * _f_batch(delta_equity) +
+        weights.realized * _f_batch(realized_pnl) -
+        weights.cost * np.abs(_f_batch(costs)) -
+        weights.risk * np.abs(_f_batch(risk_penalty)) -
+        weights.hold * np.abs(_f_batch(hold_penalty))
+    )
+
+    # 2. 컨텍스트 기반 페널티
+    age = np.maximum(0, _f_batch(pos_age_bars).astype(np.int64))
+    churn = np.where((_f_batch(flip).astype(np.int64) == 1) & (age <= weights.churn_max_age_strong), 1.0,
+                     np.where(age <= weights.churn_max_age_weak, 0.5, 0.0))
+    slippage = max(0.0, _f(slippage_bps)) / 10000.0
+    rate8h = _f(funding_rate_8h)
+    paying = ((side > 0) & (rate8h > 0)) | ((side < 0) & (rate8h < 0))
+    funding = np.where(paying, abs(rate8h) * (max(0.0, _f(step_minutes, 1.0) / 60.0) / 8.0), 0.0)
+    limit = _f(daily_loss_limit_usdt)
+    if limit > 0:
+        loss_ratio = np.maximum(0.0, -_f_batch(daily_pnl_usdt) / limit)
+        loss_barrier = _softplus_batch(loss_ratio - weights.loss_barrier_start_pct)
+    else:
+        loss_barrier = np.zeros_like(base_reward)
+    dd_pct = _f_batch(daily_drawdown_pct)
+    drawdown = np.where(dd_pct > 0, dd_pct / 100.0, 0.0)
+    context_penalty = (
+        weights.churn * churn +
+        weights.slip * slippage +
+        weights.funding * funding +
+        weights.loss_cut * loss_barrier +
+        weights.drawdown * drawdown
+    )
+
+    # 3. 잠재력 기반 Shaping
+    phi = np.zeros_like(base_reward)
+    shaped_reward = base_reward - context_penalty
+    if weights.profile > 0:
+        potential_func = BATCH_POTENTIALS.get(profile)
+        if potential_func is not None:
+            phi = np.asarray(potential_func(feature_column, side), dtype=np.float64)
+        effective_gamma = _clip(float(gamma), 0.0, 0.999)
+        shaped_reward = shaped_reward + weights.profile * (phi - effective_gamma * _f_batch(last_potential))
+
+    # 4. 후처리 (스케일링 및 클리핑)
+    final_reward = shaped_reward * float(weights.scale or 1.0)
+    if tanh_scale > 0:
+        final_reward = np.tanh(final_reward * float(tanh_scale))
+    if clip_range > 0:
+        final_reward = np.clip(final_reward, -abs(clip_range), abs(clip_range))
+
+    return final_reward, phi
+
 # --- 프리셋 ---
 PRESETS: Dict[str, RewardWeights] = {
     "default": RewardWeights(),
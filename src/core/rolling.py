@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+NumPy 롤링 윈도우 커널
+
+- 목적: 호출마다 `pd.Series(...).rolling(...)`를 만들어 치르는 객체 생성/디스패치 비용 없이,
+  1차원 시계열과 (심볼 × 캔들) 2차원 패널 모두에 O(n) 롤링 통계를 제공합니다.
+- 핵심 기능:
+  1) 합/평균/분산/표준편차: 블록 단위 누적합. 블록(2048캔들)마다 누적합을 새로 시작하고 분산은 블록 평균을 빼서
+     계산하므로, 긴 이력에서도 누적합 크기가 커지며 생기는 정밀도 손실이 없습니다.
+  2) 최소/최대: van Herk/Gil-Werman 방식(윈도우 크기 블록의 전방/후방 누적 최대)으로 윈도우 길이와 무관한 O(n).
+  3) pandas 규칙: 마지막 축 방향 계산, NaN은 건너뛰고 유효 관측 수가 `min_periods`(기본값 window) 미만이면 NaN,
+     분산/표준편차의 기본 ddof=1.
+"""
+from __future__ import annotations
+from typing import Optional, Tuple
+
+import numpy as np
+
+# --- 상수 정의 ---
+_BLOCK = 2048   # 누적합을 다시 시작하는 블록 크기 (출력 캔들 수)
+
+
+def _as_2d(x: np.ndarray) -> Tuple[np.ndarray, bool]:
+    x = np.asarray(x, dtype=np.float64)
+    if x.ndim == 1:
+        return x[None, :], True
+    if x.ndim != 2:
+        raise ValueError(f"1차원 또는 2차원 배열만 지원합니다: ndim={x.ndim}")
+    return x, False
+
+
+def _check_window(window: int, min_periods: Optional[int]) -> int:
+    if window < 1:
+        raise ValueError(f"window는 1 이상이어야 합니다: {window}")
+    min_periods = window if min_periods is None else int(min_periods)
+    if not 0 <= min_periods <= window:
+        raise ValueError(f"min_periods는 0..window 범위여야 합니다: {min_periods}")
+    return min_periods
+
+
+def _window_moments(x: np.ndarray, window: int, center: bool) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+    """
+    (유효 개수, 합, 제곱합) 윈도우 통계. center=True이면 블록마다 블록 평균을 뺀 값으로 합/제곱합을 계산합니다
+    (분산 계산용, 합은 평균 이동만큼 달라짐).
+    """
+    rows, n = x.shape
+    valid = ~np.isnan(x)
+    has_nan = not valid.all()
+    if has_nan:
+        count = np.empty((rows, n))
+    else:
+        # NaN이 없으면 유효 개수는 min(i + 1, window)로 고정
+        count = np.broadcast_to(np.minimum(np.arange(1, n + 1), window).astype(np.float64), (rows, n))
+    s1 = np.empty((rows, n))
+    s2 = np.empty((rows, n)) if center else None
+    pad = np.zeros((rows, window))
+    for start in range(0, n, _BLOCK):
+        stop = min(start + _BLOCK, n)
+        lo = max(0, start - window + 1)
+        seg = x[:, lo:stop]
+        if has_nan:
+            seg_valid = valid[:, lo:stop]
+            seg = np.where(seg_valid, seg, 0.0)
+        if center:
+            seg_count = seg_valid.sum(axis=1, keepdims=True) if has_nan else seg.shape[1]
+            seg = seg - seg.sum(axis=1, keepdims=True) / np.maximum(seg_count, 1)
+            if has_nan:
+                seg[~seg_valid] = 0.0
+        # 앞에 window개의 0을 붙인 누적합: 세그먼트 j번째 윈도우 합 = c[j + window] - c[j]
+        head, tail = start - lo, stop - lo
+        c1 = np.concatenate([pad, np.cumsum(seg, axis=1)], axis=1)
+        s1[:, start:stop] = c1[:, head + window:tail + window] - c1[:, head:tail]
+        if has_nan:
+            c = np.concatenate([pad, np.cumsum(seg_valid, axis=1)], axis=1)
+            count[:, start:stop] = c[:, head + window:tail + window] - c[:, head:tail]
+        if center:
+            c2 = np.concatenate([pad, np.cumsum(seg * seg, axis=1)], axis=1)
+            s2[:, start:stop] = c2[:, head + window:tail + window] - c2[:, head:tail]
+    return count, s1, s2
+
+
+def _finish(out: np.ndarray, count: np.ndarray, min_periods: int, squeeze: bool) -> np.ndarray:
+    out[np.broadcast_to(count < max(min_periods, 1), out.shape)] = np.nan
+    return out[0] if squeeze else out
+
+
+# --- 합/평균/분산 ---
+def rolling_sum(x: np.ndarray, window: int, min_periods: Optional[int] = None) -> np.ndarray:
+    """마지막 축 방향 롤링 합 (`Series.rolling(window, min_periods).sum()`과 동일)."""
+    min_periods = _check_window(window, min_periods)
+    x2, squeeze = _as_2d(x)
+    count, s1, _ = _window_moments(x2, window, center=False)
+    if min_periods == 0:
+        # pandas와 같이 유효 값이 없는 구간의 합은 NaN이 아니라 0 (평균/최솟값 등은 NaN 유지)
+        out = np.where(np.broadcast_to(count == 0, s1.shape), 0.0, s1)
+        return out[0] if squeeze else out
+    return _finish(s1, count, min_periods, squeeze)
+
+
+def rolling_mean(x: np.ndarray, window: int, min_periods: Optional[int] = None) -> np.ndarray:
+    """마지막 축 방향 롤링 평균 (`Series.rolling(window, min_periods).mean()`과 동일)."""
+    min_periods = _check_window(window, min_periods)
+    x2, squeeze = _as_2d(x)
+    count, s1, _ = _window_moments(x2, window, center=False)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out = s1 / count
+    return _finish(out, count, min_periods, squeeze)
+
+
+def rolling_var(x: np.ndarray, window: int, min_periods: Optional[int] = None, ddof: int = 1) -> np.ndarray:
+    """마지막 축 방향 롤링 분산. 유효 개수가 ddof 이하인 위치는 NaN입니다."""
+    min_periods = _check_window(window, min_periods)
+    x2, squeeze = _as_2d(x)
+    count, s1, s2 = _window_moments(x2, window, center=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out = (s2 - s1 * s1 / count) / (count - ddof)
+    np.maximum(out, 0.0, out=out)   # 반올림으로 생기는 미세한 음수 제거
+    out[np.broadcast_to(count <= ddof, out.shape)] = np.nan
+    return _finish(out, count, min_periods, squeeze)
+
+
+def rolling_std(x: np.ndarray, window: int, min_periods: Optional[int] = None, ddof: int = 1) -> np.ndarray:
+    """마지막 축 방향 롤링 표준편차 (`Series.rolling(window, min_periods).std(ddof)`와 동일)."""
+    return np.sqrt(rolling_var(x, window, min_periods, ddof))
+
+
+# --- 최소/최대 ---
+def _rolling_extreme(x: np.ndarray, window: int, min_periods: Optional[int], is_max: bool) -> np.ndarray:
+    min_periods = _check_window(window, min_periods)
+    x2, squeeze = _as_2d(x)
+    rows, n = x2.shape
+    valid = ~np.isnan(x2)
+    fill = -np.inf if is_max else np.inf
+    ufunc = np.maximum if is_max else np.minimum
+
+    # 윈도우 크기 블록으로 나누어 블록 내 전방 누적(prefix)과 후방 누적(suffix)을 계산
+    blocks = -(-n // window)
+    padded = np.full((rows, blocks * window), fill)
+    padded[:, :n] = np.where(valid, x2, fill)
+    shaped = padded.reshape(rows, blocks, window)
+    prefix = ufunc.accumulate(shaped, axis=2).reshape(rows, -1)
+    suffix = ufunc.accumulate(shaped[:, :, ::-1], axis=2)[:, :, ::-1].reshape(rows, -1)
+
+    # 윈도우 [i-w+1, i] = suffix[i-w+1] (왼쪽 블록 끝까지) ∘ prefix[i] (오른쪽 블록 시작부터).
+    # i < w-1이면 윈도우가 첫 블록 안에서 잘리므로 prefix[i] 그대로입니다.
+    out = prefix[:, :n].copy()
+    if n >= window:
+        out[:, window - 1:] = ufunc(suffix[:, :n - window + 1], prefix[:, window - 1:n])
+
+    if valid.all():
+        count = np.minimum(np.arange(1, n + 1), window)
+    else:
+        _, count, _ = _window_moments(valid.astype(np.float64), window, center=False)   # 유효값 개수 = 마스크의 윈도우 합
+    return _finish(out, count, min_periods, squeeze)
+
+
+def rolling_max(x: np.ndarray, window: int, min_periods: Optional[int] = None) -> np.ndarray:
+    """마지막 축 방향 롤링 최대 (`Series.rolling(window, min_periods).max()`와 동일)."""
+    return _rolling_extreme(x, window, min_periods, is_max=True)
+
+
+def rolling_min(x: np.ndarray, window: int, min_periods: Optional[int] = None) -> np.ndarray:
+    """마지막 축 방향 롤링 최소 (`Series.rolling(window, min_periods).min()`과 동일)."""
+    return _rolling_extreme(x, window, min_periods, is_max=False)
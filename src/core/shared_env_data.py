@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+공유 메모리 기반 환경 데이터 전달 (멀티프로세스 롤아웃 워커용)
+
+- 목적: `SubprocVecEnv` 워커마다 TradingEnv를 만들면 워커 수만큼 데이터 로드(`get_bybit_data`)와 피처 계산,
+  관측 텐서 사전 계산을 반복하고 메모리도 그만큼 씁니다. 부모가 한 번 준비한 배열을 공유 메모리 블록 하나에 쓰고
+  워커는 읽기 전용 뷰로 붙어 환경을 만듭니다.
+- 핵심 기능:
+  1) 블록 배치: 피처 행렬(float32/float64), 일자 서수, 관측 사전 계산 결과(윈도우 통계, 정규화 텐서)를
+     64바이트 정렬 슬롯에 순서대로 배치합니다. 디스크립터에는 (오프셋, dtype, 모양)만 담깁니다.
+  2) 워커 설정: 워커는 환경을 만들기 전에 CPU 고정(`os.sched_setaffinity`)과 torch 스레드 수를 설정하여
+     워커끼리 코어를 두고 경쟁하지 않게 합니다.
+  3) 수명 관리: 생성한 쪽(부모)이 `close()`/`with` 종료 시 블록을 해제합니다. 워커는 매핑만 유지하다 프로세스 종료 시 해제합니다.
+"""
+from __future__ import annotations
+import os
+import logging
+import functools
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .trading_env import TradingEnv
+
+logger = logging.getLogger(__name__)
+
+_ALIGN = 64   # 슬롯 시작 오프셋 정렬 (캐시 라인)
+
+
+@dataclass(frozen=True)
+class SharedEnvDataDescriptor:
+    """워커에 전달하는 블록 정보 (이름, 피처 컬럼 인덱스, {배열 이름: (오프셋, dtype, 모양)})."""
+    name: str
+    feature_columns: Dict[str, int]
+    slots: Dict[str, Tuple[int, str, Tuple[int, ...]]]
+
+
+def _flatten(prepared: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    arrays = {k: prepared[k] for k in ("features", "features_f64", "day_ordinal")}
+    arrays.update({f"obs_{k}": v for k, v in prepared["obs_precomputed"].items()})
+    return arrays
+
+
+def _views(buf, slots: Dict[str, Tuple[int, str, Tuple[int, ...]]]) -> Dict[str, np.ndarray]:
+    return {name: np.ndarray(shape, dtype=np.dtype(dtype), buffer=buf, offset=offset)
+            for name, (offset, dtype, shape) in slots.items()}
+
+
+class SharedEnvData:
+    """
+    준비된 TradingEnv 배열을 공유 메모리 블록 하나에 담는 부모 측 핸들.
+
+    Args:
+        env: 데이터를 로드한 TradingEnv (`prepared_arrays()`를 블록에 복사).
+    """
+
+    def __init__(self, env: TradingEnv):
+        arrays = _flatten(env.prepared_arrays())
+        slots: Dict[str, Tuple[int, str, Tuple[int, ...]]] = {}
+        offset = 0
+        for name, array in arrays.items():
+            slots[name] = (offset, array.dtype.str, tuple(array.shape))
+            offset += -(-array.nbytes // _ALIGN) * _ALIGN
+        self._shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        views = _views(self._shm.buf, slots)
+        for name, array in arrays.items():
+            views[name][...] = array
+        del views   # 블록을 닫을 수 있도록 버퍼 참조 해제
+        self.descriptor = SharedEnvDataDescriptor(self._shm.name, dict(env.feature_columns), slots)
+        logger.info(f"[공유 환경 데이터] {len(slots)}개 배열, {self.nbytes / 2**20:.1f}MiB 블록 생성")
+
+    @property
+    def nbytes(self) -> int:
+        return self._shm.size
+
+    def close(self) -> None:
+        """블록을 닫고 해제합니다. 여러 번 호출해도 안전합니다."""
+        if self._shm is None:
+            return
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+        self._shm = None
+
+    def __enter__(self) -> "SharedEnvData":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def attach_env_data(descriptor: SharedEnvDataDescriptor) -> Tuple[shared_memory.SharedMemory, Dict[str, Any]]:
+    """
+    블록에 붙어 (공유 메모리 핸들, `TradingEnv(prepared=...)` 인자)를 반환합니다.
+    배열은 블록을 직접 참조하는 읽기 전용 뷰이므로 핸들을 배열보다 오래 유지해야 합니다.
+    """
+    shm = shared_memory.SharedMemory(name=descriptor.name)
+    views = _views(shm.buf, descriptor.slots)
+    for view in views.values():
+        view.flags.writeable = False
+    prepared: Dict[str, Any] = {"feature_columns": descriptor.feature_columns,
+                                "obs_precomputed": {k[4:]: v for k, v in views.items() if k.startswith("obs_")}}
+    prepared.update({k: v for k, v in views.items() if not k.startswith("obs_")})
+    return shm, prepared
+
+
+# --- 워커 ---
+def configure_worker(cpus: Optional[Sequence[int]] = None, torch_threads: Optional[int] = 1) -> None:
+    """현재 프로세스를 주어진 CPU에 고정하고 torch 스레드 수를 설정합니다 (지원하지 않는 플랫폼에서는 건너뜀)."""
+    if cpus and hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, set(cpus))
+        except OSError as e:
+            logger.warning(f"[워커] CPU 고정 실패 ({sorted(cpus)}): {e}")
+    if torch_threads:
+        import torch
+        torch.set_num_threads(int(torch_threads))
+
+
+def make_shared_env(descriptor: SharedEnvDataDescriptor, config: Optional[Dict[str, Any]] = None,
+                    cpus: Optional[Sequence[int]] = None, torch_threads: Optional[int] = 1):
+    """워커 안에서 실행: 워커를 설정하고 공유 블록을 참조하는 Monitor(TradingEnv)를 만듭니다."""
+    from stable_baselines3.common.monitor import Monitor
+
+    configure_worker(cpus, torch_threads)
+    shm, prepared = attach_env_data(descriptor)
+    env = TradingEnv(config, prepared=prepared)
+    env._shared_memory = shm   # 뷰가 참조하는 매핑을 환경 수명 동안 유지
+    return Monitor(env)
+
+
+def worker_cpu_sets(n_workers: int, cpus: Optional[Sequence[int]] = None) -> List[Optional[List[int]]]:
+    """사용 가능한 CPU를 워커에 라운드로빈으로 하나씩 배정합니다. 알 수 없으면 고정하지 않습니다 (None)."""
+    if cpus is None:
+        if not hasattr(os, "sched_getaffinity"):
+            return [None] * n_workers
+        cpus = sorted(os.sched_getaffinity(0))
+    cpus = list(cpus)
+    if not cpus:
+        return [None] * n_workers
+    return [[cpus[rank % len(cpus)]] for rank in range(n_workers)]
+
+
+def shared_env_fns(descriptor: SharedEnvDataDescriptor, n_envs: int, config: Optional[Dict[str, Any]] = None,
+                   pin_cpus: bool = True, torch_threads: Optional[int] = 1) -> List[Callable[[], Any]]:
+    """`SubprocVecEnv`에 넘길 환경 생성 함수 목록 (피클링 가능한 partial)."""
+    cpu_sets = worker_cpu_sets(n_envs) if pin_cpus else [None] * n_envs
+    return [functools.partial(make_shared_env, descriptor, config, cpu_sets[rank], torch_threads)
+            for rank in range(n_envs)]
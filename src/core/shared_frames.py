@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+공유 메모리 기반 캔들 배열 전달 (프로세스 풀 워커용)
+
+- 목적: spawn 컨텍스트 `ProcessPoolExecutor`에 캔들을 넘길 때마다 치르는 피클링 → 프로세스 간 전송 → 언피클링 비용을
+  없애기 위해, 한 사이클의 모든 (심볼, 타임프레임) OHLCV 배열을 `multiprocessing.shared_memory` 블록 하나에 한 번만 쓰고
+  워커에는 작은 디스크립터만 보냅니다.
+- 핵심 기능:
+  1) 블록 배치: [int64 타임스탬프 × 전체 캔들 수][float64 (5 × 전체 캔들 수) OHLCV]. 각 프레임은 (시작, 길이) 슬롯입니다.
+  2) 제로 카피 복원: 워커는 `attach_frames`로 블록에 붙어 슬롯마다 `OHLCVFrame` 뷰를 만듭니다 (복사 없음).
+  3) 수명 관리: 생성한 쪽(부모)이 `close()`/`with` 종료 시 블록을 해제합니다. spawn/fork 워커는 부모의 리소스 트래커를
+     공유하므로 워커가 붙었다 떨어져도 블록이 지워지지 않으며, 워커는 매핑만 닫습니다.
+"""
+from __future__ import annotations
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Dict, Hashable, Iterator, Mapping, Tuple
+
+import numpy as np
+
+from .ohlcv_frame import OHLCV_FIELDS, OHLCVFrame
+
+logger = logging.getLogger(__name__)
+
+_ITEMSIZE = 8   # int64 타임스탬프와 float64 값 모두 8바이트
+
+
+@dataclass(frozen=True)
+class SharedFramesDescriptor:
+    """워커에 전달하는 블록 정보 (이름, 전체 캔들 수, {키: (시작, 길이)})."""
+    name: str
+    total: int
+    slots: Dict[Hashable, Tuple[int, int]]
+
+
+def _views(buf, total: int) -> Tuple[np.ndarray, np.ndarray]:
+    timestamp = np.ndarray((total,), dtype=np.int64, buffer=buf)
+    values = np.ndarray((len(OHLCV_FIELDS), total), dtype=np.float64, buffer=buf, offset=total * _ITEMSIZE)
+    return timestamp, values
+
+
+class SharedFrames:
+    """
+    여러 `OHLCVFrame`을 공유 메모리 블록 하나에 담는 부모 측 핸들.
+
+    Args:
+        frames: {키: 프레임}. 키는 피클링 가능한 값이어야 합니다 (예: (심볼, 타임프레임)).
+    """
+
+    def __init__(self, frames: Mapping[Hashable, OHLCVFrame]):
+        slots: Dict[Hashable, Tuple[int, int]] = {}
+        total = 0
+        for key, frame in frames.items():
+            slots[key] = (total, len(frame))
+            total += len(frame)
+        # 크기 0 블록은 만들 수 없으므로 최소 1캔들 크기로 할당
+        size = max(total, 1) * _ITEMSIZE * (1 + len(OHLCV_FIELDS))
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        timestamp, values = _views(self._shm.buf, total)
+        for key, frame in frames.items():
+            start, length = slots[key]
+            timestamp[start:start + length] = frame.timestamp
+            values[:, start:start + length] = frame.values
+        del timestamp, values   # 블록을 닫을 수 있도록 버퍼 참조 해제
+        self.descriptor = SharedFramesDescriptor(self._shm.name, total, slots)
+
+    @property
+    def nbytes(self) -> int:
+        return self._shm.size
+
+    def close(self) -> None:
+        """블록을 닫고 해제합니다. 여러 번 호출해도 안전합니다."""
+        if self._shm is None:
+            return
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+        self._shm = None
+
+    def __enter__(self) -> "SharedFrames":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+@contextmanager
+def attach_frames(descriptor: SharedFramesDescriptor) -> Iterator[Dict[Hashable, OHLCVFrame]]:
+    """
+    블록에 붙어 {키: 프레임 뷰}를 제공합니다. 프레임은 블록 메모리를 직접 참조하므로
+    `with` 블록 밖으로 내보내지 말고, 결과는 계산된 배열로 반환해야 합니다.
+    """
+    shm = shared_memory.SharedMemory(name=descriptor.name)
+    frames: Dict[Hashable, OHLCVFrame] = {}
+    try:
+        timestamp, values = _views(shm.buf, descriptor.total)
+        for key, (start, length) in descriptor.slots.items():
+            frames[key] = OHLCVFrame(timestamp[start:start + length], values[:, start:start + length])
+        del timestamp, values
+        yield frames
+    finally:
+        frames.clear()
+        try:
+            shm.close()
+        except BufferError:
+            # 호출자가 프레임 뷰를 아직 참조 중이면 매핑은 마지막 참조가 사라질 때 해제됨
+            logger.warning(f"[공유 프레임] 블록 뷰가 남아 있어 바로 닫지 못했습니다: {descriptor.name}")
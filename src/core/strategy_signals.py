@@ -6,7 +6,10 @@
 from __future__ import annotations
 from typing import Dict, Literal, Any
 import pandas as pd
-import pandas_ta as ta  # 📦 pandas-ta 라이브러리 임포트
+
+from .lazy_import import lazy_import
+
+ta = lazy_import("pandas_ta")  # 📦 pandas-ta 라이브러리 (첫 사용 시 임포트)
 
 Side = Literal['BUY','SELL','HOLD']
 
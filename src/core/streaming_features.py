@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+"""
+상태 기반 증분 지표 엔진 (심볼 × 타임프레임)
+
+- 목적: `market_features_optimized.extract_market_features`가 매 사이클 전체 윈도우로 지표를 다시 계산하고
+  마지막 행만 쓰는 대신, 키별 지표 상태를 유지하여 마감된 캔들 1개당 O(1)로 갱신합니다.
+- 핵심 기능:
+  1) 증분 상태: SMA/볼린저/거래량용 이동 합계 윈도우, RSI용 상승/하락폭 윈도우,
+     스토캐스틱용 고가/저가 윈도우를 보관합니다.
+  2) 윈도우 EMA: 배치 함수는 EMA를 넘겨받은 윈도우의 첫 종가로 초기화하므로 값이 윈도우 시작에 따라 달라집니다.
+     EMA(20/50)와 MACD 히스토그램은 선형이므로 윈도우 길이별 가중치 벡터를 한 번 만들어 두고 내적으로 계산합니다.
+  3) 배치 동등성: 매 사이클 같은 프레임에 대해 `extract_market_features(frame)`의 마지막 행과 같은 피처를 만듭니다.
+     (RSI는 배치 구현과 같이 14개 변화량의 단순 평균을 사용합니다.)
+  4) 진행 중 캔들: 마지막(미마감) 캔들은 상태를 바꾸지 않고 사본에 적용하여 피처만 미리 계산합니다.
+  5) 직렬화: 상태를 JSON으로 저장/복원하여 재시작 후 워밍업 없이 이어서 갱신합니다.
+"""
+from __future__ import annotations
+import os
+import json
+import math
+import logging
+import functools
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .ohlcv_frame import OHLCVFrame
+from .panel_features import ema_panel
+
+logger = logging.getLogger(__name__)
+
+# --- 상수 정의 ---
+MIN_BARS = 50               # 배치 함수의 최소 캔들 수와 동일
+STATE_VERSION = 2           # 2: EMA 상태 제거 (윈도우 가중치로 계산)
+_RESYNC_EVERY = 1024        # 이동 합계의 부동소수점 누적 오차를 주기적으로 재계산
+
+Key = Tuple[str, str]
+
+
+# --- 상태 구성 요소 ---
+class _Window:
+    """고정 길이 윈도우 + 이동 합계. 갱신은 O(1), 표준편차/최솟값/최댓값은 조회 시 윈도우 길이만큼 계산."""
+    __slots__ = ('values', 'total', '_pushes')
+
+    def __init__(self, period: int, values: Iterable[float] = ()):
+        self.values = deque(values, maxlen=period)
+        self.total = math.fsum(self.values)
+        self._pushes = 0
+
+    def push(self, x: float) -> None:
+        if len(self.values) == self.values.maxlen:
+            self.total -= self.values[0]
+        self.values.append(x)
+        self.total += x
+        self._pushes += 1
+        if self._pushes % _RESYNC_EVERY == 0:
+            self.total = math.fsum(self.values)
+
+    def mean(self) -> float:
+        return self.total / len(self.values)
+
+    def copy(self) -> "_Window":
+        clone = _Window.__new__(_Window)
+        clone.values, clone.total, clone._pushes = self.values.copy(), self.total, self._pushes
+        return clone
+
+    def std(self) -> float:
+        """표본 표준편차 (ddof=1, pandas rolling std와 동일)."""
+        n = len(self.values)
+        if n < 2:
+            return float('nan')
+        m = self.mean()
+        return math.sqrt(sum((v - m) ** 2 for v in self.values) / (n - 1))
+
+
+@functools.lru_cache(maxsize=8)
+def _window_weights(n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    길이 n 윈도우의 마지막 EMA20, EMA50, MACD(12/26/9) 히스토그램을 종가의 선형 결합으로 만드는 가중치.
+    단위 벡터 패널에 배치와 같은 EMA 연산을 적용하여 얻습니다.
+    """
+    basis = np.eye(n)
+    macd_line = ema_panel(basis, 12) - ema_panel(basis, 26)
+    histogram = macd_line - ema_panel(macd_line, 9)
+    weights = tuple(np.ascontiguousarray(w[:, -1]) for w in (ema_panel(basis, 20), ema_panel(basis, 50), histogram))
+    for w in weights:
+        w.setflags(write=False)
+    return weights
+
+
+# --- 지표 상태 ---
+class IndicatorState:
+    """(심볼, 타임프레임) 하나의 증분 지표 상태."""
+
+    def __init__(self):
+        self.count = 0
+        self.last_ts: Optional[int] = None
+        self.prev_close: Optional[float] = None
+        self.last_close = float('nan')
+        self.last_volume = float('nan')
+        self.close_win = _Window(20)
+        self.vol_win = _Window(20)
+        self.gain_win = _Window(14)
+        self.loss_win = _Window(14)
+        self.high_win = _Window(14)
+        self.low_win = _Window(14)
+
+    def update(self, ts: int, high: float, low: float, close: float, volume: float) -> None:
+        """마감된 캔들 1개를 반영합니다 (O(1))."""
+        if self.prev_close is not None:
+            delta = close - self.prev_close
+            self.gain_win.push(delta if delta > 0 else 0.0)
+            self.loss_win.push(-delta if delta < 0 else 0.0)
+        self.close_win.push(close)
+        self.vol_win.push(volume)
+        self.high_win.push(high)
+        self.low_win.push(low)
+        self.prev_close = self.last_close = close
+        self.last_volume = volume
+        self.last_ts = int(ts)
+        self.count += 1
+
+    def features(self, closes: np.ndarray, min_bars: int = MIN_BARS) -> Dict[str, float]:
+        """
+        배치 함수와 같은 키의 마지막 행 피처. closes는 상태의 마지막 캔들로 끝나는 윈도우 종가입니다
+        (EMA 계열은 이 윈도우 기준). 윈도우가 min_bars개 미만이면 빈 딕셔너리.
+        """
+        n = len(closes)
+        if n < min_bars:
+            return {}
+        w_ema20, w_ema50, w_hist = _window_weights(n)
+        features: Dict[str, float] = {}
+        features['sma_20'] = self.close_win.mean()
+        features['ema_20'] = float(closes @ w_ema20)
+
+        rs = self.gain_win.mean() / (self.loss_win.mean() + 1e-14)
+        features['rsi'] = 100 - (100 / (1 + rs))
+        lowest, highest = min(self.low_win.values), max(self.high_win.values)
+        features['stoch_k'] = 100 * (self.last_close - lowest) / (highest - lowest + 1e-14)
+
+        features['macd_histogram'] = float(closes @ w_hist)
+
+        sma, std = features['sma_20'], self.close_win.std()
+        features['bb_width'] = ((sma + std * 2.0) - (sma - std * 2.0)) / (sma + 1e-12)
+        features['vol_spike'] = self.last_volume / (self.vol_win.mean() + 1e-12)
+        features['trend_signal'] = 1.0 if features['ema_20'] > float(closes @ w_ema50) else -1.0
+        return features
+
+    def preview(self, ts: int, high: float, low: float, close: float, volume: float,
+                closes: np.ndarray, min_bars: int = MIN_BARS) -> Dict[str, float]:
+        """진행 중 캔들을 반영한 피처를 계산합니다 (closes는 이 캔들까지의 윈도우 종가). 상태 자체는 바꾸지 않습니다."""
+        trial = self.copy()
+        trial.update(ts, high, low, close, volume)
+        return trial.features(closes, min_bars)
+
+    def copy(self) -> "IndicatorState":
+        clone = IndicatorState.__new__(IndicatorState)
+        for name, value in self.__dict__.items():
+            if isinstance(value, _Window):
+                value = value.copy()
+            setattr(clone, name, value)
+        return clone
+
+    # --- 직렬화 ---
+    def to_dict(self) -> dict:
+        windows = ('close_win', 'vol_win', 'gain_win', 'loss_win', 'high_win', 'low_win')
+        return {
+            'count': self.count, 'last_ts': self.last_ts, 'prev_close': self.prev_close,
+            'last_close': self.last_close, 'last_volume': self.last_volume,
+            # 이동 합계도 그대로 저장하여 복원 후 결과가 비트 단위로 같게 유지
+            'windows': {name: [list(getattr(self, name).values), getattr(self, name).total] for name in windows},
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "IndicatorState":
+        state = cls()
+        state.count = int(payload['count'])
+        state.last_ts = payload['last_ts']
+        state.prev_close = payload['prev_close']
+        state.last_close = float(payload['last_close'])
+        state.last_volume = float(payload['last_volume'])
+        for name, (values, total) in payload['windows'].items():
+            window = _Window(getattr(state, name).values.maxlen, values)
+            window.total = float(total)
+            setattr(state, name, window)
+        return state
+
+
+# --- 엔진 ---
+class StreamingFeatureEngine:
+    """
+    (심볼, 타임프레임)별 `IndicatorState`를 관리하며 캔들 프레임을 증분 반영합니다.
+
+    Args:
+        min_bars (int): 피처를 내보내기 위한 최소 누적 캔들 수.
+    """
+
+    def __init__(self, min_bars: int = MIN_BARS):
+        self.min_bars = int(min_bars)
+        self._states: Dict[Key, IndicatorState] = {}
+        self.reseeds = 0
+        self.incremental_updates = 0
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def state(self, symbol: str, timeframe: str) -> Optional[IndicatorState]:
+        return self._states.get((symbol, timeframe))
+
+    def sync(self, symbol: str, timeframe: str, frame: OHLCVFrame) -> Dict[str, float]:
+        """
+        프레임의 마감된 캔들(마지막 행 제외) 중 새 캔들만 상태에 반영하고,
+        마지막(진행 중일 수 있는) 캔들을 미리 적용한 피처 딕셔너리를 반환합니다.
+        EMA 계열은 프레임 전체를 윈도우로 계산하므로 결과는 `extract_market_features(frame)`의 마지막 행과 같습니다.
+
+        상태가 없거나 프레임이 저장된 마지막 캔들과 겹치지 않으면(프레임 첫 캔들이 그 이후) 프레임 전체로 상태를 다시 만듭니다.
+        """
+        n = len(frame)
+        if n == 0:
+            return {}
+        key = (symbol, timeframe)
+        ts = frame.timestamp
+        state = self._states.get(key)
+        if state is not None and state.last_ts is not None:
+            # 연속성 판정: 프레임이 마지막 상태 캔들을 포함해야 이어서 갱신 (포함하지 않으면 사이 구간을 확인할 수 없음)
+            if int(ts[0]) > state.last_ts:
+                state = None
+        if state is None:
+            state = IndicatorState()
+            self._states[key] = state
+            self.reseeds += 1
+
+        # 아직 반영하지 않은 캔들만 파이썬 값으로 변환 (정상 사이클에서는 0~1개)
+        start = 0 if state.last_ts is None else int(np.searchsorted(ts, state.last_ts, side='right'))
+        closes = frame.close.astype(np.float64, copy=False)
+        if start >= n:
+            return state.features(closes, self.min_bars)
+        new = frame[start:]
+        rows = zip(new.timestamp.tolist(), new.high.tolist(), new.low.tolist(),
+                   new.close.tolist(), new.volume.tolist())
+        *closed, last = rows
+        for row in closed:
+            state.update(*row)
+        self.incremental_updates += len(closed)
+        return state.preview(*last, closes=closes, min_bars=self.min_bars)
+
+    def features_frame(self, symbol: str, timeframe: str, frame: OHLCVFrame) -> pd.DataFrame:
+        """`extract_market_features`와 같은 형태(마지막 캔들 시각 인덱스의 1행)로 피처를 반환합니다."""
+        features = self.sync(symbol, timeframe, frame)
+        if not features:
+            return pd.DataFrame()
+        return pd.DataFrame([features], index=[pd.Timestamp(int(frame.timestamp[-1]), unit='ms')])
+
+    def retain(self, symbols: Iterable[str]) -> int:
+        """주어진 심볼 외의 상태를 제거하고, 제거된 키 수를 반환합니다."""
+        keep = set(symbols)
+        stale = [key for key in self._states if key[0] not in keep]
+        for key in stale:
+            del self._states[key]
+        return len(stale)
+
+    # --- 저장/복원 ---
+    def save(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            'version': STATE_VERSION,
+            'states': [[sym, tf, st.to_dict()] for (sym, tf), st in self._states.items()],
+        }
+        tmp_path = path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, path)
+
+    def load(self, path: Path) -> int:
+        """저장된 상태를 불러오고, 불러온 키 수를 반환합니다. 파일이 없거나 손상되면 0."""
+        path = Path(path)
+        if not path.exists():
+            return 0
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            if payload.get('version') != STATE_VERSION:
+                return 0
+            for sym, tf, st in payload['states']:
+                self._states[(sym, tf)] = IndicatorState.from_dict(st)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"[증분 지표] 상태 로드 실패, 새로 시작합니다: {e}")
+            return 0
+        logger.info(f"[증분 지표] 저장된 상태 {len(self._states)}개 복원")
+        return len(self._states)
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+(심볼 × 피처) 행렬 기반 심볼 랭킹
+
+- 목적: 심볼마다 파이썬에서 점수를 계산하고 전체 리스트를 정렬하던 방식을, 유니버스 전체를 행렬 한 번의 가중합과
+  부분 정렬로 처리하여 Bybit 선형 무기한 전체를 매 사이클 밀리초 단위로 채점합니다.
+- 핵심 기능:
+  1) 가중 점수: (심볼 × 피처) 행렬의 열 단위 가중 누적 (심볼 축 벡터화). NaN/무한대가 섞인 행은 -inf 점수로 맨 뒤에 둡니다.
+  2) 상위 N 선택: `np.argpartition`으로 O(n) 선택 후 선택된 N개만 정렬합니다 (전체 정렬 없음).
+     동점은 입력 순서가 앞선 심볼이 먼저입니다 (기존 안정 정렬과 같은 규칙).
+  3) 필터: 불리언 마스크로 후보를 제한합니다 (예: 시장 상황별 리스크/유동성 조건).
+"""
+from __future__ import annotations
+import logging
+from typing import List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Weights = Union[Sequence[float], np.ndarray, Mapping[str, float]]
+
+
+def weight_vector(weights: Weights, feature_names: Optional[Sequence[str]] = None) -> np.ndarray:
+    """가중치를 피처 순서의 벡터로 만듭니다. 딕셔너리이면 feature_names 순서로 읽고, 없는 피처는 0입니다."""
+    if isinstance(weights, Mapping):
+        if feature_names is None:
+            raise ValueError("딕셔너리 가중치에는 feature_names가 필요합니다.")
+        unknown = set(weights) - set(feature_names)
+        if unknown:
+            raise ValueError(f"알 수 없는 피처 가중치: {sorted(unknown)}")
+        return np.array([float(weights.get(name, 0.0)) for name in feature_names])
+    return np.asarray(weights, dtype=np.float64)
+
+
+def weighted_scores(matrix: np.ndarray, weights: Weights, feature_names: Optional[Sequence[str]] = None) -> np.ndarray:
+    """(심볼 × 피처) 행렬의 행별 가중합. 유한하지 않은 점수는 -inf로 바꿉니다."""
+    matrix = np.asarray(matrix, dtype=np.float64)
+    w = weight_vector(weights, feature_names)
+    if matrix.ndim != 2 or matrix.shape[1] != w.shape[0]:
+        raise ValueError(f"행렬 {matrix.shape}와 가중치 {w.shape}의 피처 수가 다릅니다.")
+    # 피처 수가 적으므로 열 순서대로 누적: BLAS 합산 순서에 따라 동점이 뒤집히지 않고,
+    # 가중치 0인 피처의 NaN이 점수를 오염시키지 않습니다.
+    scores = np.zeros(matrix.shape[0])
+    with np.errstate(invalid="ignore", over="ignore"):
+        for j in np.flatnonzero(w):
+            scores += matrix[:, j] * w[j]
+    scores[~np.isfinite(scores)] = -np.inf
+    return scores
+
+
+def top_n_indices(scores: np.ndarray, n: int, mask: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    점수 내림차순 상위 n개 위치를 반환합니다. mask가 주어지면 True인 위치만 후보입니다.
+    점수가 -inf인 위치(계산 실패)는 제외합니다.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    candidates = np.isfinite(scores) if mask is None else (np.asarray(mask, dtype=bool) & np.isfinite(scores))
+    positions = np.flatnonzero(candidates)
+    if n <= 0 or positions.size == 0:
+        return positions[:0]
+    values = scores[positions]
+    if n < positions.size:
+        # n번째 점수를 경계로 O(n) 선택. 경계 동점은 입력 순서가 앞선 것을 남김
+        kth = values[np.argpartition(-values, n - 1)[n - 1]]
+        keep = np.flatnonzero(values > kth)
+        ties = np.flatnonzero(values == kth)[:n - keep.size]
+        selected = np.concatenate([keep, ties])
+    else:
+        selected = np.arange(positions.size)
+    # 선택된 n개만 정렬 (점수 내림차순, 동점은 입력 순서)
+    order = np.lexsort((selected, -values[selected]))
+    return positions[selected[order]]
+
+
+def rank_symbols(
+    symbols: Sequence[str],
+    matrix: np.ndarray,
+    weights: Weights,
+    top_n: int,
+    feature_names: Optional[Sequence[str]] = None,
+    mask: Optional[np.ndarray] = None,
+) -> List[Tuple[str, float]]:
+    """(심볼, 점수) 상위 top_n개를 점수 내림차순으로 반환합니다."""
+    scores = weighted_scores(matrix, weights, feature_names)
+    return [(symbols[i], float(scores[i])) for i in top_n_indices(scores, top_n, mask)]
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+전체 유니버스 티커 스냅샷 서비스 (TTL 캐시)
+
+- 목적: 심볼마다 `fetch_ticker`를 순차 호출하는 대신, Bybit v5 `fetch_tickers` 한 번으로
+  모든 선형 계약 티커를 받아 짧은 TTL 동안 재사용합니다.
+- 핵심 기능:
+  1) 단일 요청: category='linear' 전체 티커를 1회 요청으로 가져옵니다.
+  2) TTL 캐시: 유효 기간 내 요청은 네트워크 없이 같은 스냅샷을 반환합니다.
+  3) 중복 요청 방지: 여러 코루틴이 동시에 만료된 스냅샷을 요청해도 실제 요청은 1회만 나갑니다.
+"""
+from __future__ import annotations
+import time
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TickerSnapshot:
+    """
+    `fetch_tickers` 결과를 TTL 동안 캐시하는 스냅샷.
+
+    Args:
+        ttl_sec (float): 스냅샷 유효 기간(초).
+        params (Optional[dict]): `fetch_tickers`에 전달할 파라미터 (기본: category='linear').
+    """
+
+    def __init__(self, ttl_sec: float = 5.0, params: Optional[dict] = None):
+        self.ttl_sec = float(ttl_sec)
+        self.params = params if params is not None else {'category': 'linear'}
+        self._tickers: Dict[str, Dict[str, Any]] = {}
+        self._fetched_at = 0.0
+        self._lock = asyncio.Lock()
+        self.refresh_count = 0
+
+    @property
+    def age_sec(self) -> float:
+        return time.monotonic() - self._fetched_at if self._fetched_at else float('inf')
+
+    def is_fresh(self) -> bool:
+        return self.age_sec < self.ttl_sec
+
+    async def get(self, session, force: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        전체 티커 스냅샷을 반환합니다. 만료되었거나 force=True이면 한 번의 요청으로 갱신합니다.
+        갱신에 실패하면 직전 스냅샷을 그대로 반환합니다.
+        """
+        if not force and self.is_fresh():
+            return self._tickers
+        async with self._lock:
+            # 대기 중 다른 코루틴이 이미 갱신했으면 재사용
+            if not force and self.is_fresh():
+                return self._tickers
+            try:
+                tickers = await session.fetch_tickers(params=self.params)
+                self._tickers = tickers or {}
+                self._fetched_at = time.monotonic()
+                self.refresh_count += 1
+            except Exception as e:
+                logger.warning(f"[티커 스냅샷] 갱신 실패, 직전 스냅샷 사용 (경과 {self.age_sec:.1f}초): {e}")
+        return self._tickers
+
+    async def ticker(self, session, symbol: str) -> Optional[Dict[str, Any]]:
+        return (await self.get(session)).get(symbol)
+
+    async def last_price(self, session, symbol: str) -> Optional[float]:
+        """스냅샷의 최신가를 반환합니다. 심볼이 없거나 가격이 비어 있으면 None."""
+        ticker = await self.ticker(session, symbol)
+        if ticker and ticker.get('last') is not None:
+            return float(ticker['last'])
+        return None
@@ -3,6 +3,9 @@
 """
 커스텀 Gym 환경: TradingEnv-v0 (상태 추적 기능 확장)
 - 일일 손익, 포지션 보유 기간 등 상세한 상태를 추적하여 정교한 보상 계산을 지원합니다.
+- 데이터 로드 시 피처 데이터프레임을 배열(float32 피처 행렬, 종가, 일자 서수, 컬럼 인덱스)로 한 번 변환하여
+  스텝 경로에서는 pandas 접근 없이 NumPy 인덱싱만 사용합니다. 관측은 `ObservationProvider`의 사전 계산 윈도우 통계를 사용합니다.
+- `prepared`로 다른 환경이 만든 배열(예: `shared_env_data`의 공유 메모리 뷰)을 받으면 데이터 로드/피처 계산을 건너뜁니다.
 """
 from __future__ import annotations
 import os
@@ -10,11 +13,19 @@ import logging
 import gymnasium as gym
 import numpy as np
 import pandas as pd
-from typing import Dict, Any, Optional, Tuple
+import functools
+from collections.abc import Mapping
+from typing import Dict, Any, Iterator, Optional, Tuple
 from dataclasses import dataclass, field
 
-from .market_features import extract_market_features, get_bybit_data
-from .rl.observation_builder import ObsConfig, build_obs
+from .market_features import _TF_SUFFIX_MAP, extract_market_features, feature_definition_hash, get_bybit_data
+from .mtf_features import build_mtf_features
+from .feature_store import get_feature_store
+from .memmap_dataset import _compact_symbol, load_ohlcv_frame
+from .ohlcv_integrity import timeframe_to_ms
+from .dataset_registry import get_dataset_registry
+from .rl.observation_builder import ObsConfig
+from .rl.observation_provider import DEFAULT_TENSOR_BYTES, ObservationProvider
 from .rl.action_schemes import TradeConfig, apply_action, unrealized_pnl
 from .rl.reward_schemes import RewardWeights, ShapingContext, compute_reward, get_preset
 
@@ -37,16 +48,48 @@ class EnvConfig:
     funding_rate_8h: float = 0.0
     # 보상 프로필
     reward_profile: str = "snake_ma"
-    # 데이터 소스
+    # 데이터 소스 (dataset이 있으면 레지스트리의 로컬 데이터만 사용, 네트워크 없음. symbol/interval은 데이터셋 명세를 따름)
+    dataset: Optional[str] = None        # dataset_registry에 확정된 데이터셋 이름
+    dataset_split: Optional[str] = "train"  # "train" / "validation" / "test" (None이면 전체)
     use_online: bool = True
-    data_path: Optional[str] = None
+    data_path: Optional[str] = None  # CSV 파일 또는 메모리 맵 데이터셋 디렉토리 (memmap_dataset)
+    data_start: Optional[str] = None
+    data_end: Optional[str] = None
     random_start: bool = True
+    use_feature_store: bool = True  # 계산된 피처 행렬을 (데이터 해시, 지표 정의 해시) 키로 저장/재사용
+    mtf_timeframes: Tuple[str, ...] = ()  # interval 캔들에서 파생해 붙일 상위 타임프레임 (예: ("15m", "1h"))
+    obs_tensor_max_bytes: int = DEFAULT_TENSOR_BYTES  # 정규화 관측 텐서를 미리 만들 최대 크기 (0이면 스텝별 계산)
     # 보상 가중치는 프로필을 통해 로드
     reward_weights: RewardWeights = field(init=False)
 
     def __post_init__(self):
         self.reward_weights = get_preset(self.reward_profile)
 
+def _interval_minutes(interval: str) -> float:
+    """'5', '5m', '1h', 'D' 형식의 캔들 간격을 분 단위로 변환합니다 (알 수 없으면 1분)."""
+    try:
+        return timeframe_to_ms(_TF_SUFFIX_MAP.get(interval, interval)) / 60_000
+    except ValueError:
+        return 1.0
+
+class _FeatureRow(Mapping):
+    """보상 컨텍스트용 한 행 피처 뷰 (`df.iloc[i].to_dict()` 대체, 조회한 키만 읽음)."""
+    __slots__ = ("_row", "_columns")
+
+    def __init__(self, row: np.ndarray, columns: Dict[str, int]):
+        self._row = row
+        self._columns = columns
+
+    def __getitem__(self, key: str) -> float:
+        return float(self._row[self._columns[key]])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+
 class TradingEnv(gym.Env):
     """
     Bybit 선물 거래를 위한 커스텀 Gym 환경.
@@ -56,9 +99,16 @@ class TradingEnv(gym.Env):
     """
     metadata = {"render.modes": ["human"], "render_fps": 1}
 
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, prepared: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            config: `EnvConfig` 필드 딕셔너리.
+            prepared: `prepared_arrays()` 형식의 배열 딕셔너리. 주어지면 데이터를 로드하지 않고 이 배열을 참조합니다.
+        """
         super().__init__()
         self.cfg = EnvConfig(**(config or {}))
+        if self.cfg.dataset:
+            self._apply_dataset_spec(config or {})
         self.obs_cfg = ObsConfig(window=self.cfg.window)
         self.trade_cfg = TradeConfig(
             taker_fee=self.cfg.taker_fee, 
@@ -66,38 +116,103 @@ class TradingEnv(gym.Env):
             max_leverage=self.cfg.max_leverage
         )
         
-        self._load_and_prepare_data()
+        if prepared is not None:
+            self.df_raw = self.df_feat = None
+            self._set_arrays(**prepared)
+        else:
+            self._load_and_prepare_data()
         self._setup_spaces()
         self.reset()
 
     def _setup_spaces(self):
-        feat_dim = len(self.df_feat.columns)
+        feat_dim = self.features.shape[1]
         obs_dim = self.cfg.window * feat_dim
         if self.obs_cfg.include_state:
             obs_dim += 4
         self.observation_space = gym.spaces.Box(low=-np.inf, high=np.inf, shape=(obs_dim,), dtype=np.float32)
         self.action_space = gym.spaces.Discrete(9)
 
+    def _apply_dataset_spec(self, config: Dict[str, Any]):
+        """심볼/타임프레임을 데이터셋 명세로 맞춥니다. 설정에 다른 값이 명시되어 있으면 ValueError."""
+        spec = get_dataset_registry().entry(self.cfg.dataset)["spec"]
+        symbol, timeframe = spec["symbol"], spec["timeframe"]
+        if "symbol" in config and _compact_symbol(str(config["symbol"])) != _compact_symbol(symbol):
+            raise ValueError(f"env symbol '{config['symbol']}'이 데이터셋 '{self.cfg.dataset}'의 심볼 '{symbol}'과 다릅니다.")
+        if "interval" in config and _interval_minutes(str(config["interval"])) != _interval_minutes(timeframe):
+            raise ValueError(f"env interval '{config['interval']}'이 데이터셋 '{self.cfg.dataset}'의 타임프레임 '{timeframe}'과 다릅니다.")
+        self.cfg.symbol, self.cfg.interval = symbol, timeframe
+
     def _load_and_prepare_data(self):
-        # (이전과 동일, 생략)
-        if self.cfg.use_online:
+        if self.cfg.dataset:
+            self.df_raw = get_dataset_registry().load(self.cfg.dataset, self.cfg.dataset_split, warmup_bars=self.cfg.window)
+        elif self.cfg.use_online:
             self.df_raw = get_bybit_data(self.cfg.symbol, self.cfg.interval, limit=5000)
         else:
             path = self.cfg.data_path
             if path and os.path.exists(path):
-                self.df_raw = pd.read_csv(path, index_col='timestamp', parse_dates=True)
+                self.df_raw = load_ohlcv_frame(path, self.cfg.symbol, self.cfg.data_start, self.cfg.data_end)
             else:
                 logger.warning("Local data not found, falling back to online.")
                 self.df_raw = get_bybit_data(self.cfg.symbol, self.cfg.interval, limit=5000)
         
         if self.df_raw.empty:
             raise RuntimeError("Data loading failed.")
-        self.df_feat = extract_market_features(self.df_raw)
+        self.df_feat = self._compute_features(self.df_raw)
         if len(self.df_feat) < self.cfg.window + 10:
             raise RuntimeError("Insufficient data for training.")
+        self._prepare_arrays()
+
+    def _prepare_arrays(self):
+        """스텝 경로에서 쓰는 배열을 피처 데이터프레임에서 한 번 만듭니다."""
+        df = self.df_feat
+        # 인덱스 시간대 기준 날짜의 epoch 일수 (`index[i].date()` 비교 대체)
+        index = pd.DatetimeIndex(df.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        self._set_arrays(
+            feature_columns={str(c): j for j, c in enumerate(df.columns)},
+            features=df.to_numpy(dtype=np.float32),                                   # 관측용
+            features_f64=np.ascontiguousarray(df.to_numpy(dtype=np.float64)),         # 보상 컨텍스트용 (원래 정밀도)
+            day_ordinal=index.to_numpy(dtype="datetime64[D]").astype(np.int64),
+        )
+
+    def _set_arrays(self, feature_columns: Dict[str, int], features: np.ndarray, features_f64: np.ndarray,
+                    day_ordinal: np.ndarray, obs_precomputed: Optional[Dict[str, np.ndarray]] = None):
+        self.feature_columns = dict(feature_columns)
+        self.features = features
+        self.features_f64 = features_f64
+        self.close_prices = self.features_f64[:, self.feature_columns["close"]]   # gym `close()`와 이름이 겹치지 않도록
+        self.day_ordinal = day_ordinal
+        self._step_minutes = _interval_minutes(self.cfg.interval)
+        self.obs_provider = ObservationProvider(self.features, self.obs_cfg, self.cfg.obs_tensor_max_bytes,
+                                                precomputed=obs_precomputed)
+
+    def prepared_arrays(self) -> Dict[str, Any]:
+        """다른 환경의 `prepared` 인자로 넘길 수 있는 배열 딕셔너리 (관측 사전 계산 결과 포함)."""
+        return {
+            "feature_columns": self.feature_columns, "features": self.features, "features_f64": self.features_f64,
+            "day_ordinal": self.day_ordinal, "obs_precomputed": self.obs_provider.precomputed_arrays(),
+        }
+
+    def _compute_features(self, df_raw: pd.DataFrame) -> pd.DataFrame:
+        """피처 저장소에 같은 데이터/지표 정의의 결과가 있으면 재사용하고, 없으면 계산 후 저장합니다."""
+        compute = extract_market_features
+        definition_hash = feature_definition_hash()
+        if self.cfg.mtf_timeframes:
+            timeframes = tuple(self.cfg.mtf_timeframes)
+            base_timeframe = _TF_SUFFIX_MAP.get(self.cfg.interval, self.cfg.interval)
+            compute = functools.partial(build_mtf_features, timeframes=timeframes, base_timeframe=base_timeframe)
+            definition_hash = f"{definition_hash}-mtf-{base_timeframe}-{'-'.join(timeframes)}"
+        if not self.cfg.use_feature_store:
+            return compute(df_raw)
+        try:
+            return get_feature_store().load_or_compute(df_raw, compute, definition_hash)
+        except KeyError as e:
+            logger.warning(f"피처 저장소를 사용할 수 없는 입력입니다 (OHLCV 컬럼 누락: {e}). 직접 계산합니다.")
+            return compute(df_raw)
 
     def _reset_episode_indices(self):
-        self.N = len(self.df_feat)
+        self.N = len(self.features)
         min_start_idx = self.cfg.window + 1
         if self.cfg.random_start:
             max_start_idx = self.N - self.cfg.max_steps - 2
@@ -134,7 +249,7 @@ class TradingEnv(gym.Env):
 
     def step(self, action: int) -> Tuple[np.ndarray, float, bool, bool, Dict[str, Any]]:
         # --- 1. 상태 업데이트 ---
-        current_price = float(self.df_feat["close"].iloc[self.i])
+        current_price = float(self.close_prices[self.i])
         previous_side = self.side
         
         # 일일 상태 초기화
@@ -162,7 +277,7 @@ class TradingEnv(gym.Env):
 
     def _update_daily_stats(self):
         """날짜가 바뀌면 일일 통계치를 리셋합니다."""
-        current_date = self.df_feat.index[self.i].date()
+        current_date = int(self.day_ordinal[self.i])
         if self.current_day != current_date:
             self.current_day = current_date
             self.daily_realized_pnl = 0.0
@@ -222,13 +337,13 @@ class TradingEnv(gym.Env):
         return upnl, funding_cost, daily_dd_pct
 
     def _calculate_reward(self, realized_pnl: float, costs: float, price: float, flip: int, daily_dd_pct: float) -> float:
-        feats = self.df_feat.iloc[self.i].to_dict()
+        feats = _FeatureRow(self.features_f64[self.i], self.feature_columns)
         ctx = ShapingContext(
             features=feats, side=self.side, position_value=self.size * price,
             pos_age_bars=self.pos_age_bars, flip=flip,
             slippage_bps=self.cfg.slippage_bps,
             funding_rate_8h=self.cfg.funding_rate_8h,
-            step_minutes=float(self.cfg.interval) if self.cfg.interval.isdigit() else 1.0,
+            step_minutes=self._step_minutes,
             daily_pnl_usdt=self.daily_realized_pnl,
             daily_loss_limit_usdt=self.cfg.daily_loss_limit_usdt,
             daily_drawdown_pct=daily_dd_pct
@@ -256,9 +371,9 @@ class TradingEnv(gym.Env):
         return terminated, truncated
 
     def _get_obs(self) -> np.ndarray:
-        return build_obs(
-            self.df_feat, self.i, self.obs_cfg, self.side, self.size, 
-            self.equity, self.leverage, self.cfg.initial_equity, self.cfg.max_leverage
+        return self.obs_provider.obs(
+            self.i, self.side, self.size, self.equity, self.leverage,
+            self.cfg.initial_equity, self.cfg.max_leverage
         )
 
     def _get_info(self, upnl: float, reason: str) -> Dict[str, Any]:
@@ -13,6 +13,7 @@ MRL (Modular Reinforcement Learning) 기반 실시간 거래 엔진
 - ErrCode 10001 방지: lotSizeFilter 기반 수량 보정
 - ErrCode 10029 방지: SYMBOL_DENY_PATTERNS / SYMBOL_ALLOWLIST 기반 심볼 필터
 """
+from __future__ import annotations
 import os
 import json
 import re
@@ -29,7 +30,22 @@ from dataclasses import dataclass
 from loguru import logger
 import pandas as pd
 from dotenv import load_dotenv, find_dotenv
-import ccxt.async_support as ccxt
+
+from ..core.lazy_import import lazy_import
+from ..core.rate_limiter import AsyncRateLimiter
+from ..core.candle_cache import CandleCache
+from ..core.ohlcv_frame import OHLCVFrame
+from ..core.streaming_features import StreamingFeatureEngine
+from ..core.panel_features import FEATURE_NAMES, panel_features_task
+from ..core.shared_frames import SharedFrames
+from ..core.mtf_features import derive_frames
+from ..core.ohlcv_integrity import timeframe_to_ms
+from ..core.ticker_snapshot import TickerSnapshot
+from ..core.market_catalog import MarketCatalog
+from ..core.kline_stream import KlineStream, BYBIT_PUBLIC_LINEAR_WS, BYBIT_TESTNET_PUBLIC_LINEAR_WS
+
+# ccxt.async_support는 임포트에 ~0.7초가 걸리므로 세션을 만들 때 임포트 (프로세스 풀 워커는 임포트하지 않음)
+ccxt = lazy_import("ccxt.async_support")
 
 PATCH_VERSION = "MRL-2025-09-14-v5-FINAL-PATCHED"
 
@@ -38,6 +54,8 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 SETTINGS_FILE = PROJECT_ROOT / "configs/settings.json"
 LOG_FILE = PROJECT_ROOT / "outputs/live_logs/trade_log.csv"
 STATUS_FILE_PATH = PROJECT_ROOT / "outputs/engine_status.json"
+MARKETS_SNAPSHOT_PATH = PROJECT_ROOT / "data/cache/markets_linear.json"
+FEATURE_STATE_PATH = PROJECT_ROOT / "data/cache/feature_state.json"
 KST = timezone(timedelta(hours=9))
 
 # ===== 애플리케이션 상태 클래스 =====
@@ -147,17 +165,28 @@ def _env_int(key: str, default: str) -> int:
 ORDER_RISK_PCT      = _env_float("ORDER_RISK_PCT", "0.10")
 MIN_BALANCE         = _env_float("MIN_BALANCE", "10")
 TOP_SYMBOLS_N       = _env_int("TOP_SYMBOLS_N", "3")
-SCAN_COUNT          = _env_int("SCAN_COUNT", "30")
+SCAN_COUNT          = _env_int("SCAN_COUNT", "30")      # 0 이하: 전체 유니버스 평가
 MAX_PARALLEL_FETCH  = _env_int("MAX_PARALLEL_FETCH", "6")
+FETCH_RATE_PER_SEC  = _env_float("FETCH_RATE_PER_SEC", "10")   # 캔들 조회 REST 요청 예산 (초당)
+TICKER_TTL_SEC      = _env_float("TICKER_TTL_SEC", "5")        # 전체 티커 스냅샷 유효 기간
 TF_PRIMARY          = os.getenv("TF_PRIMARY", "1")     # v5 interval 문자열 (기본 1분)
 TIMEFRAMES          = [tf.strip() for tf in os.getenv("TIMEFRAMES", "1,5,60").split(',')]
 FEATURE_MIN_BARS    = _env_int("FEATURE_MIN_BARS", "50")
+KLINE_STREAM        = os.getenv("KLINE_STREAM", "false").lower() == "true"   # WebSocket kline 스트리밍 모드
+KLINE_BUFFER_BARS   = _env_int("KLINE_BUFFER_BARS", "500")
+STREAMING_FEATURES  = os.getenv("STREAMING_FEATURES", "true").lower() == "true"   # 증분 지표 엔진 사용 (같은 프레임의 배치 피처와 같은 값)
+# 조회 대신 기준(첫 번째) 타임프레임 캔들을 리샘플하여 만들 상위 타임프레임 (예: "1h")
+MTF_DERIVED_TIMEFRAMES = [tf.strip() for tf in os.getenv("MTF_DERIVED_TIMEFRAMES", "").split(',') if tf.strip()]
+MAX_BASE_FETCH_BARS = 1000    # Bybit kline 1회 조회 최대 개수
 DRY_RUN             = os.getenv("DRY_RUN", "false").lower() == "true"
 
 # 기본 deny 패턴: 1000토큰/레버리지 토큰류 등
 DEFAULT_DENY = r"^(1000|[A-Z]+BULLUSDT|[A-Z]+BEARUSDT)"
 SYMBOL_DENY_PATTERNS = os.getenv("SYMBOL_DENY_PATTERNS", DEFAULT_DENY).strip()
 SYMBOL_ALLOWLIST = os.getenv("SYMBOL_ALLOWLIST", "").strip()
+MARKETS_TTL_SEC = _env_float("MARKETS_TTL_SEC", "3600")
+_SYMBOL_DENY_RX = re.compile(SYMBOL_DENY_PATTERNS) if SYMBOL_DENY_PATTERNS else None
+_SYMBOL_ALLOW_SET = {x.strip() for x in SYMBOL_ALLOWLIST.split(",") if x.strip()}
 
 # ===== 유틸 =====
 def now_kst_str() -> str:
@@ -448,27 +477,29 @@ async def get_open_position(session: ccxt.bybit, symbol: str) -> Dict[str, Any]
 
 
 # ===== 심볼 조회 (+ 필터링) =====
+_market_catalog: Optional[MarketCatalog] = None
+
+def get_market_catalog() -> MarketCatalog:
+    """심볼 조회와 주문 수량 보정이 공유하는 마켓 카탈로그를 반환합니다."""
+    global _market_catalog
+    if _market_catalog is None:
+        _market_catalog = MarketCatalog(MARKETS_SNAPSHOT_PATH, ttl_sec=MARKETS_TTL_SEC)
+    return _market_catalog
+
 async def get_realtime_symbols(session: ccxt.bybit) -> List[str]:
     try:
-        # Bybit v5 API는 markets를 미리 로드할 필요가 없으며, 직접 엔드포인트를 호출합니다.
-        # category='linear'는 USDT 무기한/선형 계약을 의미합니다.
-        params = {'category': 'linear'}
-        markets = await session.fetch_markets(params)
-        
-        syms = [
-            s['symbol'] for s in markets
-            if s.get('active')
-        ]
+        # category='linear'(USDT 무기한/선형 계약) 카탈로그에서 활성 심볼을 조회합니다.
+        catalog = get_market_catalog()
+        await catalog.ensure_loaded(session)
+        syms = catalog.active_symbols()
         
         if not syms:
             logger.warning("필터링 후 거래 가능한 USDT 선물 심볼이 없습니다.")
 
-        if SYMBOL_DENY_PATTERNS:
-            rx = re.compile(SYMBOL_DENY_PATTERNS)
-            syms = [s for s in syms if not rx.search(s)]
-        if SYMBOL_ALLOWLIST:
-            allow_set = {x.strip() for x in SYMBOL_ALLOWLIST.split(",") if x.strip()}
-            syms = [s for s in syms if s in allow_set]
+        if _SYMBOL_DENY_RX is not None:
+            syms = [s for s in syms if not _SYMBOL_DENY_RX.search(s)]
+        if _SYMBOL_ALLOW_SET:
+            syms = [s for s in syms if s in _SYMBOL_ALLOW_SET]
         return syms
     except Exception as e:
         logger.exception(f"[심볼 조회 실패] {e}")
@@ -479,10 +510,7 @@ def _parse_kline_to_df(raw_ohlcv: list) -> pd.DataFrame:
     if not raw_ohlcv:
         return pd.DataFrame()
     
-    df = pd.DataFrame(raw_ohlcv, columns=["timestamp", "open", "high", "low", "close", "volume"])
-    df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True).dt.tz_convert(KST)
-    for c in ["open", "high", "low", "close", "volume"]:
-        df[c] = pd.to_numeric(df[c], errors='coerce')
+    df = OHLCVFrame.from_ccxt(raw_ohlcv).to_pandas(tz=KST, timestamp_column=True)
     df = df.dropna()
     return df.sort_values("timestamp")
 
@@ -503,8 +531,155 @@ async def fetch_candles(session: ccxt.bybit, symbol: str, interval: str = TF_PRI
         logger.exception(f"[{symbol}] 캔들 조회 실패: {e}")
         return pd.DataFrame()
 
+_fetch_rate_limiter: Optional[AsyncRateLimiter] = None
+
+def get_fetch_rate_limiter() -> AsyncRateLimiter:
+    """캔들 조회 요청이 공유하는 토큰 버킷 속도 제한기를 반환합니다."""
+    global _fetch_rate_limiter
+    if _fetch_rate_limiter is None:
+        _fetch_rate_limiter = AsyncRateLimiter(FETCH_RATE_PER_SEC)
+    return _fetch_rate_limiter
+
+_candle_cache: Optional[CandleCache] = None
+
+def get_candle_cache() -> CandleCache:
+    """REST 폴링 모드에서 사이클 간 공유하는 증분 캔들 캐시를 반환합니다."""
+    global _candle_cache
+    if _candle_cache is None:
+        _candle_cache = CandleCache(capacity=KLINE_BUFFER_BARS)
+    return _candle_cache
+
+_feature_engine: Optional[StreamingFeatureEngine] = None
+
+def get_feature_engine() -> StreamingFeatureEngine:
+    """사이클 간 지표 상태를 유지하는 증분 피처 엔진을 반환합니다 (저장된 상태가 있으면 복원)."""
+    global _feature_engine
+    if _feature_engine is None:
+        _feature_engine = StreamingFeatureEngine()
+        _feature_engine.load(FEATURE_STATE_PATH)
+    return _feature_engine
+
+async def fetch_candle_frames(
+    session: ccxt.bybit,
+    symbols: List[str],
+    timeframes: List[str],
+    limit: int,
+    max_parallel: int = MAX_PARALLEL_FETCH,
+    rate_limiter: Optional[AsyncRateLimiter] = None,
+    cache: Optional[CandleCache] = None,
+) -> Dict[str, Dict[str, OHLCVFrame]]:
+    """
+    모든 (심볼, 타임프레임) 캔들 요청을 동시에 실행합니다.
+    동시 요청 수는 세마포어(max_parallel)로, 초당 요청 수는 토큰 버킷으로 제한합니다.
+    cache가 주어지면 직전 사이클 이후의 캔들만 `since`로 요청하여 캐시에 병합합니다.
+
+    Returns:
+        Dict[str, Dict[str, OHLCVFrame]]: {심볼: {타임프레임: OHLCVFrame}}. 실패/빈 응답은 제외됩니다.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_parallel))
+    limiter = rate_limiter or get_fetch_rate_limiter()
+
+    async def fetch_one(symbol: str, tf: str) -> Tuple[str, str, Optional[OHLCVFrame]]:
+        since, request_limit = cache.plan(symbol, tf, limit) if cache is not None else (None, limit)
+        async with semaphore:
+            await limiter.acquire()
+            try:
+                bars = await session.fetch_ohlcv(symbol, tf, since=since, limit=request_limit)
+            except Exception as e:
+                logger.warning(f"[{symbol}] {tf} OHLCV 데이터 가져오기 실패: {e}")
+                return symbol, tf, cache.frame(symbol, tf, limit) if cache is not None else None
+        if cache is not None:
+            cache.update(symbol, tf, bars, full=since is None)
+            return symbol, tf, cache.frame(symbol, tf, limit)
+        if not bars:
+            return symbol, tf, None
+        return symbol, tf, OHLCVFrame.from_ccxt(bars)
+
+    if cache is not None:
+        cache.retain(symbols)
+    results = await asyncio.gather(*(fetch_one(sym, tf) for sym in symbols for tf in timeframes))
+    frames: Dict[str, Dict[str, OHLCVFrame]] = {}
+    for symbol, tf, frame in results:
+        if frame is not None:
+            frames.setdefault(symbol, {})[tf] = frame
+    return frames
+
+def base_bars_available() -> int:
+    """기준 타임프레임에서 한 사이클에 확보할 수 있는 최대 캔들 수 (1회 조회 한도와 스트림/캐시 버퍼 용량 중 작은 값)."""
+    return min(MAX_BASE_FETCH_BARS, KLINE_BUFFER_BARS)
+
+def split_derivable_timeframes(
+    base_tf: str, derived_timeframes: List[str], available_bars: int, min_bars: int = FEATURE_MIN_BARS
+) -> Tuple[List[str], List[str]]:
+    """
+    파생 타임프레임을 (기준 캔들로 min_bars개 이상 만들 수 있는 것, 없는 것)으로 나눕니다.
+    예: 5m 기준 500개로는 1h가 41개뿐이라 피처 최소치(50)에 못 미칩니다.
+    """
+    base_ms = timeframe_to_ms(base_tf)
+    derivable, short = [], []
+    for tf in derived_timeframes:
+        ratio = max(1, timeframe_to_ms(tf) // base_ms)
+        (derivable if available_bars // ratio >= min_bars else short).append(tf)
+    return derivable, short
+
+async def start_kline_stream(timeframes: List[str]) -> Optional[KlineStream]:
+    """KLINE_STREAM 모드일 때 공개 kline 스트림을 시작합니다. 연결 실패 시 None (REST 폴링으로 대체)."""
+    use_testnet = os.getenv("BYBIT_USE_TESTNET", "false").lower() == "true"
+    stream = KlineStream(
+        timeframes,
+        capacity=KLINE_BUFFER_BARS,
+        url=BYBIT_TESTNET_PUBLIC_LINEAR_WS if use_testnet else BYBIT_PUBLIC_LINEAR_WS,
+    )
+    try:
+        await stream.start()
+        return stream
+    except Exception as e:
+        logger.warning(f"kline 스트림 연결 실패, REST 폴링으로 동작합니다: {e}")
+        await stream.stop()
+        return None
+
+async def read_stream_candle_frames(
+    stream: KlineStream,
+    session: ccxt.bybit,
+    symbols: List[str],
+    timeframes: List[str],
+    limit: int,
+) -> Dict[str, Dict[str, OHLCVFrame]]:
+    """
+    스트림 버퍼에서 캔들을 읽습니다. 구독 유니버스를 갱신하고,
+    아직 시드되지 않았거나 재연결/공백으로 재시드 대상이 된 심볼만 REST로 (다시) 시드합니다.
+    시드에 실패한 버퍼는 공백이 있을 수 있으므로 결과에서 제외합니다.
+    """
+    await stream.update_symbols(symbols)
+    unseeded = [sym for sym in symbols if not all(stream.has_history(sym, tf) for tf in timeframes)]
+    if unseeded:
+        seeded = await fetch_candle_frames(session, unseeded, timeframes, limit)
+        for sym, frames in seeded.items():
+            for tf, frame in frames.items():
+                stream.seed(sym, tf, frame)
+
+    frames: Dict[str, Dict[str, OHLCVFrame]] = {}
+    for sym in symbols:
+        for tf in timeframes:
+            if stream.has_history(sym, tf):
+                frames.setdefault(sym, {})[tf] = stream.get_frame(sym, tf, limit)
+    return frames
+
+# ===== 티커 스냅샷 =====
+_ticker_snapshot: Optional[TickerSnapshot] = None
+
+def get_ticker_snapshot() -> TickerSnapshot:
+    """랭킹, 최신가 조회, 명령 처리기가 공유하는 전체 티커 스냅샷을 반환합니다."""
+    global _ticker_snapshot
+    if _ticker_snapshot is None:
+        _ticker_snapshot = TickerSnapshot(ttl_sec=TICKER_TTL_SEC)
+    return _ticker_snapshot
+
 # ===== 최신가 조회 (CCXT) =====
 async def get_last_price(session: ccxt.bybit, symbol: str) -> float:
+    price = await get_ticker_snapshot().last_price(session, symbol)
+    if price:
+        return price
     try:
         ticker = await session.fetch_ticker(symbol)
         if ticker and 'last' in ticker:
@@ -520,35 +695,25 @@ async def get_last_price(session: ccxt.bybit, symbol: str) -> float:
 async def fetch_top_symbols_data(session: ccxt.bybit, symbols: List[str], scan_count: int, top_n: int) -> Dict[str, Any]:
     """
     상위 N개 심볼에 대한 시장 데이터를 가져옵니다.
-    (수정: 심볼 유효성 검사 추가)
+    전체 티커 스냅샷 1회 요청으로 후보 심볼을 모두 평가합니다.
     """
     try:
-        await session.load_markets(True)
+        tickers = await get_ticker_snapshot().get(session)
         
         market_data = {}
         
-        # 로드된 마켓에 대해 심볼 필터링
-        valid_symbols = [s for s in symbols if s in session.markets]
-        symbols_to_scan = valid_symbols[:scan_count] if len(valid_symbols) > scan_count else valid_symbols
+        # 스냅샷에 티커가 있는 심볼만 평가 (scan_count <= 0 이면 전체 유니버스)
+        valid_symbols = [s for s in symbols if s in tickers]
+        symbols_to_scan = valid_symbols[:scan_count] if 0 < scan_count < len(valid_symbols) else valid_symbols
         
         for symbol in symbols_to_scan:
-            try:
-                # 24시간 통계 가져오기
-                ticker = await session.fetch_ticker(symbol)
-                if ticker:
-                    volume_usd = float(ticker.get('quoteVolume', 0))
-                    price_change_pct = float(ticker.get('percentage', 0))
-                    
-                    market_data[symbol] = {
-                        'volume_usd': volume_usd,
-                        'price_change_pct': price_change_pct,
-                        'last_price': float(ticker.get('last', 0)),
-                        'ticker': ticker
-                    }
-                    
-            except Exception as e:
-                logger.warning(f"[{symbol}] 티커 데이터 가져오기 실패: {e}")
-                continue
+            ticker = tickers[symbol]
+            market_data[symbol] = {
+                'volume_usd': float(ticker.get('quoteVolume') or 0),
+                'price_change_pct': float(ticker.get('percentage') or 0),
+                'last_price': float(ticker.get('last') or 0),
+                'ticker': ticker
+            }
         
         # 거래량 기준으로 상위 N개 선택
         if market_data:
@@ -588,8 +753,11 @@ async def get_balance(session: ccxt.bybit, coin: str = "USDT") -> float:
 getcontext().prec = 20
 
 async def normalize_qty(session: ccxt.bybit, symbol: str, raw_qty: float) -> Tuple[float, Dict[str, Any]]:
-    await session.load_markets(True) 
-    market = session.markets[symbol]
+    catalog = get_market_catalog()
+    await catalog.ensure_loaded(session)
+    market = catalog.get(symbol)
+    if market is None:
+        raise KeyError(f"마켓 카탈로그에 없는 심볼입니다: {symbol}")
     
     limits = market.get('limits', {})
     amount_limits = limits.get('amount', {})
@@ -687,6 +855,58 @@ async def load_and_update_model(
         logger.error(f"모델 로딩 또는 업데이트 중 예상치 못한 오류 발생: {e}", exc_info=True)
 
 
+def _feature_table(symbols: List[str], matrix) -> pd.DataFrame:
+    """워커가 반환한 (심볼 목록, 피처 행렬)을 심볼 인덱스 피처 테이블로 변환합니다."""
+    return pd.DataFrame(matrix, index=symbols, columns=list(FEATURE_NAMES))
+
+async def compute_batch_features(
+    executor: ProcessPoolExecutor,
+    market_features,
+    candle_frames: Dict[str, Dict[str, OHLCVFrame]],
+    timeframes: List[str],
+    min_bars: int,
+) -> Dict[str, pd.DataFrame]:
+    """
+    모든 (심볼, 타임프레임) 캔들을 공유 메모리 블록 하나에 한 번 쓰고, 워커에는 디스크립터만 보내 피처를 계산합니다.
+    타임프레임별 패널 작업 1개씩 실행하고, 패널 계산에 실패한 심볼은 심볼당 1개 작업(전체 타임프레임)으로 다시 계산합니다.
+    Returns: {타임프레임: 심볼 인덱스 피처 테이블}.
+    """
+    loop = asyncio.get_running_loop()
+    tables: Dict[str, pd.DataFrame] = {}
+    with SharedFrames({(sym, tf): frame for sym, frames in candle_frames.items() for tf, frame in frames.items()}) as shared:
+        for tf in timeframes:
+            try:
+                symbols, matrix = await loop.run_in_executor(
+                    executor, panel_features_task, shared.descriptor, tf, min_bars
+                )
+                tables[tf] = _feature_table(symbols, matrix)
+            except Exception as e:
+                logger.warning(f"{tf} 패널 피처 계산 실패: {e}")
+
+        missing = {
+            sym: [tf for tf, frame in frames.items()
+                  if len(frame) >= min_bars and not (tf in tables and sym in tables[tf].index)]
+            for sym, frames in candle_frames.items()
+        }
+        missing = {sym: tfs for sym, tfs in missing.items() if tfs}
+        if missing:
+            try:
+                results = await asyncio.gather(*(
+                    loop.run_in_executor(executor, market_features.symbol_features_task, shared.descriptor, sym, tfs, min_bars)
+                    for sym, tfs in missing.items()
+                ), return_exceptions=True)
+            except Exception as e:  # 예: 프로세스 풀이 깨져 작업 제출 자체가 실패
+                logger.warning(f"심볼별 피처 작업 제출 실패: {e}")
+                results = []
+            for sym, result in zip(missing, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"[{sym}] 피처 추출 실패: {result}")
+                    continue
+                for tf, row in zip(*result):
+                    extra = _feature_table([sym], row[None, :])
+                    tables[tf] = pd.concat([tables[tf], extra]) if tf in tables else extra
+    return tables
+
 async def main_loop(app_state: AppState, executor: ProcessPoolExecutor, session: ccxt.bybit):
     """메인 거래 로직 루프 (최적화된 버전)"""
     global engine_running, trading_enabled
@@ -719,6 +939,24 @@ async def main_loop(app_state: AppState, executor: ProcessPoolExecutor, session:
     model = app_state.model
 
     command_task = asyncio.create_task(command_check_loop(session))
+    market_catalog = get_market_catalog()
+    await market_catalog.ensure_loaded(session)
+    market_catalog.start_background_refresh(session)
+    timeframes = ['5m', '1h', '1d']
+    base_tf = timeframes[0]
+    derived_timeframes = [tf for tf in timeframes[1:] if tf in MTF_DERIVED_TIMEFRAMES]
+    available_base_bars = base_bars_available()
+    derived_timeframes, short_timeframes = split_derivable_timeframes(base_tf, derived_timeframes, available_base_bars)
+    if short_timeframes:
+        logger.warning(
+            f"[MTF] {short_timeframes}는 {base_tf} 캔들 {available_base_bars}개(KLINE_BUFFER_BARS/조회 한도)로 "
+            f"피처 최소치({FEATURE_MIN_BARS}개)를 만들 수 없어 파생하지 않고 직접 조회합니다."
+        )
+    fetch_timeframes = [tf for tf in timeframes if tf not in derived_timeframes]
+    if derived_timeframes:
+        logger.info(f"[MTF] {derived_timeframes}는 {base_tf} 캔들에서 파생합니다 (타임프레임별 조회 없음).")
+    kline_stream = await start_kline_stream(fetch_timeframes) if KLINE_STREAM else None
+    feature_engine = get_feature_engine() if STREAMING_FEATURES else None
 
     try:
         while engine_running:
@@ -764,6 +1002,44 @@ async def main_loop(app_state: AppState, executor: ProcessPoolExecutor, session:
             process = psutil.Process()
             initial_memory = process.memory_info().rss / 1024 / 1024
             
+            # 스트리밍 모드면 메모리 버퍼에서, 아니면 모든 (심볼, 타임프레임) 캔들을 한 번에 동시 조회
+            fetch_symbols = [symbol for symbol, market_info in symbols_batch if market_info]
+            if feature_engine is not None:
+                # 캔들 캐시(`cache.retain`)와 같이 이번 배치에서 빠진 심볼의 지표 상태는 버림 (저장 파일도 배치 크기로 유지)
+                feature_engine.retain(fetch_symbols)
+            candle_limit = min(100, longest_period + 20)
+            fetch_limit = candle_limit
+            if derived_timeframes:
+                # 가장 긴 파생 타임프레임도 candle_limit개(최소 FEATURE_MIN_BARS개)가 되도록 기준 캔들을 더 조회.
+                # 버퍼 용량을 넘겨 요청하면 캐시가 매 사이클 전체 조회로 돌아가므로 확보 가능한 개수로 제한
+                ratio = max(timeframe_to_ms(tf) for tf in derived_timeframes) // timeframe_to_ms(base_tf)
+                fetch_limit = min(available_base_bars, max(candle_limit, FEATURE_MIN_BARS) * ratio)
+            if kline_stream is not None:
+                candle_frames = await read_stream_candle_frames(
+                    kline_stream, session, fetch_symbols, fetch_timeframes, fetch_limit
+                )
+            else:
+                candle_frames = await fetch_candle_frames(
+                    session, fetch_symbols, fetch_timeframes, limit=fetch_limit, cache=get_candle_cache()
+                )
+            if derived_timeframes:
+                for sym, frames in candle_frames.items():
+                    if base_tf not in frames:
+                        continue
+                    derived = derive_frames(frames[base_tf], derived_timeframes)
+                    derived[base_tf] = frames[base_tf]
+                    candle_frames[sym] = {
+                        tf: (derived[tf] if tf in derived else frames[tf]).tail(candle_limit)
+                        for tf in timeframes if tf in frames or tf in derived
+                    }
+
+            # 배치 모드: 타임프레임별로 전체 심볼을 (심볼 × 캔들) 패널 1회 연산으로 계산
+            panel_features: Dict[str, pd.DataFrame] = {}
+            if feature_engine is None and candle_frames:
+                panel_features = await compute_batch_features(
+                    executor, market_features, candle_frames, timeframes, longest_period
+                )
+
             for symbol, market_info in symbols_batch:
                 if not market_info:
                     continue
@@ -773,51 +1049,33 @@ async def main_loop(app_state: AppState, executor: ProcessPoolExecutor, session:
                     logger.warning(f"메모리 사용량이 {current_memory:.1f}MB로 증가하여 처리를 중단합니다.")
                     break
                 
-                try:
-                    timeframes = ['5m', '1h', '1d']
-                    ohlcv_data = {}
-                    
-                    for tf in timeframes:
-                        try:
-                            limit = min(100, longest_period + 20)
-                            bars = await session.fetch_ohlcv(symbol, tf, limit=limit)
-                            
-                            if bars and len(bars) > 0:
-                                df = pd.DataFrame(bars, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-                                df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-                                ohlcv_data[tf] = df
-                            
-                            await asyncio.sleep(0.1)
-                            
-                        except Exception as e:
-                            logger.warning(f"[{symbol}] {tf} OHLCV 데이터 가져오기 실패: {e}")
-                            continue
-                    
-                    if not ohlcv_data:
-                        logger.warning(f"[{symbol}] 사용 가능한 OHLCV 데이터가 없습니다.")
-                        continue
-                        
-                except Exception as e:
-                    logger.exception(f"[{symbol}] OHLCV 데이터 처리 중 오류: {e}")
+                ohlcv_data = candle_frames.get(symbol)
+                if not ohlcv_data:
+                    logger.warning(f"[{symbol}] 사용 가능한 OHLCV 데이터가 없습니다.")
                     continue
                 
                 feature_df_dict = {}
-                loop = asyncio.get_running_loop()
                 
-                for tf, df in ohlcv_data.items():
-                    if not df.empty and len(df) >= longest_period:
+                for tf, frame in ohlcv_data.items():
+                    if len(frame) >= longest_period:
                         try:
-                            feature_df = await loop.run_in_executor(
-                                executor, market_features.extract_market_features, df.copy()
-                            )
+                            if feature_engine is not None:
+                                # 새로 마감된 캔들만 상태에 반영하므로 프로세스 풀 없이 바로 계산
+                                feature_df = feature_engine.features_frame(symbol, tf, frame)
+                            elif tf in panel_features and symbol in panel_features[tf].index:
+                                feature_df = panel_features[tf].loc[[symbol]]
+                                feature_df.index = [pd.Timestamp(frame.last_timestamp, unit='ms')]
+                            else:
+                                # 패널/심볼 작업 모두 실패한 타임프레임 (compute_batch_features에서 경고 기록)
+                                continue
                             if feature_df is not None and not feature_df.empty:
                                 feature_df_dict[tf] = feature_df
                             
-                            await asyncio.sleep(0.2)
-                            
                         except Exception as e:
                             logger.warning(f"[{symbol}] {tf} 피처 추출 실패: {e}")
                             continue
+                    elif tf in derived_timeframes:
+                        logger.warning(f"[{symbol}] 파생 {tf} 캔들이 {len(frame)}개로 지표 기간({longest_period})보다 적어 제외합니다.")
 
                 if not feature_df_dict:
                     continue
@@ -832,8 +1090,6 @@ async def main_loop(app_state: AppState, executor: ProcessPoolExecutor, session:
                             "primary_df": feature_df_dict.get(TF_PRIMARY)
                         })
                         
-                        await asyncio.sleep(0.5)
-                        
                 except Exception as e:
                     logger.warning(f"[{symbol}] MTF 피처 병합 실패: {e}")
                     continue
@@ -902,7 +1158,11 @@ async def main_loop(app_state: AppState, executor: ProcessPoolExecutor, session:
             else:
                 sleep_time = 90
                 
-            await safe_sleep(sleep_time)
+            if kline_stream is not None and kline_stream.connected:
+                # 다음 봉 마감 즉시 다음 사이클 시작 (최대 sleep_time 대기)
+                await kline_stream.wait_bar_closed(timeout=sleep_time)
+            else:
+                await safe_sleep(sleep_time)
 
     except (asyncio.CancelledError, KeyboardInterrupt):
         logger.info("메인 루프가 외부 요청에 의해 중단되었습니다.")
@@ -914,6 +1174,14 @@ async def main_loop(app_state: AppState, executor: ProcessPoolExecutor, session:
 
     finally:
         await resource_manager.stop()
+        if kline_stream is not None:
+            await kline_stream.stop()
+        await market_catalog.stop()
+        if feature_engine is not None:
+            try:
+                await asyncio.to_thread(feature_engine.save, FEATURE_STATE_PATH)
+            except OSError as e:
+                logger.warning(f"증분 지표 상태 저장 실패: {e}")
         
     command_task.cancel()
     try:
@@ -20,7 +20,8 @@ def check_signal(df: pd.DataFrame, fast_period: int = 10, slow_period: int = 30)
     if df.empty or len(df) < slow_period:
         return 'hold'
 
-    # pandas-ta를 사용하여 이동평균선 계산
+    # pandas-ta를 사용하여 이동평균선 계산 (임포트 시 df.ta 접근자 등록)
+    import pandas_ta  # noqa: F401
     # append=True를 통해 df에 직접 컬럼을 추가합니다.
     df.ta.sma(length=fast_period, append=True)
     df.ta.sma(length=slow_period, append=True)
@@ -1,3 +1,10 @@
 # -*- coding: utf-8 -*-
 """Notifier 패키지를 위한 초기화 파일."""
-from . import telegram_notifier
+import importlib
+
+
+def __getattr__(name: str):
+    # telegram_notifier는 aiogram을 임포트하므로 `src.notifier.telegram_notifier` 접근 시점까지 지연
+    if name == "telegram_notifier":
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -20,6 +20,16 @@ TRAINING_CONFIG = {
     # 전략 및 환경 ID
     "strategy_name": "PPO_Trading_Strategy",
     "env_id": "TradingEnv-v0",
+    # 데이터셋 레지스트리 이름 (tools/materialize_dataset.py로 확정). 설정하면 train/validation 분할을 로컬에서 읽음
+    "dataset": "BTCUSDT_5m",
+    "eval_split": "validation",
+    "vec_env": "batched", # "batched": BatchedTradingVecEnv (배열 연산), "subproc": 워커 프로세스 + 공유 데이터, "dummy": DummyVecEnv
+    "n_envs": 8,
+    "subproc": {
+        "pin_cpus": True,     # 워커마다 CPU 하나에 고정 (os.sched_setaffinity)
+        "torch_threads": 1,   # 워커의 torch 스레드 수
+        "start_method": None, # None이면 SB3 기본값 (forkserver/spawn)
+    },
 
     # 훈련 루프 설정
     "total_timesteps": 1_000_000,
@@ -30,7 +40,7 @@ TRAINING_CONFIG = {
     "eval_n_episodes": 10,
     "reward_threshold": 1000.0, # 조기 종료를 위한 목표 보상
 
-    # 환경(TradingEnv) 설정
+    # 환경(TradingEnv) 설정. dataset이 있으면 symbol/interval은 데이터셋 명세를 따르며, 다르면 TradingEnv가 거부
     "env_config": {
         "symbol": "BTC/USDT",
         "interval": "5m",
@@ -40,7 +50,7 @@ TRAINING_CONFIG = {
         "risk_dd_limit": 0.5,
         "daily_loss_limit_usdt": 200.0,
         "reward_profile": "snake_ma",
-        "use_online": True, # 실시간 데이터로 훈련 시 True
+        "use_online": False, # dataset이 없을 때만 사용: 실시간 데이터로 훈련 시 True
         "data_path": None, # 로컬 데이터 사용 시 경로 지정
     },
 
@@ -9,15 +9,18 @@ from __future__ import annotations
 import os
 import logging
 from datetime import datetime
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Optional, Tuple
 
 import torch
 import gymnasium as gym
 from stable_baselines3 import PPO
 from stable_baselines3.common.callbacks import EvalCallback, StopTrainingOnRewardThreshold
-from stable_baselines3.common.env_util import make_vec_env
-from stable_baselines3.common.vec_env import VecNormalize
+from stable_baselines3.common.monitor import Monitor
+from stable_baselines3.common.vec_env import DummyVecEnv, SubprocVecEnv, VecNormalize
 
+from ..core.batched_trading_env import BatchedTradingVecEnv
+from ..core.shared_env_data import SharedEnvData, shared_env_fns
+from ..core.trading_env import TradingEnv
 from .config import TRAINING_CONFIG
 
 logger = logging.getLogger(__name__)
@@ -47,28 +50,57 @@ def _setup_paths(config: Dict[str, Any]) -> Dict[str, str]:
     logger.info(f"TensorBoard logs available at: {log_dir}")
     return paths
 
-def _create_environments(config: Dict[str, Any]) -> Tuple[VecNormalize, VecNormalize]:
-    """훈련 및 평가용 Gym 환경을 생성하고 VecNormalize로 래핑합니다."""
+def _create_environments(config: Dict[str, Any]) -> Tuple[VecNormalize, VecNormalize, Optional[SharedEnvData]]:
+    """
+    훈련 및 평가용 Gym 환경을 생성하고 VecNormalize로 래핑합니다.
+    데이터 로드/피처 계산은 템플릿 환경에서 한 번만 하고 모든 훈련 환경이 그 배열을 공유합니다.
+    `dataset`(레지스트리 이름)이 있으면 훈련은 train 분할, 평가는 validation 분할을 로컬에서 읽습니다.
+    반환값의 세 번째 항목은 subproc 모드의 공유 메모리 블록 (훈련 종료 후 닫아야 함, 그 외 모드는 None).
+    """
     env_id = config.get("env_id", "TradingEnv-v0")
-    env_config = config.get("env_config", {})
+    env_config = dict(config.get("env_config", {}))
+    eval_config = None
+    if config.get("dataset"):
+        env_config.update(dataset=config["dataset"], dataset_split="train")
+        eval_config = {**env_config, "dataset_split": config.get("eval_split", "validation")}
+    n_envs = int(config.get("n_envs", 1))
+    vec_env_type = config.get("vec_env", "dummy")
+    shared = None
     
     try:
         # 커스텀 환경 등록
         env_registry = getattr(gym.envs.registry, "env_specs", gym.envs.registry)
         if env_id not in env_registry:
             gym.register(id=env_id, entry_point="src.core.trading_env:TradingEnv")
+        template = TradingEnv(env_config)
         
         # 훈련 환경 생성
-        train_env = make_vec_env(env_id, n_envs=1, env_kwargs={"config": env_config})
+        if vec_env_type == "batched":
+            # N개 에피소드를 한 프로세스에서 배열 연산으로 실행
+            train_env = BatchedTradingVecEnv(env_config, n_envs=n_envs, template=template)
+        elif vec_env_type == "subproc":
+            # 워커 프로세스마다 환경 하나, 데이터는 공유 메모리 블록에서 읽기 전용으로 참조
+            subproc_config = config.get("subproc", {})
+            shared = SharedEnvData(template)
+            env_fns = shared_env_fns(shared.descriptor, n_envs, env_config,
+                                     pin_cpus=subproc_config.get("pin_cpus", True),
+                                     torch_threads=subproc_config.get("torch_threads", 1))
+            train_env = SubprocVecEnv(env_fns, start_method=subproc_config.get("start_method"))
+        else:
+            prepared = template.prepared_arrays()
+            train_env = DummyVecEnv([lambda: Monitor(TradingEnv(env_config, prepared=prepared)) for _ in range(n_envs)])
         train_env = VecNormalize(train_env, norm_obs=True, norm_reward=True)
         
-        # 평가 환경 생성
-        eval_env = make_vec_env(env_id, n_envs=1, env_kwargs={"config": env_config})
+        # 평가 환경 생성 (데이터셋 분할이 없으면 템플릿 환경 재사용)
+        eval_source = TradingEnv(eval_config) if eval_config is not None else template
+        eval_env = DummyVecEnv([lambda: Monitor(eval_source)])
         eval_env = VecNormalize(eval_env, norm_obs=True, norm_reward=True)
         
-        logger.info("Training and evaluation environments created successfully.")
-        return train_env, eval_env
+        logger.info(f"Training ({vec_env_type}, n_envs={n_envs}) and evaluation environments created successfully.")
+        return train_env, eval_env, shared
     except Exception as e:
+        if shared is not None:
+            shared.close()
         logger.error(f"Gym 환경 생성 오류: {e}", exc_info=True)
         raise RuntimeError("Gym 환경을 생성하지 못했습니다. TradingEnv가 올바르게 설치 및 등록되었는지 확인하세요.")
 
@@ -99,12 +131,13 @@ def train_ppo_trading(config: Dict[str, Any] = None):
     logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
     logger.info("PPO training pipeline started.")
 
+    shared = None
     try:
         # 1. 경로 설정
         paths = _setup_paths(config)
         
         # 2. 환경 생성
-        train_env, eval_env = _create_environments(config)
+        train_env, eval_env, shared = _create_environments(config)
         
         # 3. 콜백 설정
         eval_callback = _setup_callbacks(config, eval_env, paths)
@@ -128,16 +161,20 @@ def train_ppo_trading(config: Dict[str, Any] = None):
         )
         logger.info("Model training finished.")
 
+        # 6. 최종 모델 및 환경 통계 저장
+        model.save(paths["final_model_path"])
+        train_env.save(paths["vecnorm_path"])
     except (RuntimeError, KeyboardInterrupt) as e:
         logger.warning(f"Training stopped or failed: {e}")
         return
     except Exception as e:
         logger.error(f"An unexpected error occurred during the training pipeline: {e}", exc_info=True)
         return
+    finally:
+        if shared is not None:
+            train_env.close()
+            shared.close()
     
-    # 6. 최종 모델 및 환경 통계 저장
-    model.save(paths["final_model_path"])
-    train_env.save(paths["vecnorm_path"])
     logger.info(f"Final model saved to: {paths['final_model_path']}")
     logger.info(f"VecNormalize stats saved to: {paths['vecnorm_path']}")
     logger.info(f"To monitor training, run: tensorboard --logdir {paths['log_dir']}")
@@ -6,7 +6,6 @@ import logging
 from fastapi import FastAPI, Request, Depends
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
-from ..engine.manager import TradingEngine
 from ..core.database import get_db
 from ..core.models import SignalLog
 
@@ -17,15 +16,21 @@ app = FastAPI(title="Crypto Trading Bot Dashboard")
 # 이 경로가 프로젝트 루트에서 실행되는 것을 기준으로 합니다.
 templates = Jinja2Templates(directory="src/web/templates")
 
-# TradingEngine 싱글턴 인스턴스 가져오기
-engine = TradingEngine()
+# TradingEngine 싱글턴 인스턴스 (ccxt 등 무거운 의존성을 임포트하므로 첫 요청 시 생성)
+_engine = None
+def get_engine():
+    global _engine
+    if _engine is None:
+        from ..engine.manager import TradingEngine
+        _engine = TradingEngine()
+    return _engine
 
 @app.get("/")
 async def get_dashboard(request: Request, db: Session = Depends(get_db)):
     """
     메인 대시보드 페이지를 렌더링합니다.
     """
-    status = engine.get_status()
+    status = get_engine().get_status()
     try:
         recent_signals = db.query(SignalLog).order_by(SignalLog.timestamp.desc()).limit(10).all()
     except Exception as e:
@@ -46,7 +51,7 @@ async def api_get_status():
     """
     현재 엔진 상태를 JSON으로 반환하는 API 엔드포인트
     """
-    return engine.get_status()
+    return get_engine().get_status()
 
 @app.get("/api/signals")
 async def api_get_signals(db: Session = Depends(get_db)):
@@ -1,91 +1,99 @@
 # tests/backtest/test_runner.py
 # -*- coding: utf-8 -*-
 """
-src.backtest.runner의 데이터 캐싱 기능에 대한 단위 테스트
+src.backtest.runner의 데이터 저장소/백필 기능에 대한 단위 테스트
 """
 import unittest
 import os
+import shutil
+import tempfile
 import pandas as pd
 from unittest.mock import patch, AsyncMock
 import asyncio
 import sys
+from pathlib import Path
 
 # 프로젝트 루트를 sys.path에 추가
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from src.backtest.runner import get_ohlcv_data, CACHE_DIR
+from src.backtest.runner import get_ohlcv_data
+from src.core.ohlcv_store import OHLCVStore
+
+DAY_MS = 86_400_000
+
+
+def _fake_fetch_ohlcv(symbol, timeframe, since=None, limit=None):
+    """since부터 limit개의 일봉을 돌려주는 가짜 거래소 응답 (종가 = 일 번호)"""
+    return [[since + i * DAY_MS, 100, 110, 90, (since // DAY_MS) + i, 1000] for i in range(limit)]
+
 
 class TestBacktestRunnerCaching(unittest.TestCase):
 
     def setUp(self):
-        """테스트 실행 전, 테스트용 캐시 파일 경로 설정 및 디렉토리 생성"""
+        """테스트용 임시 OHLCV 저장소 생성"""
+        self.root = Path(tempfile.mkdtemp())
+        self.store = OHLCVStore(self.root)
         self.symbol = "TEST/USDT"
-        self.start_date = "2023-01-01"
-        safe_symbol = self.symbol.replace('/', '_')
-        self.cache_filename = f"{safe_symbol}_1d_{self.start_date.split('-')[0]}.csv"
-        self.cache_filepath = CACHE_DIR / self.cache_filename
-        
-        # 테스트 실행 전 혹시 모를 캐시 파일 삭제
-        if os.path.exists(self.cache_filepath):
-            os.remove(self.cache_filepath)
+        store_patcher = patch('src.backtest.runner._get_store', return_value=self.store)
+        store_patcher.start()
+        self.addCleanup(store_patcher.stop)
 
     def tearDown(self):
-        """테스트 실행 후, 생성된 캐시 파일 삭제"""
-        if os.path.exists(self.cache_filepath):
-            os.remove(self.cache_filepath)
+        shutil.rmtree(self.root, ignore_errors=True)
 
-    @patch('src.backtest.runner.get_exchange_client')
+    def _mock_client(self, mock_get_client):
+        mock_client = AsyncMock()
+        mock_client.fetch_ohlcv.side_effect = _fake_fetch_ohlcv
+        mock_get_client.return_value = mock_client
+        return mock_client
+
+    @patch('src.backtest.runner.get_bybit_client')
     def test_caching_logic(self, mock_get_client):
         """
         캐싱 로직 테스트:
-        1. 캐시 없을 때: API 호출하고, CSV 파일 생성하는지 확인
-        2. 캐시 있을 때: API 호출 안 하고, CSV 파일 읽어오는지 확인
+        1. 저장소에 없을 때: API를 호출하여 저장소에 병합하는지 확인
+        2. 저장소에 있을 때: API 호출 없이 저장소에서 읽어오는지 확인
         """
-        # --- 1. 캐시 파일이 없을 때 ---
-        
-        # Mock 객체 설정: fetch_ohlcv가 테스트용 데이터프레임을 반환하도록 설정
-        mock_client = AsyncMock()
-        mock_client.parse8601.return_value = 'mock_since'
-        mock_ohlcv = [
-            [pd.to_datetime('2023-05-01').value // 10**6, 100, 110, 90, 105, 1000],
-            [pd.to_datetime('2023-05-02').value // 10**6, 105, 115, 95, 110, 1200],
-        ]
-        mock_client.fetch_ohlcv.return_value = mock_ohlcv
-        mock_get_client.return_value = mock_client
+        mock_client = self._mock_client(mock_get_client)
 
-        # get_ohlcv_data 실행 (비동기 함수 실행)
-        df1 = asyncio.run(get_ohlcv_data(self.symbol, self.start_date))
+        df1 = asyncio.run(get_ohlcv_data(self.symbol, "2023-01-01", "2023-01-10"))
 
-        # 검증 (1): API가 호출되었는지 확인
         mock_get_client.assert_called_once()
-        mock_client.fetch_ohlcv.assert_called_once()
-        
-        # 검증 (2): 캐시 파일이 생성되었는지 확인
-        self.assertTrue(os.path.exists(self.cache_filepath))
-        
-        # 검증 (3): 반환된 데이터프레임이 올바른지 확인
+        self.assertTrue(mock_client.fetch_ohlcv.called)
+        self.assertEqual(self.store.list_months(self.symbol, "1d"), ["2023-01"])
         self.assertIsInstance(df1, pd.DataFrame)
-        self.assertEqual(len(df1), 2)
-        self.assertEqual(df1.iloc[0]['close'], 105)
+        self.assertEqual(len(df1), 10)
+        self.assertEqual(df1.index[0], pd.Timestamp("2023-01-01"))
+        self.assertEqual(df1.index[-1], pd.Timestamp("2023-01-10"))
 
-        # --- 2. 캐시 파일이 있을 때 ---
-        
-        # Mock 객체 리셋 (다시 호출되지 않아야 함)
         mock_get_client.reset_mock()
         mock_client.fetch_ohlcv.reset_mock()
 
-        # get_ohlcv_data 다시 실행
-        df2 = asyncio.run(get_ohlcv_data(self.symbol, self.start_date))
+        df2 = asyncio.run(get_ohlcv_data(self.symbol, "2023-01-01", "2023-01-10"))
 
-        # 검증 (4): API가 호출되지 않았는지 확인
         mock_get_client.assert_not_called()
         mock_client.fetch_ohlcv.assert_not_called()
-
-        # 검증 (5): 반환된 데이터프레임이 첫 번째와 동일한지 확인
         self.assertTrue(df1.equals(df2))
-        self.assertEqual(df2.iloc[1]['close'], 110)
+
+    @patch('src.backtest.runner.get_bybit_client')
+    def test_paginated_backfill_is_not_truncated(self, mock_get_client):
+        """거래소 페이지 크기(1000개)를 넘는 기간이 여러 페이지로 나뉘어 빠짐없이 저장되는지 테스트"""
+        mock_client = self._mock_client(mock_get_client)
+
+        df = asyncio.run(get_ohlcv_data(self.symbol, "2018-01-01", "2023-12-31"))
+
+        expected_days = len(pd.date_range("2018-01-01", "2023-12-31", freq="D"))
+        self.assertEqual(len(df), expected_days)
+        self.assertTrue(df.index.is_monotonic_increasing)
+        self.assertEqual(mock_client.fetch_ohlcv.call_count, 3)
+
+        # 기간을 늘리면 새로 필요한 구간만 요청 (재개)
+        mock_client.fetch_ohlcv.reset_mock()
+        asyncio.run(get_ohlcv_data(self.symbol, "2017-12-01", "2023-12-31"))
+        mock_client.fetch_ohlcv.assert_called_once()
+        self.assertEqual(mock_client.fetch_ohlcv.call_args.kwargs["since"], pd.Timestamp("2017-12-01", tz="UTC").value // 10**6)
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.batched_trading_env 배치 벡터 환경이 TradingEnv N개와 같은 궤적을 내는지 확인하는 테스트
+"""
+import unittest
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from stable_baselines3.common.vec_env import VecNormalize
+
+from src.core.batched_trading_env import BatchedTradingVecEnv
+from src.core.trading_env import TradingEnv
+from tests.core.test_trading_env import _write_csv
+
+N_ENVS = 4
+
+
+class TestBatchedTradingVecEnv(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        path = os.path.join(cls._tmp.name, "ohlcv.csv")
+        _write_csv(path)
+        cls.config = {'use_online': False, 'data_path': path, 'random_start': False,
+                      'max_steps': 300, 'use_feature_store': False, 'reward_profile': 'snake_ma'}
+        cls.template = TradingEnv(cls.config)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def test_matches_independent_envs(self):
+        vec = BatchedTradingVecEnv(n_envs=N_ENVS, template=self.template)
+        starts = [self.template.cfg.window + 1 + 97 * k for k in range(N_ENVS)]
+        obs = vec.set_start_indices(starts)
+        envs = []
+        for start in starts:
+            env = TradingEnv(self.config)
+            env.reset()
+            env.start_idx = env.i = start
+            env.end_idx = min(env.N - 2, start + env.cfg.max_steps)
+            envs.append(env)
+        np.testing.assert_array_equal(obs, np.stack([env._get_obs() for env in envs]))
+
+        rng = np.random.default_rng(3)
+        finished = 0
+        for _ in range(self.template.cfg.max_steps + 20):
+            actions = rng.integers(0, 9, N_ENVS)
+            obs, rewards, dones, infos = vec.step(actions)
+            for k, env in enumerate(envs):
+                expected_obs, reward, terminated, truncated, info = env.step(int(actions[k]))
+                self.assertEqual(dones[k], terminated or truncated)
+                self.assertAlmostEqual(float(rewards[k]), np.float32(reward), places=6)
+                self.assertAlmostEqual(infos[k]["equity"], info["equity"], places=9)
+                self.assertEqual(infos[k]["termination_reason"], info["termination_reason"])
+                if dones[k]:
+                    np.testing.assert_allclose(infos[k]["terminal_observation"], expected_obs, atol=1e-6)
+                    self.assertIn("episode", infos[k])
+                    env.reset()
+                    finished += 1
+                np.testing.assert_allclose(obs[k], env._get_obs(), atol=1e-6)
+        self.assertGreaterEqual(finished, N_ENVS)
+
+    def test_vec_normalize_and_attrs(self):
+        vec = VecNormalize(BatchedTradingVecEnv(n_envs=N_ENVS, template=self.template))
+        vec.seed(7)
+        obs = vec.reset()
+        self.assertEqual(obs.shape, (N_ENVS,) + self.template.observation_space.shape)
+        obs, rewards, dones, infos = vec.step(np.full(N_ENVS, 1))
+        self.assertEqual(rewards.shape, (N_ENVS,))
+        self.assertEqual(vec.get_attr("side"), [1] * N_ENVS)
+        self.assertEqual(vec.env_is_wrapped(VecNormalize), [False] * N_ENVS)
+
+
+if __name__ == '__main__':
+    unittest.main()
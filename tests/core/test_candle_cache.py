@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.candle_cache의 증분 요청 계획 및 병합에 대한 단위 테스트
+"""
+import unittest
+import os
+import sys
+import time
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.candle_cache import CandleCache
+
+TF_MS = 300_000
+
+
+def _bars(start_ms, count):
+    return [[start_ms + i * TF_MS, 1.0, 2.0, 0.5, float(i), 10.0] for i in range(count)]
+
+
+class TestCandleCache(unittest.TestCase):
+
+    def setUp(self):
+        """현재 시각까지 이어지는 5분봉 50개로 캐시를 채움"""
+        self.cache = CandleCache(capacity=100)
+        self.now_bar = int(time.time() * 1000) // TF_MS * TF_MS
+        self.cache.update("BTC/USDT:USDT", "5m", _bars(self.now_bar - 49 * TF_MS, 50), full=True)
+
+    def test_incremental_plan_and_merge(self):
+        """마지막 캔들부터 소량만 요청하고, 진행 중 캔들은 덮어쓰며 새 캔들을 추가하는지 테스트"""
+        since, limit = self.cache.plan("BTC/USDT:USDT", "5m", 50)
+        self.assertEqual(since, self.now_bar)
+        self.assertLessEqual(limit, 3)
+
+        update = [[self.now_bar, 1.0, 2.0, 0.5, 123.0, 10.0], [self.now_bar + TF_MS, 1.0, 2.0, 0.5, 124.0, 10.0]]
+        self.cache.update("BTC/USDT:USDT", "5m", update, full=False)
+        df = self.cache.frame("BTC/USDT:USDT", "5m", 50)
+
+        self.assertEqual(len(df), 50)
+        self.assertEqual(list(df.close[-2:]), [123.0, 124.0])
+        self.assertEqual(self.cache.incremental_fetches, 1)
+
+    def test_unknown_or_short_key_requests_full_history(self):
+        """캐시에 없거나 캔들이 부족한 키는 전체 조회를 계획하는지 테스트"""
+        self.assertEqual(self.cache.plan("ETH/USDT:USDT", "5m", 50), (None, 50))
+        self.assertEqual(self.cache.plan("BTC/USDT:USDT", "5m", 80), (None, 80))
+
+    def test_retain_evicts_symbols_leaving_universe(self):
+        """유니버스에서 빠진 심볼 버퍼를 제거하는지 테스트"""
+        self.cache.update("ETH/USDT:USDT", "5m", _bars(self.now_bar, 1), full=True)
+        self.assertEqual(self.cache.retain(["ETH/USDT:USDT"]), 1)
+        self.assertIsNone(self.cache.frame("BTC/USDT:USDT", "5m"))
+
+if __name__ == '__main__':
+    unittest.main()
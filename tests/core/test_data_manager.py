@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.data_manager.fetch_ohlcv 증분 로딩 테스트 (마지막 시각 기준 since, 최근 구간만 읽기)
+"""
+import unittest
+import os
+import sys
+import shutil
+import asyncio
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core import data_manager
+from src.core.ohlcv_store import OHLCVStore
+
+_MINUTE_MS = 60_000
+
+
+class _FakeClient:
+    """`since` 이후 캔들을 최대 limit개 돌려주는 가짜 ccxt 클라이언트."""
+
+    def __init__(self, index: pd.DatetimeIndex):
+        self.timestamps = (index.asi8 // 10**6).tolist()
+        self.calls = []
+
+    async def fetch_ohlcv(self, symbol, timeframe=None, limit=None, since=None):
+        self.calls.append(since)
+        ts = [t for t in self.timestamps if since is None or t >= since][:limit]
+        return [[t, 1.0, 2.0, 0.5, float(t // _MINUTE_MS), 1.0] for t in ts]
+
+
+class TestFetchOhlcv(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.store = OHLCVStore(self.root)
+        self.symbol = "BTC/USDT:USDT"
+        # 월 경계를 넘는 과거 캔들 (모두 마감됨)
+        self.index = pd.date_range("2024-01-31 20:00", periods=600, freq="min", tz="UTC")
+        patcher = mock.patch.object(data_manager, "_store", self.store)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_incremental_update_reads_only_tail(self):
+        history = self.index[:500]
+        values = np.tile([1.0, 2.0, 0.5, 0.0, 1.0], (len(history), 1))
+        values[:, 3] = history.asi8 // 10**6 // _MINUTE_MS
+        self.store.append(self.symbol, "1m", pd.DataFrame(values, index=history,
+                                                          columns=["open", "high", "low", "close", "volume"]))
+        client = _FakeClient(self.index)
+
+        with mock.patch.object(self.store, "read", side_effect=AssertionError("full history read")):
+            df = asyncio.run(data_manager.fetch_ohlcv(client, self.symbol, "1m", limit=200))
+
+        self.assertEqual(client.calls, [int(history[-1].value // 10**6)])   # 저장소 마지막 캔들부터
+        self.assertEqual(len(df), 200)
+        self.assertEqual(df.index[-1], self.index[-1])
+        self.assertTrue(df.index.is_monotonic_increasing and df.index.is_unique)
+        self.assertEqual(self.store.last_timestamp(self.symbol, "1m"), self.index[-1])
+
+    def test_empty_store_fetches_full(self):
+        client = _FakeClient(self.index)
+        df = asyncio.run(data_manager.fetch_ohlcv(client, self.symbol, "1m", limit=100))
+        self.assertEqual(client.calls, [None])
+        self.assertEqual(len(df), 100)
+        self.assertEqual(len(self.store.tail(self.symbol, "1m", 1000)), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.dataset_registry 데이터셋 확정/해시/분할과 이름으로 만드는 TradingEnv 테스트
+"""
+import unittest
+import os
+import sys
+import tempfile
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.config.data_windows import LOOKBACK_CONFIG
+from src.core import dataset_registry
+from src.core.dataset_registry import DatasetRegistry, DatasetSpec, compute_splits
+from src.core.trading_env import TradingEnv
+
+
+def _ohlcv(days=150, freq="15min", seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2024-01-01", periods=days * 96, freq=freq, tz="UTC", name="timestamp")
+    close = 100 + np.cumsum(rng.normal(0, 0.5, len(index)))
+    return pd.DataFrame({'open': close, 'high': close + rng.random(len(index)), 'low': close - rng.random(len(index)),
+                         'close': close, 'volume': rng.random(len(index)) * 10}, index=index)
+
+
+class TestDatasetRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.registry = DatasetRegistry(self._tmp.name)
+        self.spec = DatasetSpec("BTC_15m", "BTCUSDT", "15m", "2024-01-02", "2024-05-25")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_materialize_splits_and_hash(self):
+        entry = self.registry.materialize(self.spec, source=_ohlcv())
+        self.assertEqual(entry["rows"], 144 * 96)                                # [start, end) 구간만
+        self.assertTrue(self.registry.verify("BTC_15m"))
+        lookback = LOOKBACK_CONFIG["15m"]
+        test, validation, train = (entry["splits"][s] for s in ("test", "validation", "train"))
+        self.assertEqual(test[1] - test[0], lookback["oos_days"] * 96)
+        self.assertEqual(validation[1] - validation[0], lookback["wf_days"] * 96)
+        self.assertEqual((train[0], train[1], validation[1]), (0, validation[0], test[0]))
+
+        # 같은 명세는 네트워크/재기록 없이 기존 항목 반환, 다른 명세는 거부
+        self.assertEqual(self.registry.materialize(self.spec), entry)
+        with self.assertRaises(ValueError):
+            self.registry.materialize(DatasetSpec("BTC_15m", "BTCUSDT", "15m", "2024-01-03"))
+
+        df = self.registry.load("BTC_15m", "validation", warmup_bars=10)
+        self.assertEqual(len(df), validation[1] - validation[0] + 10)
+        self.assertEqual(df.index.tz, pd.Timestamp("2024-01-01", tz="UTC").tz)
+        with self.assertRaises(KeyError):
+            self.registry.load("missing")
+
+    def test_compute_splits_short_data(self):
+        ts = pd.date_range("2024-01-01", periods=10, freq="1d").asi8 // 10**6
+        splits = compute_splits(ts, "1h")                       # test 90일 > 데이터 10일
+        self.assertEqual(splits, {"train": (0, 0), "validation": (0, 0), "test": (0, 10)})
+
+    def test_trading_env_by_name(self):
+        self.registry.materialize(self.spec, source=_ohlcv())
+        config = {'dataset': 'BTC_15m', 'dataset_split': 'test', 'use_feature_store': False, 'random_start': False}
+        with mock.patch.object(dataset_registry, "_dataset_registry", self.registry), \
+                mock.patch("src.core.trading_env.get_bybit_data", side_effect=AssertionError("network")):
+            env = TradingEnv(config)
+        test = self.registry.entry("BTC_15m")["splits"]["test"]
+        self.assertEqual(len(env.df_raw), test[1] - test[0] + env.cfg.window)
+        self.assertEqual(env.df_raw.index[env.cfg.window], self.registry.load("BTC_15m", "test").index[0])
+        # 심볼/타임프레임은 데이터셋 명세를 따름
+        self.assertEqual((env.cfg.symbol, env.cfg.interval, env._step_minutes), ("BTCUSDT", "15m", 15.0))
+
+    def test_trading_env_rejects_mismatched_spec(self):
+        self.registry.materialize(self.spec, source=_ohlcv())
+        base = {'dataset': 'BTC_15m', 'dataset_split': 'test', 'use_feature_store': False}
+        with mock.patch.object(dataset_registry, "_dataset_registry", self.registry):
+            env = TradingEnv({**base, 'symbol': 'BTC/USDT:USDT', 'interval': '15'})     # 표기만 다른 같은 값
+            self.assertEqual(env.cfg.interval, "15m")
+            for override in ({'symbol': 'ETH/USDT'}, {'interval': '5m'}):
+                with self.subTest(override=override), self.assertRaises(ValueError):
+                    TradingEnv({**base, **override})
+
+
+if __name__ == '__main__':
+    unittest.main()
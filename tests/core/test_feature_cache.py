@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.feature_cache의 바이트 예산 축출, 디스크 스필 및 피처 추출 캐시 키에 대한 단위 테스트
+"""
+import unittest
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.feature_cache import FeatureCache, estimate_nbytes
+from src.core.ohlcv_frame import OHLCVFrame
+from src.core import market_features_optimized as mfo
+
+
+def _features(i):
+    return {'sma_20': float(i), 'rsi': 50.0 + i}
+
+
+class TestFeatureCache(unittest.TestCase):
+
+    def test_byte_budget_evicts_least_recently_used(self):
+        entry = estimate_nbytes(_features(0))
+        cache = FeatureCache(max_bytes=entry * 2)
+        cache.put("a", _features(1))
+        cache.put("b", _features(2))
+        self.assertEqual(cache.get("a"), _features(1))   # a를 최근 사용으로 갱신
+        cache.put("c", _features(3))
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIsNone(cache.get("b"))
+        info = cache.info()
+        self.assertEqual((info["hits"], info["misses"], info["evictions"]), (1, 1, 1))
+        self.assertLessEqual(info["bytes"], cache.max_bytes)
+
+    def test_evicted_entries_are_reloaded_from_spill(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = FeatureCache(max_bytes=1, spill_dir=tmp)
+            cache.put(("BTC", "5m", 1), _features(1))
+            cache.put(("ETH", "5m", 1), _features(2))
+            self.assertEqual(cache.get(("BTC", "5m", 1)), _features(1))
+            self.assertEqual(cache.spill_hits, 1)
+            cache.clear()
+            self.assertEqual(os.listdir(tmp), [])
+
+    def test_extract_market_features_keys_on_series_identity(self):
+        """같은 값이라도 심볼이 다르면 별도 항목이고, 같은 심볼/윈도우는 캐시 히트여야 합니다."""
+        mfo.clear_cache()
+        n = 60
+        close = 100 + np.sin(np.arange(n))
+        frame = OHLCVFrame.from_columns(np.arange(n) * 60_000, close, close + 1, close - 1, close, np.ones(n))
+        mfo.extract_market_features(frame, "BTC/USDT:USDT", "5m")
+        mfo.extract_market_features(frame, "ETH/USDT:USDT", "5m")
+        mfo.extract_market_features(frame, "BTC/USDT:USDT", "5m")
+        info = mfo.get_cache_info()
+        self.assertEqual((info["cache_hits"], info["cache_misses"], info["cache_size"]), (1, 2, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
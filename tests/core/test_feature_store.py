@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.feature_store의 키 기반 재사용 및 재계산 조건에 대한 단위 테스트
+"""
+import unittest
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.feature_store import FeatureStore
+
+
+def _ohlcv(n=50):
+    close = 100 + np.arange(n, dtype=float)
+    index = pd.date_range('2024-01-01', periods=n, freq='1min', tz='UTC', name='timestamp')
+    return pd.DataFrame({'open': close, 'high': close + 1, 'low': close - 1, 'close': close, 'volume': 1.0}, index=index)
+
+
+class TestFeatureStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = FeatureStore(self.tmp.name)
+        self.calls = 0
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _compute(self, df):
+        self.calls += 1
+        return df.assign(ret=df['close'].pct_change()).dropna()
+
+    def test_reuses_until_data_or_definition_changes(self):
+        df = _ohlcv()
+        first = self.store.load_or_compute(df, self._compute, "def-a")
+        second = self.store.load_or_compute(df.copy(), self._compute, "def-a")
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(second.dtypes.iloc[0], np.float32)
+        self.assertEqual(list(second.columns), list(first.columns))
+        self.assertEqual(str(second.index.tz), 'UTC')
+        pd.testing.assert_frame_equal(first, second)
+
+        self.store.load_or_compute(df, self._compute, "def-b")
+        changed = df.copy()
+        changed.iloc[-1, changed.columns.get_loc('close')] += 1
+        self.store.load_or_compute(changed, self._compute, "def-a")
+        self.assertEqual(self.calls, 3)
+        self.assertEqual((self.store.hits, self.store.misses), (1, 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.kline_stream의 링 버퍼 및 로컬 가짜 WebSocket 서버 기반 스트리밍 테스트
+"""
+import unittest
+import os
+import sys
+import json
+import asyncio
+
+import numpy as np
+import websockets
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.kline_stream import CandleRingBuffer, KlineStream
+from src.core.ohlcv_frame import OHLCVFrame
+
+MIN_MS = 60_000
+TF_MS = 5 * MIN_MS
+
+
+def _rest_frame(first, last, close=1.0):
+    ts = np.arange(first, last + 1, dtype=np.int64) * TF_MS
+    n = len(ts)
+    return OHLCVFrame.from_columns(ts, np.ones(n), np.full(n, 2.0), np.full(n, 0.5), np.full(n, close), np.ones(n))
+
+
+def _kline(start_ms, close, confirm):
+    return {"start": start_ms, "end": start_ms + 5 * MIN_MS - 1, "interval": "5",
+            "open": "1", "high": "2", "low": "0.5", "close": str(close),
+            "volume": "10", "turnover": "10", "confirm": confirm, "timestamp": start_ms}
+
+
+class TestCandleRingBuffer(unittest.TestCase):
+
+    def test_wraparound_and_inplace_update(self):
+        """용량 초과 시 오래된 캔들을 덮어쓰고, 같은 시각 캔들은 제자리 갱신하는지 테스트"""
+        buf = CandleRingBuffer(capacity=3)
+        for i in range(5):
+            buf.upsert([i * MIN_MS, 1, 2, 0, i, 1])
+        buf.upsert([4 * MIN_MS, 1, 2, 0, 99, 1])
+
+        arr = buf.to_array()
+        self.assertEqual(len(buf), 3)
+        np.testing.assert_array_equal(arr[:, 0], [2 * MIN_MS, 3 * MIN_MS, 4 * MIN_MS])
+        self.assertEqual(arr[-1, 4], 99)
+
+
+class TestKlineStream(unittest.TestCase):
+
+    def test_stream_against_fake_server(self):
+        """가짜 서버의 kline 메시지로 버퍼가 채워지고 봉 마감 이벤트가 발생하는지 테스트"""
+
+        async def scenario():
+            subscribed = []
+
+            async def handler(ws):
+                async for raw in ws:
+                    msg = json.loads(raw)
+                    if msg.get("op") != "subscribe":
+                        continue
+                    subscribed.extend(msg["args"])
+                    await ws.send(json.dumps({"success": True, "op": "subscribe"}))
+                    topic = "kline.5.BTCUSDT"
+                    # 진행 중 캔들 갱신 2회 → 마감 → 다음 캔들 시작
+                    for close, confirm, start in [(100, False, 0), (101, False, 0), (102, True, 0), (103, False, 5 * MIN_MS)]:
+                        await ws.send(json.dumps({"topic": topic, "type": "snapshot", "data": [_kline(start, close, confirm)]}))
+
+            async with websockets.serve(handler, "127.0.0.1", 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                stream = KlineStream(["5m"], capacity=10, url=f"ws://127.0.0.1:{port}")
+                await stream.update_symbols(["BTC/USDT:USDT"])
+                await stream.start()
+                event = await asyncio.wait_for(stream.bar_closed.get(), timeout=5)
+                for _ in range(50):
+                    if len(stream.buffer("BTC/USDT:USDT", "5m")) == 2:
+                        break
+                    await asyncio.sleep(0.02)
+                frame = stream.get_frame("BTC/USDT:USDT", "5m")
+                await stream.stop()
+            return subscribed, event, frame
+
+        subscribed, event, frame = asyncio.run(scenario())
+
+        self.assertEqual(subscribed, ["kline.5.BTCUSDT"])
+        self.assertEqual(event.symbol, "BTC/USDT:USDT")
+        self.assertEqual(event.timeframe, "5m")
+        self.assertEqual(event.close, 102)
+        self.assertEqual(list(frame.close), [102, 103])
+
+    def test_gap_marks_stale_and_reseed_fills_it(self):
+        """캔들 시각이 건너뛰면 재시드 전까지 이력이 없는 것으로 보고, 재시드가 빈 구간을 채우는지 테스트"""
+        stream = KlineStream(["5m"], capacity=50)
+        asyncio.run(stream.update_symbols(["BTC/USDT:USDT"]))
+        topic = "kline.5.BTCUSDT"
+        self.assertFalse(stream.has_history("BTC/USDT:USDT", "5m"))
+
+        stream.seed("BTC/USDT:USDT", "5m", _rest_frame(0, 9))
+        stream._handle_message({"topic": topic, "data": [_kline(10 * TF_MS, 7, False)]})    # 연속
+        self.assertTrue(stream.has_history("BTC/USDT:USDT", "5m"))
+        stream._handle_message({"topic": topic, "data": [_kline(13 * TF_MS, 8, False)]})    # 11, 12 누락
+        self.assertFalse(stream.has_history("BTC/USDT:USDT", "5m"))
+
+        stream.seed("BTC/USDT:USDT", "5m", _rest_frame(4, 13, close=5.0))
+        self.assertTrue(stream.has_history("BTC/USDT:USDT", "5m"))
+        frame = stream.get_frame("BTC/USDT:USDT", "5m")
+        np.testing.assert_array_equal(frame.timestamp, np.arange(0, 14) * TF_MS)
+        self.assertEqual(frame.close[10], 5.0)              # 겹치는 마감 캔들은 REST 값
+        self.assertEqual(frame.close[-1], 8.0)              # REST 마지막과 같은 시각의 진행 중 캔들은 스트림 값
+
+        # REST 구간으로도 이어지지 않으면 마지막 연속 구간만 보관
+        stream._handle_message({"topic": topic, "data": [_kline(40 * TF_MS, 9, False)]})
+        stream.seed("BTC/USDT:USDT", "5m", _rest_frame(30, 39))
+        np.testing.assert_array_equal(stream.get_frame("BTC/USDT:USDT", "5m").timestamp, np.arange(30, 41) * TF_MS)
+
+    def test_reconnect_marks_buffers_stale(self):
+        """재연결하면 시드된 버퍼를 재시드 대상으로 표시하는지 테스트"""
+
+        async def scenario():
+            connections = []
+
+            async def handler(ws):
+                connections.append(ws)
+                async for raw in ws:
+                    if json.loads(raw).get("op") == "subscribe" and len(connections) == 1:
+                        await ws.close()                            # 첫 연결은 구독 직후 끊김
+
+            async with websockets.serve(handler, "127.0.0.1", 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                stream = KlineStream(["5m"], capacity=50, url=f"ws://127.0.0.1:{port}")
+                await stream.update_symbols(["BTC/USDT:USDT"])
+                stream.seed("BTC/USDT:USDT", "5m", _rest_frame(0, 9))
+                await stream.start()
+                self.assertTrue(stream.has_history("BTC/USDT:USDT", "5m"))
+                for _ in range(150):
+                    if len(connections) >= 2 and stream.connected:
+                        break
+                    await asyncio.sleep(0.02)
+                fresh = stream.has_history("BTC/USDT:USDT", "5m")
+                await stream.stop()
+            return len(connections), fresh
+
+        connections, fresh = asyncio.run(scenario())
+        self.assertEqual(connections, 2)
+        self.assertFalse(fresh)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.lazy_import 지연 임포트 프록시와 시작 경로의 무거운 의존성 임포트 여부에 대한 단위 테스트
+"""
+import unittest
+import os
+import sys
+import subprocess
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.lazy_import import HEAVY_MODULES, LazyModule, is_loaded, lazy_import
+
+
+class TestLazyImport(unittest.TestCase):
+
+    def test_proxy_imports_on_first_attribute_access(self):
+        sys.modules.pop("colorsys", None)
+        proxy = lazy_import("colorsys")
+        self.assertIsInstance(proxy, LazyModule)
+        self.assertFalse(is_loaded(proxy))
+        self.assertNotIn("colorsys", sys.modules)
+
+        self.assertEqual(proxy.rgb_to_hsv(1.0, 0.0, 0.0), (0.0, 1.0, 1.0))
+        self.assertTrue(is_loaded(proxy))
+        self.assertIs(lazy_import("colorsys"), sys.modules["colorsys"])
+
+    def test_engine_import_does_not_load_heavy_dependencies(self):
+        """실시간 엔진 모듈 임포트만으로는 ccxt/pandas_ta 등이 임포트되지 않아야 합니다."""
+        code = (
+            "import sys, src.engine.main_realtime, src.core.exit_manager, src.core.strategy_signals;"
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+        )
+        proc = subprocess.run([sys.executable, "-c", code], cwd=project_root, capture_output=True, text=True)
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        self.assertEqual(proc.stdout.strip(), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
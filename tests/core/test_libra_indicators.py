@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.libra_indicators의 NumPy 지표가 pandas-ta `study(LibraStrategy)` 결과와 같은지 확인하는 패리티 테스트
+"""
+import unittest
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core import market_features as mf
+from src.core.libra_indicators import append_indicators, compute_indicators
+
+
+def _ohlcv(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, rows))
+    high = close + np.abs(rng.normal(0, 0.5, rows))
+    low = close - np.abs(rng.normal(0, 0.5, rows))
+    open_ = np.clip(close + rng.normal(0, 0.2, rows), low, high)
+    volume = np.abs(rng.normal(10, 2, rows))
+    # 0 범위 캔들(high == low)을 섞어 non_zero_range 보정 경로도 확인
+    high[::97] = low[::97] = open_[::97] = close[::97]
+    index = pd.date_range("2024-01-01", periods=rows, freq="5min", name="timestamp")
+    return pd.DataFrame({"open": open_, "high": high, "low": low, "close": close, "volume": volume}, index=index)
+
+
+class TestLibraIndicators(unittest.TestCase):
+
+    def test_columns_and_values_match_pandas_ta(self):
+        df = _ohlcv(1200)
+        strategy = mf.LibraStrategy  # pandas_ta 임포트 (df.ta 접근자 등록)
+        expected = df.copy()
+        expected.ta.study(strategy, append=True)
+        actual = append_indicators(df, mf.LIBRA_INDICATORS)
+
+        self.assertEqual(list(actual.columns), list(expected.columns))
+        for column in expected.columns:
+            with self.subTest(column=column):
+                np.testing.assert_allclose(actual[column].to_numpy(dtype=float),
+                                           expected[column].to_numpy(dtype=float),
+                                           rtol=1e-9, atol=1e-9, equal_nan=True)
+
+    def test_extract_market_features_engines_agree(self):
+        df = _ohlcv(300, seed=1)
+        numpy_features = mf.extract_market_features(df.copy(), engine="numpy")
+        ta_features = mf.extract_market_features(df.copy(), engine="pandas_ta")
+        pd.testing.assert_frame_equal(numpy_features, ta_features, check_exact=False, rtol=1e-9, atol=1e-9)
+        self.assertNotEqual(mf.feature_definition_hash("numpy"), mf.feature_definition_hash("pandas_ta"))
+
+    def test_short_series_yields_nan_columns(self):
+        data = {c: np.arange(10, dtype=float) + 1 for c in ("open", "high", "low", "close", "volume")}
+        columns = compute_indicators(data, mf.LIBRA_INDICATORS)
+        self.assertTrue(np.isnan(columns["EMA_50"]).all())
+        self.assertTrue(np.isnan(columns["MACD_12_26_9"]).all())
+        self.assertEqual(len(columns["HA_close"]), 10)
+        with self.assertRaises(ValueError):
+            compute_indicators(data, [{"kind": "supertrend"}])
+
+
+if __name__ == '__main__':
+    unittest.main()
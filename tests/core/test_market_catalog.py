@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.market_catalog의 TTL 캐시 및 디스크 스냅샷에 대한 단위 테스트
+"""
+import unittest
+import os
+import sys
+import shutil
+import asyncio
+import tempfile
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.market_catalog import MarketCatalog
+
+MARKETS = [
+    {"symbol": "BTC/USDT:USDT", "active": True, "precision": {"amount": 3}, "limits": {"amount": {"min": 0.001, "max": 100}}},
+    {"symbol": "LUNA/USDT:USDT", "active": False, "precision": {"amount": 0}, "limits": {"amount": {"min": 1, "max": None}}},
+]
+
+
+def _session():
+    session = MagicMock()
+    session.fetch_markets = AsyncMock(return_value=MARKETS)
+    return session
+
+
+class TestMarketCatalog(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = Path(tempfile.mkdtemp())
+        self.snapshot_path = self.tmp_dir / "markets.json"
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_loads_once_and_serves_lookups(self):
+        """TTL 내 반복 호출 시 마켓을 다시 받지 않고 O(1) 조회를 제공하는지 테스트"""
+        session = _session()
+        catalog = MarketCatalog(self.snapshot_path, ttl_sec=3600)
+
+        async def scenario():
+            for _ in range(5):
+                await catalog.ensure_loaded(session)
+
+        asyncio.run(scenario())
+        session.fetch_markets.assert_called_once()
+        session.set_markets.assert_called_once_with(MARKETS)
+        self.assertEqual(catalog.active_symbols(), ["BTC/USDT:USDT"])
+        self.assertEqual(catalog.precision("BTC/USDT:USDT")["amount"], 3)
+        self.assertFalse(catalog.is_active("LUNA/USDT:USDT"))
+
+    def test_cold_start_uses_disk_snapshot(self):
+        """새 프로세스가 디스크 스냅샷만으로 시작하고 거래소를 호출하지 않는지 테스트"""
+        asyncio.run(MarketCatalog(self.snapshot_path).ensure_loaded(_session()))
+        self.assertTrue(self.snapshot_path.exists())
+
+        session = _session()
+        catalog = MarketCatalog(self.snapshot_path, ttl_sec=3600)
+        asyncio.run(catalog.ensure_loaded(session))
+
+        session.fetch_markets.assert_not_called()
+        self.assertIn("BTC/USDT:USDT", catalog)
+        self.assertEqual(catalog.limits("BTC/USDT:USDT")["amount"]["min"], 0.001)
+
+if __name__ == '__main__':
+    unittest.main()
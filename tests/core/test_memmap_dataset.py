@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.memmap_dataset CSV → 메모리 맵 변환, 인덱스 파일, 제로 카피 슬라이스, CSV/메모리 맵 로드 일치 테스트
+"""
+import unittest
+import os
+import sys
+import json
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.memmap_dataset import (
+    INDEX_FILENAME, TIMESTAMP_COLUMN, MemmapDataset, convert_csv_to_memmap, is_memmap_dataset, load_ohlcv_frame,
+)
+
+
+def _ohlcv(rows, start="2024-01-01", seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(start, periods=rows, freq="1min", name=TIMESTAMP_COLUMN)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, rows))
+    return pd.DataFrame({'open': close, 'high': close + 1, 'low': close - 1,
+                         'close': close, 'volume': rng.random(rows) * 10}, index=index)
+
+
+class TestMemmapDataset(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_convert_multi_symbol_unsorted_chunks(self):
+        btc, eth = _ohlcv(300, seed=1), _ohlcv(200, seed=2)
+        long = pd.concat([btc.assign(symbol="BTC/USDT"), eth.assign(symbol="ETH/USDT")]).reset_index()
+        shuffled = long.sample(frac=1.0, random_state=0)                     # 심볼/시간 순서가 섞인 입력
+        csv_path = os.path.join(self.tmp, "panel.csv")
+        shuffled.to_csv(csv_path, index=False)
+        out_dir = os.path.join(self.tmp, "memmap")
+
+        index = convert_csv_to_memmap(csv_path, out_dir, chunksize=64)     # 여러 청크에 걸쳐 기록
+        self.assertTrue(is_memmap_dataset(out_dir))
+
+        with open(os.path.join(out_dir, INDEX_FILENAME), encoding="utf-8") as f:
+            meta = json.load(f)
+        self.assertEqual(meta["symbols"], index)
+        self.assertEqual(meta["columns"], [TIMESTAMP_COLUMN, "open", "high", "low", "close", "volume"])
+        self.assertEqual(meta["dtypes"][TIMESTAMP_COLUMN], "int64")
+        self.assertEqual(meta["dtypes"]["close"], "float32")
+        btc_meta = meta["symbols"]["BTC/USDT"]
+        self.assertEqual((btc_meta["dir"], btc_meta["rows"]), ("BTC_USDT", 300))
+        self.assertEqual(btc_meta["start_ms"], int(btc.index[0].value // 10**6))
+        self.assertEqual(btc_meta["end_ms"], int(btc.index[-1].value // 10**6))
+        self.assertEqual(btc_meta["integrity"]["step_ms"], 60_000)
+        self.assertEqual((btc_meta["integrity"]["gaps"], btc_meta["integrity"]["missing_bars"]), ([], 0))
+        self.assertEqual(meta["symbols"]["ETH/USDT"]["rows"], 200)
+
+        dataset = MemmapDataset(out_dir)
+        for name, expected in (("BTC/USDT", btc), ("ETH/USDT", eth)):
+            df = dataset.to_frame(name)
+            self.assertTrue(df.index.is_monotonic_increasing)
+            np.testing.assert_array_equal(df.index.tz_localize(None), expected.index)
+            np.testing.assert_allclose(df["close"], expected["close"], rtol=1e-6)
+
+    def test_resolve_symbol(self):
+        csv_path = os.path.join(self.tmp, "panel.csv")
+        _ohlcv(10).assign(symbol="BTC/USDT:USDT").to_csv(csv_path)
+        out_dir = os.path.join(self.tmp, "memmap")
+        convert_csv_to_memmap(csv_path, out_dir)
+        dataset = MemmapDataset(out_dir)
+        for alias in ("BTC/USDT:USDT", "BTC_USDT_USDT", "BTC/USDT", "BTCUSDT"):
+            self.assertEqual(dataset.resolve_symbol(alias), "BTC/USDT:USDT")
+        with self.assertRaises(KeyError):
+            dataset.resolve_symbol("ETH/USDT")
+
+    def test_load_slice_returns_memmap_views(self):
+        csv_path = os.path.join(self.tmp, "BTCUSDT.csv")
+        _ohlcv(100).to_csv(csv_path)
+        out_dir = os.path.join(self.tmp, "memmap")
+        convert_csv_to_memmap(csv_path, out_dir)
+        dataset = MemmapDataset(out_dir)
+
+        cols = dataset.load_slice("BTCUSDT", "2024-01-01 00:10", "2024-01-01 00:19")
+        self.assertEqual(len(cols[TIMESTAMP_COLUMN]), 10)                  # 양 끝 포함
+        full = dataset.load_slice("BTCUSDT")
+        for name, arr in cols.items():
+            self.assertIsInstance(arr.base, np.memmap)
+            self.assertTrue(np.shares_memory(arr, full[name]))
+            self.assertFalse(arr.flags.writeable)
+
+    def test_date_bounds_match_between_csv_and_memmap(self):
+        csv_path = os.path.join(self.tmp, "BTCUSDT.csv")
+        _ohlcv(3 * 1440).to_csv(csv_path)
+        out_dir = os.path.join(self.tmp, "memmap")
+        convert_csv_to_memmap(csv_path, out_dir)
+
+        cases = [
+            (("2024-01-01", "2024-01-02"), 2 * 1440),                        # 날짜만 있는 end는 그날 전체 포함
+            (("2024-01-02", None), 2 * 1440),
+            (("2024-01-01 12:00", "2024-01-02 00:00"), 12 * 60 + 1),         # 시각이 있는 end는 그 시각까지 포함
+            ((None, None), 3 * 1440),
+        ]
+        for (start, end), rows in cases:
+            with self.subTest(start=start, end=end):
+                from_csv = load_ohlcv_frame(csv_path, "BTCUSDT", start, end)
+                from_memmap = load_ohlcv_frame(out_dir, "BTCUSDT", start, end)
+                self.assertEqual(len(from_csv), rows)
+                self.assertEqual(str(from_csv.index.tz), "UTC")
+                pd.testing.assert_index_equal(from_csv.index, from_memmap.index)
+                pd.testing.assert_frame_equal(from_csv, from_memmap, check_dtype=False, rtol=1e-5)
+
+    def test_csv_offset_timestamps_are_converted_to_utc(self):
+        csv_path = os.path.join(self.tmp, "BTCUSDT.csv")
+        df = _ohlcv(60)
+        df.index = df.index.tz_localize("UTC").tz_convert("Asia/Seoul")
+        df.to_csv(csv_path)
+        loaded = load_ohlcv_frame(csv_path, "BTCUSDT")
+        pd.testing.assert_index_equal(loaded.index, df.index.tz_convert("UTC"))
+
+
+if __name__ == '__main__':
+    unittest.main()
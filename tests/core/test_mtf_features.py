@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.mtf_features의 리샘플 집계와 as-of 정렬(미래 참조 없음)에 대한 단위 테스트
+"""
+import unittest
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.mtf_features import build_mtf_features, resample_ohlcv
+
+
+def _ohlcv(rows, freq="5min", seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.2, rows))
+    index = pd.date_range("2024-01-01", periods=rows, freq=freq, tz="UTC", name="timestamp")
+    return pd.DataFrame({"open": close + rng.normal(0, 0.05, rows), "high": close + 0.3, "low": close - 0.3,
+                         "close": close, "volume": rng.uniform(1, 10, rows)}, index=index)
+
+
+def _last_close(df):
+    """피처 함수 대역: 종가와 3캔들 이동평균."""
+    return pd.DataFrame({"close": df["close"], "ma3": df["close"].rolling(3).mean()}).dropna()
+
+
+class TestMtfFeatures(unittest.TestCase):
+
+    def test_resample_matches_pandas_resample(self):
+        df = _ohlcv(500)
+        expected = df.resample("1h").agg({"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"})
+        actual = resample_ohlcv(df, "1h")
+        pd.testing.assert_frame_equal(actual, expected, check_freq=False)
+
+    def test_higher_timeframe_values_come_from_closed_bars_only(self):
+        df = _ohlcv(24 * 12 * 2)
+        out = build_mtf_features(df, ["1h"], base_timeframe="5m", compute=_last_close)
+
+        # 10:55 캔들이 마감되는 11:00에는 10:00 시간봉이 마감되어 있음
+        at_close = pd.Timestamp("2024-01-01 10:55", tz="UTC")
+        self.assertEqual(out.loc[at_close, "close_1h"], df.loc[at_close, "close"])
+        # 10:50 캔들 시점에는 09:00 시간봉까지만 사용 (종가 = 09:55 캔들 종가)
+        before_close = pd.Timestamp("2024-01-01 10:50", tz="UTC")
+        self.assertEqual(out.loc[before_close, "close_1h"], df.loc["2024-01-01 09:55", "close"])
+
+    def test_future_bars_do_not_change_past_rows(self):
+        df = _ohlcv(24 * 12 * 5, seed=3)
+        cut = pd.Timestamp("2024-01-04 13:25", tz="UTC")
+        full = build_mtf_features(df, ["1h"], base_timeframe="5m")
+        truncated = build_mtf_features(df.loc[:cut], ["1h"], base_timeframe="5m")
+        self.assertEqual(truncated.index[-1], cut)
+        pd.testing.assert_frame_equal(truncated, full.loc[truncated.index], check_exact=False, rtol=1e-9)
+
+
+if __name__ == '__main__':
+    unittest.main()
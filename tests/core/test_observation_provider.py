@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.rl.observation_provider 사전 계산 관측이 `build_obs`와 같은지 확인하는 테스트
+"""
+import unittest
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.rl.observation_builder import ObsConfig, build_obs
+from src.core.rl.observation_provider import ObservationProvider
+
+STATE = (1, 0.5, 1100.0, 3.0, 1000.0, 10.0)   # side, size, equity, leverage, initial_equity, max_leverage
+
+
+def _features(rows=400, seed=0):
+    rng = np.random.default_rng(seed)
+    price = 30_000 + np.cumsum(rng.normal(0, 20, rows))
+    flag = np.where(np.arange(rows) // 50 % 2 == 0, 1.0, 0.0)    # 윈도우 안에서 일정한 구간이 있는 열
+    columns = {'close': price, 'ema': price + rng.normal(0, 5, rows), 'rsi': rng.uniform(0, 100, rows),
+               'flag': flag, 'volume': rng.lognormal(3, 1, rows)}
+    return pd.DataFrame(columns).astype(np.float32)
+
+
+def _reference(df, i, window):
+    """float64로 계산한 윈도우 z-score (build_obs와 같은 정의)"""
+    x = df.to_numpy(np.float64)[i - window + 1:i + 1]
+    return ((x - x.mean(axis=0)) / (x.std(axis=0) + 1e-7)).ravel()
+
+
+class TestObservationProvider(unittest.TestCase):
+
+    def test_matches_build_obs(self):
+        df = _features()
+        cfg = ObsConfig(window=60)
+        features = df.to_numpy(np.float32)
+        for budget in (ObservationProvider(features, cfg).tensor_nbytes or 1 << 30, 0):   # 텐서 경로 / 스텝별 경로
+            provider = ObservationProvider(features, cfg, max_tensor_bytes=budget)
+            self.assertEqual(provider.tensor_nbytes > 0, budget > 0)
+            for i in range(len(df)):
+                obs = provider.obs(i, *STATE)
+                expected = build_obs(df, i, cfg, *STATE)
+                self.assertEqual(obs.shape, expected.shape)
+                self.assertEqual(obs.dtype, np.float32)
+                if i < cfg.window - 1:
+                    np.testing.assert_allclose(obs, expected, atol=1e-3)   # 덜 찬 윈도우는 스텝별 경로
+                    continue
+                # build_obs 자체가 float32 평균/표준편차라 3만 달러대 가격 열에서 ~1e-4 오차가 있으므로 float64 기준과 더 좁게 비교
+                np.testing.assert_allclose(obs[:-4], _reference(df, i, cfg.window), atol=2e-6)
+                np.testing.assert_allclose(obs, expected, atol=1e-3)
+
+    def test_fallback_paths(self):
+        df = _features(200)
+        df.iloc[30:35, 2] = np.nan
+        features = df.to_numpy(np.float32)
+        for cfg in (ObsConfig(window=20), ObsConfig(window=20, normalize_market_data=False, include_state=False)):
+            provider = ObservationProvider(features, cfg)
+            for i in (5, 33, 40, 199):
+                np.testing.assert_allclose(provider.obs(i, *STATE), build_obs(df, i, cfg, *STATE), atol=1e-3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.ohlcv_frame의 제로 카피 변환, 슬라이스 뷰, 직렬화에 대한 단위 테스트
+"""
+import unittest
+import os
+import sys
+import pickle
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.ohlcv_frame import OHLCVFrame
+
+TF_MS = 60_000
+
+
+def _bars(count):
+    return [[1_700_000_000_000 + i * TF_MS, 1.0 + i, 2.0 + i, 0.5 + i, 1.5 + i, 10.0] for i in range(count)]
+
+
+class TestOHLCVFrame(unittest.TestCase):
+
+    def setUp(self):
+        self.frame = OHLCVFrame.from_ccxt(_bars(10))
+
+    def test_columns_and_slices_are_views(self):
+        """컬럼 접근과 슬라이싱은 원본 블록을 공유해야 합니다."""
+        self.assertEqual(len(self.frame), 10)
+        self.assertTrue(self.frame.close.flags['C_CONTIGUOUS'])
+        tail = self.frame.tail(3)
+        self.assertTrue(np.shares_memory(tail.values, self.frame.values))
+        self.assertEqual(list(tail.close), [8.5, 9.5, 10.5])
+        self.assertEqual(tail.last_timestamp, self.frame.last_timestamp)
+
+    def test_to_pandas_zero_copy_and_round_trip(self):
+        """to_pandas()는 값을 복사하지 않고, from_pandas()로 되돌리면 같은 내용이어야 합니다."""
+        df = self.frame.to_pandas(tz='UTC')
+        self.assertTrue(np.shares_memory(df['close'].to_numpy(), self.frame.values))
+        self.assertEqual(str(df.index.tz), 'UTC')
+        self.assertEqual(df.index[0], pd.Timestamp(1_700_000_000_000, unit='ms', tz='UTC'))
+
+        back = OHLCVFrame.from_pandas(self.frame.to_pandas(timestamp_column=True))
+        np.testing.assert_array_equal(back.timestamp, self.frame.timestamp)
+        np.testing.assert_array_equal(back.values, self.frame.values)
+
+    def test_pickle_round_trip(self):
+        restored = pickle.loads(pickle.dumps(self.frame.astype(np.float32)))
+        self.assertEqual(restored.dtype, np.float32)
+        np.testing.assert_array_equal(restored.timestamp, self.frame.timestamp)
+
+
+if __name__ == '__main__':
+    unittest.main()
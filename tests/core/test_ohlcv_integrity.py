@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.ohlcv_integrity의 벡터화 갭 검사 및 저장소 매니페스트에 대한 단위 테스트
+"""
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.ohlcv_integrity import scan_timestamps, read_manifest, manifest_path_for, subtract_ranges
+from src.core.ohlcv_store import OHLCVStore
+
+MIN_MS = 60_000
+
+
+class TestOHLCVIntegrity(unittest.TestCase):
+
+    def test_scan_detects_gaps_duplicates_and_disorder(self):
+        """갭 구간, 중복, 역순 타임스탬프를 모두 찾아내는지 테스트"""
+        ts = np.array([0, 1, 2, 2, 6, 5, 7], dtype=np.int64) * MIN_MS
+        report = scan_timestamps(ts, MIN_MS)
+
+        self.assertEqual(report.gaps, [(3 * MIN_MS, 5 * MIN_MS)])
+        self.assertEqual(report.missing_bars, 2)
+        self.assertEqual(report.duplicates, 1)
+        self.assertEqual(report.out_of_order, 1)
+        self.assertEqual(report.covered_ranges(), [(0, 3 * MIN_MS), (5 * MIN_MS, 8 * MIN_MS)])
+
+    def test_subtract_ranges(self):
+        self.assertEqual(subtract_ranges([(0, 10)], [(2, 4), (8, 12)]), [(0, 2), (4, 8)])
+
+
+class TestStoreManifest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.store = OHLCVStore(self.root)
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_manifest_written_and_gaps_span_partitions(self):
+        """파티션 쓰기 시 매니페스트가 생성되고, 월 경계를 포함한 갭이 매니페스트만으로 집계되는지 테스트"""
+        index = pd.date_range("2024-01-31 23:50", periods=20, freq="min", tz="UTC")
+        df = pd.DataFrame(np.ones((20, 5)), index=index, columns=["open", "high", "low", "close", "volume"])
+        df = df.drop(index[[9, 10]])   # 23:59, 00:00 누락 → 월 경계 갭
+        self.store.append("BTC/USDT:USDT", "1m", df)
+
+        path = self.store.partition_path("BTC/USDT:USDT", "1m", "2024-02")
+        manifest = read_manifest(manifest_path_for(path))
+        self.assertIsNotNone(manifest)
+        self.assertTrue(manifest.matches(path))
+        self.assertEqual(manifest.rows, 9)
+
+        report = self.store.integrity("BTC/USDT:USDT", "1m")
+        gap_start = int(pd.Timestamp("2024-01-31 23:59", tz="UTC").value // 10**6)
+        self.assertEqual(report.gaps, [(gap_start, gap_start + 2 * MIN_MS)])
+        self.assertEqual(report.rows, 18)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.ohlcv_store의 파티션 저장소에 대한 단위 테스트
+"""
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.ohlcv_store import OHLCVStore
+
+class TestOHLCVStore(unittest.TestCase):
+
+    def setUp(self):
+        """임시 저장소 디렉토리와 월 경계를 넘는 1분봉 데이터 생성"""
+        self.root = Path(tempfile.mkdtemp())
+        self.store = OHLCVStore(self.root)
+        self.symbol = "BTC/USDT:USDT"
+        index = pd.date_range("2024-01-31 22:00", periods=240, freq="min", tz="UTC")
+        values = np.arange(240 * 5, dtype=float).reshape(240, 5)
+        self.df = pd.DataFrame(values, index=index, columns=["open", "high", "low", "close", "volume"])
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_append_touches_only_new_month(self):
+        """증분 추가 시 새 캔들이 속한 월 파티션만 다시 쓰는지 테스트"""
+        self.store.append(self.symbol, "1m", self.df)
+        self.assertEqual(self.store.list_months(self.symbol, "1m"), ["2024-01", "2024-02"])
+
+        jan_path = self.store.partition_path(self.symbol, "1m", "2024-01")
+        jan_mtime = os.stat(jan_path).st_mtime_ns
+
+        # 마지막 캔들과 중복되는 1개 + 새 캔들 1개 추가
+        extra = self.df.iloc[[-1]].copy()
+        extra.index = extra.index + pd.Timedelta(minutes=1)
+        self.store.append(self.symbol, "1m", pd.concat([self.df.iloc[[-1]], extra]))
+
+        self.assertEqual(os.stat(jan_path).st_mtime_ns, jan_mtime)
+        self.assertEqual(len(self.store.read(self.symbol, "1m")), 241)
+        self.assertEqual(self.store.last_timestamp(self.symbol, "1m"), extra.index[-1])
+
+    def test_range_read(self):
+        """범위 조회가 요청 구간의 캔들만 반환하는지 테스트"""
+        self.store.append(self.symbol, "1m", self.df)
+        out = self.store.read(self.symbol, "1m", "2024-01-31 23:50", "2024-02-01 00:09")
+
+        self.assertEqual(len(out), 20)
+        self.assertEqual(out.index[0], pd.Timestamp("2024-01-31 23:50", tz="UTC"))
+        np.testing.assert_allclose(out.to_numpy(), self.df.loc[out.index].to_numpy())
+
+if __name__ == '__main__':
+    unittest.main()
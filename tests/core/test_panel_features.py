@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.panel_features의 패널 EMA 및 (심볼 × 피처) 계산이 단일 시리즈 계산과 같은지 확인하는 단위 테스트
+"""
+import unittest
+import os
+import sys
+
+import numpy as np
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.ohlcv_frame import OHLCVFrame
+from src.core.panel_features import FEATURE_NAMES, ema_panel, extract_panel_features
+from src.core.market_features_optimized import _calculate_features
+
+
+def _reference_ema(x, period):
+    alpha = 2.0 / (period + 1.0)
+    out = np.empty_like(x)
+    out[0] = x[0]
+    for i in range(1, len(x)):
+        out[i] = alpha * x[i] + (1 - alpha) * out[i - 1]
+    return out
+
+
+def _random_frame(rng, length):
+    close = 100 + np.cumsum(rng.normal(0, 1, length))
+    high = close + np.abs(rng.normal(0, 0.5, length))
+    low = close - np.abs(rng.normal(0, 0.5, length))
+    volume = np.abs(rng.normal(10, 2, length))
+    return OHLCVFrame.from_columns(np.arange(length) * 60_000, close, high, low, close, volume)
+
+
+class TestPanelFeatures(unittest.TestCase):
+
+    def test_ema_panel_matches_recursive_ema_across_blocks(self):
+        x = 100 + np.cumsum(np.random.default_rng(0).normal(0, 1, 600))
+        np.testing.assert_allclose(ema_panel(x, 20), _reference_ema(x, 20), rtol=1e-12)
+
+    def test_panel_rows_match_single_series_features(self):
+        """길이가 다른 심볼이 섞여도 각 행은 단일 시리즈 계산 결과와 같아야 합니다."""
+        rng = np.random.default_rng(1)
+        frames = {f"S{i}/USDT:USDT": _random_frame(rng, 100) for i in range(5)}
+        frames["NEW/USDT:USDT"] = _random_frame(rng, 60)
+        frames["TINY/USDT:USDT"] = _random_frame(rng, 30)
+
+        panel = extract_panel_features(frames, min_bars=50)
+
+        self.assertEqual(list(panel.columns), list(FEATURE_NAMES))
+        self.assertNotIn("TINY/USDT:USDT", panel.index)
+        for symbol in frames:
+            if symbol == "TINY/USDT:USDT":
+                continue
+            expected = _calculate_features(frames[symbol])
+            np.testing.assert_allclose(panel.loc[symbol, list(expected)].to_numpy(dtype=float),
+                                       list(expected.values()), rtol=1e-9)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.rate_limiter 토큰 버킷 속도 제한 테스트 (가짜 시계로 대기 시간 확인)
+"""
+import unittest
+import os
+import sys
+import asyncio
+from types import SimpleNamespace
+from unittest import mock
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core import rate_limiter
+from src.core.rate_limiter import AsyncRateLimiter
+
+_real_sleep = asyncio.sleep
+
+
+class _FakeClock:
+    """`time.monotonic`/`asyncio.sleep` 대체. sleep은 실제로 기다리지 않고 시각만 진행합니다."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, sec: float) -> None:
+        self.now += sec
+        await _real_sleep(0)
+
+
+def _run_acquires(rate, capacity, n, cost=1.0):
+    clock = _FakeClock()
+    with mock.patch.object(rate_limiter, "time", SimpleNamespace(monotonic=clock.monotonic)), \
+            mock.patch.object(rate_limiter.asyncio, "sleep", clock.sleep):
+        limiter = AsyncRateLimiter(rate, capacity)
+
+        async def run():
+            return await asyncio.gather(*(limiter.acquire(cost) for _ in range(n)))
+
+        waits = asyncio.run(run())
+    return limiter, waits, clock.now
+
+
+class TestAsyncRateLimiter(unittest.TestCase):
+
+    def test_burst_then_paced(self):
+        limiter, waits, elapsed = _run_acquires(rate=10, capacity=5, n=25)
+        self.assertEqual(waits[:5], [0.0] * 5)                              # 버스트 허용량까지는 대기 없음
+        self.assertAlmostEqual(elapsed, (25 - 5) / 10)
+        self.assertAlmostEqual(limiter.total_wait_sec, (25 - 5) / 10)
+        self.assertEqual(limiter.total_requests, 25)
+
+    def test_cost_above_capacity(self):
+        # 요청 1개가 버킷보다 커도 지속 속도는 rate를 유지해야 함: (n * cost - capacity) / rate
+        _, waits, elapsed = _run_acquires(rate=10, capacity=2, n=4, cost=3)
+        self.assertAlmostEqual(elapsed, (4 * 3 - 2) / 10)
+        self.assertAlmostEqual(waits[0], (3 - 2) / 10)
+        for wait in waits[1:]:
+            self.assertAlmostEqual(wait, 3 / 10)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            AsyncRateLimiter(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+src.engine.main_realtime 캔들 조회 경로 테스트 (동시 조회 제한, 실패 대체, 증분 캐시, 파생 타임프레임 캔들 수 점검)
+"""
+import unittest
+from unittest import mock
+import os
+import sys
+import time
+import asyncio
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.candle_cache import CandleCache
+from src.core.kline_stream import KlineStream
+from src.core.rate_limiter import AsyncRateLimiter
+from src.engine import main_realtime
+from src.engine.main_realtime import fetch_candle_frames, read_stream_candle_frames, split_derivable_timeframes
+
+_MINUTE_MS = 60_000
+
+
+def _bars(n, end_ms, close=100.0):
+    return [[end_ms - (n - 1 - i) * _MINUTE_MS, close, close + 1, close - 1, close + i, 1.0] for i in range(n)]
+
+
+class _FakeSession:
+    """`fetch_ohlcv` 호출을 기록하고 동시 실행 수를 재는 가짜 ccxt 세션."""
+
+    def __init__(self, fail=(), delay=0.01):
+        self.fail = set(fail)
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.end_ms = (int(time.time() * 1000) // _MINUTE_MS) * _MINUTE_MS
+
+    async def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+        self.calls.append((symbol, timeframe, since, limit))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if (symbol, timeframe) in self.fail:
+                raise RuntimeError("boom")
+            if since is not None:
+                return [bar for bar in _bars(limit, self.end_ms, close=200.0) if bar[0] >= since]
+            return _bars(limit, self.end_ms)
+        finally:
+            self.in_flight -= 1
+
+
+def _fetch(session, symbols, timeframes, limit, **kwargs):
+    limiter = AsyncRateLimiter(1000, capacity=1000)
+    return asyncio.run(fetch_candle_frames(session, symbols, timeframes, limit, rate_limiter=limiter, **kwargs))
+
+
+class TestFetchCandleFrames(unittest.TestCase):
+
+    def test_max_parallel_in_flight(self):
+        session = _FakeSession()
+        symbols = [f"S{i}" for i in range(6)]
+        frames = _fetch(session, symbols, ["1m", "5m"], 10, max_parallel=3)
+        self.assertEqual(len(session.calls), 12)
+        self.assertEqual(session.max_in_flight, 3)
+        self.assertEqual(sorted(frames), symbols)
+        self.assertTrue(all(len(frames[s][tf]) == 10 for s in symbols for tf in ("1m", "5m")))
+
+    def test_failed_request_is_omitted_without_cache(self):
+        session = _FakeSession(fail={("ETH", "1m")})
+        frames = _fetch(session, ["BTC", "ETH"], ["1m", "5m"], 10)
+        self.assertEqual(set(frames["BTC"]), {"1m", "5m"})
+        self.assertEqual(set(frames["ETH"]), {"5m"})
+
+    def test_failed_request_falls_back_to_cache(self):
+        cache = CandleCache(capacity=50)
+        session = _FakeSession()
+        first = _fetch(session, ["BTC", "ETH"], ["1m"], 10, cache=cache)
+
+        failing = _FakeSession(fail={("ETH", "1m")})
+        frames = _fetch(failing, ["BTC", "ETH"], ["1m"], 10, cache=cache)
+        self.assertIn("BTC", frames)
+        self.assertEqual(frames["ETH"]["1m"].last_timestamp, first["ETH"]["1m"].last_timestamp)
+        self.assertEqual(len(frames["ETH"]["1m"]), 10)
+
+    def test_cache_plan_requests_since_last_candle(self):
+        cache = CandleCache(capacity=50)
+        session = _FakeSession()
+        _fetch(session, ["BTC"], ["1m"], 10, cache=cache)
+        self.assertEqual(session.calls, [("BTC", "1m", None, 10)])           # 첫 조회는 전체
+
+        frames = _fetch(session, ["BTC"], ["1m"], 10, cache=cache)
+        _, _, since, limit = session.calls[-1]
+        self.assertEqual(since, session.end_ms)                               # 마지막(진행 중일 수 있는) 캔들부터
+        self.assertLess(limit, 10)
+        frame = frames["BTC"]["1m"]
+        self.assertEqual(len(frame), 10)
+        self.assertEqual(frame.last_timestamp, session.end_ms)
+        self.assertEqual(frame.close[-1], 200.0 + limit - 1)                  # 마지막 캔들은 새 응답으로 갱신
+        self.assertEqual((cache.full_fetches, cache.incremental_fetches), (1, 1))
+
+    def test_cache_retains_only_requested_symbols(self):
+        cache = CandleCache(capacity=50)
+        _fetch(_FakeSession(), ["BTC", "ETH"], ["1m"], 10, cache=cache)
+        _fetch(_FakeSession(), ["BTC"], ["1m"], 10, cache=cache)
+        self.assertEqual(len(cache), 1)
+
+
+class TestReadStreamCandleFrames(unittest.TestCase):
+
+    def test_stale_buffers_are_reseeded(self):
+        stream = KlineStream(["1m"], capacity=50)
+        session = _FakeSession()
+        limiter = AsyncRateLimiter(1000, capacity=1000)
+
+        async def read():
+            return await read_stream_candle_frames(stream, session, ["BTC", "ETH"], ["1m"], 10)
+
+        with mock.patch.object(main_realtime, "get_fetch_rate_limiter", return_value=limiter):
+            asyncio.run(read())
+            self.assertEqual(len(session.calls), 2)                              # 최초 시드
+            asyncio.run(read())
+            self.assertEqual(len(session.calls), 2)                              # 이어지는 버퍼는 REST 없음
+            stream.mark_stale("ETH", "1m")                                       # 재연결/공백 이후
+            frames = asyncio.run(read())
+        self.assertEqual([call[0] for call in session.calls[2:]], ["ETH"])
+        self.assertEqual(set(frames), {"BTC", "ETH"})
+        self.assertEqual(len(frames["ETH"]["1m"]), 10)
+
+    def test_failed_reseed_is_excluded(self):
+        stream = KlineStream(["1m"], capacity=50)
+        limiter = AsyncRateLimiter(1000, capacity=1000)
+        with mock.patch.object(main_realtime, "get_fetch_rate_limiter", return_value=limiter):
+            asyncio.run(read_stream_candle_frames(stream, _FakeSession(), ["BTC"], ["1m"], 10))
+            stream.mark_stale()
+            frames = asyncio.run(read_stream_candle_frames(stream, _FakeSession(fail={("BTC", "1m")}), ["BTC"], ["1m"], 10))
+        self.assertEqual(frames, {})
+
+
+class TestDerivedTimeframeCapacity(unittest.TestCase):
+
+    def test_split_by_available_base_bars(self):
+        # 5m 500개 → 1h 41개 (< 50), 1d 1개
+        self.assertEqual(split_derivable_timeframes("5m", ["1h", "1d"], 500, 50), ([], ["1h", "1d"]))
+        # 5m 1000개 → 1h 83개
+        self.assertEqual(split_derivable_timeframes("5m", ["1h", "1d"], 1000, 50), (["1h"], ["1d"]))
+        self.assertEqual(split_derivable_timeframes("1m", ["5m"], 250, 50), (["5m"], []))
+
+    def test_available_bars_capped_by_buffer(self):
+        with mock.patch.object(main_realtime, "KLINE_BUFFER_BARS", 500):
+            self.assertEqual(main_realtime.base_bars_available(), 500)
+        with mock.patch.object(main_realtime, "KLINE_BUFFER_BARS", 5000):
+            self.assertEqual(main_realtime.base_bars_available(), main_realtime.MAX_BASE_FETCH_BARS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.rolling 커널이 pandas `.rolling()`과 같은 결과를 내는지 확인하는 테스트
+"""
+import unittest
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core import rolling
+
+
+def _series(rows, seed=0, nan_every=0):
+    x = 30_000 + np.cumsum(np.random.default_rng(seed).normal(0, 5, rows))
+    if nan_every:
+        x[::nan_every] = np.nan
+        x[100:130] = np.nan   # 윈도우보다 긴 결측 구간
+    return x
+
+
+def _pandas(x, kind, window, min_periods, **kwargs):
+    return getattr(pd.Series(x).rolling(window, min_periods=min_periods), kind)(**kwargs).to_numpy()
+
+
+class TestRollingKernels(unittest.TestCase):
+
+    def test_matches_pandas_with_nans(self):
+        # 블록 경계(2048)를 넘는 길이에서 NaN 건너뛰기와 min_periods 규칙 확인
+        x = _series(5000, nan_every=17)
+        x[2040:2070] = np.nan                                   # 전부 NaN인 윈도우 (min_periods=0이면 합은 0)
+        for window, min_periods in ((1, None), (3, None), (14, 1), (20, 5), (20, None), (5, 0), (20, 0)):
+            for kind in ("sum", "mean", "min", "max"):
+                with self.subTest(kind=kind, window=window, min_periods=min_periods):
+                    ours = getattr(rolling, f"rolling_{kind}")(x, window, min_periods=min_periods)
+                    np.testing.assert_allclose(ours, _pandas(x, kind, window, min_periods), rtol=1e-12)
+
+    def test_variance_is_accurate(self):
+        # pandas는 누적 온라인 알고리즘이라 큰 가격대에서 ~1e-8 오차가 있으므로 정밀 계산과 비교
+        x = _series(5000, nan_every=17)
+        window = 20
+        expected = np.full(len(x), np.nan)
+        for i in range(len(x)):
+            w = x[max(0, i - window + 1):i + 1]
+            w = w[~np.isnan(w)].astype(np.longdouble)
+            if len(w) >= 5:
+                expected[i] = float(((w - w.mean()) ** 2).sum() / (len(w) - 1))
+        ours = rolling.rolling_var(x, window, min_periods=5)
+        np.testing.assert_allclose(ours, expected, rtol=1e-9)
+        np.testing.assert_allclose(rolling.rolling_std(x, window, min_periods=5),
+                                   _pandas(x, "std", window, 5), rtol=1e-6)
+        np.testing.assert_allclose(rolling.rolling_std(x, window, ddof=0),
+                                   _pandas(x, "std", window, None, ddof=0), rtol=1e-6)
+
+    def test_panel_rows_are_independent(self):
+        panel = np.stack([_series(300, seed=s) for s in range(4)])
+        panel[1, 50:60] = np.nan
+        for kind in ("mean", "std", "min", "max"):
+            ours = getattr(rolling, f"rolling_{kind}")(panel, 14, min_periods=1)
+            expected = np.stack([_pandas(row, kind, 14, 1) for row in panel])
+            np.testing.assert_allclose(ours, expected, rtol=1e-6, err_msg=kind)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            rolling.rolling_mean(np.ones(5), 0)
+        with self.assertRaises(ValueError):
+            rolling.rolling_mean(np.ones(5), 3, min_periods=4)
+        with self.assertRaises(ValueError):
+            rolling.rolling_max(np.ones((2, 2, 2)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.shared_env_data 공유 메모리 환경 데이터로 만든 환경이 직접 로드한 환경과 같은지 확인하는 테스트
+"""
+import unittest
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from stable_baselines3.common.vec_env import SubprocVecEnv
+
+from src.core.shared_env_data import SharedEnvData, attach_env_data, shared_env_fns, worker_cpu_sets
+from src.core.trading_env import TradingEnv
+from tests.core.test_trading_env import _write_csv
+
+
+class TestSharedEnvData(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        path = os.path.join(cls._tmp.name, "ohlcv.csv")
+        _write_csv(path)
+        cls.config = {'use_online': False, 'data_path': path, 'random_start': False,
+                      'max_steps': 200, 'use_feature_store': False}
+        cls.template = TradingEnv(cls.config)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def _rollout(self, step, reset, actions):
+        obs = [reset()]
+        rewards = []
+        for action in actions:
+            o, r = step(action)
+            obs.append(o)
+            rewards.append(r)
+        return np.stack(obs), np.asarray(rewards)
+
+    def test_attached_env_matches_template(self):
+        actions = np.random.default_rng(0).integers(0, 9, 150)
+        with SharedEnvData(self.template) as shared:
+            shm, prepared = attach_env_data(shared.descriptor)
+            env = TradingEnv(self.config, prepared=prepared)
+            self.assertFalse(env.features.flags.writeable)
+            self.assertGreater(env.obs_provider.tensor_nbytes, 0)     # 텐서도 재계산 없이 공유
+            got = self._rollout(lambda a: env.step(int(a))[:2], lambda: env.reset()[0], actions)
+            expected = self._rollout(lambda a: self.template.step(int(a))[:2], lambda: self.template.reset()[0], actions)
+            np.testing.assert_array_equal(got[0], expected[0])
+            np.testing.assert_array_equal(got[1], expected[1])
+            del env, prepared
+            shm.close()
+
+    def test_subproc_workers(self):
+        with SharedEnvData(self.template) as shared:
+            vec = SubprocVecEnv(shared_env_fns(shared.descriptor, 2, self.config, torch_threads=1))
+            try:
+                obs = vec.reset()
+                self.template.reset()
+                np.testing.assert_array_equal(obs[0], self.template._get_obs())
+                obs, rewards, dones, infos = vec.step(np.array([1, 3]))
+                self.assertEqual(obs.shape, (2,) + self.template.observation_space.shape)
+                self.assertEqual(vec.get_attr("side"), [1, -1])
+            finally:
+                vec.close()
+
+    def test_worker_cpu_sets(self):
+        self.assertEqual(worker_cpu_sets(3, [4, 5]), [[4], [5], [4]])
+        self.assertEqual(worker_cpu_sets(2, []), [None, None])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.shared_frames 공유 메모리 캔들 전달과 이를 사용하는 워커 작업에 대한 단위 테스트
+"""
+import unittest
+import os
+import sys
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.ohlcv_frame import OHLCVFrame
+from src.core.shared_frames import SharedFrames, attach_frames
+from src.core.panel_features import extract_panel_features, panel_features_task
+from src.core.market_features_optimized import _calculate_features, clear_cache, get_cache_info, symbol_features_task
+
+
+def _frames(rng, symbols, timeframes, length=80):
+    out = {}
+    for sym in symbols:
+        for tf in timeframes:
+            close = 100 + np.cumsum(rng.normal(0, 1, length))
+            out[(sym, tf)] = OHLCVFrame.from_columns(np.arange(length) * 60_000, close, close + 1, close - 1,
+                                                     close, np.abs(rng.normal(10, 2, length)))
+    return out
+
+
+class TestSharedFrames(unittest.TestCase):
+
+    def test_attached_frames_match_source_and_block_is_released(self):
+        frames = _frames(np.random.default_rng(0), ["BTC", "ETH"], ["5m", "1h"])
+        frames[("NEW", "5m")] = OHLCVFrame.empty()
+        with SharedFrames(frames) as shared:
+            name = shared.descriptor.name
+            with attach_frames(shared.descriptor) as attached:
+                self.assertEqual(set(attached), set(frames))
+                for key, frame in frames.items():
+                    np.testing.assert_array_equal(attached[key].timestamp, frame.timestamp)
+                    np.testing.assert_array_equal(attached[key].values, frame.values)
+                attached = None
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+    def test_worker_tasks_in_spawned_process(self):
+        frames = _frames(np.random.default_rng(1), [f"S{i}" for i in range(4)], ["5m", "1h"])
+        with SharedFrames(frames) as shared, \
+                ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            symbols, matrix = executor.submit(panel_features_task, shared.descriptor, "1h", 50).result()
+            timeframes, rows = executor.submit(symbol_features_task, shared.descriptor, "S2", ["5m", "1h"], 50).result()
+
+        expected = extract_panel_features({sym: frames[(sym, "1h")] for sym in symbols}, 50)
+        np.testing.assert_allclose(matrix, expected.to_numpy(), rtol=1e-12)
+        self.assertEqual(timeframes, ["5m", "1h"])
+        np.testing.assert_allclose(rows[1], list(_calculate_features(frames[("S2", "1h")]).values()), rtol=1e-12)
+
+    def test_symbol_task_reuses_process_feature_cache(self):
+        frames = _frames(np.random.default_rng(2), ["S0"], ["5m", "1h"])
+        clear_cache()
+        with SharedFrames(frames) as shared:
+            _, first = symbol_features_task(shared.descriptor, "S0", ["5m", "1h"], 50)
+            hits = get_cache_info()["cache_hits"]
+            _, second = symbol_features_task(shared.descriptor, "S0", ["5m", "1h"], 50)
+        self.assertEqual(get_cache_info()["cache_hits"], hits + 2)          # 같은 프로세스의 두 번째 호출은 캐시 적중
+        np.testing.assert_array_equal(second, first)
+        clear_cache()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.streaming_features의 배치 동등성 및 상태 저장/복원에 대한 단위 테스트
+"""
+import unittest
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.ohlcv_frame import OHLCVFrame
+from src.core.streaming_features import StreamingFeatureEngine
+from src.core.market_features_optimized import extract_market_features
+
+TF_MS = 300_000
+
+
+def _frame(count, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 60_000 + np.cumsum(rng.normal(0, 50, count))
+    high = close + np.abs(rng.normal(0, 20, count))
+    low = close - np.abs(rng.normal(0, 20, count))
+    volume = np.abs(rng.normal(100, 30, count))
+    ts = np.arange(count, dtype=np.int64) * TF_MS
+    return OHLCVFrame.from_columns(ts, close, high, low, close, volume)
+
+
+class TestStreamingFeatureEngine(unittest.TestCase):
+
+    def setUp(self):
+        self.frame = _frame(200)
+
+    def test_matches_batch_every_cycle(self):
+        """실시간 루프처럼 100개 윈도우를 밀며 갱신해도 매 사이클 같은 윈도우의 배치 마지막 행과 같아야 합니다."""
+        frame = _frame(1000, seed=3)
+        engine = StreamingFeatureEngine()
+        for end in range(100, len(frame) + 1):
+            window = frame[end - 100:end]
+            streamed = engine.features_frame("BTC/USDT:USDT", "5m", window)
+            batch = extract_market_features(window)
+            with self.subTest(end=end):
+                self.assertEqual(list(streamed.columns), list(batch.columns))
+                self.assertEqual(streamed.index[0], batch.index[0])
+                self.assertEqual(streamed['trend_signal'].iloc[0], batch['trend_signal'].iloc[0])
+                np.testing.assert_allclose(streamed.to_numpy(), batch.to_numpy(), rtol=1e-9, atol=1e-9)
+        self.assertEqual(engine.reseeds, 1)
+        self.assertEqual(engine.incremental_updates, len(frame) - 1)
+
+    def test_in_progress_candle_and_window_length(self):
+        """진행 중 캔들 값이 바뀌거나 윈도우 길이가 달라도 배치 결과와 같아야 합니다."""
+        engine = StreamingFeatureEngine()
+        engine.sync("BTC/USDT:USDT", "5m", self.frame[50:150])
+        live = self.frame[60:151].copy()
+        live.values[:, -1] *= 1.001                                # 마지막 캔들만 갱신된 상태
+        for window in (live, self.frame[90:151], self.frame[61:151]):
+            streamed = engine.features_frame("BTC/USDT:USDT", "5m", window)
+            np.testing.assert_allclose(streamed.to_numpy(), extract_market_features(window).to_numpy(),
+                                       rtol=1e-9, atol=1e-9)
+        self.assertEqual(engine.reseeds, 1)
+
+    def test_non_overlapping_frame_reseeds_and_short_history_is_empty(self):
+        engine = StreamingFeatureEngine()
+        self.assertEqual(engine.sync("BTC/USDT:USDT", "5m", self.frame[:30]), {})
+        engine.sync("BTC/USDT:USDT", "5m", self.frame[100:200])
+        self.assertEqual(engine.reseeds, 2)
+        # 마지막 상태 캔들(198번) 바로 다음부터 시작하는 프레임도 겹치지 않으므로 다시 만듦
+        engine.sync("BTC/USDT:USDT", "5m", _frame(300)[199:300])
+        self.assertEqual(engine.reseeds, 3)
+
+    def test_retain_drops_other_symbols(self):
+        engine = StreamingFeatureEngine()
+        for sym in ("BTC/USDT:USDT", "ETH/USDT:USDT"):
+            engine.sync(sym, "5m", self.frame[:100])
+        self.assertEqual(engine.retain(["ETH/USDT:USDT"]), 1)
+        self.assertIsNone(engine.state("BTC/USDT:USDT", "5m"))
+        self.assertEqual(len(engine), 1)
+
+    def test_save_and_load_resumes_without_warmup(self):
+        engine = StreamingFeatureEngine()
+        engine.sync("BTC/USDT:USDT", "5m", self.frame[:150])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "state.json")
+            engine.save(path)
+            restored = StreamingFeatureEngine()
+            self.assertEqual(restored.load(path), 1)
+
+        expected = engine.sync("BTC/USDT:USDT", "5m", self.frame[100:160])
+        self.assertEqual(restored.sync("BTC/USDT:USDT", "5m", self.frame[100:160]), expected)
+        self.assertEqual(restored.reseeds, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
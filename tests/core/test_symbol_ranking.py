@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.symbol_ranking 부분 정렬 랭킹과 이를 사용하는 심볼 선정 경로 테스트
+"""
+import unittest
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.symbol_ranking import rank_symbols, top_n_indices, weighted_scores
+from src.core.enhanced_trading_logic import SmartSymbolSelector
+from src.core.market_features import get_top_ranked_symbols
+
+
+def _market_data(n, seed=0):
+    rng = np.random.default_rng(seed)
+    data = {}
+    for i in range(n):
+        last = float(rng.uniform(1, 100))
+        spread = float(rng.uniform(0, 0.02)) * last
+        data[f"C{i}USDT"] = {
+            'volume_usd': float(rng.lognormal(15, 2)),
+            'price_change_pct': float(rng.normal(0, 6)),
+            'last_price': last,
+            'ticker': {'bid': last - spread / 2, 'ask': last + spread / 2} if i % 7 else {},
+        }
+    data['BTCUSDT'] = {'volume_usd': 5e9, 'price_change_pct': 1.5, 'last_price': 60000.0,
+                       'ticker': {'bid': 59999.0, 'ask': 60001.0}}
+    return data
+
+
+def _reference_total_score(selector, symbol, data, volume_median, volatility_median):
+    """기존 심볼별 루프 구현의 종합 점수"""
+    volume_score = min(100, (data['volume_usd'] / (volume_median + 1e-12)) * 50)
+    volatility_score = min(100, (abs(data['price_change_pct']) / (volatility_median + 1e-12)) * 50)
+    bid, ask = data['ticker'].get('bid', 0), data['ticker'].get('ask', 0)
+    liquidity = min(100, max(0, 100 - (ask - bid) / ((ask + bid) / 2) * 100 * 50)) if bid > 0 and ask > 0 else 50
+    momentum = max(-100, min(100, data['price_change_pct'] * 10))
+    change = abs(data['price_change_pct'])
+    risk = 40 if change > 10 else 20 if change > 5 else 10 if change > 2 else 0
+    perf = selector.symbol_performance.get(symbol)
+    if perf and perf["wins"] + perf["losses"] > 0:
+        win_rate = perf["wins"] / (perf["wins"] + perf["losses"])
+        risk += 30 if win_rate < 0.3 else 15 if win_rate < 0.5 else 0
+    risk = min(100, risk + (0 if symbol in ('BTCUSDT', 'ETHUSDT') else 10))
+    rank = selector._get_market_cap_rank(symbol)
+    return volume_score + volatility_score + liquidity + abs(momentum) - risk + (100 - rank) * 0.1
+
+
+class TestSymbolRanking(unittest.TestCase):
+
+    def test_top_n_matches_stable_full_sort(self):
+        rng = np.random.default_rng(1)
+        scores = rng.integers(0, 20, 500).astype(float)   # 동점이 많은 점수
+        scores[::13] = -np.inf
+        mask = rng.random(500) > 0.3
+        for n in (0, 1, 5, 50, 1000):
+            candidates = [i for i in range(500) if mask[i] and np.isfinite(scores[i])]
+            expected = sorted(candidates, key=lambda i: scores[i], reverse=True)[:n]
+            self.assertEqual(top_n_indices(scores, n, mask).tolist(), expected)
+
+    def test_weighted_scores(self):
+        matrix = np.array([[1.0, 2.0, np.nan], [3.0, np.nan, 1.0], [0.0, 1.0, 1.0]])
+        scores = weighted_scores(matrix, {"a": 1.0, "b": 2.0}, ("a", "b", "c"))
+        np.testing.assert_array_equal(scores, [5.0, -np.inf, 2.0])   # 가중치 0인 열의 NaN은 무시
+        self.assertEqual(rank_symbols(["x", "y", "z"], matrix[:, :2], [1.0, 2.0], 2), [("x", 5.0), ("z", 2.0)])
+        with self.assertRaises(ValueError):
+            weighted_scores(matrix, {"d": 1.0}, ("a", "b", "c"))
+
+    def test_selector_matches_per_symbol_scores(self):
+        selector = SmartSymbolSelector()
+        data = _market_data(200)
+        selector.symbol_performance['C3USDT'] = {"wins": 1, "losses": 4, "avg_pnl": -1.0}
+        data['BROKEN'] = {'volume_usd': None, 'price_change_pct': 1.0}
+
+        metrics = selector.analyze_symbols(data)
+        valid = {k: v for k, v in data.items() if k != 'BROKEN'}
+        volume_median = np.median([d['volume_usd'] for d in valid.values()])
+        # 숫자가 아닌 값만 통계에서 빠짐 (BROKEN의 가격 변동률은 변동성 중앙값에 포함)
+        volatility_median = np.median([abs(d['price_change_pct']) for d in data.values()])
+        expected = {s: _reference_total_score(selector, s, d, volume_median, volatility_median) for s, d in valid.items()}
+        self.assertEqual([m.symbol for m in metrics], sorted(expected, key=expected.get, reverse=True))
+        for m in metrics:
+            self.assertAlmostEqual(m.total_score, expected[m.symbol], places=9)
+
+        top = selector.select_top_symbols(data, top_n=5, market_condition="volatile")
+        by_symbol = {m.symbol: m for m in metrics}
+        eligible = [m.symbol for m in metrics if m.risk_score < 60 and m.liquidity_score > 40]
+        self.assertEqual(top, eligible[:5])
+        self.assertTrue(all(abs(by_symbol[s].momentum_score) > 30
+                            for s in selector.select_top_symbols(data, top_n=5, market_condition="trending")))
+
+    def test_volatility_ranking_matches_pandas(self):
+        rng = np.random.default_rng(2)
+        market = {f"S{i}": pd.DataFrame({'close': 100 + np.cumsum(rng.normal(0, 1 + i % 5, 60 + i)),
+                                         'volume': rng.random(60 + i)}) for i in range(30)}
+        market['SHORT'] = pd.DataFrame({'close': [1.0, 1.1, 1.2], 'volume': [1.0, 1.0, 1.0]})
+        expected = {s: df['close'].pct_change().rolling(48, min_periods=10).std().iloc[-1] for s, df in market.items()}
+        ranked = sorted((s for s in expected if not np.isnan(expected[s])), key=expected.get, reverse=True)
+        self.assertEqual(get_top_ranked_symbols(market, top_n=8), ranked[:8])
+        self.assertEqual(get_top_ranked_symbols(market, method="price", top_n=1),
+                         [max(market, key=lambda s: market[s]['close'].iloc[-1])])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.ticker_snapshot의 TTL 캐시에 대한 단위 테스트
+"""
+import unittest
+import os
+import sys
+import asyncio
+from unittest.mock import AsyncMock
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.ticker_snapshot import TickerSnapshot
+
+class TestTickerSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.session = AsyncMock()
+        self.session.fetch_tickers.return_value = {
+            "BTC/USDT:USDT": {"symbol": "BTC/USDT:USDT", "last": 65000.0, "quoteVolume": 1e9},
+            "ETH/USDT:USDT": {"symbol": "ETH/USDT:USDT", "last": 3200.0, "quoteVolume": 5e8},
+        }
+
+    def test_concurrent_reads_share_one_request(self):
+        """TTL 내 동시 조회가 fetch_tickers 1회로 처리되는지 테스트"""
+        snapshot = TickerSnapshot(ttl_sec=60)
+
+        async def scenario():
+            return await asyncio.gather(
+                snapshot.last_price(self.session, "BTC/USDT:USDT"),
+                snapshot.last_price(self.session, "ETH/USDT:USDT"),
+                snapshot.get(self.session),
+            )
+
+        btc, eth, tickers = asyncio.run(scenario())
+        self.assertEqual((btc, eth), (65000.0, 3200.0))
+        self.assertEqual(len(tickers), 2)
+        self.session.fetch_tickers.assert_called_once()
+
+    def test_expired_snapshot_is_refreshed_and_kept_on_failure(self):
+        """만료 시 재요청하고, 갱신 실패 시 직전 스냅샷을 유지하는지 테스트"""
+        snapshot = TickerSnapshot(ttl_sec=0)
+        asyncio.run(snapshot.get(self.session))
+        self.session.fetch_tickers.side_effect = RuntimeError("timeout")
+
+        price = asyncio.run(snapshot.last_price(self.session, "BTC/USDT:USDT"))
+        self.assertEqual(price, 65000.0)
+        self.assertEqual(self.session.fetch_tickers.call_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()
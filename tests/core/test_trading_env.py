@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+src.core.trading_env 배열 기반 스텝 경로가 데이터프레임 경로와 같은 결과를 내는지 확인하는 테스트
+"""
+import unittest
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.memmap_dataset import TIMESTAMP_COLUMN
+from src.core.rl.observation_builder import ObsConfig, build_obs, build_obs_from_array
+from src.core.trading_env import TradingEnv
+
+
+def _write_csv(path, rows=1500, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, rows))
+    index = pd.date_range("2024-01-01 20:00", periods=rows, freq="1min", tz="Asia/Seoul", name=TIMESTAMP_COLUMN)
+    df = pd.DataFrame({'open': close, 'high': close + rng.random(rows), 'low': close - rng.random(rows),
+                       'close': close, 'volume': rng.random(rows) * 10}, index=index)
+    df.to_csv(path)
+
+
+class TestTradingEnvArrays(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        path = os.path.join(cls._tmp.name, "ohlcv.csv")
+        _write_csv(path)
+        cls.env = TradingEnv({'use_online': False, 'data_path': path, 'random_start': False,
+                              'max_steps': 500, 'use_feature_store': False})
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def test_observations_match_dataframe_path(self):
+        env = self.env
+        env.reset()
+        actions = np.random.default_rng(1).integers(0, 9, 200)
+        for action in actions:
+            obs, _, terminated, truncated, _ = env.step(int(action))
+            expected = build_obs(env.df_feat, env.i, env.obs_cfg, env.side, env.size, env.equity,
+                                 env.leverage, env.cfg.initial_equity, env.cfg.max_leverage)
+            # 관측은 사전 계산 윈도우 통계(float64)를 쓰므로 build_obs의 float32 통계와 반올림 수준만 다름
+            np.testing.assert_allclose(obs, expected, atol=1e-4)
+            if terminated or truncated:
+                break
+
+    def test_precomputed_arrays(self):
+        env = self.env
+        np.testing.assert_array_equal(env.close_prices, env.df_feat["close"].to_numpy())
+        dates = [d.toordinal() for d in env.df_feat.index.date]
+        ordinal = env.day_ordinal - env.day_ordinal[0]
+        np.testing.assert_array_equal(ordinal, np.asarray(dates) - dates[0])
+        self.assertEqual(env.features.shape, env.df_feat.shape)
+        self.assertEqual(env.features.dtype, np.float32)
+
+    def test_window_fill_matches_pandas(self):
+        rng = np.random.default_rng(2)
+        df = pd.DataFrame(rng.normal(size=(40, 4)), columns=list("abcd"))
+        df.iloc[:5, 0] = np.nan       # 윈도우 앞쪽 결측 → bfill
+        df.iloc[20:25, 1] = np.nan    # 중간 결측 → ffill
+        df.iloc[:, 2] = np.nan        # 전부 결측 → NaN 유지
+        features = df.to_numpy(dtype=np.float32)
+        cfg = ObsConfig(window=16, normalize_market_data=False)
+        for idx in (3, 10, 24, 39):
+            np.testing.assert_array_equal(build_obs_from_array(features, idx, cfg, 1, 2.0, 900.0, 3.0, 1000.0, 10.0),
+                                          build_obs(df, idx, cfg, 1, 2.0, 900.0, 3.0, 1000.0, 10.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
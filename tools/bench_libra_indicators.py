@@ -0,0 +1,69 @@
+# tools/bench_libra_indicators.py
+# -*- coding: utf-8 -*-
+"""
+LibraStrategy 지표 계산 엔진 벤치마크 (NumPy 구현 vs pandas-ta)
+
+사용 예:
+    python tools/bench_libra_indicators.py
+    python tools/bench_libra_indicators.py --rows 500 5000 50000 --repeat 5
+
+행 수별로 두 엔진의 `extract_market_features` 실행 시간과 결과 최대 상대 오차를 출력합니다.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 sys.path에 추가하여 모듈 임포트 경로 문제 해결
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.market_features import extract_market_features
+
+
+def _synthetic_ohlcv(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, rows))
+    high = close + np.abs(rng.normal(0, 0.5, rows))
+    low = close - np.abs(rng.normal(0, 0.5, rows))
+    open_ = np.clip(close + rng.normal(0, 0.2, rows), low, high)
+    volume = np.abs(rng.normal(10, 2, rows))
+    index = pd.date_range("2024-01-01", periods=rows, freq="5min", name="timestamp")
+    return pd.DataFrame({"open": open_, "high": high, "low": low, "close": close, "volume": volume}, index=index)
+
+
+def _best_time(df: pd.DataFrame, engine: str, repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = extract_market_features(df.copy(), engine=engine)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the NumPy LibraStrategy indicators against pandas-ta.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[500, 5_000, 50_000], help="Row counts to benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per measurement (best is reported)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    import pandas_ta  # noqa: F401  (임포트 비용을 따로 측정)
+    print(f"pandas_ta import: {time.perf_counter() - started:.3f}s")
+
+    print(f"{'rows':>8} {'numpy':>10} {'pandas_ta':>10} {'speedup':>8} {'max_rel_err':>12}")
+    for rows in args.rows:
+        df = _synthetic_ohlcv(rows)
+        t_np, feat_np = _best_time(df, "numpy", args.repeat)
+        t_ta, feat_ta = _best_time(df, "pandas_ta", args.repeat)
+        a, b = feat_np.to_numpy(dtype=float), feat_ta[feat_np.columns].to_numpy(dtype=float)
+        err = float(np.max(np.abs(a - b) / (np.abs(b) + 1e-12))) if a.size else 0.0
+        print(f"{rows:>8} {t_np * 1e3:>8.1f}ms {t_ta * 1e3:>8.1f}ms {t_ta / t_np:>7.1f}x {err:>12.2e}")
+
+
+if __name__ == "__main__":
+    main()
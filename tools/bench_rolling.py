@@ -0,0 +1,73 @@
+# tools/bench_rolling.py
+# -*- coding: utf-8 -*-
+"""
+롤링 윈도우 커널(`src.core.rolling`) vs pandas `.rolling()` 마이크로 벤치마크
+
+사용 예:
+    python tools/bench_rolling.py
+    python tools/bench_rolling.py --rows 100 10000 1000000 --window 20 --symbols 300
+
+1차원 시계열(행 수별)과 (심볼 × 캔들) 2차원 패널에 대해 커널별 실행 시간과 pandas 대비 최대 오차를 출력합니다.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 sys.path에 추가하여 모듈 임포트 경로 문제 해결
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core import rolling
+
+KERNELS = ("mean", "std", "min", "max")
+
+
+def _best(fn, repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def _report(label: str, kernel: str, t_np: float, t_pd: float, a: np.ndarray, b: np.ndarray):
+    scale = np.nanmax(np.abs(b)) or 1.0
+    err = float(np.nanmax(np.abs(a - b)) / scale) if np.isfinite(b).any() else 0.0
+    print(f"{label:<18} {kernel:<5} {t_np * 1e3:>9.3f}ms {t_pd * 1e3:>9.3f}ms {t_pd / t_np:>7.1f}x {err:>10.1e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark NumPy rolling kernels against pandas rolling.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 10_000, 1_000_000], help="1-D series lengths")
+    parser.add_argument("--window", type=int, default=20, help="Rolling window length")
+    parser.add_argument("--symbols", type=int, default=300, help="Rows of the 2-D panel (panel length 100)")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions per measurement (best is reported)")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    w = args.window
+    print(f"{'input':<18} {'kind':<5} {'numpy':>11} {'pandas':>11} {'speedup':>8} {'rel_err':>10}")
+    for rows in args.rows:
+        x = 100 + np.cumsum(rng.normal(0, 1, rows))
+        for kernel in KERNELS:
+            t_np, a = _best(lambda: getattr(rolling, f"rolling_{kernel}")(x, w), args.repeat)
+            t_pd, b = _best(lambda: getattr(pd.Series(x).rolling(w), kernel)().to_numpy(), args.repeat)
+            _report(f"1-D n={rows}", kernel, t_np, t_pd, a, b)
+
+    panel = 100 + np.cumsum(rng.normal(0, 1, (args.symbols, 100)), axis=1)
+    for kernel in KERNELS:
+        t_np, a = _best(lambda: getattr(rolling, f"rolling_{kernel}")(panel, w), args.repeat)
+        # pandas 기준: 기존 코드처럼 심볼마다 Series를 만들어 계산
+        t_pd, b = _best(lambda: np.stack([getattr(pd.Series(row).rolling(w), kernel)().to_numpy() for row in panel]),
+                        args.repeat)
+        _report(f"2-D {args.symbols}x100", kernel, t_np, t_pd, a, b)
+
+
+if __name__ == "__main__":
+    main()
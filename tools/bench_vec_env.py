@@ -0,0 +1,78 @@
+# tools/bench_vec_env.py
+# -*- coding: utf-8 -*-
+"""
+벡터 환경 처리량 벤치마크: `DummyVecEnv`(TradingEnv N개) vs `SubprocVecEnv`(공유 데이터) vs `BatchedTradingVecEnv`
+
+사용 예:
+    python tools/bench_vec_env.py
+    python tools/bench_vec_env.py --rows 50000 --envs 1 8 32 --steps 2000
+
+합성 1분봉 CSV로 세 종류의 벡터 환경을 만들고 초당 환경 스텝 수(env-steps/s)를 출력합니다.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 sys.path에 추가하여 모듈 임포트 경로 문제 해결
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from stable_baselines3.common.vec_env import DummyVecEnv, SubprocVecEnv
+
+from src.core.batched_trading_env import BatchedTradingVecEnv
+from src.core.memmap_dataset import TIMESTAMP_COLUMN
+from src.core.shared_env_data import SharedEnvData, shared_env_fns
+from src.core.trading_env import TradingEnv
+
+
+def _write_csv(path: str, rows: int):
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, rows))
+    index = pd.date_range("2024-01-01", periods=rows, freq="1min", tz="Asia/Seoul", name=TIMESTAMP_COLUMN)
+    pd.DataFrame({'open': close, 'high': close + rng.random(rows), 'low': close - rng.random(rows),
+                  'close': close, 'volume': rng.random(rows) * 10}, index=index).to_csv(path)
+
+
+def _steps_per_sec(vec, steps: int) -> float:
+    rng = np.random.default_rng(1)
+    vec.reset()
+    actions = rng.integers(0, 9, (steps, vec.num_envs))
+    started = time.perf_counter()
+    for a in actions:
+        vec.step(a)
+    return steps * vec.num_envs / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vectorized TradingEnv throughput.")
+    parser.add_argument("--rows", type=int, default=20_000, help="Synthetic candles")
+    parser.add_argument("--envs", type=int, nargs="+", default=[1, 8, 32], help="Environment counts")
+    parser.add_argument("--steps", type=int, default=2_000, help="Vector steps per measurement")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ohlcv.csv")
+        _write_csv(path, args.rows)
+        config = {'use_online': False, 'data_path': path, 'use_feature_store': False, 'max_steps': 1_000}
+        template = TradingEnv(config)
+        print(f"rows={args.rows} steps={args.steps}")
+        print(f"{'n_envs':>6} {'dummy steps/s':>14} {'subproc steps/s':>16} {'batched steps/s':>16}")
+        with SharedEnvData(template) as shared:
+            for n in args.envs:
+                prepared = template.prepared_arrays()
+                dummy = DummyVecEnv([lambda: TradingEnv(config, prepared=prepared) for _ in range(n)])
+                subproc = SubprocVecEnv(shared_env_fns(shared.descriptor, n, config))
+                batched = BatchedTradingVecEnv(n_envs=n, template=template)
+                d, s, b = (_steps_per_sec(v, args.steps) for v in (dummy, subproc, batched))
+                subproc.close()
+                print(f"{n:>6} {d:>14,.0f} {s:>16,.0f} {b:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# tools/check_import_time.py
+# -*- coding: utf-8 -*-
+"""
+진입 모듈 콜드 임포트 시간 점검 (`python -X importtime` 기반)
+
+사용 예:
+    python tools/check_import_time.py
+    python tools/check_import_time.py --repeat 5 --top 10
+    python tools/check_import_time.py --module src.engine.main_realtime=500
+
+모듈마다 새 인터프리터에서 `-X importtime`으로 임포트한 누적 시간(중앙값)과 함께 임포트된 무거운 의존성
+(`lazy_import.HEAVY_MODULES`)을 출력합니다. 예산(ms)을 넘거나 시작 경로에서 무거운 의존성이 임포트되면
+종료 코드 1로 끝나므로 배포 전 점검에 사용할 수 있습니다. 설치되지 않은 의존성이 필요한 모듈은 건너뜁니다.
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+# 프로젝트 루트를 sys.path에 추가하여 모듈 임포트 경로 문제 해결
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.lazy_import import HEAVY_MODULES
+
+# 진입 모듈별 콜드 임포트 예산 (ms). pandas/numpy 임포트(~0.3초)는 포함됩니다.
+DEFAULT_BUDGETS_MS: Dict[str, float] = {
+    "src.engine.main_realtime": 800,
+    "src.notifier.bot_listener": 800,
+    "src.web.main": 800,
+    "src.core.strategy_signals": 600,
+    "src.core.exit_manager": 600,
+    "src.backtest.runner": 800,
+}
+
+# 모듈 자체가 직접 사용하여 시작 경로에 있어도 되는 무거운 의존성
+ALLOWED_HEAVY: Dict[str, Tuple[str, ...]] = {
+    "src.notifier.bot_listener": ("aiogram",),
+}
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def measure(module: str) -> Tuple[Optional[float], List[Tuple[float, str]], str]:
+    """
+    새 인터프리터에서 module을 임포트하여 (누적 ms, [(ms, 최상위 무거운 의존성)], 오류)를 반환합니다.
+    임포트에 실패하면 누적 ms는 None입니다.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_root, capture_output=True, text=True,
+    )
+    total, heavy = None, []
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        cumulative_ms = int(match.group(2)) / 1000.0
+        name = match.group(4)
+        if name == module:
+            total = cumulative_ms
+        if name in HEAVY_MODULES:
+            heavy.append((cumulative_ms, name))
+    error = ""
+    if proc.returncode != 0:
+        error = (proc.stderr.strip().splitlines() or ["unknown error"])[-1]
+        total = None
+    return total, heavy, error
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check cold import time of entry modules against budgets.")
+    parser.add_argument("--module", action="append", default=[],
+                        help="module[=budget_ms] to check (repeatable, default: built-in entry modules)")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreter runs per module (median is used)")
+    args = parser.parse_args()
+
+    budgets = dict(DEFAULT_BUDGETS_MS)
+    if args.module:
+        budgets = {}
+        for item in args.module:
+            name, _, budget = item.partition("=")
+            budgets[name] = float(budget) if budget else DEFAULT_BUDGETS_MS.get(name, 800)
+
+    failed = False
+    print(f"{'module':<32} {'median':>9} {'budget':>8}  status")
+    for module, budget in budgets.items():
+        runs, heavy, error = [], [], ""
+        for _ in range(max(1, args.repeat)):
+            total, heavy, error = measure(module)
+            if total is None:
+                break
+            runs.append(total)
+        if not runs:
+            print(f"{module:<32} {'-':>9} {budget:>6.0f}ms  SKIP ({error})")
+            continue
+        median = statistics.median(runs)
+        status = "OK"
+        if median > budget:
+            status, failed = "OVER BUDGET", True
+        heavy = [(ms, name) for ms, name in heavy if name not in ALLOWED_HEAVY.get(module, ())]
+        if heavy:
+            status, failed = status + " + HEAVY: " + ", ".join(f"{n} {ms:.0f}ms" for ms, n in heavy), True
+        print(f"{module:<32} {median:>7.0f}ms {budget:>6.0f}ms  {status}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# tools/convert_csv_to_memmap.py
+# -*- coding: utf-8 -*-
+"""
+대용량 1분봉 CSV → 심볼별 메모리 맵(.npy) 데이터셋 일회성 변환 스크립트
+
+사용 예:
+    python tools/convert_csv_to_memmap.py data/ALL_COINS_1min_2022_2024.csv data/memmap/ALL_COINS_1min_2022_2024
+    python tools/convert_csv_to_memmap.py data/BTCUSDT_1min_2022_2024.csv data/memmap/BTCUSDT_1min --symbol BTCUSDT
+
+변환 결과 디렉토리는 TradingEnv(`data_path`), run_backtest.py(`--data_path`),
+run_rl_backtest.py(`--data-path`)에 그대로 전달할 수 있습니다.
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+# 프로젝트 루트를 sys.path에 추가하여 모듈 임포트 경로 문제 해결
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.memmap_dataset import convert_csv_to_memmap
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert OHLCV CSV files into per-symbol memory-mapped .npy datasets.")
+    parser.add_argument("csv_path", help="Source CSV file")
+    parser.add_argument("out_dir", help="Output dataset directory (index.json + per-symbol folders)")
+    parser.add_argument("--symbol", default=None, help="Symbol name for single-symbol CSVs without a symbol column")
+    parser.add_argument("--chunksize", type=int, default=1_000_000, help="Rows per CSV chunk")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    started = time.perf_counter()
+    index = convert_csv_to_memmap(args.csv_path, args.out_dir, symbol=args.symbol, chunksize=args.chunksize)
+    elapsed = time.perf_counter() - started
+
+    total_rows = sum(info["rows"] for info in index.values())
+    print(f"변환 완료: 심볼 {len(index)}개, 총 {total_rows:,}개 행 ({elapsed:.1f}초) → {args.out_dir}")
+
+if __name__ == "__main__":
+    main()
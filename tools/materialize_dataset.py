@@ -0,0 +1,58 @@
+# tools/materialize_dataset.py
+# -*- coding: utf-8 -*-
+"""
+이름 붙인 훈련 데이터셋을 로컬에 확정하는 스크립트 (`src.core.dataset_registry`)
+
+사용 예:
+    python tools/materialize_dataset.py BTCUSDT_5m BTC/USDT:USDT 5m --start 2024-01-01 --end 2025-01-01
+    python tools/materialize_dataset.py BTCUSDT_1m BTCUSDT 1m --start 2024-01-01 --csv data/BTCUSDT_1min.csv
+    python tools/materialize_dataset.py --list
+
+확정한 이름은 TradingEnv(`dataset`) 및 PPO 훈련 설정(`TRAINING_CONFIG["dataset"]`)에서 사용합니다.
+네트워크는 확정할 때만 사용하며, 이후 훈련은 로컬 데이터만 읽습니다.
+"""
+import argparse
+import logging
+import os
+import sys
+
+# 프로젝트 루트를 sys.path에 추가하여 모듈 임포트 경로 문제 해결
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from src.core.dataset_registry import DatasetSpec, get_dataset_registry
+from src.core.memmap_dataset import load_ohlcv_frame
+
+def main():
+    parser = argparse.ArgumentParser(description="Materialize a named offline dataset with train/validation/test splits.")
+    parser.add_argument("name", nargs="?", help="Dataset name (letters, digits, '_.-')")
+    parser.add_argument("symbol", nargs="?", help="Exchange symbol, e.g. BTC/USDT:USDT")
+    parser.add_argument("timeframe", nargs="?", help="Candle timeframe, e.g. 5m")
+    parser.add_argument("--start", help="Start time (UTC, inclusive)")
+    parser.add_argument("--end", default=None, help="End time (UTC, exclusive). Default: last closed candle")
+    parser.add_argument("--csv", default=None, help="Build from a local CSV or memmap dataset instead of the exchange")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if the dataset already exists")
+    parser.add_argument("--list", action="store_true", help="List registered datasets and exit")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    registry = get_dataset_registry()
+
+    if args.list:
+        for name in registry.names():
+            entry = registry.entry(name)
+            splits = ", ".join(f"{s}={b[1] - b[0]}" for s, b in entry["splits"].items())
+            print(f"{name}: {entry['spec']['symbol']} {entry['spec']['timeframe']} {entry['rows']:,}행 "
+                  f"해시 {entry['content_hash'][:12]} ({splits})")
+        return
+    if not (args.name and args.symbol and args.timeframe and args.start):
+        parser.error("name, symbol, timeframe, --start are required (or use --list)")
+
+    spec = DatasetSpec(args.name, args.symbol, args.timeframe, args.start, args.end)
+    source = load_ohlcv_frame(args.csv, args.symbol) if args.csv else None
+    entry = registry.materialize(spec, source=source, force=args.force)
+    print(f"확정 완료: {spec.name} {entry['rows']:,}행, 해시 {entry['content_hash']} → {registry.path_for(spec.name)}")
+
+if __name__ == "__main__":
+    main()